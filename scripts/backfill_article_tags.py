@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+既存のコラムのタグ行をタグ隣接リスト（article-tags）に登録するスクリプト
+タグ隣接リスト導入前のデータを移行する場合に使用する（何度実行しても同じ結果になる）
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/backfill_article_tags.py
+"""
+import os
+import sys
+
+# srcをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from admin.repositories.article_repository import ArticleRepository  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def main():
+    """メイン処理"""
+    repo = ArticleRepository()
+    tag_index = repo.tag_index
+
+    articles = 0
+    rows = 0
+
+    for item in parallel_scan(repo.table, ProjectionExpression='articleId, tags, publishedAt'):
+        puts = [
+            {'PutRequest': {'Item': operation['Put']['Item']}}
+            for operation in tag_index.transact_items(
+                int(item['articleId']), [], None, item.get('tags'), item.get('publishedAt')
+            )
+        ]
+        for start in range(0, len(puts), 25):
+            request_items = {tag_index.table_name: puts[start:start + 25]}
+            while request_items:
+                result = tag_index.client.batch_write_item(RequestItems=request_items)
+                request_items = result.get('UnprocessedItems') or None
+        articles += 1
+        rows += len(puts)
+
+    print(f"✅ 完了しました！ コラム: {articles}件 / タグ行: {rows}件")
+
+
+if __name__ == '__main__':
+    main()
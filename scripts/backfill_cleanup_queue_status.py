@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+既存の画像削除キューのアイテムにqueueStatus属性（DueIndex用）を付与するスクリプト
+nextAttemptAtのあるアイテムはpending、無いアイテム（再試行を打ち切ったもの）はdeadにしてTTLを設定する
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/backfill_cleanup_queue_status.py
+
+    # AWS環境
+    export IMAGE_CLEANUP_TABLE_NAME=image-cleanup-queue
+    python scripts/backfill_cleanup_queue_status.py
+"""
+import os
+import time
+
+import boto3
+
+AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-1')
+IMAGE_CLEANUP_TABLE_NAME = os.environ.get('IMAGE_CLEANUP_TABLE_NAME', 'image-cleanup-queue')
+DYNAMODB_ENDPOINT_URL = os.environ.get('DYNAMODB_ENDPOINT_URL')
+
+# src/admin/repositories/image_cleanup_repository.py の DEAD_RETENTION_SECONDS と同じ
+DEAD_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+
+def main():
+    """メイン処理"""
+    dynamodb_config = {'region_name': AWS_REGION}
+    if DYNAMODB_ENDPOINT_URL:
+        dynamodb_config['endpoint_url'] = DYNAMODB_ENDPOINT_URL
+
+    table = boto3.resource('dynamodb', **dynamodb_config).Table(IMAGE_CLEANUP_TABLE_NAME)
+
+    scan_kwargs = {'ProjectionExpression': 'imageKey, queueStatus, nextAttemptAt'}
+    pending = 0
+    dead = 0
+    skipped = 0
+
+    while True:
+        response = table.scan(**scan_kwargs)
+
+        for item in response.get('Items', []):
+            if item.get('queueStatus'):
+                skipped += 1
+                continue
+
+            if item.get('nextAttemptAt'):
+                table.update_item(
+                    Key={'imageKey': item['imageKey']},
+                    UpdateExpression='SET queueStatus = :pending',
+                    ExpressionAttributeValues={':pending': 'pending'}
+                )
+                pending += 1
+            else:
+                table.update_item(
+                    Key={'imageKey': item['imageKey']},
+                    UpdateExpression='SET queueStatus = :dead, expiresAt = :expires',
+                    ExpressionAttributeValues={
+                        ':dead': 'dead',
+                        ':expires': int(time.time()) + DEAD_RETENTION_SECONDS
+                    }
+                )
+                dead += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    print(f"✅ 完了しました！ pending: {pending}件 / dead: {dead}件 / スキップ: {skipped}件")
+
+
+if __name__ == '__main__':
+    main()
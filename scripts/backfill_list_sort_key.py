@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+既存のコラムにlistPartition・listSortKey属性（ArticleListIndex用）を付与するスクリプト
+ArticleIndexStage 6のデプロイ後、7で読み込みを切り替える前に実行する
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/backfill_list_sort_key.py
+
+    # AWS環境
+    export ARTICLES_TABLE_NAME=articles
+    python scripts/backfill_list_sort_key.py
+"""
+import os
+
+import boto3
+
+AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-1')
+ARTICLES_TABLE_NAME = os.environ.get('ARTICLES_TABLE_NAME', 'articles')
+DYNAMODB_ENDPOINT_URL = os.environ.get('DYNAMODB_ENDPOINT_URL')
+
+# src/admin/repositories/article_repository.pyのLIST_PARTITION・list_index_attributesと同じ値
+LIST_PARTITION = 'articles'
+
+
+def main():
+    """メイン処理"""
+    dynamodb_config = {'region_name': AWS_REGION}
+    if DYNAMODB_ENDPOINT_URL:
+        dynamodb_config['endpoint_url'] = DYNAMODB_ENDPOINT_URL
+
+    table = boto3.resource('dynamodb', **dynamodb_config).Table(ARTICLES_TABLE_NAME)
+
+    scan_kwargs = {
+        'ProjectionExpression': 'articleId, publishedAt, listPartition, listSortKey'
+    }
+    updated = 0
+    skipped = 0
+
+    while True:
+        response = table.scan(**scan_kwargs)
+
+        for item in response.get('Items', []):
+            list_sort_key = f"{item.get('publishedAt') or ''}#{int(item['articleId']):010d}"
+            if item.get('listPartition') == LIST_PARTITION and item.get('listSortKey') == list_sort_key:
+                skipped += 1
+                continue
+
+            table.update_item(
+                Key={'articleId': item['articleId']},
+                UpdateExpression='SET listPartition = :partition, listSortKey = :sortKey',
+                ExpressionAttributeValues={':partition': LIST_PARTITION, ':sortKey': list_sort_key}
+            )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    print(f"✅ 完了しました！ 更新: {updated}件 / スキップ: {skipped}件")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+既存のコラムにstatusCategory属性（StatusCategoryIndex用）を付与するスクリプト
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/backfill_status_category.py
+
+    # AWS環境
+    export ARTICLES_TABLE_NAME=articles
+    python scripts/backfill_status_category.py
+"""
+import os
+
+import boto3
+
+AWS_REGION = os.environ.get('AWS_REGION', 'ap-northeast-1')
+ARTICLES_TABLE_NAME = os.environ.get('ARTICLES_TABLE_NAME', 'articles')
+DYNAMODB_ENDPOINT_URL = os.environ.get('DYNAMODB_ENDPOINT_URL')
+
+
+def main():
+    """メイン処理"""
+    dynamodb_config = {'region_name': AWS_REGION}
+    if DYNAMODB_ENDPOINT_URL:
+        dynamodb_config['endpoint_url'] = DYNAMODB_ENDPOINT_URL
+
+    table = boto3.resource('dynamodb', **dynamodb_config).Table(ARTICLES_TABLE_NAME)
+
+    scan_kwargs = {
+        'ProjectionExpression': 'articleId, #status, category, statusCategory',
+        'ExpressionAttributeNames': {'#status': 'status'}
+    }
+    updated = 0
+    skipped = 0
+
+    while True:
+        response = table.scan(**scan_kwargs)
+
+        for item in response.get('Items', []):
+            if not item.get('status') or not item.get('category'):
+                skipped += 1
+                continue
+
+            status_category = f"{item['status']}#{item['category']}"
+            if item.get('statusCategory') == status_category:
+                skipped += 1
+                continue
+
+            table.update_item(
+                Key={'articleId': item['articleId']},
+                UpdateExpression='SET statusCategory = :sc',
+                ExpressionAttributeValues={':sc': status_category}
+            )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    print(f"✅ 完了しました！ 更新: {updated}件 / スキップ: {skipped}件")
+
+
+if __name__ == '__main__':
+    main()
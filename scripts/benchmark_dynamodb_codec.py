@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+DynamoDBアイテム変換のベンチマークスクリプト
+queryの1ページ（約1MB）分のコラム一覧のアイテムを、リソースと同じ変換（TypeDeserializer）と
+utils.dynamodb_codecで変換した時間を比較する（DynamoDBへの接続は不要）
+アイテムはArticleRepository.createと同じ属性で作り、ArticleListIndexの射影（LIST_FIELDSとキー）に絞る
+
+使用方法:
+    python scripts/benchmark_dynamodb_codec.py
+    python scripts/benchmark_dynamodb_codec.py --pages 50
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# srcをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer  # noqa: E402
+
+from admin.repositories.article_repository import (  # noqa: E402
+    LIST_FIELDS,
+    build_status_category,
+    list_index_attributes
+)
+from admin.services.image_variant_service import LIST_VARIANT  # noqa: E402
+from utils.dynamodb_codec import decode_items, encode_item  # noqa: E402
+from utils.image_variants import expected_image_variants  # noqa: E402
+
+# queryの1ページの上限
+PAGE_BYTES = 1024 * 1024
+
+
+def build_article(article_id):
+    """ArticleRepository.createが書き込むものと同じ属性のコラム（画像の派生画像生成後）"""
+    published_at = f'2026-01-{article_id % 28 + 1:02d}T09:00:00Z'
+    image_key = f'articles/20260101090000_{article_id:08x}.jpg'
+    variants = expected_image_variants(image_key)
+    article = {
+        'articleId': article_id,
+        'title': f'今週の特売情報：スーパー各社で鶏肉が安い！ その{article_id}',
+        'content': 'まとめ買いと作り置きで食費を抑えるコツを紹介します。' * 40,
+        'category': '特売情報',
+        'status': 'published',
+        'images': [f'https://example.com/{image_key}'],
+        'tags': ['特売', '鶏肉', 'まとめ買い'],
+        'publishedAt': published_at,
+        'createdBy': 'admin001',
+        'updatedBy': 'admin001',
+        'createdAt': published_at,
+        'updatedAt': published_at,
+        'imageUrl': f'https://example.com/{image_key}',
+        'imageVariants': variants,
+        'thumbnail': variants.get(LIST_VARIANT, {}),
+        'statusCategory': build_status_category('published', '特売情報'),
+    }
+    article.update(list_index_attributes(published_at, article_id))
+    return article
+
+
+def build_page():
+    """1MB分のコラム一覧のアイテム（ArticleListIndexの射影・ワイヤ形式）を生成"""
+    projected = set(LIST_FIELDS) | {'listPartition', 'listSortKey'}
+    items = []
+    size = 0
+    article_id = 0
+    while size < PAGE_BYTES:
+        article_id += 1
+        article = build_article(article_id)
+        item = encode_item({name: value for name, value in article.items() if name in projected})
+        size += len(json.dumps(item, ensure_ascii=False).encode('utf-8'))
+        items.append(item)
+    return items
+
+
+def resource_decode(items, deserializer):
+    """boto3リソースと同じ変換（属性ごとにTypeDeserializer）"""
+    return [{name: deserializer.deserialize(value) for name, value in item.items()} for item in items]
+
+
+def measure(name, func, pages):
+    start = time.perf_counter()
+    for _ in range(pages):
+        func()
+    elapsed = (time.perf_counter() - start) / pages * 1000
+    print(f"  {name:<28} {elapsed:8.2f} ms/page")
+    return elapsed
+
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description='DynamoDBアイテム変換のベンチマーク')
+    parser.add_argument('--pages', type=int, default=20, help='計測するページ数')
+    args = parser.parse_args()
+
+    items = build_page()
+    deserializer = TypeDeserializer()
+    serializer = TypeSerializer()
+    print(f"1ページ: {len(items)}件（約{PAGE_BYTES // 1024}KB）, {args.pages}ページの平均")
+
+    decoded = decode_items(items)
+    resource = measure('resource (TypeDeserializer)', lambda: resource_decode(items, deserializer), args.pages)
+    codec = measure('dynamodb_codec.decode_items', lambda: decode_items(items), args.pages)
+    print(f"  -> {resource / codec:.1f}x")
+
+    resource_items = resource_decode(items, deserializer)
+    measure('resource (TypeSerializer)', lambda: [
+        {name: serializer.serialize(value) for name, value in item.items()} for item in resource_items
+    ], args.pages)
+    measure('dynamodb_codec.encode_item', lambda: [encode_item(item) for item in decoded], args.pages)
+
+
+if __name__ == '__main__':
+    main()
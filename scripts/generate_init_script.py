@@ -24,10 +24,19 @@ def ref_constructor(loader, node):
 
 
 def get_att_constructor(loader, node):
-    """!GetAtt タグのコンストラクタ"""
+    """!GetAtt タグのコンストラクタ（!GetAtt Resource.Attribute の短縮形も受け付ける）"""
+    if isinstance(node, yaml.ScalarNode):
+        return {'Fn::GetAtt': loader.construct_scalar(node).split('.', 1)}
     return {'Fn::GetAtt': loader.construct_sequence(node)}
 
 
+def function_constructor(name):
+    """!If・!Equals などの条件関数タグのコンストラクタ"""
+    def constructor(loader, node):
+        return {name: loader.construct_sequence(node, deep=True)}
+    return constructor
+
+
 # カスタムローダーを作成
 class CFNLoader(yaml.SafeLoader):
     pass
@@ -37,6 +46,8 @@ class CFNLoader(yaml.SafeLoader):
 CFNLoader.add_constructor('!Sub', sub_constructor)
 CFNLoader.add_constructor('!Ref', ref_constructor)
 CFNLoader.add_constructor('!GetAtt', get_att_constructor)
+for function_name in ('If', 'Equals', 'Not', 'And', 'Or'):
+    CFNLoader.add_constructor(f'!{function_name}', function_constructor(f'Fn::{function_name}'))
 
 
 def load_template() -> Dict[str, Any]:
@@ -62,6 +73,38 @@ def extract_table_name(table_name_def: Any) -> str:
         return str(table_name_def)
 
 
+def evaluate(template: Dict[str, Any], value: Any) -> Any:
+    """
+    条件関数をパラメータのデフォルト値で評価
+    （ローカルのテーブルは新規作成のため、移行段階のパラメータは最終段階のデフォルト値を使う）
+    """
+    if isinstance(value, dict) and len(value) == 1:
+        name, args = next(iter(value.items()))
+        if name == 'Ref':
+            parameter = template.get('Parameters', {}).get(args)
+            return str(parameter['Default']) if parameter and 'Default' in parameter else value
+        if name == 'Condition':
+            return evaluate(template, template['Conditions'][args])
+        if name == 'Fn::Equals':
+            return evaluate(template, args[0]) == evaluate(template, args[1])
+        if name == 'Fn::Not':
+            return not evaluate(template, args[0])
+        if name == 'Fn::And':
+            return all(evaluate(template, arg) for arg in args)
+        if name == 'Fn::Or':
+            return any(evaluate(template, arg) for arg in args)
+        if name == 'Fn::If':
+            condition = evaluate(template, template['Conditions'][args[0]])
+            return evaluate(template, args[1] if condition else args[2])
+    return value
+
+
+def resolve_conditional(template: Dict[str, Any], values: List[Any]) -> List[Dict]:
+    """!Ifで切り替えるGSI・属性定義を評価し、作成しないもの（AWS::NoValue）を除く"""
+    resolved = [evaluate(template, value) for value in values]
+    return [value for value in resolved if value != {'Ref': 'AWS::NoValue'}]
+
+
 def convert_attribute_type(cf_type: str) -> str:
     """CloudFormation属性タイプをDynamoDB CLIタイプに変換"""
     return cf_type  # S, N, B はそのまま使える
@@ -88,14 +131,14 @@ def generate_gsi_json(indexes: List[Dict]) -> str:
     return json.dumps(gsi_list, ensure_ascii=False)
 
 
-def generate_table_creation_command(table_name: str, table_def: Dict[str, Any]) -> str:
+def generate_table_creation_command(table_name: str, table_def: Dict[str, Any], template: Dict[str, Any]) -> str:
     """テーブル作成用のAWS CLIコマンドを生成"""
     props = table_def['Properties']
 
     # 属性定義
     attr_defs = ' \\\n    '.join([
         f"AttributeName={attr['AttributeName']},AttributeType={attr['AttributeType']}"
-        for attr in props['AttributeDefinitions']
+        for attr in resolve_conditional(template, props['AttributeDefinitions'])
     ])
 
     # キースキーマ
@@ -118,7 +161,7 @@ aws dynamodb create-table \\
 
     # GSIがある場合
     if 'GlobalSecondaryIndexes' in props:
-        gsi_json = generate_gsi_json(props['GlobalSecondaryIndexes'])
+        gsi_json = generate_gsi_json(resolve_conditional(template, props['GlobalSecondaryIndexes']))
         # JSONを1行で表現（シェルスクリプト内で改行を避ける）
         gsi_json_compact = gsi_json.replace('\n', ' ').replace('  ', ' ')
         cmd += f''' \\
@@ -166,7 +209,7 @@ echo ""
     # テーブル作成コマンドを生成
     for table_resource_name, table_def in tables.items():
         table_name = extract_table_name(table_def['Properties']['TableName'])
-        cmd = generate_table_creation_command(table_name, table_def)
+        cmd = generate_table_creation_command(table_name, table_def, template)
         script += cmd + '\n'
 
     script += '''
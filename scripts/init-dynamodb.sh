@@ -39,14 +39,95 @@ aws dynamodb create-table \
     AttributeName=status,AttributeType=S \
     AttributeName=publishedAt,AttributeType=S \
     AttributeName=category,AttributeType=S \
+    AttributeName=statusCategory,AttributeType=S \
+    AttributeName=listPartition,AttributeType=S \
+    AttributeName=listSortKey,AttributeType=S \
   --key-schema AttributeName=articleId,KeyType=HASH \
   --billing-mode PAY_PER_REQUEST \
   --global-secondary-indexes \
-    '[{"IndexName": "StatusIndex", "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}, {"AttributeName": "publishedAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "ALL"}}, {"IndexName": "CategoryIndex", "KeySchema": [{"AttributeName": "category", "KeyType": "HASH"}, {"AttributeName": "publishedAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "ALL"}}]' \
+    '[{"IndexName": "StatusCategoryIndex", "KeySchema": [{"AttributeName": "statusCategory", "KeyType": "HASH"}, {"AttributeName": "publishedAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["title", "status", "category", "tags", "images", "thumbnail", "createdBy", "updatedBy", "createdAt", "updatedAt"]}}, {"IndexName": "StatusSummaryIndex", "KeySchema": [{"AttributeName": "status", "KeyType": "HASH"}, {"AttributeName": "publishedAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["title", "category", "tags", "images", "thumbnail", "createdBy", "updatedBy", "createdAt", "updatedAt"]}}, {"IndexName": "CategorySummaryIndex", "KeySchema": [{"AttributeName": "category", "KeyType": "HASH"}, {"AttributeName": "publishedAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["title", "status", "tags", "images", "thumbnail", "createdBy", "updatedBy", "createdAt", "updatedAt"]}}, {"IndexName": "ArticleListIndex", "KeySchema": [{"AttributeName": "listPartition", "KeyType": "HASH"}, {"AttributeName": "listSortKey", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["title", "status", "category", "tags", "images", "thumbnail", "publishedAt", "createdBy", "updatedBy", "createdAt", "updatedAt"]}}]' \
   --endpoint-url $ENDPOINT \
   --region $REGION \
   --no-cli-pager 2>/dev/null || echo "articles table already exists"
 
+# Article Search Indexテーブル
+echo "Creating article-search-index table..."
+aws dynamodb create-table \
+  --table-name article-search-index \
+  --attribute-definitions \
+    AttributeName=term,AttributeType=S \
+    AttributeName=articleId,AttributeType=N \
+  --key-schema AttributeName=term,KeyType=HASH AttributeName=articleId,KeyType=RANGE \
+  --billing-mode PAY_PER_REQUEST\
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "article-search-index table already exists"
+
+# Article Tagsテーブル
+echo "Creating article-tags table..."
+aws dynamodb create-table \
+  --table-name article-tags \
+  --attribute-definitions \
+    AttributeName=tag,AttributeType=S \
+    AttributeName=sortKey,AttributeType=S \
+  --key-schema AttributeName=tag,KeyType=HASH AttributeName=sortKey,KeyType=RANGE \
+  --billing-mode PAY_PER_REQUEST\
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "article-tags table already exists"
+
+# Article Countersテーブル
+echo "Creating article-counters table..."
+aws dynamodb create-table \
+  --table-name article-counters \
+  --attribute-definitions \
+    AttributeName=counterKey,AttributeType=S \
+  --key-schema AttributeName=counterKey,KeyType=HASH \
+  --billing-mode PAY_PER_REQUEST\
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "article-counters table already exists"
+
+# Id Sequencesテーブル
+echo "Creating id-sequences table..."
+aws dynamodb create-table \
+  --table-name id-sequences \
+  --attribute-definitions \
+    AttributeName=sequenceName,AttributeType=S \
+  --key-schema AttributeName=sequenceName,KeyType=HASH \
+  --billing-mode PAY_PER_REQUEST\
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "id-sequences table already exists"
+
+# Image Cleanup Queueテーブル
+echo "Creating image-cleanup-queue table..."
+aws dynamodb create-table \
+  --table-name image-cleanup-queue \
+  --attribute-definitions \
+    AttributeName=imageKey,AttributeType=S \
+    AttributeName=queueStatus,AttributeType=S \
+    AttributeName=nextAttemptAt,AttributeType=S \
+  --key-schema AttributeName=imageKey,KeyType=HASH \
+  --billing-mode PAY_PER_REQUEST \
+  --global-secondary-indexes \
+    '[{"IndexName": "DueIndex", "KeySchema": [{"AttributeName": "queueStatus", "KeyType": "HASH"}, {"AttributeName": "nextAttemptAt", "KeyType": "RANGE"}], "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["imageUrl", "attempts"]}}]' \
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "image-cleanup-queue table already exists"
+
+# Image Refsテーブル
+echo "Creating image-refs table..."
+aws dynamodb create-table \
+  --table-name image-refs \
+  --attribute-definitions \
+    AttributeName=refKey,AttributeType=S \
+  --key-schema AttributeName=refKey,KeyType=HASH \
+  --billing-mode PAY_PER_REQUEST\
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null || echo "image-refs table already exists"
+
 # Companiesテーブル
 echo "Creating companies table..."
 aws dynamodb create-table \
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+連番IDシーケンス（id-sequences）を既存データの最大IDまで進めるスクリプト
+シーケンス導入前のデータがある環境で1回実行する（何度実行しても同じ結果になる）
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/init_id_sequences.py
+"""
+import os
+import sys
+
+# srcをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from admin.repositories.article_repository import ArticleRepository, ARTICLE_ID_SEQUENCE  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def main():
+    """メイン処理"""
+    repo = ArticleRepository()
+
+    max_id = max(
+        (int(item['articleId']) for item in parallel_scan(repo.table, ProjectionExpression='articleId')),
+        default=0
+    )
+
+    if repo.id_sequence.ensure_at_least(ARTICLE_ID_SEQUENCE, max_id):
+        print(f"✅ 完了しました！ {ARTICLE_ID_SEQUENCE}: {max_id}")
+    else:
+        print(f"✅ 完了しました！ {ARTICLE_ID_SEQUENCE} は既に{max_id}以上です")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+コールドスタート（ハンドラーのインポート）のプロファイルスクリプト
+template.yamlのLambda関数ごとに、新しいインタープリターでハンドラーモジュールをインポートし、
+`-X importtime`の出力をモジュールのツリーにして表示する
+
+初期化時間（インポート開始からハンドラー関数を取得するまで）が予算を超えた関数があれば終了コード1を返す
+予算は関数リソースの`Metadata.ColdStartBudgetMs`（なければ--default-budget）
+
+使用方法:
+    python scripts/profile_cold_start.py
+    python scripts/profile_cold_start.py --function ArticlesApiFunction --depth 3 --min-ms 5
+    python scripts/profile_cold_start.py --runs 5 --json
+
+プライミング（utils/warmup.py）はLambda上でのみ実行されるため、この計測には含まれない
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+TEMPLATE_PATH = os.path.join(ROOT_DIR, 'template.yaml')
+
+# 予算が設定されていない関数の予算（ミリ秒）
+DEFAULT_BUDGET_MS = 1000
+
+# `import time:       123 |        456 |   package.module`
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+# 子プロセスで実行するコード（インポートの開始からハンドラー関数を取得するまでの時間を出力）
+CHILD_CODE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+getattr(module, sys.argv[2])
+print(json.dumps({'initMs': (time.perf_counter() - start) * 1000}))
+"""
+
+
+class CFNLoader(yaml.SafeLoader):
+    """CloudFormationのタグ（!Ref, !Sub など）を読み飛ばすローダー"""
+
+
+def _tag_constructor(loader, suffix, node):
+    if isinstance(node, yaml.ScalarNode):
+        return {suffix: loader.construct_scalar(node)}
+    if isinstance(node, yaml.SequenceNode):
+        return {suffix: loader.construct_sequence(node)}
+    return {suffix: loader.construct_mapping(node)}
+
+
+CFNLoader.add_multi_constructor('!', _tag_constructor)
+
+
+def load_functions(template_path: str) -> List[Dict[str, Any]]:
+    """
+    template.yamlからLambda関数の一覧を取得
+
+    Returns:
+        [{'name', 'handler', 'codeUri', 'budgetMs', 'environment'}]
+    """
+    with open(template_path, 'r') as f:
+        template = yaml.load(f, Loader=CFNLoader)
+
+    globals_function = template.get('Globals', {}).get('Function', {})
+    global_environment = globals_function.get('Environment', {}).get('Variables', {})
+
+    functions = []
+    for name, resource in template.get('Resources', {}).items():
+        if resource.get('Type') != 'AWS::Serverless::Function':
+            continue
+        properties = resource.get('Properties', {})
+        if 'Handler' not in properties:
+            continue
+        environment = {**global_environment, **properties.get('Environment', {}).get('Variables', {})}
+        functions.append({
+            'name': name,
+            'handler': properties['Handler'],
+            'codeUri': properties.get('CodeUri', globals_function.get('CodeUri', '.')),
+            'budgetMs': resource.get('Metadata', {}).get('ColdStartBudgetMs'),
+            # !Refなどのデプロイ時に決まる値はプレースホルダーにする
+            'environment': {key: value if isinstance(value, str) else f'profile-{key.lower()}'
+                            for key, value in environment.items()}
+        })
+    return functions
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    `-X importtime`の出力をモジュールのツリーに変換
+    出力は子が親より先に並ぶ（インデントが深いほど下の階層）
+
+    Returns:
+        トップレベルのモジュール [{'module', 'selfMs', 'cumulativeMs', 'children'}]
+    """
+    pending: Dict[int, List[Dict[str, Any]]] = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        level = len(indent) // 2
+        node = {
+            'module': module,
+            'selfMs': int(self_us) / 1000,
+            'cumulativeMs': int(cumulative_us) / 1000,
+            'children': pending.pop(level + 1, [])
+        }
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_handler(function: Dict[str, Any], python: str) -> Dict[str, Any]:
+    """
+    新しいインタープリターでハンドラーをインポートして計測
+
+    Returns:
+        {'initMs': 初期化時間, 'tree': モジュールのツリー}
+    """
+    module_name, handler_name = function['handler'].rsplit('.', 1)
+    code_dir = os.path.normpath(os.path.join(ROOT_DIR, function['codeUri']))
+
+    env = {key: value for key, value in os.environ.items() if not key.startswith('AWS_LAMBDA_')}
+    env.update(function['environment'])
+    env['PYTHONPATH'] = code_dir
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', CHILD_CODE, module_name, handler_name],
+        cwd=code_dir, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {function['handler']}:\n{result.stderr[-2000:]}")
+
+    return {
+        'initMs': json.loads(result.stdout.strip().splitlines()[-1])['initMs'],
+        'tree': parse_importtime(result.stderr)
+    }
+
+
+def print_tree(nodes: List[Dict[str, Any]], depth: int, min_ms: float, level: int = 0) -> None:
+    """累積時間の大きい順にツリーを表示"""
+    for node in sorted(nodes, key=lambda n: n['cumulativeMs'], reverse=True):
+        if node['cumulativeMs'] < min_ms:
+            continue
+        print(f"    {'  ' * level}{node['module']:<{48 - 2 * level}} "
+              f"{node['cumulativeMs']:8.1f} ms (self {node['selfMs']:.1f})")
+        if level + 1 < depth:
+            print_tree(node['children'], depth, min_ms, level + 1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description='ハンドラーのインポート時間のプロファイル')
+    parser.add_argument('--template', default=TEMPLATE_PATH, help='SAMテンプレート')
+    parser.add_argument('--function', action='append', help='対象の関数（論理ID、複数指定可）')
+    parser.add_argument('--runs', type=int, default=3, help='関数ごとの計測回数（中央値を使う）')
+    parser.add_argument('--depth', type=int, default=2, help='表示するツリーの深さ')
+    parser.add_argument('--min-ms', type=float, default=10.0, help='表示するモジュールの累積時間の下限')
+    parser.add_argument('--default-budget', type=float, default=DEFAULT_BUDGET_MS, help='予算のない関数の予算（ミリ秒）')
+    parser.add_argument('--python', default=sys.executable, help='計測に使うPython')
+    parser.add_argument('--json', action='store_true', help='結果をJSONで出力')
+    args = parser.parse_args(argv)
+
+    functions = load_functions(args.template)
+    if args.function:
+        functions = [function for function in functions if function['name'] in args.function]
+
+    results = []
+    for function in functions:
+        runs = [profile_handler(function, args.python) for _ in range(max(args.runs, 1))]
+        init_ms = statistics.median(run['initMs'] for run in runs)
+        budget_ms = function['budgetMs'] or args.default_budget
+        # ツリーは中央値に最も近い回のもの
+        tree = min(runs, key=lambda run: abs(run['initMs'] - init_ms))['tree']
+        results.append({
+            'function': function['name'],
+            'handler': function['handler'],
+            'initMs': round(init_ms, 1),
+            'budgetMs': budget_ms,
+            'ok': init_ms <= budget_ms,
+            'tree': tree
+        })
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        for result in results:
+            mark = '✅' if result['ok'] else '❌'
+            print(f"{mark} {result['function']} ({result['handler']}): "
+                  f"{result['initMs']} ms / 予算 {result['budgetMs']} ms")
+            print_tree(result['tree'], args.depth, args.min_ms)
+
+    over_budget = [result['function'] for result in results if not result['ok']]
+    if over_budget:
+        print(f"予算超過: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+コラム全文検索インデックス（article-search-index）を再構築するスクリプト
+インデックス更新に失敗した場合や、既存データを初めて登録する場合に使用する
+既存のポスティング・文書長・統計をすべて削除してから、全コラムを登録し直す
+（実行中に更新されたコラムは反映されない場合があるため、更新の少ない時間帯に実行する）
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/rebuild_search_index.py
+"""
+import os
+import sys
+
+# srcをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from admin.repositories.article_repository import ArticleRepository  # noqa: E402
+from utils.dynamodb_batch import batch_write  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def main():
+    """メイン処理"""
+    repo = ArticleRepository()
+    index_table = repo.search_index.table
+
+    # 差分ではなく全体を作り直すため、既存のアイテムを先に削除する
+    keys = parallel_scan(
+        index_table,
+        ProjectionExpression='#term, articleId',
+        ExpressionAttributeNames={'#term': 'term'}
+    )
+    requests = [{'DeleteRequest': {'Key': {'term': key['term'], 'articleId': key['articleId']}}} for key in keys]
+    failed = batch_write(index_table.meta.client, index_table.name, requests)
+    if failed:
+        print(f"❌ {len(failed)}件の削除に失敗しました。再実行してください")
+        sys.exit(1)
+
+    indexed = 0
+
+    for item in parallel_scan(repo.table, ProjectionExpression='articleId, title, content'):
+        repo.search_index.apply_article_change(None, item)
+        indexed += 1
+
+    print(f"✅ 完了しました！ 削除: {len(requests)}件 / インデックス登録: {indexed}件")
+
+
+if __name__ == '__main__':
+    main()
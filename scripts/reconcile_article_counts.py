@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+コラム件数カウンター（article-counters）を実際のコラムから数え直して修復するスクリプト
+カウンター更新の失敗などでずれが生じた場合や、既存データを初めて集計する場合に使用する
+
+使用方法:
+    # ローカル
+    export DYNAMODB_ENDPOINT_URL=http://localhost:8000
+    python scripts/reconcile_article_counts.py
+"""
+import os
+import sys
+
+# srcをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from admin.repositories.article_repository import ArticleRepository  # noqa: E402
+from utils.parallel_scan import parallel_scan  # noqa: E402
+
+
+def main():
+    """メイン処理"""
+    repo = ArticleRepository()
+
+    articles = parallel_scan(
+        repo.table,
+        ProjectionExpression='#status, category',
+        ExpressionAttributeNames={'#status': 'status'}
+    )
+    drift = repo.counters.reconcile(articles)
+
+    for key, values in drift.items():
+        print(f"  {key}: {values['stored']} -> {values['actual']}")
+
+    print(f"✅ 完了しました！ 修正: {len(drift)}件")
+
+
+if __name__ == '__main__':
+    main()
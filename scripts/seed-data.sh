@@ -84,6 +84,9 @@ aws dynamodb put-item \
     "content": {"S": "2025年1月から、食品メーカー各社が値上げを実施します。小麦粉製品を中心に、平均5-10%の値上げが予定されています。早めの買い溜めがおすすめです。"},
     "category": {"S": "値上げ情報"},
     "status": {"S": "published"},
+    "statusCategory": {"S": "published#値上げ情報"},
+    "listPartition": {"S": "articles"},
+    "listSortKey": {"S": "2025-01-15T09:00:00Z#0000000001"},
     "images": {"L": [
       {"S": "https://example.com/image1.jpg"}
     ]},
@@ -110,6 +113,9 @@ aws dynamodb put-item \
     "content": {"S": "今週は鶏肉が各スーパーで特売となっています。イオンでは100g 98円、イトーヨーカドーでは100g 88円と非常にお得です。この機会にまとめ買いして冷凍保存がおすすめです。"},
     "category": {"S": "特売情報"},
     "status": {"S": "published"},
+    "statusCategory": {"S": "published#特売情報"},
+    "listPartition": {"S": "articles"},
+    "listSortKey": {"S": "2025-01-20T10:30:00Z#0000000002"},
     "images": {"L": [
       {"S": "https://example.com/image2.jpg"},
       {"S": "https://example.com/image3.jpg"}
@@ -137,6 +143,9 @@ aws dynamodb put-item \
     "content": {"S": "この記事は下書きです。まだ公開されていません。"},
     "category": {"S": "節約術"},
     "status": {"S": "draft"},
+    "statusCategory": {"S": "draft#節約術"},
+    "listPartition": {"S": "articles"},
+    "listSortKey": {"S": "#0000000003"},
     "tags": {"L": [
       {"S": "レシピ"},
       {"S": "節約"}
@@ -150,6 +159,17 @@ aws dynamodb put-item \
   --region $REGION \
   --no-cli-pager 2>/dev/null
 
+# コラムIDのシーケンスを投入済みの最大IDに合わせる
+aws dynamodb put-item \
+  --table-name id-sequences \
+  --item '{
+    "sequenceName": {"S": "articles"},
+    "lastId": {"N": "3"}
+  }' \
+  --endpoint-url $ENDPOINT \
+  --region $REGION \
+  --no-cli-pager 2>/dev/null
+
 echo "Sample articles created"
 echo ""
 
@@ -0,0 +1,25 @@
+"""
+全文検索インデックス更新ワーカーハンドラー
+articlesテーブルのDynamoDB Streamsで起動し、コラムの作成・更新・削除を全文検索インデックスに反映する
+"""
+from typing import Dict, Any
+
+from admin.services.article_search_index_service import ArticleSearchIndexService
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def process_article_stream(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    コラムの変更を全文検索インデックスに反映
+
+    Returns:
+        {'processed': 反映した件数, 'batchItemFailures': 再試行するレコード}
+        （失敗したレコード以降はStreamsの再試行で同じ順序のまま処理し直される）
+    """
+    try:
+        return ArticleSearchIndexService().process_stream_event(event)
+    except Exception as e:
+        logger.error(f"Failed to process article stream: {str(e)}")
+        raise
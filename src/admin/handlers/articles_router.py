@@ -3,10 +3,12 @@
 1つのLambda関数で全てのコラム管理APIを処理することで、コールドスタートを削減
 """
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from admin.services.article_service import ArticleService
-from utils.auth import require_role
+from config.settings import settings
+from utils.auth import generate_token, require_role, verify_token
+from utils.aws_clients import get_dynamodb_raw_client, get_s3_client
 from utils.response import (
     success_response,
     bad_request_response,
@@ -15,24 +17,35 @@ from utils.response import (
     internal_server_error_response
 )
 from utils.logger import get_logger
+from utils.metrics import add_dimension, route_metrics
+from utils.text_search import tokenize
+from utils.warmup import Primer, is_warmup_event, open_dynamodb_connection, open_s3_connection, prime_imports
 
 logger = get_logger(__name__)
 
 
+@route_metrics
 def route_articles(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     コラム管理APIのルーティング
     パスとメソッドに基づいて適切なハンドラーに振り分ける
 
     対応するエンドポイント:
-    - GET    /admin/articles/list
+    - GET    /admin/articles/list（ids指定時は複数取得）
     - GET    /admin/articles/list/{articleId}
     - POST   /admin/articles/add
+    - POST   /admin/articles/upload-session
     - PUT    /admin/articles/update/{articleId}
     - DELETE /admin/articles/delete/{articleId}
     - PUT    /admin/articles/bulk-status
     - DELETE /admin/articles/bulk-delete
+
+    ウォームアップ（スケジュール）イベントはプライミングのレポートを返して終了する
+    ルートごとのメトリクス（EMF）はroute_metricsが出力する
     """
+    if is_warmup_event(event):
+        return primer.warmup_response()
+
     try:
         # リクエスト情報を取得
         http_method = event.get('httpMethod', event.get('requestContext', {}).get('http', {}).get('method', ''))
@@ -48,6 +61,8 @@ def route_articles(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return get_article(event)
         elif http_method == 'POST' and path.endswith('/add'):
             return create_article(event)
+        elif http_method == 'POST' and path.endswith('/upload-session'):
+            return create_upload_session(event)
         elif http_method == 'PUT' and 'articleId' in path_parameters:
             return update_article(event)
         elif http_method == 'DELETE' and 'articleId' in path_parameters:
@@ -82,14 +97,51 @@ def list_articles(event: Dict[str, Any]) -> Dict[str, Any]:
             'dateTo': params.get('dateTo')
         }
 
-        page = int(params.get('page', 1))
+        # どのフィルターの組み合わせが重いかをメトリクスで確認できるようにする
+        add_dimension('Filters', '+'.join(sorted(name for name, value in filters.items() if value)) or 'none')
+
         limit = int(params.get('limit', 20))
 
+        # 返却する項目（カンマ区切り、省略時は本文以外の一覧項目）
+        fields = [f.strip() for f in params['fields'].split(',') if f.strip()] if params.get('fields') else None
+
         # サービス層に委譲
         service = ArticleService()
-        articles, total, total_pages = service.list_articles(filters, page, limit)
 
-        return success_response({
+        # ID指定の複数取得（ids=1,2,3）
+        if params.get('ids'):
+            try:
+                article_ids = [int(i) for i in params['ids'].split(',') if i.strip()]
+            except ValueError:
+                return bad_request_response("idsはカンマ区切りの数値で指定してください")
+
+            articles, missing = service.get_articles(article_ids, fields=fields)
+
+            return success_response(body={
+                'items': articles,
+                'notFound': missing
+            })
+
+        # カーソル方式（paging=cursor または cursor指定時）
+        if params.get('paging') == 'cursor' or params.get('cursor'):
+            articles, next_cursor, plan = service.list_articles_by_cursor(
+                filters, limit, params.get('cursor'), fields=fields
+            )
+
+            return success_response(body={
+                'items': articles,
+                'pagination': {
+                    'limit': limit,
+                    'nextCursor': next_cursor,
+                    'hasMore': next_cursor is not None
+                }
+            }, headers=_query_plan_headers(plan))
+
+        # ページ番号方式（管理画面用）
+        page = int(params.get('page', 1))
+        articles, total, total_pages, plan = service.list_articles(filters, page, limit, fields=fields)
+
+        return success_response(body={
             'items': articles,
             'pagination': {
                 'currentPage': page,
@@ -97,7 +149,7 @@ def list_articles(event: Dict[str, Any]) -> Dict[str, Any]:
                 'totalItems': total,
                 'limit': limit
             }
-        })
+        }, headers=_query_plan_headers(plan))
 
     except ValueError as e:
         if "required" in str(e).lower() or "authentication" in str(e).lower():
@@ -108,6 +160,17 @@ def list_articles(event: Dict[str, Any]) -> Dict[str, Any]:
         return internal_server_error_response()
 
 
+def _query_plan_headers(plan: Optional[str]) -> Dict[str, str]:
+    """実行計画をデバッグ用ヘッダーとして返す（開発環境またはDEBUG_QUERY_PLAN有効時のみ）"""
+    if not plan or not (settings.DEBUG_QUERY_PLAN or settings.is_development()):
+        return {}
+
+    return {
+        'X-Query-Plan': plan,
+        'Access-Control-Expose-Headers': 'X-Query-Plan'
+    }
+
+
 def get_article(event: Dict[str, Any]) -> Dict[str, Any]:
     """コラム詳細取得"""
     try:
@@ -124,7 +187,7 @@ def get_article(event: Dict[str, Any]) -> Dict[str, Any]:
         if not article:
             return not_found_response("コラムが見つかりません")
 
-        return success_response(article)
+        return success_response(body=article)
 
     except KeyError:
         return bad_request_response("コラムIDが指定されていません")
@@ -154,9 +217,9 @@ def create_article(event: Dict[str, Any]) -> Dict[str, Any]:
 
         # サービス層に委譲
         service = ArticleService()
-        article = service.create_article(body)
+        article = service.create_article(body, admin.get('adminId'))
 
-        return success_response(article, status_code=201)
+        return success_response(body=article, status_code=201)
 
     except json.JSONDecodeError:
         return bad_request_response("不正なJSONフォーマットです")
@@ -169,6 +232,46 @@ def create_article(event: Dict[str, Any]) -> Dict[str, Any]:
         return internal_server_error_response()
 
 
+def create_upload_session(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    コラム画像のアップロードセッション発行
+    返却した署名付きURLにブラウザから直接アップロードし、
+    作成・更新時にimageUploadTokenを指定して画像を確定する
+    """
+    try:
+        # 認証チェック
+        admin = require_role(event, ['system_admin'])
+
+        # リクエストボディを取得
+        body = json.loads(event.get('body') or '{}')
+
+        content_type = body.get('contentType')
+        if not content_type:
+            return bad_request_response("contentTypeは必須です")
+
+        size = body.get('size')
+        if size is not None and (not isinstance(size, int) or isinstance(size, bool)):
+            return bad_request_response("sizeは数値で指定してください")
+
+        # サービス層に委譲
+        service = ArticleService()
+        session = service.create_image_upload_session(
+            content_type, size, str(body.get('method') or 'POST').upper()
+        )
+
+        return success_response(body=session, status_code=201)
+
+    except json.JSONDecodeError:
+        return bad_request_response("不正なJSONフォーマットです")
+    except ValueError as e:
+        if "required" in str(e).lower() or "authentication" in str(e).lower():
+            return forbidden_response(str(e))
+        return bad_request_response(str(e))
+    except Exception as e:
+        logger.error(f"Failed to create upload session: {str(e)}")
+        return internal_server_error_response()
+
+
 def update_article(event: Dict[str, Any]) -> Dict[str, Any]:
     """コラム更新"""
     try:
@@ -183,12 +286,12 @@ def update_article(event: Dict[str, Any]) -> Dict[str, Any]:
 
         # サービス層に委譲
         service = ArticleService()
-        article = service.update_article(article_id, body)
+        article = service.update_article(article_id, body, admin.get('adminId'))
 
         if not article:
             return not_found_response("コラムが見つかりません")
 
-        return success_response(article)
+        return success_response(body=article)
 
     except KeyError:
         return bad_request_response("コラムIDが指定されていません")
@@ -219,7 +322,7 @@ def delete_article(event: Dict[str, Any]) -> Dict[str, Any]:
         if not success:
             return not_found_response("コラムが見つかりません")
 
-        return success_response({'message': 'コラムを削除しました'})
+        return success_response(body={'message': 'コラムを削除しました'})
 
     except KeyError:
         return bad_request_response("コラムIDが指定されていません")
@@ -249,12 +352,15 @@ def bulk_update_status(event: Dict[str, Any]) -> Dict[str, Any]:
 
         # サービス層に委譲
         service = ArticleService()
-        success_count, failed_count = service.bulk_update_status(article_ids, status)
+        success_count, failed_count, results = service.bulk_update_status(
+            article_ids, status, admin.get('adminId'), atomic=bool(body.get('atomic'))
+        )
 
-        return success_response({
+        return success_response(body={
             'message': f'{success_count}件のコラムを更新しました',
             'successCount': success_count,
-            'failedCount': failed_count
+            'failedCount': failed_count,
+            'results': results
         })
 
     except json.JSONDecodeError:
@@ -284,12 +390,13 @@ def bulk_delete_articles(event: Dict[str, Any]) -> Dict[str, Any]:
 
         # サービス層に委譲
         service = ArticleService()
-        success_count, failed_count = service.bulk_delete_articles(article_ids)
+        success_count, failed_count, results = service.bulk_delete_articles(article_ids)
 
-        return success_response({
+        return success_response(body={
             'message': f'{success_count}件のコラムを削除しました',
             'successCount': success_count,
-            'failedCount': failed_count
+            'failedCount': failed_count,
+            'results': results
         })
 
     except json.JSONDecodeError:
@@ -301,3 +408,41 @@ def bulk_delete_articles(event: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Failed to bulk delete articles: {str(e)}")
         return internal_server_error_response()
+
+
+# ==================== プライミング ====================
+
+def _prime_imports() -> None:
+    # JWTの署名アルゴリズムとPillow（アップロード時の派生画像の生成、またはワーカーが出力できる形式の確認に使う）
+    modules = ['jwt.algorithms']
+    modules.append('PIL.Image' if settings.IMAGE_VARIANTS_TRIGGER == 'upload' else 'PIL.features')
+    prime_imports(*modules)
+
+
+def _prime_clients() -> None:
+    get_dynamodb_raw_client()
+    get_s3_client()
+
+
+def _prime_connections() -> None:
+    # すべてのテーブルを低レベルクライアント（1つの接続プール）で読み書きする
+    open_dynamodb_connection(get_dynamodb_raw_client(), settings.ARTICLES_TABLE_NAME)
+    open_s3_connection(get_s3_client())
+
+
+def _prime_text_search() -> None:
+    tokenize('ウォームアップ warm-up')
+
+
+def _prime_jwt() -> None:
+    verify_token(generate_token('warmup'))
+
+
+primer = Primer('route_articles', [
+    ('imports', _prime_imports),
+    ('clients', _prime_clients),
+    ('connections', _prime_connections),
+    ('regex', _prime_text_search),
+    ('jwt', _prime_jwt),
+])
+primer.install()
@@ -6,7 +6,9 @@ import bcrypt
 from typing import Dict, Any
 
 from admin.repositories.admin_repository import AdminRepository
-from utils.auth import generate_admin_token
+from config.settings import settings
+from utils.auth import generate_admin_token, verify_token
+from utils.aws_clients import get_dynamodb_raw_client
 from utils.response import (
     success_response,
     bad_request_response,
@@ -14,10 +16,13 @@ from utils.response import (
     internal_server_error_response
 )
 from utils.logger import get_logger
+from utils.metrics import route_metrics
+from utils.warmup import Primer, is_warmup_event, open_dynamodb_connection, prime_imports
 
 logger = get_logger(__name__)
 
 
+@route_metrics
 def admin_login(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     管理者ログイン
@@ -27,7 +32,12 @@ def admin_login(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "username": str,
         "password": str
     }
+
+    ウォームアップ（スケジュール）イベントはプライミングのレポートを返して終了する
     """
+    if is_warmup_event(event):
+        return primer.warmup_response()
+
     try:
         # リクエストボディを取得
         body = json.loads(event.get('body', '{}'))
@@ -62,7 +72,7 @@ def admin_login(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         admin_repo.update_last_login(admin['adminId'])
 
         # レスポンス
-        return success_response({
+        return success_response(body={
             'token': token,
             'admin': {
                 'id': admin['adminId'],
@@ -84,3 +94,22 @@ def admin_login(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
         return internal_server_error_response()
+
+
+# ==================== プライミング ====================
+
+def _prime_connections() -> None:
+    open_dynamodb_connection(get_dynamodb_raw_client(), settings.ADMINS_TABLE_NAME)
+
+
+def _prime_jwt() -> None:
+    verify_token(generate_admin_token(admin_id='warmup', role='warmup'))
+
+
+primer = Primer('admin_login', [
+    ('imports', lambda: prime_imports('jwt.algorithms')),
+    ('clients', get_dynamodb_raw_client),
+    ('connections', _prime_connections),
+    ('jwt', _prime_jwt),
+])
+primer.install()
@@ -0,0 +1,25 @@
+"""
+画像削除ワーカーハンドラー
+スケジュール（EventBridge）で定期実行し、削除キューの画像をまとめて削除する
+"""
+from typing import Dict, Any
+
+from admin.services.image_cleanup_service import ImageCleanupService
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def process_image_cleanup(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    削除キューの画像を削除
+
+    Returns:
+        {'deleted': 削除した件数, 'retried': 再試行に回した件数, 'dead': 再試行を打ち切った件数,
+         'kept': 再び参照されたため削除しなかった件数}
+    """
+    try:
+        return ImageCleanupService().drain()
+    except Exception as e:
+        logger.error(f"Failed to process image cleanup: {str(e)}")
+        raise
@@ -0,0 +1,29 @@
+"""
+派生画像ワーカーハンドラー
+画像バケットのObjectCreatedイベント（articles/・flyers/）で起動し、サムネイル・WebP/AVIF画像を生成する
+"""
+from typing import Dict, Any
+
+from admin.services.image_variant_service import ImageVariantService
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def process_image_variants(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    アップロードされた画像の派生画像を生成
+
+    Returns:
+        {'processed': 生成した件数, 'skipped': 対象外の件数, 'failed': 失敗した件数}
+    """
+    try:
+        summary = ImageVariantService().process_s3_event(event)
+    except Exception as e:
+        logger.error(f"Failed to process image variants: {str(e)}")
+        raise
+
+    if summary['failed']:
+        # S3の非同期呼び出しの再試行に任せる（生成済みの派生画像は上書きされるだけ）
+        raise RuntimeError(f"{summary['failed']}件の画像の派生画像を生成できませんでした")
+    return summary
@@ -1,24 +1,16 @@
 """
 管理者リポジトリ
 """
-import boto3
 from boto3.dynamodb.conditions import Key
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from config.settings import settings
+from utils.dynamodb_client import dynamodb
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# DynamoDB接続設定（ローカル開発環境対応）
-dynamodb_config = {'region_name': settings.AWS_REGION}
-if settings.DYNAMODB_ENDPOINT_URL:
-    dynamodb_config['endpoint_url'] = settings.DYNAMODB_ENDPOINT_URL
-    logger.info(f"Using DynamoDB endpoint: {settings.DYNAMODB_ENDPOINT_URL}")
-
-dynamodb = boto3.resource('dynamodb', **dynamodb_config)
-
 
 class AdminRepository:
     """管理者のDynamoDBリポジトリ"""
@@ -0,0 +1,222 @@
+"""
+コラム件数集計リポジトリ
+ステータス別・カテゴリ別・ステータス×カテゴリ別のコラム件数をカウンターとして保持する
+
+テーブル構造（article-counters）:
+    - counterKey='all':                          全件数
+    - counterKey='status#<status>':              ステータス別件数
+    - counterKey='category#<category>':          カテゴリ別件数
+    - counterKey='statusCategory#<status>#<category>': ステータス×カテゴリ別件数
+    各アイテムのitemCountをADDで増減する
+
+作成時はコラム本体と同じTransactWriteItemsで増減し（transact_items）、
+更新・削除時は変更前の値が書き込み後にしか分からないため、書き込み後に並列で増減する（apply）。
+applyで失敗した増減はログとメトリクス（ArticleCounterFailures）に記録し、
+scripts/reconcile_article_counts.pyで修復する。
+"""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from config.settings import settings
+from utils.dynamodb_batch import batch_write
+from utils.dynamodb_client import dynamodb
+from utils.logger import get_logger
+from utils.metrics import current_scope
+
+logger = get_logger(__name__)
+
+ALL_KEY = 'all'
+
+# applyで同時に更新するカウンターの最大数
+MAX_PARALLEL_UPDATES = 8
+
+
+def counter_key(status: Optional[str] = None, category: Optional[str] = None) -> str:
+    """
+    絞り込み条件に対応するカウンターのキーを生成
+
+    Args:
+        status: ステータス
+        category: カテゴリ
+
+    Returns:
+        カウンターのキー
+    """
+    if status and category:
+        return f"statusCategory#{status}#{category}"
+    if status:
+        return f"status#{status}"
+    if category:
+        return f"category#{category}"
+    return ALL_KEY
+
+
+def counter_keys(article: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    コラムが含まれるカウンターのキー一覧
+
+    Args:
+        article: コラム情報（status, categoryを参照）。Noneの場合は空リスト
+
+    Returns:
+        カウンターのキーのリスト
+    """
+    if article is None:
+        return []
+
+    status = article.get('status')
+    category = article.get('category')
+    keys = [ALL_KEY]
+    if status:
+        keys.append(counter_key(status=status))
+    if category:
+        keys.append(counter_key(category=category))
+    if status and category:
+        keys.append(counter_key(status, category))
+    return keys
+
+
+def counter_deltas(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    コラムの作成・更新・削除によるカウンターの増減
+
+    Args:
+        old: 変更前のコラム（作成時はNone）
+        new: 変更後のコラム（削除時はNone）
+
+    Returns:
+        {カウンターのキー: 増減}（増減が0のキーは含まない）
+    """
+    deltas: Counter = Counter(counter_keys(new))
+    deltas.subtract(counter_keys(old))
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+class ArticleCounterRepository:
+    """コラム件数カウンターのDynamoDBリポジトリ"""
+
+    def __init__(self):
+        self.table = dynamodb.Table(settings.ARTICLE_COUNTERS_TABLE_NAME)
+
+    def get_count(self, key: str) -> Optional[int]:
+        """
+        カウンターの値を取得
+
+        Args:
+            key: カウンターのキー
+
+        Returns:
+            件数。カウンターが存在しない場合は0、取得に失敗した場合はNone
+        """
+        try:
+            response = self.table.get_item(Key={'counterKey': key}, ProjectionExpression='itemCount')
+            return max(0, int(response.get('Item', {}).get('itemCount', 0)))
+        except Exception as e:
+            logger.error(f"Failed to get article count {key}: {str(e)}")
+            return None
+
+    @staticmethod
+    def transact_items(deltas: Dict[str, int]) -> List[Dict[str, Any]]:
+        """
+        カウンターの増減をTransactWriteItemsの要素として作成（コラム本体の書き込みと同じトランザクションで使用）
+
+        Args:
+            deltas: {カウンターのキー: 増減}
+
+        Returns:
+            TransactWriteItemsの要素のリスト
+        """
+        return [
+            {
+                'Update': {
+                    'TableName': settings.ARTICLE_COUNTERS_TABLE_NAME,
+                    'Key': {'counterKey': key},
+                    'UpdateExpression': 'ADD itemCount :delta',
+                    'ExpressionAttributeValues': {':delta': delta}
+                }
+            }
+            for key, delta in deltas.items() if delta
+        ]
+
+    def apply(self, deltas: Dict[str, int]) -> Dict[str, int]:
+        """
+        カウンターを並列に増減（ADDによるアトミックな更新）
+        失敗した増減はログとメトリクス（ArticleCounterFailures）に記録して続行する
+        （scripts/reconcile_article_counts.pyで修復可能）
+
+        Args:
+            deltas: {カウンターのキー: 増減}
+
+        Returns:
+            反映できなかった{カウンターのキー: 増減}
+        """
+        pending = [(key, delta) for key, delta in deltas.items() if delta]
+        if not pending:
+            return {}
+
+        def add(entry: Tuple[str, int]) -> bool:
+            key, delta = entry
+            try:
+                self.table.update_item(
+                    Key={'counterKey': key},
+                    UpdateExpression='ADD itemCount :delta',
+                    ExpressionAttributeValues={':delta': delta}
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Failed to update article count {key} by {delta}: {str(e)}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(len(pending), MAX_PARALLEL_UPDATES)) as executor:
+            results = list(executor.map(add, pending))
+
+        failed = {key: delta for (key, delta), ok in zip(pending, results) if not ok}
+        if failed:
+            logger.error(f"Article counts need reconciliation: {failed}")
+            scope = current_scope()
+            if scope is not None:
+                scope.add_metric('ArticleCounterFailures', len(failed))
+        return failed
+
+    def reconcile(self, articles: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+        """
+        実際のコラムから件数を数え直し、ずれているカウンターを修正する
+
+        Args:
+            articles: 全コラム（status, categoryを含む）
+
+        Returns:
+            {カウンターのキー: {'stored': 修正前の値, 'actual': 実際の件数}}（ずれていたもののみ）
+        """
+        actual: Counter = Counter()
+        for article in articles:
+            actual.update(counter_keys(article))
+        actual.setdefault(ALL_KEY, 0)
+
+        stored: Dict[str, int] = {}
+        scan_kwargs: Dict[str, Any] = {}
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            for item in response.get('Items', []):
+                stored[item['counterKey']] = int(item.get('itemCount', 0))
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        drift: Dict[str, Dict[str, int]] = {}
+        requests: List[Dict[str, Any]] = []
+        for key in sorted(set(actual) | set(stored)):
+            if stored.get(key, 0) == actual.get(key, 0):
+                continue
+            drift[key] = {'stored': stored.get(key, 0), 'actual': actual.get(key, 0)}
+            if actual.get(key, 0):
+                requests.append({'PutRequest': {'Item': {'counterKey': key, 'itemCount': actual[key]}}})
+            else:
+                requests.append({'DeleteRequest': {'Key': {'counterKey': key}}})
+
+        failed = batch_write(dynamodb.meta.client, self.table.name, requests)
+        if failed:
+            logger.error(f"Failed to fix {len(failed)} article counters")
+        logger.info(f"Article counts reconciled: {len(drift)} counters fixed")
+        return drift
@@ -1,24 +1,213 @@
 """
 コラム記事リポジトリ
 """
-import boto3
+from concurrent.futures import ThreadPoolExecutor
 from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from decimal import Decimal
 
+from admin.repositories.article_counter_repository import (
+    ArticleCounterRepository,
+    counter_deltas,
+    counter_key
+)
+from admin.repositories.article_search_repository import ArticleSearchRepository
+from admin.repositories.article_tag_repository import (
+    ArticleTagRepository,
+    build_sort_key,
+    sort_key_upper_bound,
+    validate_tags
+)
+from admin.repositories.id_sequence_repository import IdSequenceRepository
 from config.settings import settings
+from utils.dynamodb_batch import batch_get, batch_write
+from utils.dynamodb_client import dynamodb
 from utils.logger import get_logger
+from utils.parallel_scan import ParallelScan
+from utils.text_search import normalize_text, tokenize
 
 logger = get_logger(__name__)
 
-# DynamoDB接続設定（ローカル開発環境対応）
-dynamodb_config = {'region_name': settings.AWS_REGION}
-if settings.DYNAMODB_ENDPOINT_URL:
-    dynamodb_config['endpoint_url'] = settings.DYNAMODB_ENDPOINT_URL
-    logger.info(f"Using DynamoDB endpoint: {settings.DYNAMODB_ENDPOINT_URL}")
+# コラムIDのシーケンス名（id-sequences）
+ARTICLE_ID_SEQUENCE = 'articles'
 
-dynamodb = boto3.resource('dynamodb', **dynamodb_config)
+# 一覧で返す項目（本文contentは含めない。本文はget_by_id・get_manyでのみ取得する）
+# GSIはこれらの項目のみをINCLUDEで射影している（template.yaml）
+LIST_FIELDS = [
+    'articleId', 'title', 'category', 'status', 'tags', 'images', 'thumbnail', 'publishedAt',
+    'createdBy', 'updatedBy', 'createdAt', 'updatedAt'
+]
+# status・categoryのみで絞り込む一覧に使うGSI（settings.ARTICLE_LIST_INDEXES）
+# 移行前のStatusIndex・CategoryIndex（ALL）は*SummaryIndexの作成後に削除する（template.yamlのArticleIndexStage）
+LIST_INDEXES = {
+    'summary': {'status': 'StatusSummaryIndex', 'category': 'CategorySummaryIndex'},
+    'legacy': {'status': 'StatusIndex', 'category': 'CategoryIndex'},
+}
+# 絞り込みのない一覧に使うGSI（全コラムを1つのパーティションに入れ、listSortKeyの降順で読む）
+ARTICLE_LIST_INDEX = 'ArticleListIndex'
+# ArticleListIndexのパーティションキー（listPartition）の値
+LIST_PARTITION = 'articles'
+# 画像の項目（元画像のURL、派生画像のURL、一覧用のサムネイルのURL）
+IMAGE_FIELDS = ['imageUrl', 'imageVariants', 'thumbnail']
+
+# 候補ID経由の取得で残りの条件（matches_filters）の評価に必要な項目
+FILTER_FIELDS = ['status', 'category', 'tags', 'publishedAt']
+# 一括ステータス更新の同時実行数
+BULK_UPDATE_WORKERS = 8
+# TransactWriteItemsの1リクエストあたりの上限
+MAX_TRANSACTION_ITEMS = 100
+# 一括削除で削除前に読む項目（索引・件数カウンター・画像の後始末に使う）
+BULK_DELETE_FIELDS = ['articleId', 'status', 'category', 'tags', 'publishedAt', 'imageUrl', 'imageVariants']
+
+
+def _is_conditional_check_failed(error: ClientError) -> bool:
+    """条件付き書き込みの条件（存在確認など）を満たさなかったエラーか"""
+    return error.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
+
+
+def sort_newest_first(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """公開日時の新しい順に並べ替える（公開日時のないコラムは最後）。GSIのpublishedAt降順と同じ順序"""
+    items.sort(key=lambda x: x.get('publishedAt') or '', reverse=True)
+    return items
+
+
+def projection_params(fields: List[str]) -> Dict[str, Any]:
+    """ProjectionExpressionとExpressionAttributeNames（予約語対策でプレースホルダーを使う）"""
+    names = {f"#f{i}": field for i, field in enumerate(fields)}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names
+    }
+
+
+def build_status_category(status: Optional[str], category: Optional[str]) -> Optional[str]:
+    """
+    StatusCategoryIndexのパーティションキー（例: published#節約術）を生成
+
+    Args:
+        status: ステータス
+        category: カテゴリ
+
+    Returns:
+        statusCategoryの値。どちらかが未設定の場合はNone
+    """
+    if not status or not category:
+        return None
+    return f"{status}#{category}"
+
+
+def list_index_attributes(published_at: Optional[str], article_id: int) -> Dict[str, Any]:
+    """
+    ArticleListIndexのキー属性を生成
+    ソートキーはタグ隣接リストと同じpublishedAt#articleIdとし、公開日時が同じコラムの順序も一意にする
+
+    Args:
+        published_at: 公開日時（下書きはNone。ソートキーが'#'始まりになり一覧の最後に並ぶ）
+        article_id: コラムID
+
+    Returns:
+        {'listPartition': ..., 'listSortKey': ...}
+    """
+    return {'listPartition': LIST_PARTITION, 'listSortKey': build_sort_key(published_at, article_id)}
+
+
+class QueryPlan:
+    """コラム一覧取得の実行計画"""
+
+    def __init__(self):
+        self.index_name: Optional[str] = None
+        self.key_condition = None
+        self.key_attributes: List[str] = []
+        self.filter_expression = None
+        self.search: Optional[str] = None
+        # 候補IDを別テーブルから取得する場合の取得元（search: 全文検索インデックス, tags: タグ隣接リスト）
+        self.candidate_source: Optional[str] = None
+        self.filters: Dict[str, Any] = {}
+        self.fields: List[str] = list(LIST_FIELDS)
+        self.items_examined = 0
+        self.items_returned = 0
+
+    @property
+    def operation(self) -> str:
+        """search（全文検索インデックス）、merge（タグ隣接リスト）、query または scan"""
+        if self.candidate_source == 'search':
+            return 'search'
+        if self.candidate_source == 'tags':
+            return 'merge'
+        return 'query' if self.key_condition is not None else 'scan'
+
+    def to_request_params(self) -> Dict[str, Any]:
+        """query/scanに渡すパラメータを生成"""
+        params: Dict[str, Any] = {}
+        if self.index_name:
+            params['IndexName'] = self.index_name
+        if self.key_condition is not None:
+            params['KeyConditionExpression'] = self.key_condition
+            params['ScanIndexForward'] = False  # 新しい順
+        if self.filter_expression is not None:
+            params['FilterExpression'] = self.filter_expression
+        params.update(self.projection_params())
+        return params
+
+    def read_fields(self) -> List[str]:
+        """読み込む項目（返却する項目＋取得後の条件評価に必要な項目）"""
+        fields = list(self.fields)
+        extra = list(FILTER_FIELDS) if self.candidate_source else []
+        if self.search:
+            extra += ['title', 'content']
+        for field in extra:
+            if field not in fields:
+                fields.append(field)
+        return fields
+
+    def projection_params(self) -> Dict[str, Any]:
+        """読み込む項目のProjectionExpressionとExpressionAttributeNames"""
+        return projection_params(self.read_fields())
+
+    def trim(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """条件評価のためだけに読み込んだ項目を除く"""
+        return {key: value for key, value in item.items() if key in self.fields}
+
+    def matches_search(self, item: Dict[str, Any]) -> bool:
+        """キーワード検索条件に一致するか（NFKC正規化して大文字小文字・全角半角を区別しない）"""
+        if not self.search:
+            return True
+        return (
+            self.search in normalize_text(item.get('title')) or
+            self.search in normalize_text(item.get('content'))
+        )
+
+    def matches_filters(self, item: Dict[str, Any]) -> bool:
+        """候補ID経由（全文検索・タグ）で取得したアイテムに残りの条件を適用"""
+        filters = self.filters
+        if filters.get('status') and item.get('status') != filters['status']:
+            return False
+        if filters.get('category') and item.get('category') != filters['category']:
+            return False
+        if filters.get('tags'):
+            tags = [t.strip() for t in filters['tags'].split(',')]
+            if not any(tag in item.get('tags', []) for tag in tags):
+                return False
+        published_at = item.get('publishedAt') or ''
+        if filters.get('dateFrom') and published_at < filters['dateFrom']:
+            return False
+        if filters.get('dateTo') and published_at > filters['dateTo']:
+            return False
+        # bigramの一致だけでは連続した部分文字列とは限らないため最終確認する
+        return self.matches_search(item)
+
+    def describe(self) -> str:
+        """デバッグ用ヘッダーに出力する実行計画の要約"""
+        return (
+            f"index={self.index_name or 'table'}; "
+            f"operation={self.operation}; "
+            f"key={','.join(self.key_attributes) or '-'}; "
+            f"filter={'yes' if self.filter_expression is not None else 'no'}; "
+            f"search={'yes' if self.search else 'no'}; "
+            f"examined={self.items_examined}; "
+            f"returned={self.items_returned}"
+        )
 
 
 class ArticleRepository:
@@ -26,6 +215,10 @@ class ArticleRepository:
 
     def __init__(self):
         self.table = dynamodb.Table(settings.ARTICLES_TABLE_NAME)
+        self.search_index = ArticleSearchRepository()
+        self.tag_index = ArticleTagRepository(dynamodb.meta.client)
+        self.counters = ArticleCounterRepository()
+        self.id_sequence = IdSequenceRepository()
 
     def get_by_id(self, article_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -44,8 +237,252 @@ class ArticleRepository:
             logger.error(f"Failed to get article {article_id}: {str(e)}")
             return None
 
-    def list_articles(self, filters: Dict[str, Any], page: int = 1,
-                     limit: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+    def plan_query(self, filters: Dict[str, Any], fields: Optional[List[str]] = None) -> QueryPlan:
+        """
+        フィルター条件から最も安価なアクセスパスを選択する
+
+        優先順位:
+            1. status+category → StatusCategoryIndex
+            2. tags → タグ隣接リスト（タグごとのqueryをpublishedAtでマージ）
+            3. status → StatusSummaryIndex（移行中はStatusIndex）
+            4. category → CategorySummaryIndex（移行中はCategoryIndex）
+            5. 上記がない場合はArticleListIndex（移行中はテーブルをスキャン）
+        dateFrom/dateToはGSI・タグ隣接リスト利用時はソートキーのKeyConditionとして、
+        スキャン時はFilterExpressionとして評価する。
+        キーワード検索は全文検索インデックス（BM25順）を使い、残りの条件は取得後に評価する。
+        bigramを作れない1文字の検索語のみ、従来どおり取得後にPythonで部分一致を評価する。
+        GSIは本文を射影していないため、この場合はGSIを使わずテーブルから読み込む。
+
+        Args:
+            filters: フィルター条件
+            fields: 返却する項目（省略時はLIST_FIELDS）
+
+        Returns:
+            実行計画
+        """
+        plan = QueryPlan()
+        if fields:
+            plan.fields = list(fields)
+        conditions = []
+
+        # キーワード検索（全文検索インデックス）
+        if filters.get('search') and tokenize(filters['search']):
+            plan.index_name = 'ArticleSearchIndex'
+            plan.candidate_source = 'search'
+            plan.search = normalize_text(filters['search'])
+            plan.filters = filters
+            return plan
+
+        tags = [t.strip() for t in (filters.get('tags') or '').split(',') if t.strip()]
+        # 1文字の検索語は本文で評価するため、本文を持たないGSIは使わない
+        use_gsi = not filters.get('search')
+
+        # パーティションキーの選択
+        if use_gsi and filters.get('status') and filters.get('category'):
+            plan.index_name = 'StatusCategoryIndex'
+            plan.key_condition = Key('statusCategory').eq(
+                build_status_category(filters['status'], filters['category'])
+            )
+            plan.key_attributes.append('statusCategory')
+        elif tags:
+            # タグ隣接リスト（status/category/searchは取得後に評価）
+            plan.index_name = 'ArticleTags'
+            plan.candidate_source = 'tags'
+            plan.key_attributes.append('tag')
+            if filters.get('dateFrom') or filters.get('dateTo'):
+                plan.key_attributes.append('publishedAt')
+            plan.filters = filters
+            if filters.get('search'):
+                plan.search = normalize_text(filters['search'])
+            return plan
+        elif use_gsi and filters.get('status'):
+            plan.index_name = LIST_INDEXES[settings.ARTICLE_LIST_INDEXES]['status']
+            plan.key_condition = Key('status').eq(filters['status'])
+            plan.key_attributes.append('status')
+        elif use_gsi and filters.get('category'):
+            plan.index_name = LIST_INDEXES[settings.ARTICLE_LIST_INDEXES]['category']
+            plan.key_condition = Key('category').eq(filters['category'])
+            plan.key_attributes.append('category')
+        elif use_gsi and settings.USE_ARTICLE_LIST_INDEX:
+            plan.index_name = ARTICLE_LIST_INDEX
+            plan.key_condition = Key('listPartition').eq(LIST_PARTITION)
+            plan.key_attributes.append('listPartition')
+
+        # 日付範囲（GSIのソートキーに押し下げる）
+        date_from = filters.get('dateFrom')
+        date_to = filters.get('dateTo')
+        if date_from or date_to:
+            if plan.key_condition is not None:
+                if plan.index_name == ARTICLE_LIST_INDEX:
+                    # listSortKeyはpublishedAt#articleIdのため、終了日当日の全コラムを含む上限にする
+                    sort_key = Key('listSortKey')
+                    upper_bound = sort_key_upper_bound(date_to) if date_to else None
+                    plan.key_attributes.append('listSortKey')
+                else:
+                    sort_key = Key('publishedAt')
+                    upper_bound = date_to
+                    plan.key_attributes.append('publishedAt')
+                if date_from and date_to:
+                    date_condition = sort_key.between(date_from, upper_bound)
+                elif date_from:
+                    date_condition = sort_key.gte(date_from)
+                else:
+                    date_condition = sort_key.lte(upper_bound)
+                plan.key_condition = plan.key_condition & date_condition
+            else:
+                if date_from:
+                    conditions.append(Attr('publishedAt').gte(date_from))
+                if date_to:
+                    conditions.append(Attr('publishedAt').lte(date_to))
+
+        if not use_gsi:
+            if filters.get('status'):
+                conditions.append(Attr('status').eq(filters['status']))
+            if filters.get('category'):
+                conditions.append(Attr('category').eq(filters['category']))
+
+        # タグフィルター（いずれかのタグを含む）
+        if tags:
+            tag_condition = Attr('tags').contains(tags[0])
+            for tag in tags[1:]:
+                tag_condition = tag_condition | Attr('tags').contains(tag)
+            conditions.append(tag_condition)
+
+        if conditions:
+            expression = conditions[0]
+            for condition in conditions[1:]:
+                expression = expression & condition
+            plan.filter_expression = expression
+
+        # キーワード検索
+        if filters.get('search'):
+            plan.search = normalize_text(filters['search'])
+        plan.filters = filters
+
+        if plan.operation == 'scan':
+            logger.info(f"Article list falls back to scan: {plan.describe()}")
+
+        return plan
+
+    def _execute(self, plan: QueryPlan, **kwargs) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        実行計画に従ってquery/scanを1回実行する
+
+        Args:
+            plan: 実行計画
+            **kwargs: Limit, ExclusiveStartKeyなどの追加パラメータ
+
+        Returns:
+            (残余条件で絞り込んだアイテム, LastEvaluatedKey)
+        """
+        params = plan.to_request_params()
+        params.update(kwargs)
+
+        if plan.operation == 'query':
+            response = self.table.query(**params)
+        else:
+            response = self.table.scan(**params)
+
+        items = response.get('Items', [])
+        plan.items_examined += response.get('ScannedCount', len(items))
+
+        if plan.search:
+            items = [item for item in items if plan.matches_search(item)]
+        items = [plan.trim(item) for item in items]
+        plan.items_returned += len(items)
+
+        return items, response.get('LastEvaluatedKey')
+
+    def _scan_all(self, plan: QueryPlan) -> List[Dict[str, Any]]:
+        """
+        テーブル全体を並列スキャンし、残余条件で絞り込む
+
+        Args:
+            plan: 実行計画（operationがscanのもの）
+
+        Returns:
+            条件に一致したアイテム（順序不定）
+        """
+        scan = ParallelScan(self.table, **plan.to_request_params())
+        items = [plan.trim(item) for item in scan if plan.matches_search(item)]
+        plan.items_examined += scan.scanned_count
+        plan.items_returned += len(items)
+        return items
+
+    def _candidate_ids(self, plan: QueryPlan) -> List[int]:
+        """
+        候補のコラムIDを表示順に取得
+
+        Returns:
+            全文検索の場合はBM25スコア順、タグの場合は公開日時の新しい順のコラムID
+        """
+        if plan.candidate_source == 'tags':
+            tags = [t.strip() for t in plan.filters['tags'].split(',')]
+            rows, rows_read = self.tag_index.find_articles(
+                tags, plan.filters.get('dateFrom'), plan.filters.get('dateTo')
+            )
+            plan.items_examined += rows_read
+            return [article_id for _, article_id in rows]
+
+        ranked = self.search_index.search(plan.filters['search']) or []
+        return [article_id for article_id, _ in ranked]
+
+    def _fetch_candidates(self, plan: QueryPlan, article_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        候補のコラムを取得し、残りの条件で絞り込む（候補の順序を維持）
+
+        Args:
+            plan: 実行計画
+            article_ids: 表示順のコラムID
+
+        Returns:
+            条件に一致したコラムのリスト
+        """
+        found = self.get_many(article_ids, plan.read_fields())
+        plan.items_examined += len(found)
+
+        items = [plan.trim(found[article_id]) for article_id in article_ids
+                 if article_id in found and plan.matches_filters(found[article_id])]
+        plan.items_returned += len(items)
+        return items
+
+    def get_many(
+        self,
+        article_ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        複数のコラムをBatchGetItemでまとめて取得（100件ずつ、UnprocessedKeysは再送）
+
+        Args:
+            article_ids: コラムIDのリスト
+            fields: 読み込む項目（省略時は全項目）
+
+        Returns:
+            {コラムID: コラム情報}。存在しないコラムは含まない
+
+        Raises:
+            RuntimeError: 再送回数の上限に達しても読み込めないキーが残った場合
+        """
+        article_ids = list(dict.fromkeys(int(i) for i in article_ids))
+        items, unprocessed = batch_get(
+            dynamodb,
+            settings.ARTICLES_TABLE_NAME,
+            [{'articleId': i} for i in article_ids],
+            projection_params(fields) if fields else None
+        )
+        if unprocessed:
+            raise RuntimeError(f"{len(unprocessed)}件のコラムを読み込めませんでした")
+
+        return {int(item['articleId']): item for item in items}
+
+    def list_articles(
+        self,
+        filters: Dict[str, Any],
+        page: int = 1,
+        limit: int = 20,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[QueryPlan]]:
         """
         コラム一覧を取得（フィルター対応）
 
@@ -59,77 +496,39 @@ class ArticleRepository:
                 - dateTo: 公開日の終了日
             page: ページ番号
             limit: 1ページあたりの件数
+            fields: 返却する項目（省略時はLIST_FIELDS。本文contentは含まない）
 
         Returns:
-            (コラムリスト, 総件数)
+            (コラムリスト, 総件数, 実行計画)。取得に失敗した場合は([], 0, None)
         """
         try:
-            items = []
+            plan = self.plan_query(filters, fields)
 
-            # ステータスでフィルター（GSI-1を使用）
-            if filters.get('status'):
-                response = self.table.query(
-                    IndexName='StatusIndex',
-                    KeyConditionExpression=Key('status').eq(filters['status']),
-                    ScanIndexForward=False  # 新しい順
-                )
-                items = response.get('Items', [])
-            # カテゴリでフィルター（GSI-2を使用）
-            elif filters.get('category'):
-                response = self.table.query(
-                    IndexName='CategoryIndex',
-                    KeyConditionExpression=Key('category').eq(filters['category']),
-                    ScanIndexForward=False  # 新しい順
-                )
-                items = response.get('Items', [])
-            else:
-                # フィルターなしの場合はスキャン
-                response = self.table.scan()
-                items = response.get('Items', [])
+            # status/categoryのみの絞り込みは件数カウンターから総件数を取得し、表示するページまでしか読まない
+            total = self._count_if_covered(filters, plan)
+            if total is not None:
+                start = (page - 1) * limit
+                return self._read_first(plan, start + limit)[start:start + limit], total, plan
 
-                # ページネーション対応
-                while 'LastEvaluatedKey' in response:
-                    response = self.table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-                    items.extend(response.get('Items', []))
+            # 全文検索（BM25スコア順）・タグ（公開日時順）
+            if plan.candidate_source:
+                hits = self._fetch_candidates(plan, self._candidate_ids(plan))
+                start = (page - 1) * limit
+                return hits[start:start + limit], len(hits), plan
 
-            # 追加フィルター
-            filtered_items = items
+            if plan.operation == 'scan':
+                # 全件走査はセグメントに分割して並列に読み込む
+                filtered_items = self._scan_all(plan)
+            else:
+                filtered_items, last_key = self._execute(plan)
 
-            # キーワード検索
-            if filters.get('search'):
-                search = filters['search'].lower()
-                filtered_items = [
-                    item for item in filtered_items
-                    if search in item.get('title', '').lower() or
-                       search in item.get('content', '').lower()
-                ]
-
-            # タグフィルター
-            if filters.get('tags'):
-                tags = [t.strip() for t in filters['tags'].split(',')]
-                filtered_items = [
-                    item for item in filtered_items
-                    if any(tag in item.get('tags', []) for tag in tags)
-                ]
-
-            # 日付範囲フィルター
-            if filters.get('dateFrom'):
-                filtered_items = [
-                    item for item in filtered_items
-                    if item.get('publishedAt', '') >= filters['dateFrom']
-                ]
-
-            if filters.get('dateTo'):
-                filtered_items = [
-                    item for item in filtered_items
-                    if item.get('publishedAt', '') <= filters['dateTo']
-                ]
+                # ページネーション対応
+                while last_key:
+                    items, last_key = self._execute(plan, ExclusiveStartKey=last_key)
+                    filtered_items.extend(items)
 
             # ソート（publishedAtで新しい順）
-            filtered_items.sort(
-                key=lambda x: x.get('publishedAt', ''),
-                reverse=True
-            )
+            sort_newest_first(filtered_items)
 
             # ページネーション
             total = len(filtered_items)
@@ -137,11 +536,232 @@ class ArticleRepository:
             end = start + limit
             paginated_items = filtered_items[start:end]
 
-            return paginated_items, total
+            return paginated_items, total, plan
 
         except Exception as e:
             logger.error(f"Failed to list articles: {str(e)}")
-            return [], 0
+            return [], 0, None
+
+    def _count_if_covered(self, filters: Dict[str, Any], plan: QueryPlan) -> Optional[int]:
+        """
+        絞り込み条件が件数カウンターで表せる場合に総件数を取得
+
+        Returns:
+            総件数。カウンターで表せない条件を含む場合や取得に失敗した場合はNone
+        """
+        if plan.operation != 'query' or plan.filter_expression is not None or plan.search:
+            return None
+        if any(filters.get(key) for key in ('search', 'tags', 'dateFrom', 'dateTo')):
+            return None
+        return self.counters.get_count(counter_key(filters.get('status'), filters.get('category')))
+
+    def _read_first(self, plan: QueryPlan, count: int) -> List[Dict[str, Any]]:
+        """
+        実行計画の先頭から指定件数まで読み込む（GSIのpublishedAt降順）
+
+        Args:
+            plan: 実行計画
+            count: 読み込む件数
+
+        Returns:
+            先頭からcount件までのアイテム
+        """
+        items: List[Dict[str, Any]] = []
+        last_key = None
+        while len(items) < count:
+            params: Dict[str, Any] = {'Limit': count - len(items)}
+            if last_key:
+                params['ExclusiveStartKey'] = last_key
+            page_items, last_key = self._execute(plan, **params)
+            items.extend(page_items)
+            if not last_key:
+                break
+        return items
+
+    def list_articles_page(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 20,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], QueryPlan]:
+        """
+        コラム一覧をカーソル方式で取得
+        どのアクセスパスも前ページの最後の位置から読み始め、1ページ分（＋絞り込みで除外された分）だけ読み込む
+
+            - GSI: LastEvaluatedKeyをそのままカーソルにする
+            - タグ: 最後に返したタグ行のソートキー（publishedAt#articleId）
+            - 全文検索: 最後に返したコラムの(スコア, コラムID)
+            - 1文字の検索語: キーのみを読むGSIのLastEvaluatedKey（本文はページ分だけget_manyで読む）
+        ArticleListIndexの移行中（USE_ARTICLE_LIST_INDEX=false）のスキャンは、
+        並べ替えずにテーブルの格納順でLastEvaluatedKeyを返す。
+
+        Args:
+            filters: フィルター条件（list_articlesと同じ）
+            limit: 1ページあたりの件数
+            exclusive_start_key: 前ページのカーソル（このメソッドが返したもの）
+            fields: 返却する項目（省略時はLIST_FIELDS。本文contentは含まない）
+
+        Returns:
+            (コラムリスト, 次ページのカーソル, 実行計画)。最終ページの場合カーソルはNone
+        """
+        try:
+            plan = self.plan_query(filters, fields)
+
+            if plan.candidate_source == 'tags':
+                return (*self._tag_page(plan, limit, exclusive_start_key), plan)
+            if plan.candidate_source == 'search':
+                return (*self._search_page(plan, limit, exclusive_start_key), plan)
+            if plan.operation == 'scan' and plan.search:
+                key_plan = self.plan_query({**filters, 'search': None}, ['articleId'])
+                if key_plan.operation == 'query':
+                    return (*self._key_index_page(plan, key_plan, limit, exclusive_start_key), plan)
+
+            items: List[Dict[str, Any]] = []
+            last_key = exclusive_start_key
+
+            # Limitは評価件数の上限のため、絞り込みで除外された分だけ追加で読み込む
+            while True:
+                params: Dict[str, Any] = {'Limit': limit - len(items)}
+                if last_key:
+                    params['ExclusiveStartKey'] = last_key
+
+                page_items, last_key = self._execute(plan, **params)
+                items.extend(page_items)
+
+                if not last_key or len(items) >= limit:
+                    break
+
+            return items, last_key, plan
+
+        except Exception as e:
+            logger.error(f"Failed to list articles page: {str(e)}")
+            raise
+
+    def _key_index_page(
+        self,
+        plan: QueryPlan,
+        key_plan: QueryPlan,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        1文字の検索語の一覧を1ページ分取得
+        GSIからコラムIDのみを公開日時の新しい順に読み、本文の部分一致はページ分のコラムだけで評価する
+
+        Args:
+            plan: 返却する一覧の実行計画（検索語を含む）
+            key_plan: 検索語以外の条件で選んだGSIの実行計画（articleIdのみを読む）
+            limit: 1ページあたりの件数
+            exclusive_start_key: 前ページのkey_planのLastEvaluatedKey
+        """
+        items: List[Dict[str, Any]] = []
+        last_key = exclusive_start_key
+        while len(items) < limit:
+            params: Dict[str, Any] = {'Limit': limit - len(items)}
+            if last_key:
+                params['ExclusiveStartKey'] = last_key
+            keys, last_key = self._execute(key_plan, **params)
+
+            article_ids = [int(key['articleId']) for key in keys]
+            found = self.get_many(article_ids, plan.read_fields())
+            plan.items_examined += len(found)
+            items.extend(plan.trim(found[article_id]) for article_id in article_ids
+                         if article_id in found and plan.matches_search(found[article_id]))
+            if not last_key:
+                break
+
+        plan.items_examined += key_plan.items_examined
+        plan.items_returned += len(items)
+        return items, last_key
+
+    def _tag_page(
+        self,
+        plan: QueryPlan,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        タグ隣接リストから1ページ分取得
+        各タグを前ページの最後のソートキーより古い行からlimit行ずつ読み、絞り込みで除外された分だけ追加で読み込む
+        """
+        tags = [t.strip() for t in plan.filters['tags'].split(',')]
+        before = (exclusive_start_key or {}).get('sortKey')
+
+        items: List[Dict[str, Any]] = []
+        while len(items) < limit:
+            count = limit - len(items)
+            rows, rows_read = self.tag_index.find_articles(
+                tags, plan.filters.get('dateFrom'), plan.filters.get('dateTo'), before=before, limit=count
+            )
+            plan.items_examined += rows_read
+            if rows:
+                items.extend(self._fetch_candidates(plan, [article_id for _, article_id in rows]))
+                before = rows[-1][0]
+            if len(rows) < count:
+                return items, None
+
+        return items, {'sortKey': before}
+
+    def _search_page(
+        self,
+        plan: QueryPlan,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        全文検索インデックスから1ページ分取得
+        BM25順（スコア降順、同点はコラムIDの降順）で前ページの最後のコラムより後ろから読み込む
+        （順位付けには検索語のポスティングが必要なため、ランキング自体は毎ページ計算する）
+        """
+        ranked = self.search_index.search(plan.filters['search']) or []
+        if exclusive_start_key:
+            last = (float(exclusive_start_key['score']), int(exclusive_start_key['articleId']))
+            ranked = [(article_id, score) for article_id, score in ranked if (score, article_id) < last]
+
+        items: List[Dict[str, Any]] = []
+        position = 0
+        while position < len(ranked) and len(items) < limit:
+            chunk = ranked[position:position + limit - len(items)]
+            items.extend(self._fetch_candidates(plan, [article_id for article_id, _ in chunk]))
+            position += len(chunk)
+
+        if position >= len(ranked):
+            return items, None
+        article_id, score = ranked[position - 1]
+        return items, {'score': score, 'articleId': article_id}
+
+    def _sync_search_index(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        """
+        全文検索インデックスに変更を反映（SEARCH_INDEX_TRIGGER=requestの場合のみ）
+        streamの場合はarticlesテーブルのDynamoDB Streamsで起動するワーカーが反映する。
+        requestの場合もインデックス更新の失敗で記事の保存自体は失敗させない（再構築スクリプトで復旧可能）
+        """
+        if settings.SEARCH_INDEX_TRIGGER != 'request':
+            return
+        try:
+            self.search_index.apply_article_change(old, new)
+        except Exception as e:
+            logger.error(f"Failed to update search index for article {(new or old or {}).get('articleId')}: {str(e)}")
+
+    def _remove_from_tag_index(self, article: Dict[str, Any]) -> None:
+        """タグ隣接リストから削除されたコラムの行を削除"""
+        try:
+            self.tag_index.remove_article(int(article['articleId']), article.get('tags'), article.get('publishedAt'))
+        except Exception as e:
+            logger.error(f"Failed to remove article {article.get('articleId')} from tag index: {str(e)}")
+
+    def reserve_ids(self, count: int) -> range:
+        """
+        コラムIDをまとめて確保（一括登録では1回の呼び出しで件数分を確保する）
+
+        Args:
+            count: 確保する件数
+
+        Returns:
+            確保したIDの範囲
+        """
+        return self.id_sequence.allocate(ARTICLE_ID_SEQUENCE, count)
 
     def create(self, article_data: Dict[str, Any], admin_id: str) -> Dict[str, Any]:
         """
@@ -155,13 +775,8 @@ class ArticleRepository:
             作成されたコラム情報
         """
         try:
-            # 新しいIDを生成（既存の最大ID + 1）
-            response = self.table.scan(
-                ProjectionExpression='articleId'
-            )
-            items = response.get('Items', [])
-            max_id = max([int(item['articleId']) for item in items], default=0)
-            new_id = max_id + 1
+            # 新しいIDをアトミックカウンターから払い出す
+            new_id = self.reserve_ids(1)[0]
 
             now = datetime.utcnow().isoformat() + 'Z'
 
@@ -179,8 +794,29 @@ class ArticleRepository:
                 'createdAt': now,
                 'updatedAt': now
             }
+            for field in IMAGE_FIELDS:
+                if field in article_data:
+                    item[field] = article_data[field]
+
+            status_category = build_status_category(item['status'], item['category'])
+            if status_category:
+                item['statusCategory'] = status_category
+            item.update(list_index_attributes(item['publishedAt'], new_id))
 
-            self.table.put_item(Item=item)
+            # タグ行と件数カウンターはコラム本体と同じトランザクションで書き込む
+            # （払い出し済みIDの上書きを防ぐ条件はシーケンス未初期化時の安全策）
+            dynamodb.meta.client.transact_write_items(TransactItems=[
+                {
+                    'Put': {
+                        'TableName': settings.ARTICLES_TABLE_NAME,
+                        'Item': item,
+                        'ConditionExpression': 'attribute_not_exists(articleId)'
+                    }
+                },
+                *self.tag_index.transact_items(new_id, [], None, item['tags'], item['publishedAt']),
+                *self.counters.transact_items(counter_deltas(None, item))
+            ])
+            self._sync_search_index(None, item)
 
             logger.info(f"Article created successfully: {new_id}")
             return item
@@ -202,11 +838,31 @@ class ArticleRepository:
         Returns:
             更新されたコラム情報。見つからない場合はNone
         """
+        result = self.update_returning_old(article_id, article_data, admin_id)
+        return result[0] if result else None
+
+    def update_returning_old(self, article_id: int, article_data: Dict[str, Any],
+                             admin_id: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        既存のコラムを更新し、更新前の値も返す
+        存在確認は条件付き書き込み（attribute_exists）で行い、更新前の値はReturnValues=ALL_OLDで受け取る（事前の読み込みなし）
+        更新前の値が必要な派生データ（片方のみ変わるstatusCategory・タグ行）は、
+        受け取った更新前の値から算出して続けて書き込む（_update_derived）
+
+        Args:
+            article_id: コラムID
+            article_data: 更新するコラムデータ
+            admin_id: 更新者の管理者ID
+
+        Returns:
+            (更新後のコラム情報, 更新前のコラム情報)。見つからない場合はNone
+
+        Raises:
+            ValueError: タグ数が上限を超える場合（コラムは更新しない）
+        """
         try:
-            # 既存のアイテムを確認
-            existing = self.get_by_id(article_id)
-            if not existing:
-                return None
+            if 'tags' in article_data:
+                validate_tags(article_data['tags'])
 
             now = datetime.utcnow().isoformat() + 'Z'
 
@@ -215,7 +871,7 @@ class ArticleRepository:
             expression_values = {}
             expression_names = {}
 
-            fields = ['title', 'content', 'category', 'status', 'images', 'tags', 'publishedAt']
+            fields = ['title', 'content', 'category', 'status', 'images', 'tags', 'publishedAt'] + IMAGE_FIELDS
 
             for field in fields:
                 if field in article_data:
@@ -223,27 +879,137 @@ class ArticleRepository:
                     expression_values[f":{field}"] = article_data[field]
                     expression_names[f"#{field}"] = field
 
+            # ステータスとカテゴリが両方変わる場合は複合キーも同じ書き込みで更新
+            if 'status' in article_data and 'category' in article_data:
+                status_category = build_status_category(article_data['status'], article_data['category'])
+                if status_category:
+                    update_expression += "#statusCategory = :statusCategory, "
+                    expression_values[":statusCategory"] = status_category
+                    expression_names["#statusCategory"] = "statusCategory"
+
+            # 公開日時が変わる場合はArticleListIndexのソートキーも更新
+            if 'publishedAt' in article_data:
+                for name, value in list_index_attributes(article_data['publishedAt'], article_id).items():
+                    update_expression += f"#{name} = :{name}, "
+                    expression_values[f":{name}"] = value
+                    expression_names[f"#{name}"] = name
+
             update_expression += "#updatedBy = :updatedBy, #updatedAt = :updatedAt"
             expression_values[":updatedBy"] = admin_id
             expression_values[":updatedAt"] = now
             expression_names["#updatedBy"] = "updatedBy"
             expression_names["#updatedAt"] = "updatedAt"
 
-            response = self.table.update_item(
-                Key={'articleId': article_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values,
-                ExpressionAttributeNames=expression_names,
-                ReturnValues='ALL_NEW'
-            )
+            try:
+                response = self.table.update_item(
+                    Key={'articleId': article_id},
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeValues=expression_values,
+                    ExpressionAttributeNames=expression_names,
+                    ConditionExpression='attribute_exists(articleId)',
+                    ReturnValues='ALL_OLD'
+                )
+            except ClientError as e:
+                if _is_conditional_check_failed(e):
+                    return None
+                raise
+            old = response.get('Attributes') or {}
+
+            # 更新後の値は更新前の値と変更内容から組み立てる（追加の読み込みは不要）
+            updated = {**old, **{name: expression_values[f":{name}"] for name in expression_names.values()}}
+            self._update_derived(article_id, article_data, old, updated)
+
+            if 'title' in article_data or 'content' in article_data:
+                self._sync_search_index(old, updated)
+            if 'status' in article_data or 'category' in article_data:
+                self.counters.apply(counter_deltas(old, updated))
 
             logger.info(f"Article updated successfully: {article_id}")
-            return response.get('Attributes')
+            return updated, old
 
         except Exception as e:
             logger.error(f"Failed to update article {article_id}: {str(e)}")
             raise
 
+    def _update_derived(
+        self,
+        article_id: int,
+        article_data: Dict[str, Any],
+        old: Dict[str, Any],
+        updated: Dict[str, Any]
+    ) -> None:
+        """
+        更新前の値から算出する派生データを書き込む
+            - status/categoryの片方のみの変更: statusCategory（もう片方は更新前の値）
+            - tags/publishedAtの変更: タグ行の差分（コラムの条件確認と同じトランザクション）
+        算出に使った値（status・category・tags・publishedAt）が変わっていない場合のみ書き込む条件を付ける。
+        条件を満たさない場合は後続の更新が同じ派生データを書き込むため、何もしない。
+        書き込みに失敗した場合はコラムの更新自体は失敗させない
+        （scripts/backfill_status_category.py・scripts/backfill_article_tags.pyで復旧可能）
+
+        Args:
+            article_id: コラムID
+            article_data: 更新したコラムデータ
+            old: 更新前のコラム情報（ALL_OLD）
+            updated: 更新後のコラム情報（statusCategoryを書き込む場合は設定する）
+        """
+        update_expression = None
+        conditions: List[str] = []
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+
+        if ('status' in article_data) != ('category' in article_data):
+            status_category = build_status_category(updated.get('status'), updated.get('category'))
+            if status_category:
+                update_expression = "SET #statusCategory = :statusCategory"
+                conditions.append("#status = :status AND #category = :category")
+                names.update({'#statusCategory': 'statusCategory', '#status': 'status', '#category': 'category'})
+                values.update({
+                    ':statusCategory': status_category,
+                    ':status': updated.get('status'),
+                    ':category': updated.get('category')
+                })
+                updated['statusCategory'] = status_category
+
+        tag_items: List[Dict[str, Any]] = []
+        if 'tags' in article_data or 'publishedAt' in article_data:
+            tag_items = self.tag_index.transact_items(
+                article_id, old.get('tags'), old.get('publishedAt'), updated.get('tags'), updated.get('publishedAt')
+            )
+            if tag_items:
+                conditions.append("#tags = :tags AND #publishedAt = :publishedAt")
+                names.update({'#tags': 'tags', '#publishedAt': 'publishedAt'})
+                values.update({':tags': updated.get('tags'), ':publishedAt': updated.get('publishedAt')})
+
+        if not conditions:
+            return
+
+        article_request: Dict[str, Any] = {
+            'TableName': settings.ARTICLES_TABLE_NAME,
+            'Key': {'articleId': article_id},
+            'ConditionExpression': ' AND '.join(conditions),
+            'ExpressionAttributeNames': names,
+            'ExpressionAttributeValues': values
+        }
+        try:
+            if tag_items:
+                if update_expression:
+                    article_item = {'Update': {**article_request, 'UpdateExpression': update_expression}}
+                else:
+                    article_item = {'ConditionCheck': article_request}
+                dynamodb.meta.client.transact_write_items(TransactItems=[article_item, *tag_items])
+            else:
+                request = {key: value for key, value in article_request.items() if key != 'TableName'}
+                self.table.update_item(UpdateExpression=update_expression, **request)
+        except ClientError as e:
+            reasons = e.response.get('CancellationReasons') or [{}]
+            if _is_conditional_check_failed(e) or reasons[0].get('Code') == 'ConditionalCheckFailed':
+                logger.info(f"Derived attributes of article {article_id} were superseded by a later update")
+                return
+            logger.error(f"Failed to update derived attributes of article {article_id}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to update derived attributes of article {article_id}: {str(e)}")
+
     def delete(self, article_id: int) -> bool:
         """
         コラムを削除
@@ -255,79 +1021,247 @@ class ArticleRepository:
             削除に成功した場合True
         """
         try:
-            self.table.delete_item(Key={'articleId': article_id})
-            logger.info(f"Article deleted successfully: {article_id}")
-            return True
+            return self.delete_returning_old(article_id) is not None
         except Exception as e:
             logger.error(f"Failed to delete article {article_id}: {str(e)}")
             return False
 
-    def bulk_update_status(self, article_ids: List[int], status: str, admin_id: str) -> int:
+    def delete_returning_old(self, article_id: int) -> Optional[Dict[str, Any]]:
+        """
+        コラムを削除し、削除前の値を返す
+        存在確認は条件付き削除（attribute_exists）で行うため、事前の読み込みは不要
+
+        Args:
+            article_id: コラムID
+
+        Returns:
+            削除前のコラム情報。見つからない場合はNone
+        """
+        try:
+            response = self.table.delete_item(
+                Key={'articleId': article_id},
+                ConditionExpression='attribute_exists(articleId)',
+                ReturnValues='ALL_OLD'
+            )
+        except ClientError as e:
+            if _is_conditional_check_failed(e):
+                logger.warning(f"Article not found: {article_id}")
+                return None
+            raise
+
+        old = response.get('Attributes') or {'articleId': article_id}
+        self._sync_search_index(old, None)
+        if old.get('tags'):
+            self._remove_from_tag_index(old)
+        self.counters.apply(counter_deltas(old, None))
+        logger.info(f"Article deleted successfully: {article_id}")
+        return old
+
+    def bulk_update_status(
+        self,
+        article_ids: List[int],
+        status: str,
+        admin_id: str,
+        atomic: bool = False
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
         """
         複数のコラムのステータスを一括更新
+        変更前のステータス・カテゴリをBatchGetItemでまとめて読み、条件付きupdate_itemを並列に実行する
+        atomic=Trueの場合はTransactWriteItemsで全件を1つのトランザクションとして更新する
 
         Args:
             article_ids: コラムIDのリスト
             status: 新しいステータス
             admin_id: 更新者の管理者ID
+            atomic: 全件成功か全件失敗か（all-or-nothing）で更新するか
 
         Returns:
-            更新された件数
+            (更新したコラムの更新前の値 {コラムID: コラム情報}, 更新できなかったコラム {コラムID: 理由})
+
+        Raises:
+            ValueError: atomic=Trueで件数がトランザクションの上限を超える場合
         """
+        article_ids = list(dict.fromkeys(int(i) for i in article_ids))
+        if atomic and len(article_ids) > MAX_TRANSACTION_ITEMS:
+            raise ValueError(f"一括更新（all-or-nothing）は{MAX_TRANSACTION_ITEMS}件までです")
+
         try:
-            now = datetime.utcnow().isoformat() + 'Z'
-            updated_count = 0
+            # 複合キー（statusCategory）と件数カウンターの算出に変更前のステータス・カテゴリが必要
+            existing = self.get_many(article_ids, ['articleId', 'category', 'status'])
+        except Exception as e:
+            logger.error(f"Failed to read articles for bulk update: {str(e)}")
+            return {}, {article_id: 'error' for article_id in article_ids}
+
+        failed: Dict[int, str] = {i: 'not_found' for i in article_ids if i not in existing}
+        now = datetime.utcnow().isoformat() + 'Z'
+        requests = {
+            article_id: self._status_update_request(article_id, existing[article_id], status, admin_id, now)
+            for article_id in article_ids if article_id in existing
+        }
 
-            for article_id in article_ids:
+        if atomic:
+            failed.update(self._transact_status_updates(requests))
+        else:
+            def update(item: Tuple[int, Dict[str, Any]]) -> Tuple[int, Optional[str]]:
+                article_id, request = item
                 try:
-                    self.table.update_item(
-                        Key={'articleId': article_id},
-                        UpdateExpression="SET #status = :status, #updatedBy = :updatedBy, #updatedAt = :updatedAt",
-                        ExpressionAttributeNames={
-                            '#status': 'status',
-                            '#updatedBy': 'updatedBy',
-                            '#updatedAt': 'updatedAt'
-                        },
-                        ExpressionAttributeValues={
-                            ':status': status,
-                            ':updatedBy': admin_id,
-                            ':updatedAt': now
-                        }
-                    )
-                    updated_count += 1
+                    dynamodb.meta.client.update_item(**request)
+                    return article_id, None
+                except ClientError as e:
+                    # 読み込み後に削除・カテゴリ変更された場合
+                    if _is_conditional_check_failed(e):
+                        return article_id, 'conflict'
+                    logger.error(f"Failed to update article {article_id}: {str(e)}")
+                    return article_id, 'error'
                 except Exception as e:
                     logger.error(f"Failed to update article {article_id}: {str(e)}")
+                    return article_id, 'error'
+
+            if requests:
+                workers = min(len(requests), BULK_UPDATE_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for article_id, reason in executor.map(update, requests.items()):
+                        if reason:
+                            failed[article_id] = reason
+
+        updated: Dict[int, Dict[str, Any]] = {}
+        deltas: Dict[str, int] = {}
+        for article_id in requests:
+            if article_id in failed:
+                continue
+            old = existing[article_id]
+            updated[article_id] = old
+            for key, delta in counter_deltas(old, {**old, 'status': status}).items():
+                deltas[key] = deltas.get(key, 0) + delta
+
+        self.counters.apply(deltas)
+        logger.info(f"Bulk updated {len(updated)} articles ({len(failed)} failed)")
+        return updated, failed
+
+    @staticmethod
+    def _status_update_request(
+        article_id: int,
+        existing: Dict[str, Any],
+        status: str,
+        admin_id: str,
+        now: str
+    ) -> Dict[str, Any]:
+        """
+        ステータス更新のUpdateItemパラメータ
+        読み込んだカテゴリから変わっていないことを条件にする（statusCategoryの整合性のため）
+        """
+        names = {
+            '#status': 'status',
+            '#statusCategory': 'statusCategory',
+            '#category': 'category',
+            '#updatedBy': 'updatedBy',
+            '#updatedAt': 'updatedAt'
+        }
+        values: Dict[str, Any] = {':status': status, ':updatedBy': admin_id, ':updatedAt': now}
+        update_expression = "SET #status = :status, #updatedBy = :updatedBy, #updatedAt = :updatedAt"
+
+        category = existing.get('category')
+        if category is None:
+            condition = 'attribute_exists(articleId) AND attribute_not_exists(#category)'
+        else:
+            condition = 'attribute_exists(articleId) AND #category = :category'
+            values[':category'] = category
 
-            logger.info(f"Bulk updated {updated_count} articles")
-            return updated_count
+        status_category = build_status_category(status, category)
+        if status_category:
+            update_expression += ", #statusCategory = :statusCategory"
+            values[':statusCategory'] = status_category
+        else:
+            del names['#statusCategory']
 
+        return {
+            'TableName': settings.ARTICLES_TABLE_NAME,
+            'Key': {'articleId': article_id},
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition,
+            'ExpressionAttributeNames': names,
+            'ExpressionAttributeValues': values
+        }
+
+    def _transact_status_updates(self, requests: Dict[int, Dict[str, Any]]) -> Dict[int, str]:
+        """
+        ステータス更新を1つのトランザクションで実行
+
+        Returns:
+            更新できなかったコラム {コラムID: 理由}（失敗時は全件）
+        """
+        if not requests:
+            return {}
+
+        try:
+            dynamodb.meta.client.transact_write_items(
+                TransactItems=[{'Update': request} for request in requests.values()]
+            )
+            return {}
+        except ClientError as e:
+            reasons = e.response.get('CancellationReasons') or []
+            failed: Dict[int, str] = {}
+            for index, article_id in enumerate(requests):
+                code = reasons[index].get('Code') if index < len(reasons) else None
+                # 取り消しの原因になったコラム以外は 'aborted'
+                failed[article_id] = 'conflict' if code == 'ConditionalCheckFailed' else 'aborted'
+            logger.error(f"Bulk status transaction cancelled: {str(e)}")
+            return failed
         except Exception as e:
-            logger.error(f"Failed to bulk update articles: {str(e)}")
-            return 0
+            logger.error(f"Bulk status transaction failed: {str(e)}")
+            return {article_id: 'error' for article_id in requests}
 
-    def bulk_delete(self, article_ids: List[int]) -> int:
+    def bulk_delete(self, article_ids: List[int]) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
         """
         複数のコラムを一括削除
+        削除前の値をBatchGetItemでまとめて読み、BatchWriteItem（25件ずつ・複数チャンク並列）で削除する
 
         Args:
             article_ids: コラムIDのリスト
 
         Returns:
-            削除された件数
+            (削除したコラムの削除前の値 {コラムID: コラム情報}, 削除できなかったコラム {コラムID: 理由})
         """
+        article_ids = list(dict.fromkeys(int(i) for i in article_ids))
+        deleted: Dict[int, Dict[str, Any]] = {}
+        failed: Dict[int, str] = {}
+
         try:
-            deleted_count = 0
+            # BatchWriteItemはReturnValuesを返さないため、索引・件数・画像の後始末に使う値を先に読む
+            fields = list(BULK_DELETE_FIELDS)
+            if settings.SEARCH_INDEX_TRIGGER == 'request':
+                # 全文検索インデックスの差分計算に削除前の本文が必要
+                fields += ['title', 'content']
+            existing = self.get_many(article_ids, fields)
+        except Exception as e:
+            logger.error(f"Failed to read articles for bulk delete: {str(e)}")
+            return {}, {article_id: 'error' for article_id in article_ids}
 
-            for article_id in article_ids:
-                try:
-                    self.table.delete_item(Key={'articleId': article_id})
-                    deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete article {article_id}: {str(e)}")
+        for article_id in article_ids:
+            if article_id not in existing:
+                failed[article_id] = 'not_found'
 
-            logger.info(f"Bulk deleted {deleted_count} articles")
-            return deleted_count
+        requests = [{'DeleteRequest': {'Key': {'articleId': i}}} for i in article_ids if i in existing]
+        unprocessed = batch_write(dynamodb.meta.client, settings.ARTICLES_TABLE_NAME, requests)
+        for request in unprocessed:
+            failed[int(request['DeleteRequest']['Key']['articleId'])] = 'error'
 
-        except Exception as e:
-            logger.error(f"Failed to bulk delete articles: {str(e)}")
-            return 0
+        deltas: Dict[str, int] = {}
+        for article_id, old in existing.items():
+            if article_id in failed:
+                continue
+            deleted[article_id] = old
+            for key, delta in counter_deltas(old, None).items():
+                deltas[key] = deltas.get(key, 0) + delta
+
+        if deleted:
+            for old in deleted.values():
+                self._sync_search_index(old, None)
+            try:
+                self.tag_index.remove_articles([old for old in deleted.values() if old.get('tags')])
+            except Exception as e:
+                logger.error(f"Failed to remove articles from tag index: {str(e)}")
+            self.counters.apply(deltas)
+
+        logger.info(f"Bulk deleted {len(deleted)} articles ({len(failed)} failed)")
+        return deleted, failed
@@ -0,0 +1,176 @@
+"""
+コラム全文検索インデックスリポジトリ
+bigramの転置インデックス（ポスティング）をDynamoDBに保持する
+
+テーブル構造（article-search-index）:
+    - term=<bigram>, articleId=<ID>: ポスティング（tf: 出現回数）
+    - term='#doc',   articleId=<ID>: 文書長（len。BM25の正規化に使う）
+    - term='#stats', articleId=0:    全体統計（docCount, totalLength）
+更新・削除時の差分は変更前後のテキスト（DynamoDB Streamsの変更前後のイメージ）から計算するため、
+文書ごとのトークン一覧は保持しない
+"""
+from boto3.dynamodb.conditions import Key
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from config.settings import settings
+from utils.dynamodb_batch import batch_get, batch_write
+from utils.dynamodb_client import dynamodb
+from utils.logger import get_logger
+from utils.text_search import tokenize, term_frequencies, bm25_score
+
+logger = get_logger(__name__)
+
+DOC_TERM = '#doc'
+STATS_TERM = '#stats'
+
+
+def article_search_text(article: Optional[Dict[str, Any]]) -> Optional[str]:
+    """検索対象のテキスト（タイトル＋本文）。コラムがない場合（作成前・削除後）はNone"""
+    if article is None:
+        return None
+    return f"{article.get('title') or ''}\n{article.get('content') or ''}"
+
+
+class ArticleSearchRepository:
+    """コラム全文検索インデックスのDynamoDBリポジトリ"""
+
+    def __init__(self):
+        self.table = dynamodb.Table(settings.ARTICLE_SEARCH_TABLE_NAME)
+
+    def apply_article_change(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        """
+        コラムの変更をインデックスに反映
+
+        Args:
+            old: 変更前のコラム（作成の場合None。title・contentを含むこと）
+            new: 変更後のコラム（削除の場合None。title・contentを含むこと）
+        """
+        article = new if new is not None else old
+        if article is None:
+            return
+        self.apply_change(int(article['articleId']), article_search_text(old), article_search_text(new))
+
+    def apply_change(self, article_id: int, old_text: Optional[str], new_text: Optional[str]) -> None:
+        """
+        変更前後のテキストの差分をインデックスに反映
+        追加・削除されたトークンと出現回数が変わったトークンのポスティングのみを書き込む
+
+        Args:
+            article_id: コラムID
+            old_text: 変更前のテキスト（未登録の場合None）
+            new_text: 変更後のテキスト（削除する場合None）
+        """
+        if old_text == new_text:
+            return
+
+        old_frequencies = term_frequencies(old_text) if old_text is not None else {}
+        new_frequencies = term_frequencies(new_text) if new_text is not None else {}
+        old_length = sum(old_frequencies.values())
+        new_length = sum(new_frequencies.values())
+
+        requests: List[Dict[str, Any]] = [
+            {'DeleteRequest': {'Key': {'term': term, 'articleId': article_id}}}
+            for term in old_frequencies.keys() - new_frequencies.keys()
+        ]
+        requests.extend(
+            {'PutRequest': {'Item': {'term': term, 'articleId': article_id, 'tf': tf}}}
+            for term, tf in new_frequencies.items() if old_frequencies.get(term) != tf
+        )
+        if new_text is None:
+            requests.append({'DeleteRequest': {'Key': {'term': DOC_TERM, 'articleId': article_id}}})
+        elif old_text is None or new_length != old_length:
+            requests.append({'PutRequest': {'Item': {'term': DOC_TERM, 'articleId': article_id, 'len': new_length}}})
+
+        # 書き込めなかった場合は統計を更新せずに失敗させる（ストリームの再試行で同じ差分を書き直す）
+        failed = batch_write(dynamodb.meta.client, self.table.name, requests)
+        if failed:
+            raise RuntimeError(f"Failed to write {len(failed)} search index items for article {article_id}")
+
+        doc_delta = int(new_text is not None) - int(old_text is not None)
+        if doc_delta or new_length != old_length:
+            self._update_stats(doc_delta, new_length - old_length)
+        logger.info(f"Search index updated: {article_id} ({len(new_frequencies)} terms)")
+
+    def search(self, query: str) -> Optional[List[Tuple[int, float]]]:
+        """
+        キーワードに一致するコラムをBM25スコア順に取得
+        クエリの全bigramを含むコラムのみを返す（AND検索）
+
+        Args:
+            query: 検索キーワード
+
+        Returns:
+            [(コラムID, スコア)]のスコア降順リスト。
+            クエリからbigramが作れない場合（1文字など）はNone
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return None
+
+        stats = self.table.get_item(Key={'term': STATS_TERM, 'articleId': 0}).get('Item') or {}
+        doc_count = int(stats.get('docCount', 0))
+        avg_doc_length = int(stats.get('totalLength', 0)) / doc_count if doc_count else 0
+
+        # 全トークンを含む文書に絞り込んでから、その文書長だけを読み込む
+        term_postings: List[Dict[int, int]] = []
+        candidates: Optional[set] = None
+        for term in terms:
+            postings = self._get_postings(term)
+            term_postings.append(postings)
+            candidates = set(postings) if candidates is None else candidates & postings.keys()
+            if not candidates:
+                return []
+
+        doc_lengths = self._get_doc_lengths(candidates)
+        scores = {
+            article_id: sum(
+                bm25_score(postings[article_id], len(postings), doc_lengths.get(article_id, 0), avg_doc_length, doc_count)
+                for postings in term_postings
+            )
+            for article_id in candidates
+        }
+        return sorted(scores.items(), key=lambda x: (-x[1], -x[0]))
+
+    def _get_postings(self, term: str) -> Dict[int, int]:
+        """
+        トークンのポスティングリストを取得
+
+        Returns:
+            {コラムID: tf}
+        """
+        postings: Dict[int, int] = {}
+        params: Dict[str, Any] = {'KeyConditionExpression': Key('term').eq(term)}
+
+        while True:
+            response = self.table.query(**params)
+            for item in response.get('Items', []):
+                postings[int(item['articleId'])] = int(item['tf'])
+
+            if 'LastEvaluatedKey' not in response:
+                return postings
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def _get_doc_lengths(self, article_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        文書長をBatchGetItemでまとめて取得
+
+        Returns:
+            {コラムID: 文書長}。読み込めなかった文書は含まない
+        """
+        docs, unprocessed = batch_get(
+            dynamodb.meta.client,
+            self.table.name,
+            [{'term': DOC_TERM, 'articleId': article_id} for article_id in article_ids],
+            {'ProjectionExpression': 'articleId, #len', 'ExpressionAttributeNames': {'#len': 'len'}}
+        )
+        if unprocessed:
+            logger.warning(f"Failed to read {len(unprocessed)} document lengths from search index")
+        return {int(doc['articleId']): int(doc.get('len', 0)) for doc in docs}
+
+    def _update_stats(self, doc_delta: int, length_delta: int) -> None:
+        """全体統計（文書数・総トークン数）を更新"""
+        self.table.update_item(
+            Key={'term': STATS_TERM, 'articleId': 0},
+            UpdateExpression="ADD docCount :docs, totalLength :length",
+            ExpressionAttributeValues={':docs': doc_delta, ':length': length_delta}
+        )
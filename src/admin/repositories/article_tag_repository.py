@@ -0,0 +1,246 @@
+"""
+コラムタグ隣接リストリポジトリ
+タグ → コラムの対応をDynamoDBに保持し、タグ絞り込みをタグ付き記事数に比例するコストで処理する
+
+テーブル構造（article-tags）:
+    - tag=<タグ>, sortKey=<publishedAt>#<articleId(10桁ゼロ埋め)>, articleId=<ID>
+"""
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+
+from config.settings import settings
+from utils.dynamodb_batch import batch_write
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+KEY_SEPARATOR = '#'
+# ソートキーの上限（'#' + 数字のIDより大きい文字）
+KEY_UPPER_BOUND = '~'
+# 1つのコラムに付けられるタグの上限（TransactWriteItemsの100件制限内に収める）
+MAX_TAGS_PER_ARTICLE = 40
+# タグごとの並列query数の上限
+MAX_PARALLEL_QUERIES = 8
+
+
+def build_sort_key(published_at: Optional[str], article_id: int) -> str:
+    """ソートキー（publishedAt#articleId）を生成"""
+    return f"{published_at or ''}{KEY_SEPARATOR}{int(article_id):010d}"
+
+
+def sort_key_upper_bound(date_to: str) -> str:
+    """終了日当日の行をすべて含むソートキーの上限"""
+    return f"{date_to}{KEY_SEPARATOR}{KEY_UPPER_BOUND}"
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """空文字と重複を除いたタグのリスト（順序維持）"""
+    result: List[str] = []
+    for tag in tags or []:
+        tag = (tag or '').strip()
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
+def validate_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """
+    タグ数を検証し、正規化したタグのリストを返す
+
+    Raises:
+        ValueError: タグ数が上限を超える場合
+    """
+    tags = normalize_tags(tags)
+    if len(tags) > MAX_TAGS_PER_ARTICLE:
+        raise ValueError(f"タグは{MAX_TAGS_PER_ARTICLE}個までです")
+    return tags
+
+
+class ArticleTagRepository:
+    """コラムタグ隣接リストのDynamoDBリポジトリ"""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: DynamoDBリソースのクライアント（dynamodb.meta.client）
+                スレッドセーフなため並列queryに使用する。値はリソースと同様にPythonの型のまま扱える
+        """
+        self.client = client
+        self.table_name = settings.ARTICLE_TAGS_TABLE_NAME
+
+    def transact_items(
+        self,
+        article_id: int,
+        old_tags: Optional[Iterable[str]],
+        old_published_at: Optional[str],
+        new_tags: Optional[Iterable[str]],
+        new_published_at: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        タグ変更をTransactWriteItems用の操作リストに変換
+
+        Args:
+            article_id: コラムID
+            old_tags: 変更前のタグ
+            old_published_at: 変更前の公開日時
+            new_tags: 変更後のタグ
+            new_published_at: 変更後の公開日時
+
+        Returns:
+            TransactItemsに追加するPut/Deleteのリスト
+
+        Raises:
+            ValueError: タグ数が上限を超える場合
+        """
+        new_tags = validate_tags(new_tags)
+
+        old_keys = {(tag, build_sort_key(old_published_at, article_id)) for tag in normalize_tags(old_tags)}
+        new_keys = {(tag, build_sort_key(new_published_at, article_id)) for tag in new_tags}
+
+        items: List[Dict[str, Any]] = []
+        for tag, sort_key in sorted(old_keys - new_keys):
+            items.append({
+                'Delete': {
+                    'TableName': self.table_name,
+                    'Key': {'tag': tag, 'sortKey': sort_key}
+                }
+            })
+        for tag, sort_key in sorted(new_keys - old_keys):
+            items.append({
+                'Put': {
+                    'TableName': self.table_name,
+                    'Item': {'tag': tag, 'sortKey': sort_key, 'articleId': int(article_id)}
+                }
+            })
+        return items
+
+    def remove_article(self, article_id: int, tags: Optional[Iterable[str]], published_at: Optional[str]) -> None:
+        """
+        削除されたコラムのタグ行を削除
+
+        Args:
+            article_id: コラムID
+            tags: コラムのタグ
+            published_at: コラムの公開日時
+        """
+        self.remove_articles([{'articleId': article_id, 'tags': tags, 'publishedAt': published_at}])
+
+    def remove_articles(self, articles: Iterable[Dict[str, Any]]) -> int:
+        """
+        削除された複数のコラムのタグ行をまとめて削除
+
+        Args:
+            articles: 削除前のコラム（articleId, tags, publishedAt）
+
+        Returns:
+            削除できなかった行数
+        """
+        requests = [
+            {'DeleteRequest': {'Key': {'tag': tag, 'sortKey': build_sort_key(article.get('publishedAt'), article['articleId'])}}}
+            for article in articles
+            for tag in normalize_tags(article.get('tags'))
+        ]
+        failed = batch_write(self.client, self.table_name, requests)
+        if failed:
+            logger.error(f"Failed to remove {len(failed)} tag rows")
+        return len(failed)
+
+    def find_articles(
+        self,
+        tags: Iterable[str],
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Tuple[str, int]], int]:
+        """
+        いずれかのタグを持つコラムを公開日時の新しい順に取得（OR検索）
+        タグごとのqueryを並列に実行し、ソートキー（publishedAt#articleId）でk-wayマージする
+
+        Args:
+            tags: タグのリスト
+            date_from: 公開日の開始日
+            date_to: 公開日の終了日
+            before: このソートキーより古い行のみを取得する（カーソルの続きから読む場合）
+            limit: 取得するコラム数の上限（各タグも先頭からlimit行までしか読まない）
+
+        Returns:
+            ([(ソートキー, コラムID)]のリスト（重複なし、新しい順）, 読み込んだタグ行数)
+            limitより少ない場合は最後まで読み込んでいる
+        """
+        tags = normalize_tags(tags)
+        if not tags or limit == 0:
+            return [], 0
+
+        with ThreadPoolExecutor(max_workers=min(len(tags), MAX_PARALLEL_QUERIES)) as executor:
+            results = list(executor.map(
+                lambda tag: self._query_tag(tag, date_from, date_to, before, limit), tags
+            ))
+
+        rows: List[Tuple[str, int]] = []
+        seen = set()
+        for sort_key, article_id in heapq.merge(*results, reverse=True):
+            if article_id in seen:
+                continue
+            seen.add(article_id)
+            rows.append((sort_key, article_id))
+            if limit and len(rows) >= limit:
+                break
+        return rows, sum(len(result) for result in results)
+
+    def _query_tag(
+        self,
+        tag: str,
+        date_from: Optional[str],
+        date_to: Optional[str],
+        before: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        1つのタグの行を新しい順に取得
+
+        Returns:
+            [(sortKey, コラムID)]のソートキー降順リスト（最大limit行）
+        """
+        key_condition = '#tag = :tag'
+        values: Dict[str, Any] = {':tag': tag}
+        upper_bound = sort_key_upper_bound(date_to) if date_to else None
+        if before and (upper_bound is None or before <= upper_bound):
+            upper_bound = before
+
+        # publishedAtはソートキーの先頭なので日付範囲とカーソル位置をKeyConditionに押し下げる
+        # （BETWEENは両端を含むため、カーソル位置の行は読み込んだ後に除く）
+        if date_from and upper_bound:
+            key_condition += ' AND #sortKey BETWEEN :from AND :to'
+            values[':from'] = date_from
+            values[':to'] = upper_bound
+        elif date_from:
+            key_condition += ' AND #sortKey >= :from'
+            values[':from'] = date_from
+        elif upper_bound:
+            key_condition += ' AND #sortKey <= :to'
+            values[':to'] = upper_bound
+
+        params: Dict[str, Any] = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeNames': {'#tag': 'tag', '#sortKey': 'sortKey'},
+            'ExpressionAttributeValues': values,
+            'ProjectionExpression': '#sortKey, articleId',
+            'ScanIndexForward': False
+        }
+
+        rows: List[Tuple[str, int]] = []
+        while True:
+            if limit:
+                # カーソル位置の行を除く分を1行多く読む
+                params['Limit'] = limit - len(rows) + (1 if before else 0)
+            response = self.client.query(**params)
+            for item in response.get('Items', []):
+                if item['sortKey'] != before:
+                    rows.append((item['sortKey'], int(item['articleId'])))
+
+            if 'LastEvaluatedKey' not in response or (limit and len(rows) >= limit):
+                return rows[:limit] if limit else rows
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
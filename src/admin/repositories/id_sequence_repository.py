@@ -0,0 +1,74 @@
+"""
+ID採番リポジトリ
+テーブルごとの連番IDをアトミックカウンター（UpdateItem ADD）で払い出す
+
+テーブル構造（id-sequences）:
+    - sequenceName=<テーブル名など>, lastId=<払い出し済みの最大ID>
+"""
+from botocore.exceptions import ClientError
+
+from config.settings import settings
+from utils.dynamodb_client import dynamodb
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class IdSequenceRepository:
+    """連番IDのDynamoDBリポジトリ"""
+
+    def __init__(self):
+        self.table = dynamodb.Table(settings.ID_SEQUENCES_TABLE_NAME)
+
+    def allocate(self, name: str, count: int = 1) -> range:
+        """
+        連番IDをまとめて払い出す
+        1回のUpdateItemで払い出すため、同時に呼び出されても重複しない
+
+        Args:
+            name: シーケンス名
+            count: 払い出す件数（一括登録時はまとめて確保する）
+
+        Returns:
+            払い出したIDの範囲
+
+        Raises:
+            ValueError: countが1未満の場合
+        """
+        if count < 1:
+            raise ValueError("countは1以上を指定してください")
+
+        response = self.table.update_item(
+            Key={'sequenceName': name},
+            UpdateExpression='ADD lastId :count',
+            ExpressionAttributeValues={':count': count},
+            ReturnValues='UPDATED_NEW'
+        )
+        last_id = int(response['Attributes']['lastId'])
+        return range(last_id - count + 1, last_id + 1)
+
+    def ensure_at_least(self, name: str, value: int) -> bool:
+        """
+        シーケンスを既存データの最大ID以上に進める（導入時の初期化用）
+        既にvalue以上の場合は何もしない
+
+        Args:
+            name: シーケンス名
+            value: 払い出し済みとみなす最大ID
+
+        Returns:
+            シーケンスを進めた場合True
+        """
+        try:
+            self.table.update_item(
+                Key={'sequenceName': name},
+                UpdateExpression='SET lastId = :value',
+                ConditionExpression='attribute_not_exists(lastId) OR lastId < :value',
+                ExpressionAttributeValues={':value': value}
+            )
+            logger.info(f"Sequence {name} advanced to {value}")
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
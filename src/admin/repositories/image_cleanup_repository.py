@@ -0,0 +1,236 @@
+"""
+画像削除キューリポジトリ
+不要になったS3画像を記録し、バックグラウンドのワーカー（ImageCleanupService）でまとめて削除する
+
+テーブル構造（image-cleanup-queue）:
+    - imageKey=<S3オブジェクトのキー>, imageUrl=<画像URL>, enqueuedAt, attempts
+    - queueStatus: pending（削除待ち）/ dead（再試行の上限に達した）
+    - nextAttemptAt: 次に削除を試みる日時（deadのアイテムには持たせない）
+    - lastError: 直前の削除エラー
+    - expiresAt: deadのアイテムをTTLで消す日時（UNIX秒）
+    同じ画像を何度登録しても1アイテムにまとまる（冪等）
+
+GSI（DueIndex）: queueStatus（PK）+ nextAttemptAt（SK）
+    削除を試みる時刻になったアイテムをテーブル全体をスキャンせずに古い順に読む
+    deadのアイテムはnextAttemptAtを持たないためインデックスに入らない
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Iterable
+
+from config.settings import settings
+from utils.dynamodb_batch import batch_write
+from utils.dynamodb_client import dynamodb
+from utils.logger import get_logger
+from utils.s3 import image_key_from_url
+
+logger = get_logger(__name__)
+
+# 削除待ちのアイテムを時刻順に読むGSI
+DUE_INDEX = 'DueIndex'
+PENDING = 'pending'
+DEAD = 'dead'
+# 再試行の上限に達したアイテムを調査用に残す期間（過ぎるとTTLで消える）
+DEAD_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def _queue_items(image_urls: Iterable[Optional[str]], delay_seconds: int = 0) -> Dict[str, Dict[str, Any]]:
+    """画像URLをキューのアイテム {imageKey: アイテム} に変換（バケット外のURLは除く）"""
+    now = _now()
+    next_attempt_at = now
+    if delay_seconds:
+        next_attempt_at = (datetime.utcnow() + timedelta(seconds=delay_seconds)).isoformat() + 'Z'
+    items: Dict[str, Dict[str, Any]] = {}
+    for image_url in image_urls:
+        if not image_url:
+            continue
+        key = image_key_from_url(image_url)
+        if not key:
+            logger.warning(f"Image URL does not match bucket: {image_url}")
+            continue
+        items[key] = {
+            'imageKey': key,
+            'imageUrl': image_url,
+            'queueStatus': PENDING,
+            'enqueuedAt': now,
+            'nextAttemptAt': next_attempt_at,
+            'attempts': 0
+        }
+    return items
+
+
+class ImageCleanupRepository:
+    """画像削除キューのDynamoDBリポジトリ"""
+
+    def __init__(self):
+        self.table = dynamodb.Table(settings.IMAGE_CLEANUP_TABLE_NAME)
+
+    def enqueue(self, image_urls: Iterable[Optional[str]], delay_seconds: int = 0) -> int:
+        """
+        削除する画像をキューに登録
+
+        Args:
+            image_urls: 画像URL（Noneは無視する）
+            delay_seconds: 削除を試みるまでの秒数（その間に参照された画像は削除しない）
+
+        Returns:
+            登録した件数
+
+        Raises:
+            Exception: 登録できなかった画像がある場合
+        """
+        items = _queue_items(image_urls, delay_seconds)
+        if not items:
+            return 0
+
+        failed = batch_write(
+            self.table.meta.client,
+            self.table.name,
+            [{'PutRequest': {'Item': item}} for item in items.values()]
+        )
+        if failed:
+            raise RuntimeError(f"{len(failed)}件の画像を削除キューに登録できませんでした")
+
+        logger.info(f"Images queued for deletion: {len(items)}")
+        return len(items)
+
+    def receive(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        削除を試みる時刻になったアイテムを古い順に取得（DueIndexをquery。読むのは返すアイテムのみ）
+
+        Args:
+            limit: 取得する最大件数
+
+        Returns:
+            キューのアイテムのリスト（GSIの射影: キーとimageUrl・attempts）
+        """
+        params: Dict[str, Any] = {
+            'IndexName': DUE_INDEX,
+            'KeyConditionExpression': '#status = :pending AND #nextAttemptAt <= :now',
+            'ExpressionAttributeNames': {'#status': 'queueStatus', '#nextAttemptAt': 'nextAttemptAt'},
+            'ExpressionAttributeValues': {':pending': PENDING, ':now': _now()}
+        }
+        items: List[Dict[str, Any]] = []
+        while len(items) < limit:
+            params['Limit'] = limit - len(items)
+            response = self.table.query(**params)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return items[:limit]
+
+    def complete(self, image_keys: List[str]) -> None:
+        """
+        削除済みの画像をキューから除く
+
+        Args:
+            image_keys: S3オブジェクトのキー
+        """
+        failed = batch_write(
+            self.table.meta.client,
+            self.table.name,
+            [{'DeleteRequest': {'Key': {'imageKey': key}}} for key in image_keys]
+        )
+        if failed:
+            # 残ったアイテムは次回の実行で再度削除される（S3の削除は冪等）
+            logger.warning(f"Failed to remove {len(failed)} items from image cleanup queue")
+
+    def fail(self, image_key: str, error: str, retry_at: Optional[datetime]) -> None:
+        """
+        削除の失敗を記録
+
+        Args:
+            image_key: S3オブジェクトのキー
+            error: エラー内容
+            retry_at: 次に削除を試みる日時（Noneの場合は再試行しない）
+        """
+        if retry_at:
+            self.table.update_item(
+                Key={'imageKey': image_key},
+                UpdateExpression='SET lastError = :error, nextAttemptAt = :next ADD attempts :one',
+                ExpressionAttributeValues={
+                    ':error': error,
+                    ':next': retry_at.isoformat() + 'Z',
+                    ':one': 1
+                }
+            )
+        else:
+            # 削除待ちのインデックスから外し、調査用に残した後TTLで消す
+            self.table.update_item(
+                Key={'imageKey': image_key},
+                UpdateExpression=(
+                    'SET lastError = :error, queueStatus = :dead, expiresAt = :expires '
+                    'REMOVE nextAttemptAt ADD attempts :one'
+                ),
+                ExpressionAttributeValues={
+                    ':error': error,
+                    ':dead': DEAD,
+                    ':expires': int(time.time()) + DEAD_RETENTION_SECONDS,
+                    ':one': 1
+                }
+            )
+
+
+class InMemoryImageCleanupRepository:
+    """
+    画像削除キューのプロセス内実装（ローカル開発・テスト用）
+    ImageCleanupRepositoryと同じインターフェースを持つ
+    """
+
+    def __init__(self):
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, image_urls: Iterable[Optional[str]], delay_seconds: int = 0) -> int:
+        items = _queue_items(image_urls, delay_seconds)
+        with self._lock:
+            self.items.update(items)
+        return len(items)
+
+    def receive(self, limit: int) -> List[Dict[str, Any]]:
+        now = _now()
+        with self._lock:
+            ready = [dict(item) for item in self.items.values()
+                     if item.get('queueStatus') == PENDING and item['nextAttemptAt'] <= now]
+        return sorted(ready, key=lambda item: item['nextAttemptAt'])[:limit]
+
+    def complete(self, image_keys: List[str]) -> None:
+        with self._lock:
+            for key in image_keys:
+                self.items.pop(key, None)
+
+    def fail(self, image_key: str, error: str, retry_at: Optional[datetime]) -> None:
+        with self._lock:
+            item = self.items.get(image_key)
+            if not item:
+                return
+            item['attempts'] = int(item.get('attempts', 0)) + 1
+            item['lastError'] = error
+            if retry_at:
+                item['nextAttemptAt'] = retry_at.isoformat() + 'Z'
+            else:
+                item['queueStatus'] = DEAD
+                item['expiresAt'] = int(time.time()) + DEAD_RETENTION_SECONDS
+                item.pop('nextAttemptAt', None)
+
+
+_memory_queue: Optional[InMemoryImageCleanupRepository] = None
+
+
+def create_image_cleanup_queue():
+    """
+    設定（IMAGE_CLEANUP_QUEUE）に応じた画像削除キューを生成
+    'memory'の場合はプロセス内で共有するキューを返す
+    """
+    global _memory_queue
+    if settings.IMAGE_CLEANUP_QUEUE == 'memory':
+        if _memory_queue is None:
+            _memory_queue = InMemoryImageCleanupRepository()
+        return _memory_queue
+    return ImageCleanupRepository()
@@ -0,0 +1,264 @@
+"""
+画像参照カウントリポジトリ
+内容から決まるキー（{folder}/{SHA-256}.{拡張子}）で保存した画像を参照しているアイテムの数を保持し、
+最後の参照がなくなった画像のみを削除できるようにする
+
+テーブル構造（image-refs）:
+    - refKey=<画像のキー（拡張子なし）>, refCount=<参照数>, updatedAt
+    - deletingUntil=<削除中の期限（エポック秒）>（削除ワーカーが画像を削除している間のみ）
+    派生画像（variants/{folder}/{SHA-256}/...）は元画像と同じrefKeyで扱う
+    参照カウントのない画像（内容から決まるキーになる前の画像）は参照数0として扱う
+
+削除ワーカーとアップロードの競合:
+    ワーカーはDeleteObjectsの直前に参照数0を条件にdeletingUntilを設定し（claim_unreferenced）、
+    削除後に参照カウントを削除する（finish_removal）。削除中に参照を登録したアップロードは
+    削除が終わるまで待ち（acquire）、最初の参照として画像をアップロードし直す
+"""
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+from botocore.exceptions import ClientError
+
+from config.settings import settings
+from utils.dynamodb_client import dynamodb
+from utils.image_variants import is_variant_key
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 削除前の参照確認の同時実行数
+MAX_PARALLEL_CHECKS = 8
+# 削除ワーカーが画像を削除する期限（秒）。ワーカーが止まった場合もこの時間が過ぎれば参照を登録できる
+REMOVAL_LEASE_SECONDS = 60
+# 削除中の画像の参照を登録する場合の確認間隔（秒）
+REMOVAL_POLL_SECONDS = 0.2
+
+
+def image_ref_key(image_key: str) -> str:
+    """
+    画像のキーから参照カウントのキーを生成（元画像と派生画像で同じキーになる）
+
+    Args:
+        image_key: S3オブジェクトのキー
+
+    Returns:
+        参照カウントのキー（例: 'articles/<SHA-256>'）
+    """
+    if is_variant_key(image_key):
+        return posixpath.dirname(image_key).split('/', 1)[1]
+    return posixpath.splitext(image_key)[0]
+
+
+class ImageRefRepository:
+    """画像参照カウントのDynamoDBリポジトリ"""
+
+    def __init__(self):
+        self.table = dynamodb.Table(settings.IMAGE_REFS_TABLE_NAME)
+
+    def acquire(self, image_key: str) -> int:
+        """
+        画像の参照を1つ登録
+        削除ワーカーが画像を削除している場合は削除が終わるまで待つ
+
+        Args:
+            image_key: S3オブジェクトのキー
+
+        Returns:
+            登録後の参照数（1の場合は最初の参照。画像をアップロードし直す必要がある）
+        """
+        ref_key = image_ref_key(image_key)
+        response = self.table.update_item(
+            Key={'refKey': ref_key},
+            UpdateExpression='SET updatedAt = :now ADD refCount :one',
+            ExpressionAttributeValues={':now': datetime.utcnow().isoformat() + 'Z', ':one': 1},
+            ReturnValues='ALL_NEW'
+        )
+        attributes = response['Attributes']
+        if int(attributes.get('deletingUntil', 0)) > time.time():
+            self._wait_for_removal(ref_key)
+        return int(attributes['refCount'])
+
+    def _wait_for_removal(self, ref_key: str) -> None:
+        """削除ワーカーの削除が終わる（deletingUntilが消える、または期限を過ぎる）まで待つ"""
+        while True:
+            item = self.table.get_item(Key={'refKey': ref_key}, ConsistentRead=True).get('Item') or {}
+            if int(item.get('deletingUntil', 0)) <= time.time():
+                return
+            time.sleep(REMOVAL_POLL_SECONDS)
+
+    def release(self, image_key: str) -> int:
+        """
+        画像の参照を1つ解放
+
+        Args:
+            image_key: S3オブジェクトのキー
+
+        Returns:
+            解放後の参照数（0の場合は画像を削除してよい）
+        """
+        try:
+            response = self.table.update_item(
+                Key={'refKey': image_ref_key(image_key)},
+                UpdateExpression='SET updatedAt = :now ADD refCount :minus',
+                ConditionExpression='refCount > :zero',
+                ExpressionAttributeValues={
+                    ':now': datetime.utcnow().isoformat() + 'Z',
+                    ':minus': -1,
+                    ':zero': 0
+                },
+                ReturnValues='UPDATED_NEW'
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                # 参照カウントがない（または既に0の）画像
+                return 0
+            raise
+        return int(response['Attributes']['refCount'])
+
+    def claim_unreferenced(self, image_keys: Iterable[str]) -> Set[str]:
+        """
+        参照がなくなった画像を削除中にし、削除してよい画像のキーを返す
+        DeleteObjectsの直前に呼び出し、削除後にfinish_removalを呼び出す
+        削除キューに登録した後に同じ画像が再び参照された場合は削除しない
+
+        Args:
+            image_keys: 削除しようとしている画像のキー（派生画像を含む）
+
+        Returns:
+            削除してよい画像のキー
+        """
+        keys_by_ref = self._group_by_ref(image_keys)
+        if not keys_by_ref:
+            return set()
+
+        client = self.table.meta.client
+
+        def claim(ref_key: str) -> bool:
+            try:
+                client.update_item(
+                    TableName=self.table.name,
+                    Key={'refKey': ref_key},
+                    UpdateExpression='SET deletingUntil = :until',
+                    ConditionExpression='attribute_not_exists(refKey) OR refCount <= :zero',
+                    ExpressionAttributeValues={':until': int(time.time()) + REMOVAL_LEASE_SECONDS, ':zero': 0}
+                )
+                return True
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                    logger.error(f"Failed to check image references of {ref_key}: {str(e)}")
+                return False
+
+        ref_keys = list(keys_by_ref)
+        with ThreadPoolExecutor(max_workers=min(len(ref_keys), MAX_PARALLEL_CHECKS)) as executor:
+            claimed = list(executor.map(claim, ref_keys))
+
+        return {key for ref_key, ok in zip(ref_keys, claimed) if ok for key in keys_by_ref[ref_key]}
+
+    def finish_removal(self, image_keys: Iterable[str]) -> None:
+        """
+        削除を終えた画像の参照カウントを削除（削除中に参照された場合は削除中の印のみ外す）
+
+        Args:
+            image_keys: claim_unreferencedで削除中にした画像のキー
+        """
+        ref_keys = list(self._group_by_ref(image_keys))
+        if not ref_keys:
+            return
+
+        client = self.table.meta.client
+
+        def finish(ref_key: str) -> None:
+            try:
+                client.delete_item(
+                    TableName=self.table.name,
+                    Key={'refKey': ref_key},
+                    ConditionExpression='attribute_not_exists(refCount) OR refCount <= :zero',
+                    ExpressionAttributeValues={':zero': 0}
+                )
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+                    logger.error(f"Failed to finish removal of {ref_key}: {str(e)}")
+                    return
+                # 削除中に参照された（アップロードは削除の完了を待ってから画像をアップロードし直す）
+                client.update_item(
+                    TableName=self.table.name,
+                    Key={'refKey': ref_key},
+                    UpdateExpression='REMOVE deletingUntil'
+                )
+
+        with ThreadPoolExecutor(max_workers=min(len(ref_keys), MAX_PARALLEL_CHECKS)) as executor:
+            list(executor.map(finish, ref_keys))
+
+    @staticmethod
+    def _group_by_ref(image_keys: Iterable[str]) -> Dict[str, Set[str]]:
+        keys_by_ref: Dict[str, Set[str]] = {}
+        for image_key in image_keys:
+            keys_by_ref.setdefault(image_ref_key(image_key), set()).add(image_key)
+        return keys_by_ref
+
+
+class InMemoryImageRefRepository:
+    """
+    画像参照カウントのプロセス内実装（ローカル開発・テスト用）
+    ImageRefRepositoryと同じインターフェースを持つ
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.removing: Set[str] = set()
+        self._condition = threading.Condition()
+
+    def acquire(self, image_key: str) -> int:
+        ref_key = image_ref_key(image_key)
+        with self._condition:
+            self.counts[ref_key] = self.counts.get(ref_key, 0) + 1
+            count = self.counts[ref_key]
+            self._condition.wait_for(lambda: ref_key not in self.removing, timeout=REMOVAL_LEASE_SECONDS)
+            return count
+
+    def release(self, image_key: str) -> int:
+        ref_key = image_ref_key(image_key)
+        with self._condition:
+            if self.counts.get(ref_key, 0) <= 0:
+                return 0
+            self.counts[ref_key] -= 1
+            return self.counts[ref_key]
+
+    def claim_unreferenced(self, image_keys: Iterable[str]) -> Set[str]:
+        claimed: Set[str] = set()
+        with self._condition:
+            for image_key in image_keys:
+                ref_key = image_ref_key(image_key)
+                if self.counts.get(ref_key, 0) <= 0:
+                    self.removing.add(ref_key)
+                    claimed.add(image_key)
+        return claimed
+
+    def finish_removal(self, image_keys: Iterable[str]) -> None:
+        with self._condition:
+            for image_key in image_keys:
+                ref_key = image_ref_key(image_key)
+                self.removing.discard(ref_key)
+                if self.counts.get(ref_key, 0) <= 0:
+                    self.counts.pop(ref_key, None)
+            self._condition.notify_all()
+
+
+_memory_refs: Optional[InMemoryImageRefRepository] = None
+
+
+def create_image_ref_index():
+    """
+    設定（IMAGE_REF_INDEX）に応じた画像参照カウントを生成
+    'memory'の場合はプロセス内で共有する参照カウントを返す
+    """
+    global _memory_refs
+    if settings.IMAGE_REF_INDEX == 'memory':
+        if _memory_refs is None:
+            _memory_refs = InMemoryImageRefRepository()
+        return _memory_refs
+    return ImageRefRepository()
@@ -0,0 +1,55 @@
+"""
+全文検索インデックス更新サービス
+articlesテーブルのDynamoDB Streamsのレコード（変更前後のイメージ）から全文検索インデックスを更新する
+（SEARCH_INDEX_TRIGGER=streamの場合。requestの場合はArticleRepositoryが書き込みと同じリクエストで反映する）
+"""
+from typing import Any, Dict, List, Optional
+
+from admin.repositories.article_search_repository import ArticleSearchRepository
+from utils.dynamodb_codec import decode_item
+from utils.logger import get_logger
+from utils.metrics import timed
+
+logger = get_logger(__name__)
+
+
+class ArticleSearchIndexService:
+    """コラムの変更を全文検索インデックスに反映するワーカー"""
+
+    def __init__(self, search_index: Optional[ArticleSearchRepository] = None):
+        """
+        Args:
+            search_index: 全文検索インデックス（省略時はDynamoDBのリポジトリ）
+        """
+        self.search_index = search_index or ArticleSearchRepository()
+
+    @timed
+    def process_stream_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        DynamoDB Streamsのレコードを順に反映
+        同じコラムの変更は順序どおりに反映する必要があるため、失敗したレコード以降は処理せず再試行に回す
+
+        Args:
+            event: DynamoDB Streamsイベント（Records[].dynamodb.OldImage / NewImage / SequenceNumber）
+
+        Returns:
+            {'processed': 反映した件数, 'batchItemFailures': [{'itemIdentifier': 再試行するレコードのシーケンス番号}]}
+            （batchItemFailuresはLambdaのReportBatchItemFailuresの形式）
+        """
+        processed = 0
+        failures: List[Dict[str, str]] = []
+
+        for record in event.get('Records', []):
+            change = record.get('dynamodb', {})
+            try:
+                self.search_index.apply_article_change(
+                    decode_item(change.get('OldImage')),
+                    decode_item(change.get('NewImage'))
+                )
+                processed += 1
+            except Exception as e:
+                logger.error(f"Failed to update search index ({change.get('SequenceNumber')}): {str(e)}")
+                failures.append({'itemIdentifier': change.get('SequenceNumber')})
+                break
+
+        return {'processed': processed, 'batchItemFailures': failures}
@@ -2,26 +2,41 @@
 コラム管理サービス
 ビジネスロジックを担当
 """
-from typing import Dict, Any, List, Tuple, Optional
-from admin.repositories.article_repository import ArticleRepository
+from typing import Dict, Any, Iterable, List, Tuple, Optional
+from admin.repositories.article_repository import ArticleRepository, LIST_FIELDS
+from admin.repositories.image_cleanup_repository import create_image_cleanup_queue
+from admin.repositories.image_ref_repository import create_image_ref_index
+from admin.services.image_variant_service import ImageVariantService, item_image_urls
+from config.settings import settings
 from utils.logger import get_logger
-from utils.s3 import upload_image, delete_image
+from utils.metrics import timed
+from utils.pagination import build_cursor_scope, encode_cursor, decode_cursor
+from utils.s3 import decode_image_data, store_image, delete_images, image_key_from_url, image_url_for_key
+from utils.upload_session import ABANDONED_UPLOAD_SECONDS, create_upload_session, finalize_upload
 
 logger = get_logger(__name__)
 
+# 複数取得で一度に指定できるコラムIDの上限
+MAX_GET_MANY_IDS = 100
+
 
 class ArticleService:
     """コラム管理のビジネスロジック"""
 
     def __init__(self):
         self.article_repo = ArticleRepository()
+        self.image_cleanup = create_image_cleanup_queue()
+        self.image_refs = create_image_ref_index()
+        self.image_variants = ImageVariantService()
 
+    @timed
     def list_articles(
         self,
         filters: Dict[str, Any],
         page: int,
-        limit: int
-    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        limit: int,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], int, int, Optional[str]]:
         """
         コラム一覧を取得
 
@@ -29,15 +44,72 @@ class ArticleService:
             filters: フィルター条件
             page: ページ番号
             limit: 1ページあたりの件数
+            fields: 返却する項目（省略時は本文以外の一覧項目）
 
         Returns:
-            (記事リスト, 総件数, 総ページ数)
+            (記事リスト, 総件数, 総ページ数, 実行計画の要約（デバッグ用）)
+
+        Raises:
+            ValueError: 一覧で返せない項目が指定された場合
         """
-        articles, total = self.article_repo.list_articles(filters, page, limit)
+        fields = self._validate_list_fields(fields)
+        articles, total, plan = self.article_repo.list_articles(filters, page, limit, fields=fields)
         total_pages = (total + limit - 1) // limit if total > 0 else 1
 
-        return articles, total, total_pages
+        return articles, total, total_pages, plan.describe() if plan else None
+
+    @timed
+    def list_articles_by_cursor(
+        self,
+        filters: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        コラム一覧をカーソル方式で取得
+
+        Args:
+            filters: フィルター条件
+            limit: 1ページあたりの件数
+            cursor: 前ページのレスポンスで返されたnextCursor
+            fields: 返却する項目（省略時は本文以外の一覧項目）
+
+        Returns:
+            (記事リスト, 次ページのカーソル, 実行計画の要約（デバッグ用）)。最終ページの場合カーソルはNone
+
+        Raises:
+            ValueError: カーソルが不正な場合、一覧で返せない項目が指定された場合
+        """
+        if limit < 1:
+            raise ValueError("limitは1以上を指定してください")
+
+        fields = self._validate_list_fields(fields)
+        scope = build_cursor_scope(filters)
+        start_key = decode_cursor(cursor, scope)
+
+        articles, last_key, plan = self.article_repo.list_articles_page(filters, limit, start_key, fields=fields)
+
+        return articles, encode_cursor(last_key, scope), plan.describe() if plan else None
+
+    @staticmethod
+    def _validate_list_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        一覧の返却項目を検証（本文contentはget_articleでのみ取得できる）
+
+        Returns:
+            articleIdを先頭に含む項目リスト。未指定の場合はNone
+        """
+        if not fields:
+            return None
+
+        invalid = [field for field in fields if field not in LIST_FIELDS]
+        if invalid:
+            raise ValueError(f"fieldsに指定できない項目です: {', '.join(invalid)}")
+
+        return ['articleId'] + [field for field in fields if field != 'articleId']
 
+    @timed
     def get_article(self, article_id: int) -> Optional[Dict[str, Any]]:
         """
         コラム詳細を取得
@@ -50,36 +122,73 @@ class ArticleService:
         """
         return self.article_repo.get_by_id(article_id)
 
-    def create_article(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+    @timed
+    def get_articles(
+        self,
+        article_ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        複数のコラム詳細をまとめて取得
+
+        Args:
+            article_ids: コラムIDのリスト
+            fields: 返却する項目（省略時は全項目）
+
+        Returns:
+            (コラム情報のリスト（指定順）, 見つからなかったコラムIDのリスト)
+
+        Raises:
+            ValueError: 件数が上限を超える場合、返せない項目が指定された場合
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        if len(article_ids) > MAX_GET_MANY_IDS:
+            raise ValueError(f"idsは{MAX_GET_MANY_IDS}件までです")
+
+        if fields:
+            invalid = [field for field in fields if field not in LIST_FIELDS + ['content']]
+            if invalid:
+                raise ValueError(f"fieldsに指定できない項目です: {', '.join(invalid)}")
+            fields = ['articleId'] + [field for field in fields if field != 'articleId']
+
+        found = self.article_repo.get_many(article_ids, fields)
+        articles = [found[article_id] for article_id in article_ids if article_id in found]
+        missing = [article_id for article_id in article_ids if article_id not in found]
+
+        return articles, missing
+
+    @timed
+    def create_article(self, article_data: Dict[str, Any], admin_id: str) -> Dict[str, Any]:
         """
         コラムを作成
 
         Args:
             article_data: コラムデータ
+            admin_id: 作成者の管理者ID
 
         Returns:
             作成されたコラム情報
         """
         # 画像アップロード処理
-        if 'image' in article_data and article_data['image']:
-            image_url = upload_image(
-                article_data['image'],
-                'articles',
-                'jpg'
-            )
-            article_data['imageUrl'] = image_url
-            del article_data['image']
-
-        # 記事を作成
-        article = self.article_repo.create(article_data)
+        new_image_url = self._attach_image(article_data)
+
+        # 記事を作成（作成できなかった場合は登録した画像の参照を解放する）
+        try:
+            article = self.article_repo.create(article_data, admin_id)
+        except Exception:
+            if new_image_url:
+                self._release_images([article_data])
+            raise
         logger.info(f"Created article: {article.get('articleId')}")
 
         return article
 
+    @timed
     def update_article(
         self,
         article_id: int,
-        article_data: Dict[str, Any]
+        article_data: Dict[str, Any],
+        admin_id: str
     ) -> Optional[Dict[str, Any]]:
         """
         コラムを更新
@@ -87,36 +196,38 @@ class ArticleService:
         Args:
             article_id: コラムID
             article_data: 更新データ
+            admin_id: 更新者の管理者ID
 
         Returns:
             更新されたコラム情報（見つからない場合はNone）
         """
-        # 既存記事の確認
-        existing_article = self.article_repo.get_by_id(article_id)
-        if not existing_article:
+        # 画像アップロード処理
+        new_image_url = self._attach_image(article_data)
+
+        # 記事を更新（存在確認と更新前の値の取得は条件付き書き込み1回で行う）
+        try:
+            result = self.article_repo.update_returning_old(article_id, article_data, admin_id)
+        except Exception:
+            if new_image_url:
+                self._release_images([article_data])
+            raise
+        if not result:
+            # 記事が存在しない場合はアップロードした画像を削除
+            if new_image_url:
+                self._release_images([article_data])
             return None
 
-        # 画像アップロード処理
-        if 'image' in article_data and article_data['image']:
-            # 古い画像を削除
-            if existing_article.get('imageUrl'):
-                delete_image(existing_article['imageUrl'])
-
-            # 新しい画像をアップロード
-            image_url = upload_image(
-                article_data['image'],
-                'articles',
-                'jpg'
-            )
-            article_data['imageUrl'] = image_url
-            del article_data['image']
+        updated_article, old_article = result
+
+        # 古い画像の参照を解放（同じ画像をアップロードし直した場合も、新しい画像で参照を1つ登録しているため解放する）
+        if new_image_url and old_article.get('imageUrl'):
+            self._release_images([old_article])
 
-        # 記事を更新
-        updated_article = self.article_repo.update(article_id, article_data)
         logger.info(f"Updated article: {article_id}")
 
         return updated_article
 
+    @timed
     def delete_article(self, article_id: int) -> bool:
         """
         コラムを削除
@@ -127,59 +238,60 @@ class ArticleService:
         Returns:
             削除成功ならTrue、見つからない場合はFalse
         """
-        # 既存記事の確認
-        existing_article = self.article_repo.get_by_id(article_id)
-        if not existing_article:
+        # 記事を削除（存在確認と削除前の値の取得は条件付き削除1回で行う）
+        deleted_article = self.article_repo.delete_returning_old(article_id)
+        if not deleted_article:
             return False
 
         # 画像を削除
-        if existing_article.get('imageUrl'):
-            delete_image(existing_article['imageUrl'])
+        self._release_images([deleted_article])
 
-        # 記事を削除
-        success = self.article_repo.delete(article_id)
+        logger.info(f"Deleted article: {article_id}")
 
-        if success:
-            logger.info(f"Deleted article: {article_id}")
-
-        return success
+        return True
 
+    @timed
     def bulk_update_status(
         self,
         article_ids: List[int],
-        status: str
-    ) -> Tuple[int, int]:
+        status: str,
+        admin_id: Optional[str] = None,
+        atomic: bool = False
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
         """
         複数コラムのステータスを一括更新
 
         Args:
             article_ids: コラムIDのリスト
             status: 新しいステータス
+            admin_id: 更新者の管理者ID
+            atomic: 全件成功か全件失敗か（all-or-nothing）で更新するか
 
         Returns:
-            (成功件数, 失敗件数)
+            (成功件数, 失敗件数, コラムごとの結果 [{'articleId', 'success', 'error'}])
+
+        Raises:
+            ValueError: atomic=Trueで件数が上限を超える場合
         """
-        success_count = 0
-        failed_count = 0
+        try:
+            updated, failed = self.article_repo.bulk_update_status(article_ids, status, admin_id, atomic=atomic)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to bulk update status: {str(e)}")
+            updated, failed = {}, {int(article_id): 'error' for article_id in article_ids}
 
-        for article_id in article_ids:
-            try:
-                result = self.article_repo.update(article_id, {'status': status})
-                if result:
-                    success_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to update article {article_id}: {str(e)}")
-                failed_count += 1
+        success_count = len(updated)
+        failed_count = len(failed)
 
         logger.info(
             f"Bulk update status: success={success_count}, failed={failed_count}"
         )
 
-        return success_count, failed_count
+        return success_count, failed_count, self._bulk_results(updated, failed)
 
-    def bulk_delete_articles(self, article_ids: List[int]) -> Tuple[int, int]:
+    @timed
+    def bulk_delete_articles(self, article_ids: List[int]) -> Tuple[int, int, List[Dict[str, Any]]]:
         """
         複数コラムを一括削除
 
@@ -187,29 +299,140 @@ class ArticleService:
             article_ids: コラムIDのリスト
 
         Returns:
-            (成功件数, 失敗件数)
+            (成功件数, 失敗件数, コラムごとの結果 [{'articleId', 'success', 'error'}])
         """
-        success_count = 0
-        failed_count = 0
+        try:
+            deleted, failed = self.article_repo.bulk_delete(article_ids)
+        except Exception as e:
+            logger.error(f"Failed to bulk delete articles: {str(e)}")
+            deleted, failed = {}, {int(article_id): 'error' for article_id in article_ids}
 
-        for article_id in article_ids:
-            try:
-                # 記事情報を取得（画像削除のため）
-                article = self.article_repo.get_by_id(article_id)
-                if article and article.get('imageUrl'):
-                    delete_image(article['imageUrl'])
-
-                # 記事を削除
-                if self.article_repo.delete(article_id):
-                    success_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to delete article {article_id}: {str(e)}")
-                failed_count += 1
+        # 画像の削除は失敗してもコラムの削除結果には影響させない
+        self._release_images(deleted.values())
+
+        success_count = len(deleted)
+        failed_count = len(failed)
 
         logger.info(
             f"Bulk delete articles: success={success_count}, failed={failed_count}"
         )
 
-        return success_count, failed_count
+        return success_count, failed_count, self._bulk_results(deleted, failed)
+
+    @timed
+    def create_image_upload_session(
+        self,
+        content_type: str,
+        size: Optional[int] = None,
+        method: str = 'POST'
+    ) -> Dict[str, Any]:
+        """
+        コラム画像を直接S3にアップロードするためのセッションを発行
+        アップロード後、作成・更新のimageUploadTokenにトークンを指定すると画像が確定する
+        確定されなかった画像を消すため、アップロード先をトークンの期限後に削除するよう削除キューに登録する
+        （確定した画像は参照が登録されているため削除ワーカーが残す）
+
+        Args:
+            content_type: 画像のContent-Type
+            size: 画像のサイズ（バイト）
+            method: 'POST' または 'PUT'
+
+        Returns:
+            署名付きアップロードの情報とアップロードトークン
+
+        Raises:
+            ValueError: Content-Type・サイズ・メソッドが不正な場合
+        """
+        session = create_upload_session(settings.S3_ARTICLES_FOLDER, content_type, size, method)
+        self.image_cleanup.enqueue([image_url_for_key(session['key'])], delay_seconds=ABANDONED_UPLOAD_SECONDS)
+        return session
+
+    def _attach_image(self, article_data: Dict[str, Any]) -> Optional[str]:
+        """
+        リクエストの画像を確定してimageUrlに設定
+        派生画像（サムネイル・WebP/AVIF）のURLもimageVariants・thumbnailに設定する
+
+        imageUploadToken（直接アップロード済みの画像）を優先し、
+        互換性のためBase64のimageも受け付ける
+
+        Returns:
+            設定した画像URL。画像の指定がない場合はNone
+
+        Raises:
+            ValueError: アップロードトークンが不正、または画像が未アップロードの場合
+        """
+        image_url = None
+        image_binary = None
+        existing = False
+        upload_token = article_data.pop('imageUploadToken', None)
+        image_data = article_data.pop('image', None)
+
+        if upload_token:
+            image_url = finalize_upload(upload_token, settings.S3_ARTICLES_FOLDER)
+            image_key = image_key_from_url(image_url)
+            if image_key:
+                self.image_refs.acquire(image_key)
+        elif image_data:
+            # 同じ画像は内容から決まる同じキーに保存し、参照を登録する
+            # デコードした画像は派生画像の生成にも使う（S3から読み直さない）
+            # 保存済みの画像だった場合は派生画像も生成済みのため生成し直さない
+            image_binary = decode_image_data(image_data)
+            image_url, uploaded = store_image(image_binary, settings.S3_ARTICLES_FOLDER, 'jpg', refs=self.image_refs)
+            existing = not uploaded
+
+        if image_url:
+            article_data['imageUrl'] = image_url
+            try:
+                self.image_variants.attach(article_data, image_url, data=image_binary, existing=existing)
+            except Exception:
+                self._release_images([article_data])
+                raise
+        return image_url
+
+    def _release_images(self, items: Iterable[Optional[Dict[str, Any]]]) -> None:
+        """
+        コラムの画像の参照を解放し、最後の参照だった画像（派生画像を含む）を削除キューに登録
+        参照数を確認できない場合は画像を残す
+        """
+        image_urls: List[str] = []
+        for item in items:
+            image_url = (item or {}).get('imageUrl')
+            if not image_url:
+                continue
+
+            image_key = image_key_from_url(image_url)
+            try:
+                if image_key and self.image_refs.release(image_key) > 0:
+                    continue
+            except Exception as e:
+                logger.error(f"Failed to release image reference, keeping image: {str(e)}")
+                continue
+            image_urls.extend(item_image_urls(item))
+
+        self._schedule_image_deletion(image_urls)
+
+    def _schedule_image_deletion(self, image_urls: List[Optional[str]]) -> None:
+        """
+        不要になった画像を削除キューに登録（削除はワーカーが非同期に行う）
+        キューに登録できない場合はその場で削除する
+        """
+        image_urls = [url for url in image_urls if url]
+        if not image_urls:
+            return
+
+        try:
+            self.image_cleanup.enqueue(image_urls)
+        except Exception as e:
+            logger.error(f"Failed to queue image deletion, deleting now: {str(e)}")
+            errors = delete_images(image_urls)
+            if errors:
+                logger.warning(f"Failed to delete {len(errors)} article images")
+
+    @staticmethod
+    def _bulk_results(succeeded: Dict[int, Any], failed: Dict[int, str]) -> List[Dict[str, Any]]:
+        """一括操作のコラムごとの結果"""
+        return [
+            {'articleId': article_id, 'success': True} for article_id in succeeded
+        ] + [
+            {'articleId': article_id, 'success': False, 'error': reason} for article_id, reason in failed.items()
+        ]
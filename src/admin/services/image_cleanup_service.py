@@ -0,0 +1,112 @@
+"""
+画像削除サービス
+削除キューに登録された画像をDeleteObjectsでまとめて削除する（スケジュール実行のワーカーから呼び出す）
+登録後に再び参照された画像（内容から決まるキーで同じ画像がアップロードされた場合）は削除しない
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from admin.repositories.image_cleanup_repository import create_image_cleanup_queue
+from admin.repositories.image_ref_repository import create_image_ref_index
+from utils.logger import get_logger
+from utils.metrics import timed
+from utils.s3 import delete_images
+
+logger = get_logger(__name__)
+
+# 1回の実行で処理する最大件数（DeleteObjectsの1リクエスト分）
+DEFAULT_BATCH_SIZE = 1000
+# 削除を試みる回数の上限（超えたアイテムはキューに残し、lastErrorで確認できるようにする）
+MAX_ATTEMPTS = 5
+# 再試行までの待ち時間の基準値（秒）。試行回数ごとに倍にする
+RETRY_BASE_SECONDS = 60
+
+
+class ImageCleanupService:
+    """削除キューの画像を削除するワーカー"""
+
+    def __init__(self, queue=None, refs=None):
+        """
+        Args:
+            queue: 画像削除キュー（省略時は設定に応じたキュー）
+            refs: 画像の参照カウント（省略時は設定に応じた参照カウント）
+        """
+        self.queue = queue or create_image_cleanup_queue()
+        self.refs = refs or create_image_ref_index()
+
+    @timed
+    def drain(self, batch_size: int = DEFAULT_BATCH_SIZE, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        削除を試みる時刻になった画像をまとめて削除
+
+        Args:
+            batch_size: 1回のDeleteObjectsで削除する件数
+            max_batches: 処理するバッチ数の上限（省略時はキューが空になるまで）
+
+        Returns:
+            {'deleted': 削除した件数, 'retried': 再試行に回した件数, 'dead': 再試行を打ち切った件数,
+             'kept': 再び参照されたため削除しなかった件数}
+        """
+        summary = {'deleted': 0, 'retried': 0, 'dead': 0, 'kept': 0}
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            items = self.queue.receive(batch_size)
+            if not items:
+                break
+            batches += 1
+
+            result = self._process(items)
+            for name, count in result.items():
+                summary[name] += count
+
+            # 全件失敗したバッチはこれ以上進まないため打ち切る
+            if len(items) < batch_size or not (result['deleted'] or result['kept']):
+                break
+
+        logger.info(
+            f"Image cleanup: deleted={summary['deleted']}, retried={summary['retried']}, "
+            f"dead={summary['dead']}, kept={summary['kept']}"
+        )
+        return summary
+
+    def _process(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """1バッチ分の画像を削除し、結果をキューに反映"""
+        # 参照数0を条件に削除中にしてから削除する（削除中に参照されたアップロードは削除の完了を待つ）
+        removable = self.refs.claim_unreferenced(item['imageKey'] for item in items)
+        kept = [item['imageKey'] for item in items if item['imageKey'] not in removable]
+        if kept:
+            self.queue.complete(kept)
+            items = [item for item in items if item['imageKey'] in removable]
+
+        try:
+            errors = delete_images(item['imageUrl'] for item in items) if items else {}
+        finally:
+            self.refs.finish_removal(removable)
+
+        deleted = [item['imageKey'] for item in items if item['imageUrl'] not in errors]
+        self.queue.complete(deleted)
+
+        retried = dead = 0
+        for item in items:
+            error = errors.get(item['imageUrl'])
+            if error is None:
+                continue
+
+            attempts = int(item.get('attempts', 0)) + 1
+            if attempts >= MAX_ATTEMPTS:
+                logger.error(f"Giving up deleting image {item['imageKey']}: {error}")
+                self.queue.fail(item['imageKey'], error, None)
+                dead += 1
+            else:
+                self.queue.fail(item['imageKey'], error, self._retry_at(attempts))
+                retried += 1
+
+        return {'deleted': len(deleted), 'retried': retried, 'dead': dead, 'kept': len(kept)}
+
+    @staticmethod
+    def _retry_at(attempts: int) -> datetime:
+        """次に削除を試みる日時（指数バックオフ＋ジッター）"""
+        delay = RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+        return datetime.utcnow() + timedelta(seconds=delay * random.uniform(1.0, 1.5))
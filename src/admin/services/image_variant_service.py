@@ -0,0 +1,131 @@
+"""
+派生画像サービス
+アップロードされた画像のサムネイル・WebP/AVIF画像を用意し、アイテムに保存するURLを返す
+
+生成のタイミングは設定（IMAGE_VARIANTS_TRIGGER）で切り替える
+    - upload: アップロード時にその場で生成する（ローカル開発・テスト用）
+    - s3: S3のObjectCreatedイベントで起動するワーカー（process_s3_event）が生成する
+      派生画像のキーは元画像のキーから決まるため、アイテムには生成を待たずにそのURLを保存する
+"""
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote_plus
+
+from config.settings import settings
+from utils.image_variants import (
+    expected_image_variants, generate_image_variants, is_variant_key, variant_urls
+)
+from utils.logger import get_logger
+from utils.metrics import timed
+from utils.s3 import image_key_from_url
+
+logger = get_logger(__name__)
+
+# 一覧で返す派生画像の種類
+LIST_VARIANT = 'thumbnail'
+
+
+class ImageVariantService:
+    """派生画像の生成と取得"""
+
+    def __init__(self, executor=None):
+        """
+        Args:
+            executor: 画像処理のExecutor（省略時はプロセスプール）
+        """
+        self.executor = executor
+
+    @timed
+    def variants_for_upload(
+        self,
+        image_url: str,
+        data: Optional[bytes] = None,
+        existing: bool = False
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        アップロードされた画像の派生画像のURLを取得
+        IMAGE_VARIANTS_TRIGGER=s3の場合はワーカーが生成する派生画像のURL、uploadの場合はその場で生成する
+        保存済みの画像（同じ内容の画像が既にある場合）は派生画像も生成済みのため、生成し直さない
+        派生画像は元画像の代わりに使う補助的なものなので、失敗してもエラーにしない
+
+        Args:
+            image_url: 元画像のURL
+            data: 元画像のバイトデータ（アップロード時に手元にある場合。省略時はS3から読み込む）
+            existing: 元画像が既に保存されていた場合True
+
+        Returns:
+            派生画像のURL（{種類: {出力形式: URL}}）。用意できなかった場合は空
+        """
+        image_key = image_key_from_url(image_url)
+        if not image_key:
+            return {}
+
+        try:
+            if existing or settings.IMAGE_VARIANTS_TRIGGER == 's3':
+                return expected_image_variants(image_key)
+            return generate_image_variants(image_key, data=data, executor=self.executor)
+        except Exception as e:
+            logger.error(f"Failed to prepare image variants for {image_key}: {str(e)}")
+            return {}
+
+    @timed
+    def attach(
+        self,
+        item: Dict[str, Any],
+        image_url: str,
+        data: Optional[bytes] = None,
+        existing: bool = False
+    ) -> None:
+        """
+        派生画像のURLをアイテムに設定
+        imageVariantsに全種類、thumbnailに一覧用の派生画像を設定する
+        （用意できなかった場合は空にして、古い派生画像を参照しないようにする）
+
+        Args:
+            item: 保存するアイテム
+            image_url: 元画像のURL
+            data: 元画像のバイトデータ（省略時はS3から読み込む）
+            existing: 元画像が既に保存されていた場合True（派生画像を生成し直さない）
+        """
+        variants = self.variants_for_upload(image_url, data, existing)
+        item['imageVariants'] = variants
+        item['thumbnail'] = variants.get(LIST_VARIANT, {})
+
+    @timed
+    def process_s3_event(self, event: Dict[str, Any]) -> Dict[str, int]:
+        """
+        S3のObjectCreatedイベントの画像の派生画像を生成
+
+        Args:
+            event: S3イベント（Records[].s3.bucket.name / Records[].s3.object.key）
+
+        Returns:
+            {'processed': 生成した件数, 'skipped': 対象外の件数, 'failed': 失敗した件数}
+        """
+        summary = {'processed': 0, 'skipped': 0, 'failed': 0}
+
+        for record in event.get('Records', []):
+            s3 = record.get('s3', {})
+            bucket = s3.get('bucket', {}).get('name')
+            # イベントのキーはURLエンコードされている
+            key = unquote_plus(s3.get('object', {}).get('key', ''))
+
+            if bucket != settings.S3_BUCKET_NAME or not key or is_variant_key(key):
+                summary['skipped'] += 1
+                continue
+
+            try:
+                generate_image_variants(key, executor=self.executor)
+                summary['processed'] += 1
+            except Exception as e:
+                logger.error(f"Failed to generate image variants for {key}: {str(e)}")
+                summary['failed'] += 1
+
+        return summary
+
+
+def item_image_urls(item: Optional[Dict[str, Any]]) -> List[str]:
+    """アイテムの元画像と派生画像のURL（削除用）"""
+    if not item:
+        return []
+    urls = [item.get('imageUrl')] if item.get('imageUrl') else []
+    return urls + variant_urls(item.get('imageVariants'))
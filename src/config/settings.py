@@ -15,6 +15,12 @@ class Settings:
     STORES_TABLE_NAME: str = os.environ.get('STORES_TABLE_NAME', 'stores')
     FLYERS_TABLE_NAME: str = os.environ.get('FLYERS_TABLE_NAME', 'flyers')
     ADMINS_TABLE_NAME: str = os.environ.get('ADMINS_TABLE_NAME', 'admins')
+    ARTICLE_SEARCH_TABLE_NAME: str = os.environ.get('ARTICLE_SEARCH_TABLE_NAME', 'article-search-index')
+    ARTICLE_TAGS_TABLE_NAME: str = os.environ.get('ARTICLE_TAGS_TABLE_NAME', 'article-tags')
+    ARTICLE_COUNTERS_TABLE_NAME: str = os.environ.get('ARTICLE_COUNTERS_TABLE_NAME', 'article-counters')
+    ID_SEQUENCES_TABLE_NAME: str = os.environ.get('ID_SEQUENCES_TABLE_NAME', 'id-sequences')
+    IMAGE_CLEANUP_TABLE_NAME: str = os.environ.get('IMAGE_CLEANUP_TABLE_NAME', 'image-cleanup-queue')
+    IMAGE_REFS_TABLE_NAME: str = os.environ.get('IMAGE_REFS_TABLE_NAME', 'image-refs')
 
     # DynamoDB テーブル名（ユーザー機能）
     USERS_TABLE_NAME: str = os.environ.get('USERS_TABLE_NAME', 'users')
@@ -25,17 +31,35 @@ class Settings:
     # AWS設定
     AWS_REGION: str = os.environ.get('AWS_REGION', 'ap-northeast-1')
     DYNAMODB_ENDPOINT_URL: Optional[str] = os.environ.get('DYNAMODB_ENDPOINT_URL')  # ローカル開発用
+    PARALLEL_SCAN_SEGMENTS: int = int(os.environ.get('PARALLEL_SCAN_SEGMENTS', '4'))  # 並列スキャンのセグメント数
+    # コラム一覧で読むGSI（summary: *SummaryIndex / legacy: GSIの移行中に読む移行前のStatusIndex・CategoryIndex）
+    ARTICLE_LIST_INDEXES: str = os.environ.get('ARTICLE_LIST_INDEXES', 'summary')
+    # 絞り込みのない一覧をArticleListIndexから読むか（false: GSIの作成・バックフィル中はテーブルをスキャンする）
+    USE_ARTICLE_LIST_INDEX: bool = os.environ.get('USE_ARTICLE_LIST_INDEX', 'true').lower() == 'true'
+    # 全文検索インデックスの更新（request: コラムを書き込んだリクエスト内で反映 / stream: DynamoDB Streamsのワーカーが反映）
+    SEARCH_INDEX_TRIGGER: str = os.environ.get('SEARCH_INDEX_TRIGGER', 'request')
 
     # S3設定
     S3_BUCKET_NAME: str = os.environ.get('S3_BUCKET_NAME', 'images')
     S3_FLYERS_FOLDER: str = 'flyers'
     S3_ARTICLES_FOLDER: str = 'articles'
     S3_LOGOS_FOLDER: str = 'logos'
+    MAX_IMAGE_UPLOAD_BYTES: int = int(os.environ.get('MAX_IMAGE_UPLOAD_BYTES', str(10 * 1024 * 1024)))
+    # 画像削除キュー（dynamodb: image-cleanup-queueテーブル / memory: プロセス内キュー）
+    IMAGE_CLEANUP_QUEUE: str = os.environ.get('IMAGE_CLEANUP_QUEUE', 'dynamodb')
+    # 画像の参照カウント（dynamodb: image-refsテーブル / memory: プロセス内）
+    IMAGE_REF_INDEX: str = os.environ.get('IMAGE_REF_INDEX', 'dynamodb')
+    # 派生画像（サムネイル・WebP/AVIF）
+    S3_VARIANTS_FOLDER: str = 'variants'
+    # 生成のタイミング（upload: アップロード時に生成 / s3: S3イベントのワーカーが生成済みのものを使う）
+    IMAGE_VARIANTS_TRIGGER: str = os.environ.get('IMAGE_VARIANTS_TRIGGER', 'upload')
+    IMAGE_VARIANT_WORKERS: int = int(os.environ.get('IMAGE_VARIANT_WORKERS', '2'))  # 0の場合はプロセスプールを使わない
     
     # 認証設定
     JWT_SECRET_KEY: str = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
     JWT_ALGORITHM: str = 'HS256'
     JWT_EXPIRATION_HOURS: int = 24
+    UPLOAD_SECRET_KEY: str = os.environ.get('UPLOAD_SECRET_KEY', JWT_SECRET_KEY)  # アップロードトークン署名用
     
     # OpenAI API
     OPENAI_API_KEY: Optional[str] = os.environ.get('OPENAI_API_KEY')
@@ -48,6 +72,7 @@ class Settings:
     # ページネーション
     DEFAULT_PAGE_LIMIT: int = 20
     MAX_PAGE_LIMIT: int = 100
+    CURSOR_SECRET_KEY: str = os.environ.get('CURSOR_SECRET_KEY', JWT_SECRET_KEY)  # カーソル署名用
     
     # 価格履歴
     PRICE_HISTORY_DEFAULT_DAYS: int = 30
@@ -58,6 +83,17 @@ class Settings:
     
     # ログレベル
     LOG_LEVEL: str = os.environ.get('LOG_LEVEL', 'INFO')
+
+    # 初期化フェーズ（SnapStartの場合はスナップショット作成前）にクライアント・接続を準備するか
+    PRIMING_ENABLED: bool = os.environ.get('PRIMING_ENABLED', 'true').lower() == 'true'
+
+    # メトリクス（EMF）の名前空間と出力先（stdout: Lambdaのログ / file: METRICS_FILE / off）
+    METRICS_NAMESPACE: str = os.environ.get('METRICS_NAMESPACE', 'KaidokiNavi')
+    METRICS_SINK: str = os.environ.get('METRICS_SINK', 'stdout')
+    METRICS_FILE: str = os.environ.get('METRICS_FILE', '/tmp/metrics.jsonl')
+
+    # デバッグ用レスポンスヘッダー（X-Query-Plan）を返すか（開発環境では常に有効）
+    DEBUG_QUERY_PLAN: bool = os.environ.get('DEBUG_QUERY_PLAN', 'false').lower() == 'true'
     
     # 環境
     ENVIRONMENT: str = os.environ.get('ENVIRONMENT', 'development')
@@ -0,0 +1,138 @@
+"""
+AWSクライアント
+プロセス内で共有するDynamoDB・S3のクライアントを初回使用時に生成する
+
+- セッションはこのモジュールで1つだけ作り、リポジトリごとにリソースを作らない（コールドスタートの短縮）
+- 接続プールは並列処理（並列スキャン・バッチ書き込み・マルチパートアップロード）の同時実行数に合わせて広げる
+- リトライはadaptiveモード（スロットリング時にクライアント側で送信レートを下げる）
+- DynamoDBの呼び出しはメトリクス（utils.metrics）に記録する
+
+リポジトリはutils.dynamodb_clientのデータ層（低レベルクライアント）を使う
+リソース（モジュール変数`dynamodb`）はboto3のリソースAPIが必要な場合のためにのみ残している
+"""
+import threading
+from typing import Any, Callable, Dict
+
+import boto3
+from botocore.config import Config
+
+from config.settings import settings
+from utils.logger import get_logger
+from utils.metrics import record_dynamodb_call
+
+logger = get_logger(__name__)
+
+# 接続プールの上限（botocoreのデフォルトは10）
+MAX_POOL_CONNECTIONS = 50
+# リトライ回数の上限（初回を含む）
+MAX_ATTEMPTS = 5
+CONNECT_TIMEOUT = 2
+
+# DynamoDBの応答は速いため読み取りタイムアウトを短くし、遅い接続は早めに再試行する
+DYNAMODB_CONFIG = Config(
+    region_name=settings.AWS_REGION,
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': MAX_ATTEMPTS},
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=10
+)
+# S3はマルチパートのパート（数MB）の送信があるため読み取りタイムアウトを長くする
+S3_CONFIG = Config(
+    region_name=settings.AWS_REGION,
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': MAX_ATTEMPTS},
+    connect_timeout=CONNECT_TIMEOUT,
+    read_timeout=60
+)
+
+_clients: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _get_or_create(name: str, factory: Callable[[boto3.session.Session], Any]) -> Any:
+    """生成済みのクライアントを返す（なければ生成する）"""
+    client = _clients.get(name)
+    if client is not None:
+        return client
+
+    with _lock:
+        if name not in _clients:
+            # boto3のデフォルトセッションはスレッドセーフではないため専用のセッションを使う
+            if 'session' not in _clients:
+                _clients['session'] = boto3.session.Session()
+            _clients[name] = factory(_clients['session'])
+        return _clients[name]
+
+
+def _record_dynamodb_call(parsed: Dict[str, Any], model: Any, **kwargs) -> None:
+    record_dynamodb_call(model.name, parsed)
+
+
+def _register_metrics(client: Any) -> Any:
+    """DynamoDBの呼び出し（リトライ後の最終結果）ごとにメトリクスを記録する"""
+    client.meta.events.register('after-call.dynamodb', _record_dynamodb_call)
+    return client
+
+
+def get_dynamodb_resource():
+    """DynamoDBリソース（DYNAMODB_ENDPOINT_URLが設定されている場合はローカルのDynamoDBに接続）"""
+    def create(session: boto3.session.Session):
+        params: Dict[str, Any] = {'config': DYNAMODB_CONFIG}
+        if settings.DYNAMODB_ENDPOINT_URL:
+            params['endpoint_url'] = settings.DYNAMODB_ENDPOINT_URL
+            logger.info(f"Using DynamoDB endpoint: {settings.DYNAMODB_ENDPOINT_URL}")
+        resource = session.resource('dynamodb', **params)
+        _register_metrics(resource.meta.client)
+        return resource
+
+    return _get_or_create('dynamodb', create)
+
+
+def get_dynamodb_client():
+    """DynamoDBクライアント（リソースと接続プールを共有する。スレッドセーフ）"""
+    return get_dynamodb_resource().meta.client
+
+
+def get_dynamodb_raw_client():
+    """
+    DynamoDBの低レベルクライアント（型変換のハンドラーを持たない。ワイヤ形式で読み書きする）
+    utils.dynamodb_clientのデータ層が使う
+    """
+    def create(session: boto3.session.Session):
+        params: Dict[str, Any] = {'config': DYNAMODB_CONFIG}
+        if settings.DYNAMODB_ENDPOINT_URL:
+            params['endpoint_url'] = settings.DYNAMODB_ENDPOINT_URL
+        return _register_metrics(session.client('dynamodb', **params))
+
+    return _get_or_create('dynamodb_raw', create)
+
+
+def get_s3_client():
+    """S3クライアント"""
+    return _get_or_create('s3', lambda session: session.client('s3', config=S3_CONFIG))
+
+
+def reset_clients() -> None:
+    """生成済みのクライアントを破棄（設定を変えたテストなどで使用）"""
+    with _lock:
+        _clients.clear()
+
+
+class LazyClient:
+    """
+    初回の属性アクセスでクライアントを生成するプロキシ
+    モジュール変数として置き、インポート時にはクライアントを生成しない
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._factory(), name)
+
+
+# リポジトリ・ユーティリティで共有するクライアント
+dynamodb = LazyClient(get_dynamodb_resource)
+s3_client = LazyClient(get_s3_client)
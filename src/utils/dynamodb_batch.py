@@ -0,0 +1,133 @@
+"""
+DynamoDBバッチ読み書きユーティリティ
+BatchWriteItem（25件）・BatchGetItem（100件）の上限に合わせてリクエストを分割する
+書き込みは複数のチャンクを並列に送信し、UnprocessedItems/UnprocessedKeysは指数バックオフ（ジッター付き）で再送する
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# BatchWriteItem/BatchGetItemの1リクエストあたりの上限
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+# 同時に送信するチャンク数の上限
+MAX_PARALLEL_BATCHES = 4
+# UnprocessedItems/UnprocessedKeysの再送回数の上限
+MAX_RETRIES = 8
+# 再送待ち時間の基準値（秒）。待ち時間は base * 2^試行回数 を上限とするランダム値
+BASE_DELAY = 0.05
+MAX_DELAY = 2.0
+
+
+def backoff_delay(attempt: int, base_delay: float = BASE_DELAY) -> float:
+    """
+    再送前の待ち時間（Full Jitter）
+
+    Args:
+        attempt: 再送の試行回数（0始まり）
+        base_delay: 待ち時間の基準値（秒）
+
+    Returns:
+        待ち時間（秒）
+    """
+    return random.uniform(0, min(MAX_DELAY, base_delay * (2 ** attempt)))
+
+
+def batch_write(
+    client,
+    table_name: str,
+    requests: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    max_retries: int = MAX_RETRIES,
+    base_delay: float = BASE_DELAY
+) -> List[Dict[str, Any]]:
+    """
+    PutRequest/DeleteRequestをBatchWriteItemでまとめて書き込む
+
+    Args:
+        client: DynamoDBクライアント（スレッドセーフな`dynamodb.meta.client`など）
+        table_name: テーブル名
+        requests: WriteRequestのリスト（{'DeleteRequest': {'Key': ...}} など）
+        max_workers: 同時に送信するチャンク数の上限（省略時はMAX_PARALLEL_BATCHES）
+        max_retries: UnprocessedItemsの再送回数の上限
+        base_delay: 再送待ち時間の基準値（秒）
+
+    Returns:
+        書き込めなかったWriteRequestのリスト（再送回数の上限到達またはエラー）
+    """
+    chunks = [requests[start:start + BATCH_WRITE_LIMIT] for start in range(0, len(requests), BATCH_WRITE_LIMIT)]
+    if not chunks:
+        return []
+
+    def write_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        pending = chunk
+        attempt = 0
+        try:
+            while True:
+                response = client.batch_write_item(RequestItems={table_name: pending})
+                pending = (response.get('UnprocessedItems') or {}).get(table_name, [])
+                if not pending:
+                    return []
+                if attempt >= max_retries:
+                    logger.warning(f"Gave up {len(pending)} unprocessed writes to {table_name} after {attempt} retries")
+                    return pending
+                time.sleep(backoff_delay(attempt, base_delay))
+                attempt += 1
+        except Exception as e:
+            logger.error(f"Failed to batch write to {table_name}: {str(e)}")
+            return pending
+
+    workers = max(1, min(max_workers or MAX_PARALLEL_BATCHES, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(write_chunk, chunks))
+
+    return [request for failed in results for request in failed]
+
+
+def batch_get(
+    client,
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    projection: Optional[Dict[str, Any]] = None,
+    max_retries: int = MAX_RETRIES,
+    base_delay: float = BASE_DELAY
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    キーのリストをBatchGetItemでまとめて読み込む
+
+    Args:
+        client: batch_get_itemを持つDynamoDBリソースまたはクライアント
+        table_name: テーブル名
+        keys: 主キーのリスト（重複不可）
+        projection: ProjectionExpression/ExpressionAttributeNames（省略時は全項目）
+        max_retries: UnprocessedKeysの再送回数の上限
+        base_delay: 再送待ち時間の基準値（秒）
+
+    Returns:
+        (読み込んだアイテムのリスト（順序は保証しない）, 再送回数の上限に達しても読めなかったキーのリスト)
+    """
+    items: List[Dict[str, Any]] = []
+    unprocessed: List[Dict[str, Any]] = []
+
+    for start in range(0, len(keys), BATCH_GET_LIMIT):
+        pending = keys[start:start + BATCH_GET_LIMIT]
+        attempt = 0
+        while pending:
+            response = client.batch_get_item(RequestItems={table_name: {'Keys': pending, **(projection or {})}})
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            pending = ((response.get('UnprocessedKeys') or {}).get(table_name) or {}).get('Keys', [])
+            if not pending:
+                break
+            if attempt >= max_retries:
+                logger.warning(f"Gave up {len(pending)} unprocessed keys of {table_name} after {attempt} retries")
+                unprocessed.extend(pending)
+                break
+            time.sleep(backoff_delay(attempt, base_delay))
+            attempt += 1
+
+    return items, unprocessed
@@ -0,0 +1,198 @@
+"""
+DynamoDB低レベルクライアントのデータ層
+boto3リソースと同じ呼び出し方（Pythonの値・Key/Attr条件）のまま、変換はdynamodb_codecで行う
+
+    dynamodb.Table(name)           -> ClientTable（get_item / query / scan / put_item / update_item / delete_item）
+    dynamodb.meta.client           -> DynamoDBClient（スレッドセーフ。バッチ・トランザクション・並列処理用）
+    dynamodb.batch_get_item(...)   -> DynamoDBClient.batch_get_item
+
+リソースとの違い:
+    - 数値はDecimalではなくint/floatで返す（floatもそのまま書き込める）
+    - 変換はアイテムの形ごとにキャッシュした変換関数で行う（queryの1MBのページで速い）
+"""
+from typing import Any, Callable, Dict, List
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+
+from utils.aws_clients import get_dynamodb_raw_client
+from utils.dynamodb_codec import decode_item, decode_items, encode_item
+
+# 条件オブジェクト（Key/Attr）を受け付けるパラメータと、キー条件かどうか
+_CONDITION_PARAMS = {
+    'KeyConditionExpression': True,
+    'FilterExpression': False,
+    'ConditionExpression': False,
+}
+# アイテム（またはキー）を受け取るパラメータ
+_ITEM_PARAMS = ('Key', 'Item', 'ExclusiveStartKey', 'ExpressionAttributeValues')
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """1操作分のパラメータをワイヤ形式に変換（条件オブジェクトは式に変換する）"""
+    params = dict(params)
+    builder = None
+    for name, is_key_condition in _CONDITION_PARAMS.items():
+        condition = params.get(name)
+        if not isinstance(condition, ConditionBase):
+            continue
+        builder = builder or ConditionExpressionBuilder()
+        built = builder.build_expression(condition, is_key_condition=is_key_condition)
+        params[name] = built.condition_expression
+        params['ExpressionAttributeNames'] = {
+            **params.get('ExpressionAttributeNames', {}), **built.attribute_name_placeholders
+        }
+        params['ExpressionAttributeValues'] = {
+            **params.get('ExpressionAttributeValues', {}), **built.attribute_value_placeholders
+        }
+
+    for name in _ITEM_PARAMS:
+        if params.get(name) is not None:
+            params[name] = encode_item(params[name])
+    return params
+
+
+def _encode_write_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    if 'PutRequest' in request:
+        return {'PutRequest': {'Item': encode_item(request['PutRequest']['Item'])}}
+    return {'DeleteRequest': {'Key': encode_item(request['DeleteRequest']['Key'])}}
+
+
+def _decode_write_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    if 'PutRequest' in request:
+        return {'PutRequest': {'Item': decode_item(request['PutRequest']['Item'])}}
+    return {'DeleteRequest': {'Key': decode_item(request['DeleteRequest']['Key'])}}
+
+
+def _decode_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """レスポンスのアイテムをPythonの値に変換"""
+    for name in ('Item', 'Attributes', 'LastEvaluatedKey'):
+        if name in response:
+            response[name] = decode_item(response[name])
+    if 'Items' in response:
+        response['Items'] = decode_items(response['Items'])
+    return response
+
+
+class DynamoDBClient:
+    """
+    低レベルクライアントのラッパー（スレッドセーフ）
+    パラメータ・レスポンスはPythonの値で扱う
+    """
+
+    def __init__(self, client_factory: Callable[[], Any]):
+        """
+        Args:
+            client_factory: 低レベルクライアントを返す関数（初回の呼び出しまで生成しない）
+        """
+        self._client_factory = client_factory
+
+    @property
+    def client(self):
+        """低レベルクライアント"""
+        return self._client_factory()
+
+    @property
+    def exceptions(self):
+        return self.client.exceptions
+
+    def get_item(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.get_item(**_encode_params(params)))
+
+    def put_item(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.put_item(**_encode_params(params)))
+
+    def update_item(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.update_item(**_encode_params(params)))
+
+    def delete_item(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.delete_item(**_encode_params(params)))
+
+    def query(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.query(**_encode_params(params)))
+
+    def scan(self, **params) -> Dict[str, Any]:
+        return _decode_response(self.client.scan(**_encode_params(params)))
+
+    def batch_get_item(self, RequestItems: Dict[str, Dict[str, Any]], **params) -> Dict[str, Any]:
+        request_items = {
+            table_name: {**request, 'Keys': [encode_item(key) for key in request['Keys']]}
+            for table_name, request in RequestItems.items()
+        }
+        response = self.client.batch_get_item(RequestItems=request_items, **params)
+
+        response['Responses'] = {
+            table_name: decode_items(items) for table_name, items in response.get('Responses', {}).items()
+        }
+        response['UnprocessedKeys'] = {
+            table_name: {**request, 'Keys': [decode_item(key) for key in request.get('Keys', [])]}
+            for table_name, request in (response.get('UnprocessedKeys') or {}).items()
+        }
+        return response
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]], **params) -> Dict[str, Any]:
+        request_items = {
+            table_name: [_encode_write_request(request) for request in requests]
+            for table_name, requests in RequestItems.items()
+        }
+        response = self.client.batch_write_item(RequestItems=request_items, **params)
+
+        response['UnprocessedItems'] = {
+            table_name: [_decode_write_request(request) for request in requests]
+            for table_name, requests in (response.get('UnprocessedItems') or {}).items()
+        }
+        return response
+
+    def transact_write_items(self, TransactItems: List[Dict[str, Any]], **params) -> Dict[str, Any]:
+        transact_items = [
+            {operation: _encode_params(request) for operation, request in item.items()}
+            for item in TransactItems
+        ]
+        return self.client.transact_write_items(TransactItems=transact_items, **params)
+
+
+class _Meta:
+    def __init__(self, client: DynamoDBClient):
+        self.client = client
+
+
+class ClientTable:
+    """boto3のTableリソースと同じ呼び出し方ができるテーブル"""
+
+    def __init__(self, name: str, client: DynamoDBClient):
+        self.name = name
+        self.meta = _Meta(client)
+
+    def get_item(self, **params) -> Dict[str, Any]:
+        return self.meta.client.get_item(TableName=self.name, **params)
+
+    def put_item(self, **params) -> Dict[str, Any]:
+        return self.meta.client.put_item(TableName=self.name, **params)
+
+    def update_item(self, **params) -> Dict[str, Any]:
+        return self.meta.client.update_item(TableName=self.name, **params)
+
+    def delete_item(self, **params) -> Dict[str, Any]:
+        return self.meta.client.delete_item(TableName=self.name, **params)
+
+    def query(self, **params) -> Dict[str, Any]:
+        return self.meta.client.query(TableName=self.name, **params)
+
+    def scan(self, **params) -> Dict[str, Any]:
+        return self.meta.client.scan(TableName=self.name, **params)
+
+
+class ClientDynamoDB:
+    """boto3のDynamoDBリソースと同じ呼び出し方ができる低レベルクライアントのデータ層"""
+
+    def __init__(self, client_factory: Callable[[], Any]):
+        self.meta = _Meta(DynamoDBClient(client_factory))
+
+    def Table(self, name: str) -> ClientTable:
+        return ClientTable(name, self.meta.client)
+
+    def batch_get_item(self, **params) -> Dict[str, Any]:
+        return self.meta.client.batch_get_item(**params)
+
+
+# リポジトリで共有するデータ層（低レベルクライアントは初回使用時に生成する）
+dynamodb = ClientDynamoDB(get_dynamodb_raw_client)
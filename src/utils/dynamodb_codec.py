@@ -0,0 +1,173 @@
+"""
+DynamoDBアイテムの変換ユーティリティ
+ワイヤ形式（{'S': 'x'}, {'N': '1'} など）とPythonの型を相互に変換する
+
+boto3リソースのTypeDeserializerは数値をすべてDecimalにするが、ここでは整数はint、小数はfloatにする
+（Decimalのままだとjson.dumpsで文字列になる）。
+アイテムの変換はアイテムの形（属性名の並び）ごとに変換関数のリストをキャッシュし、
+同じ形のアイテムが並ぶqueryのページでは属性ごとの型判定を省く
+"""
+import math
+import threading
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# キャッシュするアイテムの形の上限（超えた場合はキャッシュを作り直す）
+MAX_CACHED_SHAPES = 512
+
+_Decoder = Callable[[Any], Any]
+
+
+def _decode_number(value: str) -> Any:
+    """数値文字列をint（整数の場合）またはfloatに変換"""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _decode_map(value: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return {name: decode_value(attribute) for name, attribute in value.items()}
+
+
+def _decode_list(value: List[Dict[str, Any]]) -> List[Any]:
+    return [decode_value(attribute) for attribute in value]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_DECODERS: Dict[str, _Decoder] = {
+    'S': _identity,
+    'N': _decode_number,
+    'BOOL': _identity,
+    'NULL': lambda value: None,
+    'M': _decode_map,
+    'L': _decode_list,
+    'B': bytes,
+    'SS': set,
+    'NS': lambda value: {_decode_number(number) for number in value},
+    'BS': lambda value: {bytes(item) for item in value},
+}
+
+
+def decode_value(attribute: Dict[str, Any]) -> Any:
+    """
+    ワイヤ形式の値をPythonの値に変換
+
+    Args:
+        attribute: ワイヤ形式の値（例: {'N': '1'}）
+
+    Returns:
+        Pythonの値（数値はint/float、Setはset）
+    """
+    for tag, value in attribute.items():
+        return _DECODERS[tag](value)
+    raise ValueError("Empty attribute value")
+
+
+_shapes: Dict[Tuple[str, ...], List[Tuple[str, str, _Decoder]]] = {}
+_shapes_lock = threading.Lock()
+
+
+def _compile_shape(item: Dict[str, Dict[str, Any]]) -> List[Tuple[str, str, _Decoder]]:
+    """アイテムの形の変換関数のリスト [(属性名, 型, 変換関数)] を作成してキャッシュ"""
+    decoders = []
+    for name, attribute in item.items():
+        tag = next(iter(attribute))
+        decoders.append((name, tag, _DECODERS[tag]))
+
+    with _shapes_lock:
+        if len(_shapes) >= MAX_CACHED_SHAPES:
+            _shapes.clear()
+        _shapes[tuple(item)] = decoders
+    return decoders
+
+
+def decode_item(item: Optional[Dict[str, Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    ワイヤ形式のアイテムをPythonのdictに変換
+
+    Args:
+        item: ワイヤ形式のアイテム
+
+    Returns:
+        Pythonのdict（Noneの場合はNone）
+    """
+    if item is None:
+        return None
+
+    decoders = _shapes.get(tuple(item))
+    if decoders is None:
+        decoders = _compile_shape(item)
+
+    try:
+        return {name: decode(item[name][tag]) for name, tag, decode in decoders}
+    except KeyError:
+        # 同じ属性名で型が異なるアイテム（NULLと文字列など）
+        return {name: decode_value(attribute) for name, attribute in item.items()}
+
+
+def decode_items(items: List[Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """ワイヤ形式のアイテムのリストを変換"""
+    return [decode_item(item) for item in items]
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """
+    Pythonの値をワイヤ形式に変換
+
+    Args:
+        value: Pythonの値（None, bool, int, float, Decimal, str, bytes, set, list, tuple, dict）
+
+    Returns:
+        ワイヤ形式の値
+
+    Raises:
+        TypeError: 変換できない型、空のset、NaN/Infinityの場合
+    """
+    if value is None:
+        return {'NULL': True}
+    if isinstance(value, bool):
+        return {'BOOL': value}
+    if isinstance(value, str):
+        return {'S': value}
+    if isinstance(value, (int, float, Decimal)):
+        return {'N': _encode_number(value)}
+    if isinstance(value, dict):
+        return {'M': {name: encode_value(item) for name, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {'L': [encode_value(item) for item in value]}
+    if isinstance(value, (bytes, bytearray)):
+        return {'B': bytes(value)}
+    if isinstance(value, (set, frozenset)):
+        return _encode_set(value)
+    raise TypeError(f"Unsupported type for DynamoDB: {type(value).__name__}")
+
+
+def _encode_number(value: Any) -> str:
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            raise TypeError("NaN and Infinity are not supported by DynamoDB")
+        return repr(value)
+    return str(value)
+
+
+def _encode_set(value: Any) -> Dict[str, Any]:
+    if not value:
+        raise TypeError("Empty sets are not supported by DynamoDB")
+    if all(isinstance(item, str) for item in value):
+        return {'SS': list(value)}
+    if all(isinstance(item, (int, float, Decimal)) and not isinstance(item, bool) for item in value):
+        return {'NS': [_encode_number(item) for item in value]}
+    if all(isinstance(item, (bytes, bytearray)) for item in value):
+        return {'BS': [bytes(item) for item in value]}
+    raise TypeError("Sets must contain only strings, numbers or bytes")
+
+
+def encode_item(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Pythonのdictをワイヤ形式のアイテムに変換（Noneの場合はNone）"""
+    if item is None:
+        return None
+    return {name: encode_value(value) for name, value in item.items()}
@@ -0,0 +1,211 @@
+"""
+派生画像ユーティリティ
+アップロードされた画像から一覧用のサムネイルと詳細用のWebP/AVIF画像を生成してS3に保存する
+
+キー構造:
+    元画像      articles/20260101120000_abcd1234.jpg
+    派生画像    variants/articles/20260101120000_abcd1234/thumbnail.webp
+
+画像の縮小・エンコードはCPU処理のためプロセスプールで幅ごとに並列実行する
+（Pillowはプロセスプール側でのみ読み込む）
+"""
+import functools
+import io
+import posixpath
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from config.settings import settings
+from utils.logger import get_logger
+from utils.s3 import s3_client, image_url_for_key, IMAGE_CACHE_CONTROL
+
+logger = get_logger(__name__)
+
+# 派生画像の種類と幅（px）・出力形式
+# thumbnailは一覧用、mediumは詳細画面用
+IMAGE_VARIANTS: List[Tuple[str, int, Tuple[str, ...]]] = [
+    ('thumbnail', 320, ('jpeg', 'webp', 'avif')),
+    ('medium', 960, ('webp', 'avif')),
+]
+# 出力形式ごとのPillowの形式名・機能名（PIL.features.check）・拡張子・Content-Type・品質
+VARIANT_FORMATS: Dict[str, Dict[str, Any]] = {
+    'jpeg': {'pillow': 'JPEG', 'feature': 'jpg', 'ext': 'jpg', 'content_type': 'image/jpeg', 'quality': 80},
+    'webp': {'pillow': 'WEBP', 'feature': 'webp', 'ext': 'webp', 'content_type': 'image/webp', 'quality': 75},
+    'avif': {'pillow': 'AVIF', 'feature': 'avif', 'ext': 'avif', 'content_type': 'image/avif', 'quality': 60},
+}
+
+_process_pool: Optional[Executor] = None
+
+
+def _in_process_executor() -> Executor:
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def get_variant_executor() -> Executor:
+    """
+    画像処理用のプロセスプール（プロセス内で使い回す）
+    IMAGE_VARIANT_WORKERSが0の場合やプロセスプールを作れない環境（/dev/shmのないLambdaなど）では
+    プロセス内で実行する
+    """
+    global _process_pool
+    if _process_pool is None:
+        workers = settings.IMAGE_VARIANT_WORKERS
+        if workers > 0:
+            try:
+                _process_pool = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, rendering image variants in process: {str(e)}")
+        if _process_pool is None:
+            _process_pool = _in_process_executor()
+    return _process_pool
+
+
+@functools.lru_cache(maxsize=1)
+def supported_formats() -> FrozenSet[str]:
+    """
+    このPillowで出力できる形式（AVIFはビルドによって対応していない）
+    ワーカーとAPIは同じレイヤーのPillowを使うため、APIが返す派生画像のURLとワーカーが生成する形式は一致する
+    """
+    try:
+        from PIL import features
+    except ImportError:
+        logger.warning("Pillow is not installed, no image variants are available")
+        return frozenset()
+    return frozenset(
+        image_format for image_format, spec in VARIANT_FORMATS.items()
+        if features.check(spec['feature'])
+    )
+
+
+def variant_prefix(image_key: str) -> str:
+    """元画像のキーから派生画像のキーの接頭辞を生成"""
+    stem, _ = posixpath.splitext(image_key)
+    return f"{settings.S3_VARIANTS_FOLDER}/{stem}/"
+
+
+def variant_key(image_key: str, name: str, image_format: str) -> str:
+    """派生画像のキー（variants/{元画像のキー（拡張子なし）}/{種類}.{拡張子}）"""
+    return f"{variant_prefix(image_key)}{name}.{VARIANT_FORMATS[image_format]['ext']}"
+
+
+def is_variant_key(key: str) -> bool:
+    """派生画像のキーか（S3イベントで派生画像自身を処理しないための判定）"""
+    return key.startswith(f"{settings.S3_VARIANTS_FOLDER}/")
+
+
+def render_variant(data: bytes, width: int, formats: Tuple[str, ...]) -> List[Tuple[str, bytes]]:
+    """
+    画像を指定幅に縮小して各形式にエンコード（プロセスプールで実行される）
+    元画像が指定幅より小さい場合は拡大しない。Pillowが対応していない形式（supported_formats）は出力しない
+
+    Args:
+        data: 元画像のバイトデータ
+        width: 幅（px）
+        formats: 出力形式（VARIANT_FORMATSのキー）
+
+    Returns:
+        [(出力形式, 画像のバイトデータ)]
+    """
+    from PIL import Image, ImageOps
+
+    Image.init()
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+        results: List[Tuple[str, bytes]] = []
+        supported = supported_formats()
+        for image_format in formats:
+            spec = VARIANT_FORMATS[image_format]
+            if image_format not in supported:
+                continue
+            target = image
+            if spec['pillow'] == 'JPEG' and target.mode not in ('RGB', 'L'):
+                target = target.convert('RGB')
+            buffer = io.BytesIO()
+            target.save(buffer, format=spec['pillow'], quality=spec['quality'])
+            results.append((image_format, buffer.getvalue()))
+        return results
+
+
+def generate_image_variants(
+    image_key: str,
+    data: Optional[bytes] = None,
+    executor: Optional[Executor] = None
+) -> Dict[str, Dict[str, str]]:
+    """
+    元画像から派生画像を生成してS3に保存
+
+    Args:
+        image_key: 元画像のS3オブジェクトのキー
+        data: 元画像のバイトデータ（省略時はS3から読み込む）
+        executor: 画像処理のExecutor（省略時はget_variant_executor()）
+
+    Returns:
+        派生画像のURL（{種類: {出力形式: URL}}）
+
+    Raises:
+        Exception: 画像の読み込み・変換・保存に失敗した場合
+    """
+    if data is None:
+        data = s3_client.get_object(Bucket=settings.S3_BUCKET_NAME, Key=image_key)['Body'].read()
+
+    executor = executor or get_variant_executor()
+    futures = [
+        (name, executor.submit(render_variant, data, width, formats))
+        for name, width, formats in IMAGE_VARIANTS
+    ]
+    rendered = [
+        (name, image_format, body)
+        for name, future in futures
+        for image_format, body in future.result()
+    ]
+
+    def upload(item: Tuple[str, str, bytes]) -> Tuple[str, str, str]:
+        name, image_format, body = item
+        key = variant_key(image_key, name, image_format)
+        s3_client.put_object(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            Body=body,
+            ContentType=VARIANT_FORMATS[image_format]['content_type'],
+            CacheControl=IMAGE_CACHE_CONTROL
+        )
+        return name, image_format, image_url_for_key(key)
+
+    variants: Dict[str, Dict[str, str]] = {}
+    if rendered:
+        with ThreadPoolExecutor(max_workers=len(rendered)) as uploader:
+            for name, image_format, url in uploader.map(upload, rendered):
+                variants.setdefault(name, {})[image_format] = url
+
+    logger.info(f"Generated {len(rendered)} image variants for {image_key}")
+    return variants
+
+
+def expected_image_variants(image_key: str) -> Dict[str, Dict[str, str]]:
+    """
+    元画像から生成される派生画像のURL（S3イベントのワーカーが生成する前でもキーは決まっている）
+
+    Args:
+        image_key: 元画像のS3オブジェクトのキー
+
+    Returns:
+        派生画像のURL（{種類: {出力形式: URL}}）。ワーカーのPillowが出力できない形式は含まない
+    """
+    supported = supported_formats()
+    variants = {
+        name: {
+            image_format: image_url_for_key(variant_key(image_key, name, image_format))
+            for image_format in formats if image_format in supported
+        }
+        for name, _, formats in IMAGE_VARIANTS
+    }
+    return {name: urls for name, urls in variants.items() if urls}
+
+
+def variant_urls(variants: Optional[Dict[str, Dict[str, str]]]) -> List[str]:
+    """派生画像のURLの一覧（削除用）"""
+    return [url for urls in (variants or {}).values() for url in urls.values()]
@@ -0,0 +1,213 @@
+"""
+メトリクスユーティリティ
+CloudWatchの埋め込みメトリクスフォーマット（EMF）でルート・サービスメソッドごとのメトリクスを出力する
+
+    @route_metrics                       # ハンドラー: Route次元（例: 'GET /admin/articles/list'）
+    def route_articles(event, context): ...
+
+    @timed                               # サービスメソッド: Operation次元（例: 'ArticleService.list_articles'）
+    def list_articles(self, ...): ...
+
+    add_dimension('Filters', 'category+status')   # 実行中のスコープに次元を追加
+
+- メトリクス: Latency（ミリ秒）, Errors, DynamoDBCalls, ItemsExamined, ItemsReturned
+  ルートのみ: ColdStart, ResponseBytes
+- DynamoDBの呼び出しはaws_clientsがbotocoreのafter-callイベントで記録する（並列スキャンのスレッドも含む）
+- 出力先はMETRICS_SINK（stdout: Lambdaのログ経由でCloudWatchが取り込む / file: METRICS_FILEにJSON Lines / off）
+- Lambdaは1つのプロセスで同時に1リクエストしか処理しないため、実行中のスコープはプロセスで共有する
+"""
+import functools
+import json
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from utils.logger import get_logger
+from utils.warmup import is_warmup_event
+
+logger = get_logger(__name__)
+
+# すべてのスコープで出力するDynamoDBのメトリクス（呼び出しがなくても0を出力する）
+DYNAMODB_METRICS = ('DynamoDBCalls', 'ItemsExamined', 'ItemsReturned')
+
+_open_scopes: List['MetricScope'] = []
+_lock = threading.Lock()
+_cold_start = True
+
+
+class MetricScope:
+    """1回のリクエスト（またはサービスメソッドの呼び出し）のメトリクス"""
+
+    def __init__(self, **dimensions: str):
+        """
+        Args:
+            dimensions: 集計の単位となる次元（例: Route='GET /admin/articles/list'）
+        """
+        self.dimensions: Dict[str, str] = dict(dimensions)
+        self._base_dimensions = list(dimensions)
+        self.metrics: Dict[str, Tuple[float, str]] = {name: (0, 'Count') for name in DYNAMODB_METRICS}
+        self.properties: Dict[str, Any] = {}
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add_dimension(self, name: str, value: str) -> None:
+        """次元を追加（元の次元だけの集計と、追加した次元を含む集計の両方を出力する）"""
+        self.dimensions[name] = str(value)
+
+    def put_metric(self, name: str, value: float, unit: str = 'Count') -> None:
+        """メトリクスを設定"""
+        with self._lock:
+            self.metrics[name] = (value, unit)
+
+    def add_metric(self, name: str, value: float, unit: str = 'Count') -> None:
+        """メトリクスに加算"""
+        with self._lock:
+            current = self.metrics.get(name, (0, unit))[0]
+            self.metrics[name] = (current + value, unit)
+
+    def set_property(self, name: str, value: Any) -> None:
+        """メトリクスにしない値（検索用のプロパティ）を設定"""
+        self.properties[name] = value
+
+    def __enter__(self) -> 'MetricScope':
+        with _lock:
+            _open_scopes.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        with _lock:
+            _open_scopes.remove(self)
+        self.put_metric('Latency', round((time.perf_counter() - self._start) * 1000, 3), 'Milliseconds')
+        if 'Errors' not in self.metrics:
+            self.put_metric('Errors', 1 if exc_type else 0)
+        emit(self.to_emf())
+
+    def to_emf(self) -> Dict[str, Any]:
+        """EMFのレコードを作成"""
+        dimension_sets = [self._base_dimensions]
+        if len(self.dimensions) > len(self._base_dimensions):
+            dimension_sets.append(list(self.dimensions))
+
+        return {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': settings.METRICS_NAMESPACE,
+                    'Dimensions': dimension_sets,
+                    'Metrics': [{'Name': name, 'Unit': unit} for name, (_, unit) in self.metrics.items()]
+                }]
+            },
+            **self.properties,
+            **self.dimensions,
+            **{name: value for name, (value, _) in self.metrics.items()}
+        }
+
+
+def emit(record: Dict[str, Any]) -> None:
+    """EMFのレコードを出力先に書き込む（失敗してもリクエストは失敗させない）"""
+    sink = settings.METRICS_SINK
+    if sink == 'off':
+        return
+    try:
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        if sink == 'file':
+            with _lock, open(settings.METRICS_FILE, 'a', encoding='utf-8') as f:
+                f.write(line)
+        else:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    except Exception as e:
+        logger.error(f"Failed to emit metrics: {str(e)}")
+
+
+def current_scope() -> Optional[MetricScope]:
+    """実行中の最も内側のスコープ"""
+    with _lock:
+        return _open_scopes[-1] if _open_scopes else None
+
+
+def add_dimension(name: str, value: str) -> None:
+    """実行中の最も内側のスコープに次元を追加（スコープがない場合は何もしない）"""
+    scope = current_scope()
+    if scope is not None:
+        scope.add_dimension(name, value)
+
+
+def record_dynamodb_call(operation: str, parsed: Dict[str, Any]) -> None:
+    """
+    DynamoDBの呼び出しを実行中のすべてのスコープに記録
+
+    Args:
+        operation: 操作名（Query, Scan, GetItem など）
+        parsed: レスポンス（ワイヤ形式のまま）
+    """
+    examined, returned = _item_counts(operation, parsed or {})
+    with _lock:
+        scopes = list(_open_scopes)
+    for scope in scopes:
+        scope.add_metric('DynamoDBCalls', 1)
+        scope.add_metric('ItemsExamined', examined)
+        scope.add_metric('ItemsReturned', returned)
+
+
+def _item_counts(operation: str, parsed: Dict[str, Any]) -> Tuple[int, int]:
+    """操作が読んだアイテム数と返したアイテム数"""
+    if operation in ('Query', 'Scan'):
+        return parsed.get('ScannedCount', 0), parsed.get('Count', 0)
+    if operation == 'GetItem':
+        found = 1 if parsed.get('Item') else 0
+        return found, found
+    if operation == 'BatchGetItem':
+        found = sum(len(items) for items in parsed.get('Responses', {}).values())
+        return found, found
+    return 0, 0
+
+
+def route_metrics(handler: Callable[[Dict[str, Any], Any], Dict[str, Any]]):
+    """
+    ハンドラーのデコレーター（Route次元でレイテンシー・コールドスタート・レスポンスサイズなどを出力）
+    Routeは'メソッド リソース'（例: 'GET /admin/articles/list/{articleId}'）、ウォームアップイベントは'warmup'
+    """
+    @functools.wraps(handler)
+    def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        global _cold_start
+        cold_start, _cold_start = _cold_start, False
+
+        with MetricScope(Route=_route_name(event)) as scope:
+            scope.put_metric('ColdStart', 1 if cold_start else 0)
+            response = handler(event, context)
+
+            status_code = response.get('statusCode', 200) if isinstance(response, dict) else 200
+            body = response.get('body') if isinstance(response, dict) else None
+            scope.put_metric('Errors', 1 if status_code >= 500 else 0)
+            scope.put_metric('ResponseBytes', len(body.encode('utf-8')) if isinstance(body, str) else 0, 'Bytes')
+            scope.set_property('StatusCode', status_code)
+        return response
+
+    return wrapper
+
+
+def _route_name(event: Any) -> str:
+    if not isinstance(event, dict):
+        return 'unknown'
+    if is_warmup_event(event):
+        return 'warmup'
+    method = event.get('httpMethod', event.get('requestContext', {}).get('http', {}).get('method', ''))
+    # API Gatewayのリソース（パスパラメータを含まない）を使い、次元の値の種類を抑える
+    resource = event.get('resource') or event.get('routeKey', '').split(' ')[-1] or event.get('path', '')
+    return f"{method} {resource}".strip()
+
+
+def timed(method: Callable) -> Callable:
+    """サービスメソッドのデコレーター（Operation次元でレイテンシー・DynamoDBの呼び出しなどを出力）"""
+    operation = method.__qualname__.split('<locals>.')[-1]
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with MetricScope(Operation=operation):
+            return method(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,112 @@
+"""
+カーソルページネーションユーティリティ
+DynamoDBのLastEvaluatedKeyを署名付きの不透明なカーソル文字列に変換する
+"""
+import base64
+import hashlib
+import hmac
+import json
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+
+
+def _to_json_value(value: Any) -> Any:
+    """DynamoDBのキー値をJSONシリアライズ可能な値に変換"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+def _sign(payload: bytes) -> str:
+    """ペイロードのHMAC-SHA256署名を生成"""
+    digest = hmac.new(
+        settings.CURSOR_SECRET_KEY.encode('utf-8'),
+        payload,
+        hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest).decode('ascii').rstrip('=')
+
+
+def _b64decode(value: str) -> bytes:
+    """パディングなしのURLセーフBase64をデコード"""
+    return base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+
+
+def build_cursor_scope(filters: Dict[str, Any]) -> str:
+    """
+    フィルター条件からカーソルの適用範囲を生成
+    条件を変えたリクエストで古いカーソルが使われるのを防ぐ
+
+    Args:
+        filters: フィルター条件
+
+    Returns:
+        適用範囲を表す短いハッシュ文字列
+    """
+    normalized = {k: v for k, v in filters.items() if v}
+    raw = json.dumps(normalized, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def encode_cursor(last_key: Optional[Dict[str, Any]], scope: str) -> Optional[str]:
+    """
+    LastEvaluatedKeyを署名付きカーソルにエンコード
+
+    Args:
+        last_key: DynamoDBのLastEvaluatedKey
+        scope: カーソルの適用範囲（使用したインデックスやフィルター条件）
+
+    Returns:
+        カーソル文字列。次のページがない場合はNone
+    """
+    if not last_key:
+        return None
+
+    payload = json.dumps(
+        {'k': {name: _to_json_value(v) for name, v in last_key.items()}, 's': scope},
+        ensure_ascii=False,
+        separators=(',', ':'),
+        sort_keys=True
+    ).encode('utf-8')
+
+    body = base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+    return f"{body}.{_sign(payload)}"
+
+
+def decode_cursor(cursor: Optional[str], scope: str) -> Optional[Dict[str, Any]]:
+    """
+    署名付きカーソルをExclusiveStartKeyにデコード
+
+    Args:
+        cursor: カーソル文字列
+        scope: 現在のリクエストのカーソル適用範囲
+
+    Returns:
+        ExclusiveStartKeyの辞書。カーソルが空の場合はNone
+
+    Raises:
+        ValueError: カーソルが不正、改ざんされている、または別の条件で発行された場合
+    """
+    if not cursor:
+        return None
+
+    try:
+        body, signature = cursor.split('.', 1)
+        payload = _b64decode(body)
+    except (ValueError, TypeError):
+        raise ValueError("不正なカーソルです")
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise ValueError("不正なカーソルです")
+
+    try:
+        data = json.loads(payload.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("不正なカーソルです")
+
+    if data.get('s') != scope or not isinstance(data.get('k'), dict):
+        raise ValueError("カーソルと検索条件が一致しません")
+
+    return data['k']
@@ -0,0 +1,129 @@
+"""
+DynamoDB並列スキャンユーティリティ
+TotalSegments/Segmentでテーブルを分割し、各セグメントを並列にスキャンしてアイテムを逐次返す
+一覧取得のほか、エクスポート・バックフィル・集計などの全件処理で使用する
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional
+
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 読み込み済みで未消費のページ数の上限（メモリ使用量を抑える）
+MAX_BUFFERED_PAGES = 16
+
+_DONE = object()
+
+
+class ParallelScan:
+    """
+    テーブルの並列スキャン
+
+    boto3のTableリソースはスレッドセーフではないため、各セグメントは
+    スレッドセーフな`table.meta.client`でスキャンする（Key/Attr条件や型変換はリソースと同様に使える）
+
+    使用例:
+        scan = ParallelScan(table, FilterExpression=Attr('status').eq('published'))
+        for item in scan:
+            ...
+        print(scan.scanned_count)
+    """
+
+    def __init__(
+        self,
+        table,
+        total_segments: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        **scan_kwargs
+    ):
+        """
+        Args:
+            table: DynamoDBのTableリソース
+            total_segments: セグメント数（省略時はsettings.PARALLEL_SCAN_SEGMENTS）
+            max_workers: 同時にスキャンするセグメント数の上限（省略時はセグメント数）
+            **scan_kwargs: scanに渡す追加パラメータ（FilterExpression, ProjectionExpressionなど）
+        """
+        self.table = table
+        self.total_segments = max(1, total_segments or settings.PARALLEL_SCAN_SEGMENTS)
+        self.max_workers = max(1, min(max_workers or self.total_segments, self.total_segments))
+        self.scan_kwargs = scan_kwargs
+        self.scanned_count = 0
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        スキャン結果のアイテムを読み込んだ順に返す（セグメント間の順序は保証しない）
+
+        Raises:
+            Exception: いずれかのセグメントのスキャンに失敗した場合
+        """
+        pages: queue.Queue = queue.Queue(maxsize=MAX_BUFFERED_PAGES)
+        stop = threading.Event()
+
+        def put(value) -> bool:
+            # 呼び出し側が途中で読むのをやめた場合に備えてタイムアウト付きで待つ
+            while not stop.is_set():
+                try:
+                    pages.put(value, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan_segment(segment: int) -> None:
+            params = dict(self.scan_kwargs)
+            params.update(TableName=self.table.name, Segment=segment, TotalSegments=self.total_segments)
+            try:
+                while not stop.is_set():
+                    response = self.table.meta.client.scan(**params)
+                    if not put(response):
+                        return
+                    if 'LastEvaluatedKey' not in response:
+                        return
+                    params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except Exception as e:
+                logger.error(f"Failed to scan {self.table.name} segment {segment}: {str(e)}")
+                put(e)
+            finally:
+                put(_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for segment in range(self.total_segments):
+                executor.submit(scan_segment, segment)
+
+            remaining = self.total_segments
+            while remaining:
+                page = pages.get()
+                if page is _DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+
+                items = page.get('Items', [])
+                self.scanned_count += page.get('ScannedCount', len(items))
+                self.count += len(items)
+                yield from items
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+
+def parallel_scan(table, total_segments: Optional[int] = None, **scan_kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    テーブルを並列スキャンしてアイテムを逐次返す
+
+    Args:
+        table: DynamoDBのTableリソース
+        total_segments: セグメント数（省略時はsettings.PARALLEL_SCAN_SEGMENTS）
+        **scan_kwargs: scanに渡す追加パラメータ
+
+    Returns:
+        アイテムのイテレーター
+    """
+    return iter(ParallelScan(table, total_segments, **scan_kwargs))
@@ -1,87 +1,226 @@
 """
 S3画像アップロードユーティリティ
 """
-import boto3
+from botocore.exceptions import ClientError
 import base64
+import hashlib
+import math
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from datetime import datetime
 
 from config.settings import settings
+from utils.aws_clients import s3_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# S3クライアントの初期化
-s3_client = boto3.client('s3')
+# DeleteObjectsの1リクエストあたりのキー数の上限
+DELETE_OBJECTS_LIMIT = 1000
 
+# マルチパートアップロードのパートサイズ（S3の最小パートサイズは5MB）と同時送信数
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 4
 
-def upload_image(image_data: str, folder: str, file_extension: str = 'jpg') -> str:
+# アップロードを受け付ける画像のContent-Typeと拡張子
+IMAGE_EXTENSIONS = {
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/png': 'png',
+    'image/gif': 'gif',
+    'image/webp': 'webp'
+}
+
+# アップロードした画像のキャッシュ設定（1年間キャッシュ）
+IMAGE_CACHE_CONTROL = 'max-age=31536000'
+
+# 署名付きURLのキャッシュ
+# 有効期限はこの単位に切り上げて署名し、同じ単位の要求で同じURLを使い回す
+PRESIGNED_URL_EXPIRATION_BUCKET = 300
+# 有効期限の残りがこの秒数（有効期限の半分を上限）を切ったURLは使い回さない
+PRESIGNED_URL_SAFETY_MARGIN = 300
+# キャッシュするURLの上限（超えた場合は最も古く使われたものから捨てる）
+PRESIGNED_URL_CACHE_SIZE = 2048
+
+
+def build_image_key(folder: str, file_extension: str) -> str:
     """
-    Base64エンコードされた画像をS3にアップロード
+    画像のユニークなキーを生成
 
     Args:
-        image_data: Base64エンコードされた画像データ
         folder: S3内のフォルダ（例: 'flyers', 'articles'）
-        file_extension: ファイル拡張子（デフォルト: 'jpg'）
+        file_extension: ファイル拡張子
 
     Returns:
-        アップロードされた画像のURL
+        キー（{folder}/{timestamp}_{uuid8}.{拡張子}）
+    """
+    timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    unique_id = str(uuid.uuid4())[:8]
+    return f"{folder}/{timestamp}_{unique_id}.{file_extension}"
 
-    Raises:
-        ValueError: 画像データが不正な場合
-        Exception: S3アップロードに失敗した場合
+
+def content_image_key(data: bytes, folder: str, file_extension: str) -> str:
+    """
+    画像の内容から決まるキーを生成（同じ画像は同じキーになる）
+
+    Args:
+        data: 画像のバイトデータ
+        folder: S3内のフォルダ（例: 'flyers', 'articles'）
+        file_extension: ファイル拡張子
+
+    Returns:
+        キー（{folder}/{SHA-256}.{拡張子}）
+    """
+    return f"{folder}/{hashlib.sha256(data).hexdigest()}.{file_extension}"
+
+
+def _store_content(data: bytes, folder: str, file_extension: str, content_type: str, refs=None) -> Tuple[str, bool]:
     """
+    画像を内容から決まるキーで保存（既に保存されている場合はアップロードしない）
+
+    refsを指定した場合はアップロード前に参照を登録する（削除ワーカーが同じ画像を消さないようにするため）
+    最初の参照の場合は必ずアップロードし、2件目以降はHEADでオブジェクトの存在を確認する
+    アップロードに失敗した場合は登録した参照を解放する
+
+    Args:
+        data: 画像のバイトデータ
+        folder: S3内のフォルダ
+        file_extension: ファイル拡張子
+        content_type: Content-Type
+        refs: 画像の参照カウント（acquire(key) -> 参照数）。省略時はHEADのみで確認する
+
+    Returns:
+        (S3オブジェクトのキー, 新たにアップロードしたか)
+    """
+    key = content_image_key(data, folder, file_extension)
+    references = refs.acquire(key) if refs else None
+
     try:
-        # Base64データをデコード
-        if ',' in image_data:
-            # data:image/jpeg;base64,... 形式の場合
-            image_data = image_data.split(',')[1]
+        if references != 1 and head_image(key):
+            logger.info(f"Image already stored, skipping upload: {key}")
+            return key, False
 
-        image_binary = base64.b64decode(image_data)
+        if len(data) > MULTIPART_PART_SIZE:
+            _upload_parts(data, key, content_type)
+        else:
+            s3_client.put_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=key,
+                Body=data,
+                ContentType=content_type,
+                CacheControl=IMAGE_CACHE_CONTROL
+            )
+        return key, True
+    except Exception:
+        # 保存できなかった画像の参照を残さない（残すと削除ワーカーが画像を消さなくなる）
+        if refs:
+            try:
+                refs.release(key)
+            except Exception as e:
+                logger.error(f"Failed to release image reference of {key}: {str(e)}")
+        raise
 
-        # ユニークなファイル名を生成
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]
-        file_name = f"{folder}/{timestamp}_{unique_id}.{file_extension}"
 
-        # S3にアップロード
-        bucket_name = settings.S3_BUCKET_NAME
+def image_url_for_key(key: str) -> str:
+    """S3オブジェクトのキーから画像URLを生成"""
+    return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
 
-        content_type = f'image/{file_extension}'
-        if file_extension == 'jpg':
-            content_type = 'image/jpeg'
 
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=file_name,
-            Body=image_binary,
-            ContentType=content_type,
-            CacheControl='max-age=31536000'  # 1年間キャッシュ
-        )
+def decode_image_data(image_data: str) -> bytes:
+    """
+    Base64エンコードされた画像データをデコード
 
-        # URLを生成
-        image_url = f"https://{bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{file_name}"
+    Args:
+        image_data: Base64エンコードされた画像データ（data:image/jpeg;base64,... 形式も可）
 
-        logger.info(f"Image uploaded successfully: {image_url}")
-        return image_url
+    Returns:
+        画像のバイトデータ
+
+    Raises:
+        ValueError: 画像データが不正な場合
+    """
+    if ',' in image_data:
+        # data:image/jpeg;base64,... 形式の場合
+        image_data = image_data.split(',')[1]
 
+    try:
+        return base64.b64decode(image_data)
     except base64.binascii.Error as e:
         logger.error(f"Invalid base64 image data: {str(e)}")
         raise ValueError("Invalid image data")
+
+
+def upload_image(image_data: Union[str, bytes], folder: str, file_extension: str = 'jpg', refs=None) -> str:
+    """
+    Base64エンコードされた画像をS3にアップロード
+    キーは画像の内容（SHA-256）から決まり、同じ画像が保存済みの場合はアップロードしない
+
+    Args:
+        image_data: Base64エンコードされた画像データ（デコード済みのバイトデータも可）
+        folder: S3内のフォルダ（例: 'flyers', 'articles'）
+        file_extension: ファイル拡張子（デフォルト: 'jpg'）
+        refs: 画像の参照カウント（省略時は参照を登録しない）
+
+    Returns:
+        アップロードされた画像のURL
+
+    Raises:
+        ValueError: 画像データが不正な場合
+        Exception: S3アップロードに失敗した場合
+    """
+    image_binary = image_data if isinstance(image_data, bytes) else decode_image_data(image_data)
+    image_url, _ = store_image(image_binary, folder, file_extension, refs)
+    return image_url
+
+
+def store_image(image_binary: bytes, folder: str, file_extension: str = 'jpg', refs=None) -> Tuple[str, bool]:
+    """
+    画像をS3に保存し、既に保存されていた画像かどうかも返す（upload_imageと同じキー・参照の扱い）
+
+    Args:
+        image_binary: 画像のバイトデータ
+        folder: S3内のフォルダ（例: 'flyers', 'articles'）
+        file_extension: ファイル拡張子（デフォルト: 'jpg'）
+        refs: 画像の参照カウント（省略時は参照を登録しない）
+
+    Returns:
+        (画像のURL, 新たにアップロードしたか)。保存済みの画像の場合はFalse
+
+    Raises:
+        Exception: S3アップロードに失敗した場合
+    """
+    content_type = f'image/{file_extension}'
+    if file_extension == 'jpg':
+        content_type = 'image/jpeg'
+
+    try:
+        # S3にアップロード（内容から決まるキー）
+        file_name, uploaded = _store_content(image_binary, folder, file_extension, content_type, refs)
     except Exception as e:
         logger.error(f"Failed to upload image to S3: {str(e)}")
         raise
 
+    image_url = image_url_for_key(file_name)
+    logger.info(f"Image uploaded successfully: {image_url}")
+    return image_url, uploaded
+
 
-def upload_multipart_image(file_content: bytes, content_type: str, folder: str) -> str:
+def upload_multipart_image(file_content: bytes, content_type: str, folder: str, refs=None) -> str:
     """
     マルチパートフォームデータの画像をS3にアップロード
+    キーは画像の内容（SHA-256）から決まり、同じ画像が保存済みの場合はアップロードしない
+    パートサイズを超える画像はS3マルチパートアップロード（パートを並列送信）で送る
 
     Args:
         file_content: 画像のバイトデータ
         content_type: Content-Type（例: 'image/jpeg'）
         folder: S3内のフォルダ（例: 'flyers', 'articles'）
+        refs: 画像の参照カウント（省略時は参照を登録しない）
 
     Returns:
         アップロードされた画像のURL
@@ -91,33 +230,13 @@ def upload_multipart_image(file_content: bytes, content_type: str, folder: str)
     """
     try:
         # 拡張子を決定
-        extension_map = {
-            'image/jpeg': 'jpg',
-            'image/jpg': 'jpg',
-            'image/png': 'png',
-            'image/gif': 'gif',
-            'image/webp': 'webp'
-        }
-        file_extension = extension_map.get(content_type, 'jpg')
-
-        # ユニークなファイル名を生成
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]
-        file_name = f"{folder}/{timestamp}_{unique_id}.{file_extension}"
-
-        # S3にアップロード
-        bucket_name = settings.S3_BUCKET_NAME
+        file_extension = IMAGE_EXTENSIONS.get(content_type, 'jpg')
 
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=file_name,
-            Body=file_content,
-            ContentType=content_type,
-            CacheControl='max-age=31536000'  # 1年間キャッシュ
-        )
+        # S3にアップロード（内容から決まるキー）
+        file_name, _ = _store_content(file_content, folder, file_extension, content_type, refs)
 
         # URLを生成
-        image_url = f"https://{bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{file_name}"
+        image_url = image_url_for_key(file_name)
 
         logger.info(f"Image uploaded successfully: {image_url}")
         return image_url
@@ -127,32 +246,125 @@ def upload_multipart_image(file_content: bytes, content_type: str, folder: str)
         raise
 
 
-def delete_image(image_url: str) -> bool:
+def _upload_parts(
+    data: bytes,
+    key: str,
+    content_type: str,
+    part_size: int = MULTIPART_PART_SIZE,
+    max_workers: int = MULTIPART_MAX_WORKERS
+) -> None:
+    """
+    大きな画像をS3マルチパートアップロードでパートを並列に送信（1接続で送るより速い）
+    パートはバイトデータのスライス（memoryview）で送るため、画像のコピーは作らない
+    失敗した場合はアップロードを中止する
+
+    Args:
+        data: 画像のバイトデータ
+        key: S3オブジェクトのキー
+        content_type: Content-Type（例: 'image/jpeg'）
+        part_size: パートサイズ（バイト、5MB以上）
+        max_workers: 同時に送信するパート数
+
+    Raises:
+        ValueError: パートサイズが小さすぎる場合
+        Exception: S3アップロードに失敗した場合
+    """
+    if part_size < MULTIPART_MIN_PART_SIZE:
+        raise ValueError(f"part_sizeは{MULTIPART_MIN_PART_SIZE}バイト以上を指定してください")
+
+    bucket_name = settings.S3_BUCKET_NAME
+    view = memoryview(data)
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=bucket_name,
+        Key=key,
+        ContentType=content_type,
+        CacheControl=IMAGE_CACHE_CONTROL
+    )['UploadId']
+
+    def upload_part(part_number: int) -> Dict[str, Any]:
+        start = (part_number - 1) * part_size
+        response = s3_client.upload_part(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=view[start:start + part_size]
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            completed = list(executor.map(upload_part, range(1, math.ceil(len(data) / part_size) + 1)))
+
+        s3_client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': completed}
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to upload image to S3, aborting multipart upload: {str(e)}")
+        try:
+            s3_client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+        except Exception as abort_error:
+            logger.error(f"Failed to abort multipart upload {upload_id}: {str(abort_error)}")
+        raise
+
+    logger.info(f"Image uploaded in {len(completed)} parts: {key}")
+
+
+def image_key_from_url(image_url: str) -> Optional[str]:
+    """
+    画像URLからS3オブジェクトのキーを抽出
+
+    Args:
+        image_url: 画像のURL（https://bucket-name.s3.region.amazonaws.com/path/to/file.jpg）
+
+    Returns:
+        キー（path/to/file.jpg）。バケットのURLでない場合はNone
+    """
+    bucket_name = settings.S3_BUCKET_NAME
+    prefix = f"{bucket_name}.s3."
+    if not image_url or prefix not in image_url:
+        return None
+
+    parts = image_url.split(prefix, 1)[1].split('/', 1)
+    return parts[1] if len(parts) == 2 and parts[1] else None
+
+
+def delete_image(image_url: str, refs=None) -> bool:
     """
     S3から画像を削除
+    refsを指定した場合は参照を1つ解放し、最後の参照だった場合のみオブジェクトを削除する
 
     Args:
         image_url: 削除する画像のURL
+        refs: 画像の参照カウント（release(key) -> 残りの参照数、claim_unreferenced(keys)、finish_removal(keys)）
 
     Returns:
-        削除に成功した場合True
+        削除（または参照の解放）に成功した場合True
     """
     try:
-        # URLからキーを抽出
         bucket_name = settings.S3_BUCKET_NAME
 
-        # https://bucket-name.s3.region.amazonaws.com/path/to/file.jpg
-        # から path/to/file.jpg を抽出
-        if bucket_name in image_url:
-            key = image_url.split(f"{bucket_name}.s3.")[1].split('/', 1)[1]
-        else:
+        key = image_key_from_url(image_url)
+        if not key:
             logger.warning(f"Image URL does not match bucket: {image_url}")
             return False
 
-        s3_client.delete_object(
-            Bucket=bucket_name,
-            Key=key
-        )
+        if refs and (refs.release(key) > 0 or key not in refs.claim_unreferenced([key])):
+            logger.info(f"Image is still referenced, keeping: {image_url}")
+            return True
+
+        try:
+            s3_client.delete_object(
+                Bucket=bucket_name,
+                Key=key
+            )
+        finally:
+            if refs:
+                refs.finish_removal([key])
 
         logger.info(f"Image deleted successfully: {image_url}")
         return True
@@ -162,28 +374,265 @@ def delete_image(image_url: str) -> bool:
         return False
 
 
+def delete_images(image_urls: Iterable[str]) -> Dict[str, str]:
+    """
+    複数の画像をDeleteObjectsでまとめて削除（1リクエスト1000件まで）
+
+    Args:
+        image_urls: 削除する画像のURL
+
+    Returns:
+        削除に失敗した画像 {URL: エラー内容}。全件成功した場合は空
+    """
+    bucket_name = settings.S3_BUCKET_NAME
+    errors: Dict[str, str] = {}
+    urls_by_key: Dict[str, List[str]] = {}
+
+    for image_url in image_urls:
+        if not image_url:
+            continue
+        key = image_key_from_url(image_url)
+        if key:
+            urls_by_key.setdefault(key, []).append(image_url)
+        else:
+            logger.warning(f"Image URL does not match bucket: {image_url}")
+            errors[image_url] = 'InvalidURL'
+
+    keys = list(urls_by_key)
+    for start in range(0, len(keys), DELETE_OBJECTS_LIMIT):
+        chunk = keys[start:start + DELETE_OBJECTS_LIMIT]
+        try:
+            # Quietモードでは失敗したキーのみが返る
+            response = s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+            )
+            for error in response.get('Errors', []):
+                for image_url in urls_by_key.get(error.get('Key'), []):
+                    errors[image_url] = error.get('Code') or error.get('Message') or 'Error'
+        except Exception as e:
+            logger.error(f"Failed to delete images from S3: {str(e)}")
+            for key in chunk:
+                for image_url in urls_by_key[key]:
+                    errors[image_url] = str(e)
+
+    logger.info(f"Images deleted: {len(keys) - len(errors)} objects ({len(errors)} failed)")
+    return errors
+
+
+class PresignedUrlCache:
+    """
+    署名付きURL（GetObject）のキャッシュ
+
+    (キー, 有効期限の単位)ごとに署名したURLを保持し、有効期限の安全マージン前までは同じURLを返す。
+    一覧で同じ画像を何度返しても署名の計算を省き、URLが変わらないためブラウザ・CDNのキャッシュも効く。
+    保持する件数はmax_sizeまで（LRU）
+    """
+
+    def __init__(
+        self,
+        max_size: int = PRESIGNED_URL_CACHE_SIZE,
+        expiration_bucket: int = PRESIGNED_URL_EXPIRATION_BUCKET,
+        safety_margin: int = PRESIGNED_URL_SAFETY_MARGIN
+    ):
+        self.max_size = max_size
+        self.expiration_bucket = expiration_bucket
+        self.safety_margin = safety_margin
+        self._urls: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sign(self, file_key: str, expiration: int = 3600) -> str:
+        """
+        署名付きURLを取得（キャッシュになければ署名する）
+
+        Args:
+            file_key: S3オブジェクトのキー
+            expiration: URL有効期限（秒）
+
+        Returns:
+            署名付きURL（有効期限の残りは安全マージン以上）
+        """
+        return self.sign_many([file_key], expiration)[file_key]
+
+    def sign_many(self, file_keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        """
+        複数のS3オブジェクトの署名付きURLをまとめて取得
+
+        Args:
+            file_keys: S3オブジェクトのキーのリスト
+            expiration: URL有効期限（秒）
+
+        Returns:
+            {キー: 署名付きURL}
+        """
+        ttl = self._bucketed(expiration)
+        margin = min(self.safety_margin, ttl // 2)
+        bucket_name = settings.S3_BUCKET_NAME
+        now = time.time()
+
+        urls: Dict[str, str] = {}
+        missing: List[str] = []
+        with self._lock:
+            for file_key in file_keys:
+                if file_key in urls or file_key in missing:
+                    continue
+                cache_key = (bucket_name, file_key, ttl)
+                cached = self._urls.get(cache_key)
+                if cached and cached[1] - margin > now:
+                    self._urls.move_to_end(cache_key)
+                    urls[file_key] = cached[0]
+                else:
+                    missing.append(file_key)
+
+        # 署名はロックの外で行う（他のスレッドのキャッシュの参照を待たせない）
+        signed = [
+            (file_key, s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': bucket_name, 'Key': file_key},
+                ExpiresIn=ttl
+            ))
+            for file_key in missing
+        ]
+
+        with self._lock:
+            for file_key, url in signed:
+                cache_key = (bucket_name, file_key, ttl)
+                self._urls[cache_key] = (url, now + ttl)
+                self._urls.move_to_end(cache_key)
+                urls[file_key] = url
+            while len(self._urls) > self.max_size:
+                self._urls.popitem(last=False)
+        return urls
+
+    def clear(self) -> None:
+        """キャッシュを空にする"""
+        with self._lock:
+            self._urls.clear()
+
+    def _bucketed(self, expiration: int) -> int:
+        """有効期限を単位に切り上げる"""
+        return max(self.expiration_bucket, math.ceil(expiration / self.expiration_bucket) * self.expiration_bucket)
+
+
+# プロセス内で共有する署名付きURLのキャッシュ
+presigned_urls = PresignedUrlCache()
+
+
 def get_presigned_url(file_key: str, expiration: int = 3600) -> str:
     """
     S3オブジェクトの署名付きURLを生成
+    同じキー・有効期限の単位の要求には、有効期限の安全マージン前まで同じURLを返す
 
     Args:
         file_key: S3オブジェクトのキー
-        expiration: URL有効期限（秒、デフォルト: 3600秒＝1時間）
+        expiration: URL有効期限（秒、デフォルト: 3600秒＝1時間。300秒単位に切り上げる）
 
     Returns:
         署名付きURL
     """
+    try:
+        return presigned_urls.sign(file_key, expiration)
+
+    except Exception as e:
+        logger.error(f"Failed to generate presigned URL: {str(e)}")
+        raise
+
+
+def sign_many(file_keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+    """
+    複数のS3オブジェクトの署名付きURLをまとめて生成（一覧の画像用）
+
+    Args:
+        file_keys: S3オブジェクトのキーのリスト
+        expiration: URL有効期限（秒、300秒単位に切り上げる）
+
+    Returns:
+        {キー: 署名付きURL}
+    """
+    try:
+        return presigned_urls.sign_many(file_keys, expiration)
+
+    except Exception as e:
+        logger.error(f"Failed to generate presigned URLs: {str(e)}")
+        raise
+
+
+def generate_presigned_upload(
+    file_key: str,
+    content_type: str,
+    max_size: int,
+    expiration: int = 900,
+    method: str = 'POST'
+) -> Dict[str, Any]:
+    """
+    ブラウザからS3に直接アップロードするための署名付きリクエストを生成
+
+    POSTはサイズ（content-length-range）とContent-Typeを署名の条件に含める。
+    PUTはContent-Typeのみ署名に含まれるため、サイズは確定時（head_image）に検証する。
+
+    Args:
+        file_key: アップロード先のキー
+        content_type: 画像のContent-Type
+        max_size: 最大サイズ（バイト）
+        expiration: 有効期限（秒、デフォルト: 900秒＝15分）
+        method: 'POST' または 'PUT'
+
+    Returns:
+        {'method', 'url', 'fields'(POST), 'headers'(PUT)}
+    """
     try:
         bucket_name = settings.S3_BUCKET_NAME
 
-        url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': bucket_name, 'Key': file_key},
+        if method == 'PUT':
+            url = s3_client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': bucket_name,
+                    'Key': file_key,
+                    'ContentType': content_type,
+                    'CacheControl': IMAGE_CACHE_CONTROL
+                },
+                ExpiresIn=expiration
+            )
+            return {
+                'method': 'PUT',
+                'url': url,
+                'headers': {'Content-Type': content_type, 'Cache-Control': IMAGE_CACHE_CONTROL}
+            }
+
+        post = s3_client.generate_presigned_post(
+            bucket_name,
+            file_key,
+            Fields={'Content-Type': content_type, 'Cache-Control': IMAGE_CACHE_CONTROL},
+            Conditions=[
+                {'Content-Type': content_type},
+                {'Cache-Control': IMAGE_CACHE_CONTROL},
+                ['content-length-range', 1, max_size]
+            ],
             ExpiresIn=expiration
         )
-
-        return url
+        return {'method': 'POST', 'url': post['url'], 'fields': post['fields']}
 
     except Exception as e:
-        logger.error(f"Failed to generate presigned URL: {str(e)}")
+        logger.error(f"Failed to generate presigned upload: {str(e)}")
         raise
+
+
+def head_image(file_key: str) -> Optional[Dict[str, Any]]:
+    """
+    S3オブジェクトのメタデータを取得
+
+    Args:
+        file_key: S3オブジェクトのキー
+
+    Returns:
+        {'size': バイト数, 'contentType': Content-Type}。存在しない場合はNone
+    """
+    try:
+        response = s3_client.head_object(Bucket=settings.S3_BUCKET_NAME, Key=file_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+
+    return {'size': int(response.get('ContentLength', 0)), 'contentType': response.get('ContentType')}
@@ -0,0 +1,82 @@
+"""
+全文検索ユーティリティ
+日本語向けの文字bigramトークナイザーとBM25スコア計算
+"""
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List
+
+# BM25パラメータ
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 単語区切りとみなす文字（空白・記号）
+_SEPARATOR_PATTERN = re.compile(r'[\W_]+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    検索用にテキストを正規化
+    NFKC正規化（全角英数→半角、半角カナ→全角など）と小文字化を行う
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        正規化されたテキスト
+    """
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    テキストを文字bigramに分割
+    空白・記号で区切った各セグメント内で2文字ずつずらしてトークンを生成する
+    （1文字だけのセグメントはトークンを生成しない）
+
+    例: "値上げ情報" -> ["値上", "上げ", "げ情", "情報"]
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        bigramのリスト（出現順、重複あり）
+    """
+    tokens = []
+    for segment in _SEPARATOR_PATTERN.split(normalize_text(text)):
+        tokens.extend(segment[i:i + 2] for i in range(len(segment) - 1))
+    return tokens
+
+
+def term_frequencies(text: str) -> Dict[str, int]:
+    """
+    テキスト中の各bigramの出現回数を集計
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        {bigram: 出現回数}
+    """
+    return dict(Counter(tokenize(text)))
+
+
+def bm25_score(tf: int, df: int, doc_length: int, avg_doc_length: float, doc_count: int) -> float:
+    """
+    1トークン分のBM25スコアを計算
+
+    Args:
+        tf: 文書内のトークン出現回数
+        df: トークンを含む文書数
+        doc_length: 文書のトークン数
+        avg_doc_length: 全文書の平均トークン数
+        doc_count: 全文書数
+
+    Returns:
+        スコア
+    """
+    idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+    norm = 1 - BM25_B + BM25_B * (doc_length / avg_doc_length if avg_doc_length else 1)
+    return idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
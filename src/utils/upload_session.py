@@ -0,0 +1,134 @@
+"""
+画像アップロードセッションユーティリティ
+ブラウザからS3に直接アップロードする署名付きURLを発行し、アップロード後の確定（画像URLの取得）を行う
+画像のバイト列はLambdaを経由しない
+
+1. create_upload_session: 署名付きPOST/PUTとアップロードトークンを発行
+2. ブラウザがS3に直接アップロード
+3. finalize_upload: トークンを検証し、S3上のサイズ・Content-Typeを確認して画像URLを返す
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+from utils.s3 import IMAGE_EXTENSIONS, build_image_key, generate_presigned_upload, head_image, image_url_for_key
+
+# 署名付きURLとアップロードトークンの有効期限（秒）
+UPLOAD_SESSION_EXPIRATION = 900
+# 確定されなかったアップロードを削除するまでの秒数（トークンを確定できる期限＋余裕）
+ABANDONED_UPLOAD_SECONDS = UPLOAD_SESSION_EXPIRATION * 2 + 300
+
+
+def _sign(payload: bytes) -> str:
+    """ペイロードのHMAC-SHA256署名を生成"""
+    digest = hmac.new(settings.UPLOAD_SECRET_KEY.encode('utf-8'), payload, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode('ascii').rstrip('=')
+
+
+def _encode_token(data: Dict[str, Any]) -> str:
+    payload = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    body = base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+    return f"{body}.{_sign(payload)}"
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    try:
+        body, signature = token.split('.', 1)
+        payload = base64.urlsafe_b64decode(body + '=' * (-len(body) % 4))
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError("不正なアップロードトークンです")
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise ValueError("不正なアップロードトークンです")
+
+    try:
+        return json.loads(payload.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("不正なアップロードトークンです")
+
+
+def create_upload_session(
+    folder: str,
+    content_type: str,
+    size: Optional[int] = None,
+    method: str = 'POST'
+) -> Dict[str, Any]:
+    """
+    アップロードセッションを発行
+
+    Args:
+        folder: S3内のフォルダ（例: 'articles'）
+        content_type: 画像のContent-Type
+        size: 画像のサイズ（バイト、指定時は上限の検証とPOSTのサイズ条件に使用）
+        method: 'POST'（サイズ条件付き、推奨）または 'PUT'
+
+    Returns:
+        {'uploadToken', 'key', 'method', 'url', 'fields' または 'headers', 'maxSize', 'expiresIn'}
+
+    Raises:
+        ValueError: Content-Type・サイズ・メソッドが不正な場合
+    """
+    if content_type not in IMAGE_EXTENSIONS:
+        raise ValueError(f"対応していない画像形式です: {content_type}")
+    if method not in ('POST', 'PUT'):
+        raise ValueError("methodはPOSTまたはPUTを指定してください")
+
+    max_size = settings.MAX_IMAGE_UPLOAD_BYTES
+    if size is not None:
+        if size < 1 or size > max_size:
+            raise ValueError(f"画像サイズは{max_size}バイトまでです")
+        max_size = size
+
+    key = build_image_key(folder, IMAGE_EXTENSIONS[content_type])
+    upload = generate_presigned_upload(key, content_type, max_size, UPLOAD_SESSION_EXPIRATION, method)
+
+    token = _encode_token({
+        'k': key,
+        't': content_type,
+        'm': max_size,
+        'e': int(time.time()) + UPLOAD_SESSION_EXPIRATION
+    })
+
+    return {
+        'uploadToken': token,
+        'key': key,
+        **upload,
+        'maxSize': max_size,
+        'expiresIn': UPLOAD_SESSION_EXPIRATION
+    }
+
+
+def finalize_upload(upload_token: str, folder: str) -> str:
+    """
+    アップロードを確定し、画像URLを返す
+
+    Args:
+        upload_token: create_upload_sessionで発行したトークン
+        folder: 確定先として許可するフォルダ
+
+    Returns:
+        アップロードされた画像のURL
+
+    Raises:
+        ValueError: トークンが不正・期限切れ、画像が未アップロード、サイズ・形式が条件と異なる場合
+    """
+    data = _decode_token(upload_token)
+    key = data.get('k')
+    if not isinstance(key, str) or not key.startswith(f"{folder}/"):
+        raise ValueError("不正なアップロードトークンです")
+
+    # トークンはアップロード完了後に使うため、署名付きURLの有効期限に余裕を持たせる
+    if int(data.get('e', 0)) + UPLOAD_SESSION_EXPIRATION < time.time():
+        raise ValueError("アップロードトークンの有効期限が切れています")
+
+    metadata = head_image(key)
+    if not metadata:
+        raise ValueError("画像がアップロードされていません")
+    if metadata['size'] > int(data.get('m', 0)) or metadata['contentType'] != data.get('t'):
+        raise ValueError("アップロードされた画像がセッションの条件と一致しません")
+
+    return image_url_for_key(key)
@@ -0,0 +1,149 @@
+"""
+ウォームアップ・プライミングユーティリティ
+コールドスタートの初回リクエストで払っていた準備（インポート・クライアント生成・DynamoDB/S3への接続・
+正規表現のコンパイルなど）を、初期化フェーズ（SnapStartの場合はスナップショット作成前）に済ませる
+
+    primer = Primer('route_articles', [('clients', prime_clients), ...])
+    primer.install()                     # ハンドラーモジュールの末尾で呼ぶ
+
+    def handler(event, context):
+        if is_warmup_event(event):
+            return primer.warmup_response()
+
+- Lambda上（AWS_LAMBDA_FUNCTION_NAMEあり）かつPRIMING_ENABLEDの場合のみ初期化時に実行する（テスト・ローカルでは実行しない）
+- SnapStartの場合はbefore_snapshotフックで実行し、復元後は接続のステップだけやり直す
+  （スナップショットに含まれる接続は復元後に使えないため）
+- 各ステップの所要時間を「初回リクエストから初期化フェーズに移した時間」としてレポートする
+"""
+import importlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ウォームアップイベントのキー（スケジュールのInputに {"warmup": true} を指定する）
+WARMUP_KEY = 'warmup'
+
+PrimingStep = Tuple[str, Callable[[], Any]]
+
+
+def is_warmup_event(event: Any) -> bool:
+    """
+    ウォームアップ（スケジュール）イベントかどうか
+
+    Args:
+        event: Lambdaのイベント
+
+    Returns:
+        {"warmup": true} を含むイベント、またはEventBridgeのスケジュールイベントの場合True
+    """
+    if not isinstance(event, dict):
+        return False
+    if event.get(WARMUP_KEY):
+        return True
+    return event.get('source') == 'aws.events' and event.get('detail-type') == 'Scheduled Event'
+
+
+class Primer:
+    """ハンドラーごとのプライミング（ステップを1度だけ実行し、レポートを保持する）"""
+
+    def __init__(self, name: str, steps: Iterable[PrimingStep], restore_steps: Iterable[str] = ('connections',)):
+        """
+        Args:
+            name: ハンドラー名（ログ用）
+            steps: [(ステップ名, 実行する関数)]
+            restore_steps: SnapStartの復元後にやり直すステップ名
+        """
+        self.name = name
+        self.steps: List[PrimingStep] = list(steps)
+        self.restore_steps = set(restore_steps)
+        self.report: List[Dict[str, Any]] = []
+        self._primed = False
+        self._lock = threading.Lock()
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        全ステップを実行（実行済みの場合は何もしない）
+
+        Returns:
+            [{'step': ステップ名, 'savedMs': 初回リクエストから移した時間, 'ok': 成功したか}]
+        """
+        with self._lock:
+            if not self._primed:
+                self.report = self._run_steps(self.steps)
+                self._primed = True
+                total = sum(entry['savedMs'] for entry in self.report if entry['ok'])
+                summary = ', '.join(f"{entry['step']}={entry['savedMs']}ms" for entry in self.report)
+                logger.info(f"Primed {self.name}: {summary} (total {round(total, 1)}ms)")
+        return self.report
+
+    def after_restore(self) -> None:
+        """SnapStartの復元後に接続をやり直す"""
+        steps = [step for step in self.steps if step[0] in self.restore_steps]
+        restored = self._run_steps(steps)
+        logger.info(f"Restored {self.name}: " + ', '.join(f"{entry['step']}={entry['savedMs']}ms" for entry in restored))
+
+    def install(self) -> None:
+        """
+        初期化フェーズでのプライミングを登録
+        SnapStartの場合はスナップショット作成前・復元後のフックに登録し、それ以外はその場で実行する
+        """
+        if not settings.PRIMING_ENABLED or not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+            return
+
+        if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'snap-start':
+            try:
+                from snapshot_restore_py import register_after_restore, register_before_snapshot
+            except ImportError:
+                logger.warning("snapshot_restore_py is not available, priming during init")
+            else:
+                register_before_snapshot(self.run)
+                register_after_restore(self.after_restore)
+                return
+
+        self.run()
+
+    def warmup_response(self) -> Dict[str, Any]:
+        """ウォームアップイベントへの応答（未実行の場合はここでプライミングする）"""
+        return {'warmup': True, 'handler': self.name, 'primed': self.run()}
+
+    def _run_steps(self, steps: List[PrimingStep]) -> List[Dict[str, Any]]:
+        report = []
+        for name, step in steps:
+            start = time.perf_counter()
+            try:
+                step()
+                ok = True
+            except Exception as e:
+                # プライミングの失敗で初期化を失敗させない（初回リクエストで改めて準備される）
+                logger.warning(f"Priming step {name} of {self.name} failed: {str(e)}")
+                ok = False
+            report.append({'step': name, 'savedMs': round((time.perf_counter() - start) * 1000, 1), 'ok': ok})
+        return report
+
+
+def prime_imports(*module_names: str) -> None:
+    """初回リクエストで遅延インポートされるモジュールをインポート"""
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def open_dynamodb_connection(client: Any, table_name: str) -> None:
+    """
+    DynamoDBへの接続（TLSハンドシェイク）を開いて接続プールに残す
+
+    Args:
+        client: DynamoDBクライアント（低レベルクライアントまたはリソースのmeta.client）
+        table_name: 権限のあるテーブル名（DescribeTableを使う）
+    """
+    client.describe_table(TableName=table_name)
+
+
+def open_s3_connection(client: Any, bucket_name: Optional[str] = None) -> None:
+    """S3への接続を開いて接続プールに残す（HeadBucketを使う）"""
+    client.head_bucket(Bucket=bucket_name or settings.S3_BUCKET_NAME)
@@ -15,6 +15,8 @@ os.environ['DYNAMODB_ENDPOINT_URL'] = 'http://localhost:8000'
 os.environ['ARTICLES_TABLE_NAME'] = 'articles'
 os.environ['ADMINS_TABLE_NAME'] = 'admins'
 os.environ['JWT_SECRET_KEY'] = 'test-secret-key'
+# メトリクス（EMF）は出力しない（出力を確認するテストはMETRICS_SINK=fileに切り替えてファイルに出力する）
+os.environ['METRICS_SINK'] = 'off'
 
 
 @pytest.fixture
@@ -139,7 +141,7 @@ def mock_article_repository():
     }
 
     # list_articlesのモック
-    mock_repo.list_articles.return_value = ([mock_article], 1)
+    mock_repo.list_articles.return_value = ([mock_article], 1, None)
 
     # get_by_idのモック
     mock_repo.get_by_id.return_value = mock_article
@@ -153,6 +155,12 @@ def mock_article_repository():
     # deleteのモック
     mock_repo.delete.return_value = True
 
+    # update_returning_oldのモック（更新後, 更新前）
+    mock_repo.update_returning_old.return_value = (mock_article, mock_article)
+
+    # delete_returning_oldのモック（削除前の値）
+    mock_repo.delete_returning_old.return_value = mock_article
+
     return mock_repo
 
 
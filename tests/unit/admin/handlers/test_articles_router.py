@@ -13,7 +13,8 @@ from src.admin.handlers.articles_router import (
     update_article,
     delete_article,
     bulk_update_status,
-    bulk_delete_articles
+    bulk_delete_articles,
+    create_upload_session
 )
 
 
@@ -33,7 +34,7 @@ class TestArticlesRouter:
         """GET /admin/articles/list のルーティングを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.list_articles.return_value = ([], 0, 1)
+        mock_service.list_articles.return_value = ([], 0, 1, None)
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -159,7 +160,7 @@ class TestListArticles:
         """コラム一覧取得が正常に動作することを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.list_articles.return_value = ([sample_article_response], 1, 1)
+        mock_service.list_articles.return_value = ([sample_article_response], 1, 1, None)
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -211,7 +212,7 @@ class TestListArticles:
         """フィルター条件が正しく渡されることを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.list_articles.return_value = ([], 0, 1)
+        mock_service.list_articles.return_value = ([], 0, 1, None)
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -240,6 +241,219 @@ class TestListArticles:
         assert filters['category'] == 'テクノロジー'
 
 
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_articles_cursor_mode(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token,
+        sample_article_response
+    ):
+        """cursor指定時はカーソル方式で取得しnextCursorを返すことを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.list_articles_by_cursor.return_value = ([sample_article_response], 'next-cursor', None)
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'queryStringParameters': {
+                'limit': '10',
+                'status': 'published',
+                'cursor': 'prev-cursor'
+            },
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = list_articles(event)
+
+        # Assert
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['pagination']['nextCursor'] == 'next-cursor'
+        assert body['pagination']['hasMore'] is True
+        assert 'totalItems' not in body['pagination']
+        call_args = mock_service.list_articles_by_cursor.call_args[0]
+        assert call_args[1] == 10
+        assert call_args[2] == 'prev-cursor'
+        mock_service.list_articles.assert_not_called()
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_articles_invalid_cursor(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token
+    ):
+        """不正なカーソルの場合400を返すことを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.list_articles_by_cursor.side_effect = ValueError("不正なカーソルです")
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'queryStringParameters': {'cursor': 'tampered'},
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = list_articles(event)
+
+        # Assert
+        assert response['statusCode'] == 400
+
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_articles_query_plan_header(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token
+    ):
+        """開発環境では実行計画がX-Query-Planヘッダーで返ることを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.list_articles.return_value = ([], 0, 1, 'index=table; operation=scan')
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'queryStringParameters': {},
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = list_articles(event)
+
+        # Assert
+        assert response['statusCode'] == 200
+        assert response['headers']['X-Query-Plan'] == 'index=table; operation=scan'
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_articles_fields(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token
+    ):
+        """fieldsパラメータがカンマ区切りでサービスに渡ることを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.list_articles.return_value = ([], 0, 1, None)
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'queryStringParameters': {'fields': 'title, status'},
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = list_articles(event)
+
+        # Assert
+        assert response['statusCode'] == 200
+        assert mock_service.list_articles.call_args.kwargs['fields'] == ['title', 'status']
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_articles_by_ids(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token
+    ):
+        """idsパラメータ指定時は複数取得になることを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.get_articles.return_value = ([{'articleId': 1}, {'articleId': 3}], [2])
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'queryStringParameters': {'ids': '1,2,3'},
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = list_articles(event)
+
+        # Assert
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert [item['articleId'] for item in body['items']] == [1, 3]
+        assert body['notFound'] == [2]
+        mock_service.get_articles.assert_called_once_with([1, 2, 3], fields=None)
+        mock_service.list_articles.assert_not_called()
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    def test_list_articles_invalid_ids(self, mock_require_role, system_admin_token):
+        """idsが数値でない場合400を返すことを確認"""
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+        event = {
+            'queryStringParameters': {'ids': '1,abc'},
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        response = list_articles(event)
+
+        assert response['statusCode'] == 400
+
+
+@pytest.mark.unit
+class TestCreateUploadSession:
+    """画像アップロードセッション発行ハンドラーのテスト"""
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_create_upload_session_success(
+        self,
+        mock_service_class,
+        mock_require_role,
+        system_admin_token
+    ):
+        """署名付きアップロードの情報を返すことを確認"""
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.create_image_upload_session.return_value = {
+            'uploadToken': 'token', 'method': 'POST', 'url': 'https://s3', 'fields': {}
+        }
+        mock_service_class.return_value = mock_service
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+
+        event = {
+            'body': json.dumps({'contentType': 'image/jpeg', 'size': 1024}),
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        # Act
+        response = create_upload_session(event)
+
+        # Assert
+        assert response['statusCode'] == 201
+        assert json.loads(response['body'])['uploadToken'] == 'token'
+        mock_service.create_image_upload_session.assert_called_once_with('image/jpeg', 1024, 'POST')
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    def test_create_upload_session_missing_content_type(self, mock_require_role, system_admin_token):
+        """contentTypeがない場合400を返すことを確認"""
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+        event = {
+            'body': json.dumps({'size': 1024}),
+            'headers': {'Authorization': f'Bearer {system_admin_token}'}
+        }
+
+        response = create_upload_session(event)
+
+        assert response['statusCode'] == 400
+
+
 @pytest.mark.unit
 class TestGetArticle:
     """コラム詳細取得ハンドラーのテスト"""
@@ -351,6 +565,7 @@ class TestCreateArticle:
         assert response['statusCode'] == 201
         body = json.loads(response['body'])
         assert body['articleId'] == 1
+        mock_service.create_article.assert_called_once_with(sample_article_data, 1)
 
     @patch('src.admin.handlers.articles_router.require_role')
     def test_create_article_missing_required_field(
@@ -424,6 +639,7 @@ class TestUpdateArticle:
         assert response['statusCode'] == 200
         body = json.loads(response['body'])
         assert body['articleId'] == 1
+        mock_service.update_article.assert_called_once_with(1, {'title': '更新されたタイトル'}, 1)
 
     @patch('src.admin.handlers.articles_router.require_role')
     @patch('src.admin.handlers.articles_router.ArticleService')
@@ -527,7 +743,9 @@ class TestBulkUpdateStatus:
         """ステータス一括更新が正常に動作することを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.bulk_update_status.return_value = (3, 0)
+        mock_service.bulk_update_status.return_value = (3, 0, [
+            {'articleId': i, 'success': True} for i in (1, 2, 3)
+        ])
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -547,6 +765,7 @@ class TestBulkUpdateStatus:
         body = json.loads(response['body'])
         assert body['successCount'] == 3
         assert body['failedCount'] == 0
+        assert [result['articleId'] for result in body['results']] == [1, 2, 3]
 
     @patch('src.admin.handlers.articles_router.require_role')
     def test_bulk_update_status_missing_fields(
@@ -585,7 +804,9 @@ class TestBulkDeleteArticles:
         """記事一括削除が正常に動作することを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.bulk_delete_articles.return_value = (3, 0)
+        mock_service.bulk_delete_articles.return_value = (3, 0, [
+            {'articleId': i, 'success': True} for i in (1, 2, 3)
+        ])
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -614,7 +835,11 @@ class TestBulkDeleteArticles:
         """一部失敗する場合も正しく結果を返すことを確認"""
         # Arrange
         mock_service = MagicMock()
-        mock_service.bulk_delete_articles.return_value = (2, 1)
+        mock_service.bulk_delete_articles.return_value = (2, 1, [
+            {'articleId': 1, 'success': True},
+            {'articleId': 3, 'success': True},
+            {'articleId': 2, 'success': False, 'error': 'not_found'}
+        ])
         mock_service_class.return_value = mock_service
         mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
 
@@ -631,3 +856,48 @@ class TestBulkDeleteArticles:
         body = json.loads(response['body'])
         assert body['successCount'] == 2
         assert body['failedCount'] == 1
+        assert body['results'][2] == {'articleId': 2, 'success': False, 'error': 'not_found'}
+
+
+@pytest.mark.unit
+class TestWarmupEvent:
+    """ウォームアップイベントのテスト"""
+
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_warmup_short_circuit(self, mock_service_class, lambda_context):
+        """ウォームアップイベントはルーティングせずプライミングのレポートを返すことを確認"""
+        with patch('src.admin.handlers.articles_router.primer') as mock_primer:
+            mock_primer.warmup_response.return_value = {'warmup': True, 'primed': []}
+
+            response = route_articles({'warmup': True}, lambda_context)
+
+        assert response == {'warmup': True, 'primed': []}
+        mock_service_class.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRouteMetrics:
+    """ルートごとのメトリクスのテスト"""
+
+    @patch('src.admin.handlers.articles_router.require_role')
+    @patch('src.admin.handlers.articles_router.ArticleService')
+    def test_list_filters_dimension(self, mock_service_class, mock_require_role, lambda_context, tmp_path):
+        """一覧取得はフィルターの組み合わせを次元に含めて出力することを確認"""
+        mock_service_class.return_value.list_articles.return_value = ([], 0, 1, None)
+        mock_require_role.return_value = {'adminId': 1, 'role': 'system_admin'}
+        metrics_file = tmp_path / 'metrics.jsonl'
+
+        with patch('utils.metrics.settings') as mock_settings:
+            mock_settings.METRICS_SINK = 'file'
+            mock_settings.METRICS_FILE = str(metrics_file)
+            route_articles({
+                'httpMethod': 'GET',
+                'resource': '/admin/articles/list',
+                'path': '/admin/articles/list',
+                'queryStringParameters': {'status': 'published', 'category': 'saving'}
+            }, lambda_context)
+
+        record = json.loads(metrics_file.read_text(encoding='utf-8'))
+        assert record['Route'] == 'GET /admin/articles/list'
+        assert record['Filters'] == 'category+status'
+        assert record['StatusCode'] == 200
@@ -0,0 +1 @@
+# Repositories layer unit tests
@@ -0,0 +1,137 @@
+"""
+ArticleCounterRepository ユニットテスト
+件数カウンターのテスト（DynamoDBテーブルはモック）
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from src.admin.repositories.article_counter_repository import (
+    ArticleCounterRepository,
+    counter_deltas,
+    counter_key
+)
+from utils.metrics import MetricScope
+
+
+@pytest.fixture
+def mock_dynamodb():
+    """DynamoDBデータ層のモック"""
+    with patch('src.admin.repositories.article_counter_repository.dynamodb') as mock_resource:
+        table = MagicMock()
+        table.name = 'article-counters'
+        mock_resource.Table.return_value = table
+        mock_resource.meta.client.batch_write_item.return_value = {}
+        yield mock_resource
+
+
+@pytest.fixture
+def mock_table(mock_dynamodb):
+    """DynamoDBテーブルのモック"""
+    return mock_dynamodb.Table.return_value
+
+
+@pytest.mark.unit
+class TestCounterDeltas:
+    """カウンター増減の計算のテスト"""
+
+    def test_counter_key(self):
+        """絞り込み条件に対応するキーを確認"""
+        assert counter_key() == 'all'
+        assert counter_key('published') == 'status#published'
+        assert counter_key(category='節約術') == 'category#節約術'
+        assert counter_key('published', '節約術') == 'statusCategory#published#節約術'
+
+    def test_status_change(self):
+        """ステータス変更では変わったカウンターのみ増減することを確認"""
+        deltas = counter_deltas(
+            {'status': 'draft', 'category': '節約術'},
+            {'status': 'published', 'category': '節約術'}
+        )
+
+        assert deltas == {
+            'status#published': 1,
+            'status#draft': -1,
+            'statusCategory#published#節約術': 1,
+            'statusCategory#draft#節約術': -1
+        }
+
+    def test_no_change(self):
+        """ステータス・カテゴリが変わらない場合は増減なしになることを確認"""
+        article = {'status': 'draft', 'category': '節約術'}
+
+        assert counter_deltas(article, dict(article)) == {}
+
+
+@pytest.mark.unit
+class TestArticleCounterRepository:
+    """カウンターの読み書きのテスト"""
+
+    def test_get_count(self, mock_table):
+        """カウンターの値を取得し、未作成の場合は0になることを確認"""
+        mock_table.get_item.side_effect = [{'Item': {'itemCount': 12}}, {}]
+        repo = ArticleCounterRepository()
+
+        assert repo.get_count('status#published') == 12
+        assert repo.get_count('status#draft') == 0
+
+    def test_get_count_failure(self, mock_table):
+        """取得に失敗した場合はNoneを返すことを確認"""
+        mock_table.get_item.side_effect = Exception('error')
+        repo = ArticleCounterRepository()
+
+        assert repo.get_count('all') is None
+
+    def test_apply_uses_add(self, mock_table):
+        """ADDでアトミックに増減し、失敗しても残りのカウンターを更新することを確認"""
+        mock_table.update_item.side_effect = [Exception('throttled'), None]
+        repo = ArticleCounterRepository()
+
+        failed = repo.apply({'all': 1, 'status#draft': 1, 'category#節約術': 0})
+
+        assert mock_table.update_item.call_count == 2
+        assert len(failed) == 1
+        for call in mock_table.update_item.call_args_list:
+            assert call.kwargs['UpdateExpression'] == 'ADD itemCount :delta'
+            assert call.kwargs['ExpressionAttributeValues'] == {':delta': 1}
+
+    def test_apply_records_failures(self, mock_table):
+        """反映できなかった増減を返し、実行中のスコープにメトリクスを記録することを確認"""
+        mock_table.update_item.side_effect = lambda **kwargs: (
+            None if kwargs['Key']['counterKey'] == 'all' else (_ for _ in ()).throw(Exception('throttled'))
+        )
+        repo = ArticleCounterRepository()
+
+        with MetricScope(Operation='test') as scope:
+            failed = repo.apply({'all': 1, 'status#draft': -1})
+
+        assert failed == {'status#draft': -1}
+        assert scope.metrics['ArticleCounterFailures'] == (1, 'Count')
+
+    def test_transact_items(self):
+        """作成時のトランザクションに含めるADDの要素を確認"""
+        items = ArticleCounterRepository.transact_items({'all': 1, 'status#draft': 0})
+
+        assert len(items) == 1
+        assert items[0]['Update']['Key'] == {'counterKey': 'all'}
+        assert items[0]['Update']['UpdateExpression'] == 'ADD itemCount :delta'
+        assert items[0]['Update']['ExpressionAttributeValues'] == {':delta': 1}
+
+    def test_reconcile_fixes_drift(self, mock_dynamodb, mock_table):
+        """実際の件数とずれているカウンターのみ修正することを確認"""
+        mock_table.scan.return_value = {'Items': [
+            {'counterKey': 'all', 'itemCount': 3},
+            {'counterKey': 'status#draft', 'itemCount': 2},
+            {'counterKey': 'status#published', 'itemCount': 1}
+        ]}
+        repo = ArticleCounterRepository()
+
+        drift = repo.reconcile([{'status': 'draft'}, {'status': 'draft'}])
+
+        assert drift == {
+            'all': {'stored': 3, 'actual': 2},
+            'status#published': {'stored': 1, 'actual': 0}
+        }
+        requests = mock_dynamodb.meta.client.batch_write_item.call_args.kwargs['RequestItems']['article-counters']
+        assert requests == [
+            {'PutRequest': {'Item': {'counterKey': 'all', 'itemCount': 2}}},
+            {'DeleteRequest': {'Key': {'counterKey': 'status#published'}}}
+        ]
@@ -0,0 +1,999 @@
+"""
+ArticleRepository ユニットテスト
+データアクセス層のテスト（DynamoDBテーブルはモック）
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
+from src.admin.repositories.article_repository import ArticleRepository
+
+
+@pytest.fixture
+def mock_dynamodb():
+    """DynamoDBリソース・全文検索インデックス・件数カウンター・ID採番のモック"""
+    with patch('src.admin.repositories.article_repository.dynamodb') as mock_resource, \
+            patch('src.admin.repositories.article_repository.ArticleSearchRepository') as mock_search_class, \
+            patch('src.admin.repositories.article_repository.ArticleCounterRepository') as mock_counter_class, \
+            patch('src.admin.repositories.article_repository.IdSequenceRepository') as mock_sequence_class:
+        mock_resource.Table.return_value = MagicMock()
+        mock_sequence_class.return_value.allocate.side_effect = lambda name, count=1: range(1, count + 1)
+        mock_resource.id_sequence = mock_sequence_class.return_value
+        mock_resource.search_index = mock_search_class.return_value
+        # 既定ではカウンターを使わない経路（取得失敗時と同じ）
+        mock_counter_class.return_value.get_count.return_value = None
+        mock_resource.counters = mock_counter_class.return_value
+        yield mock_resource
+
+
+@pytest.fixture
+def mock_table(mock_dynamodb):
+    """DynamoDBテーブルのモック"""
+    return mock_dynamodb.Table.return_value
+
+
+@pytest.fixture
+def mock_search_index(mock_dynamodb):
+    """全文検索インデックスのモック"""
+    return mock_dynamodb.search_index
+
+
+@pytest.fixture
+def mock_counters(mock_dynamodb):
+    """件数カウンターのモック"""
+    return mock_dynamodb.counters
+
+
+def _key_condition_attributes(expression):
+    """KeyConditionExpressionに含まれる属性名を取得"""
+    names = []
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        for value in getattr(node, '_values', ()):
+            if hasattr(value, '_values'):
+                stack.append(value)
+            elif hasattr(value, 'name'):
+                names.append(value.name)
+    return sorted(names)
+
+
+@pytest.mark.unit
+class TestQueryPlanner:
+    """実行計画のテスト"""
+
+    def test_plan_status_with_date_range(self, mock_table):
+        """status+日付範囲はStatusSummaryIndexのKeyConditionに押し下げられることを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({
+            'status': 'published',
+            'dateFrom': '2025-01-01',
+            'dateTo': '2025-12-31'
+        })
+
+        assert plan.operation == 'query'
+        assert plan.index_name == 'StatusSummaryIndex'
+        assert plan.key_attributes == ['status', 'publishedAt']
+        assert _key_condition_attributes(plan.key_condition) == ['publishedAt', 'status']
+        assert plan.filter_expression is None
+
+    def test_plan_status_and_category(self, mock_table):
+        """status+categoryの場合StatusCategoryIndexの1回のqueryになることを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'status': 'published', 'category': '節約術', 'dateFrom': '2025-01-01'})
+
+        assert plan.index_name == 'StatusCategoryIndex'
+        assert plan.key_attributes == ['statusCategory', 'publishedAt']
+        assert plan.key_condition.get_expression()['values'][0].get_expression()['values'][1] == \
+            'published#節約術'
+        assert plan.filter_expression is None
+
+    def test_plan_category_only(self, mock_table):
+        """categoryのみの場合CategorySummaryIndexを使用することを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'category': '節約術', 'dateFrom': '2025-01-01'})
+
+        assert plan.index_name == 'CategorySummaryIndex'
+        assert plan.key_attributes == ['category', 'publishedAt']
+
+    def test_plan_legacy_indexes_during_migration(self, mock_table):
+        """GSIの移行中（ARTICLE_LIST_INDEXES=legacy）は移行前のインデックスを読むことを確認"""
+        repo = ArticleRepository()
+
+        with patch('src.admin.repositories.article_repository.settings.ARTICLE_LIST_INDEXES', 'legacy'):
+            status_plan = repo.plan_query({'status': 'published'})
+            category_plan = repo.plan_query({'category': '節約術'})
+
+        assert status_plan.index_name == 'StatusIndex'
+        assert category_plan.index_name == 'CategoryIndex'
+
+    def test_plan_list_index_with_date_range(self, mock_table):
+        """絞り込みのない一覧はArticleListIndexを読み、日付範囲がソートキーの条件になることを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'dateFrom': '2025-01-01', 'dateTo': '2025-01-31'})
+
+        assert plan.operation == 'query'
+        assert plan.index_name == 'ArticleListIndex'
+        assert plan.key_attributes == ['listPartition', 'listSortKey']
+        # 終了日当日のコラム（listSortKey=2025-01-31T...#ID）を含む上限
+        assert plan.key_condition._values[1]._values[2] == '2025-01-31#~'
+        assert plan.filter_expression is None
+
+    def test_plan_scan_fallback(self, mock_table):
+        """ArticleListIndexの移行中は日付条件がFilterExpressionになることを確認"""
+        repo = ArticleRepository()
+
+        with patch('src.admin.repositories.article_repository.settings.USE_ARTICLE_LIST_INDEX', False):
+            plan = repo.plan_query({'dateFrom': '2025-01-01'})
+
+        assert plan.operation == 'scan'
+        assert plan.index_name is None
+        assert plan.filter_expression is not None
+        assert 'operation=scan' in plan.describe()
+
+
+@pytest.mark.unit
+class TestListArticles:
+    """一覧取得のテスト"""
+
+    def test_list_articles_uses_query_and_reports_plan(self, mock_table):
+        """GSIをqueryし、評価件数と返却件数が記録されることを確認"""
+        mock_table.query.side_effect = [
+            {
+                'Items': [{'articleId': 1, 'title': 'Hello', 'publishedAt': '2025-01-02'}],
+                'ScannedCount': 3,
+                'LastEvaluatedKey': {'articleId': 1}
+            },
+            {
+                'Items': [{'articleId': 2, 'title': 'hello world', 'publishedAt': '2025-01-01'}],
+                'ScannedCount': 2
+            }
+        ]
+        repo = ArticleRepository()
+
+        items, total, plan = repo.list_articles({'status': 'published'}, 1, 20)
+
+        assert total == 2
+        assert [item['articleId'] for item in items] == [1, 2]
+        assert mock_table.query.call_count == 2
+        mock_table.scan.assert_not_called()
+        assert plan.items_examined == 5
+        assert plan.items_returned == 2
+
+    def test_list_articles_page_fills_limit(self, mock_table):
+        """絞り込みで件数が足りない場合は次のページを読み込むことを確認"""
+        mock_table.query.side_effect = [
+            {'Items': [{'articleId': 1}], 'ScannedCount': 2, 'LastEvaluatedKey': {'articleId': 2}},
+            {'Items': [{'articleId': 3}], 'ScannedCount': 1, 'LastEvaluatedKey': {'articleId': 3}}
+        ]
+        repo = ArticleRepository()
+
+        items, last_key, _ = repo.list_articles_page({'status': 'published', 'dateFrom': '2025-01-01'}, 2)
+
+        assert [item['articleId'] for item in items] == [1, 3]
+        assert last_key == {'articleId': 3}
+        assert mock_table.query.call_args_list[0].kwargs['Limit'] == 2
+        assert mock_table.query.call_args_list[1].kwargs['Limit'] == 1
+        assert mock_table.query.call_args_list[1].kwargs['ExclusiveStartKey'] == {'articleId': 2}
+
+    def test_unfiltered_cursor_reads_list_index(self, mock_table):
+        """絞り込みのないカーソル方式はArticleListIndexを1ページ分だけ読み、LastEvaluatedKeyを返すことを確認"""
+        mock_table.query.return_value = {
+            'Items': [{'articleId': 4}, {'articleId': 3}],
+            'ScannedCount': 2,
+            'LastEvaluatedKey': {'articleId': 3, 'listPartition': 'articles', 'listSortKey': '2025-03-01#0000000003'}
+        }
+        repo = ArticleRepository()
+
+        items, last_key, _ = repo.list_articles_page({}, 2, {'articleId': 5})
+
+        assert [item['articleId'] for item in items] == [4, 3]
+        assert last_key['listSortKey'] == '2025-03-01#0000000003'
+        kwargs = mock_table.query.call_args.kwargs
+        assert kwargs['IndexName'] == 'ArticleListIndex'
+        assert kwargs['Limit'] == 2
+        assert kwargs['ExclusiveStartKey'] == {'articleId': 5}
+        mock_table.scan.assert_not_called()
+
+    def test_single_character_cursor_reads_keys_from_index(self, mock_dynamodb, mock_table):
+        """1文字の検索語のカーソル方式はGSIからIDのみを読み、ページ分の本文だけを評価することを確認"""
+        mock_table.query.side_effect = [
+            {'Items': [{'articleId': 3}, {'articleId': 2}], 'ScannedCount': 2, 'LastEvaluatedKey': {'articleId': 2}},
+            {'Items': [{'articleId': 1}], 'ScannedCount': 1, 'LastEvaluatedKey': {'articleId': 1}}
+        ]
+        contents = {
+            3: {'articleId': 3, 'title': '肉料理', 'content': ''},
+            2: {'articleId': 2, 'title': '魚料理', 'content': ''},
+            1: {'articleId': 1, 'title': '野菜', 'content': '肉なし'}
+        }
+        mock_dynamodb.batch_get_item.side_effect = lambda RequestItems: {'Responses': {'articles': [
+            contents[key['articleId']] for key in RequestItems['articles']['Keys']
+        ]}}
+        repo = ArticleRepository()
+
+        items, last_key, plan = repo.list_articles_page({'search': '肉', 'status': 'published'}, 2)
+
+        assert [item['articleId'] for item in items] == [3, 1]
+        assert 'content' not in items[0]
+        assert last_key == {'articleId': 1}
+        first = mock_table.query.call_args_list[0].kwargs
+        assert first['IndexName'] == 'StatusSummaryIndex'
+        assert first['ProjectionExpression'] == '#f0'
+        assert mock_table.query.call_args_list[1].kwargs['ExclusiveStartKey'] == {'articleId': 2}
+        mock_table.scan.assert_not_called()
+        assert plan.items_returned == 2
+
+
+@pytest.mark.unit
+class TestStatusCategory:
+    """statusCategory属性の維持のテスト"""
+
+    def test_create_sets_status_category(self, mock_dynamodb, mock_table):
+        """作成時にstatusCategoryが設定されることを確認"""
+        mock_table.scan.return_value = {'Items': []}
+        repo = ArticleRepository()
+
+        item = repo.create({
+            'title': 'タイトル',
+            'content': '本文',
+            'category': '節約術',
+            'status': 'published'
+        }, 'admin001')
+
+        assert item['statusCategory'] == 'published#節約術'
+        items = mock_dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        assert items[0]['Put']['Item']['statusCategory'] == 'published#節約術'
+
+    def test_list_index_attributes_follow_published_at(self, mock_table):
+        """作成時と公開日時の変更時にArticleListIndexのキーが設定されることを確認"""
+        mock_table.scan.return_value = {'Items': []}
+        mock_table.update_item.return_value = {'Attributes': {'articleId': 1, 'publishedAt': None}}
+        repo = ArticleRepository()
+
+        item = repo.create({'title': 'タイトル', 'content': '本文', 'category': '節約術'}, 'admin001')
+        repo.update(1, {'publishedAt': '2025-01-01T00:00:00Z'}, 'admin001')
+
+        assert item['listPartition'] == 'articles'
+        assert item['listSortKey'] == '#0000000001'
+        values = mock_table.update_item.call_args.kwargs['ExpressionAttributeValues']
+        assert values[':listSortKey'] == '2025-01-01T00:00:00Z#0000000001'
+
+    def test_update_recomputes_status_category(self, mock_table):
+        """ステータスのみの更新では更新前のカテゴリ（ALL_OLD）からstatusCategoryを算出して条件付きで書き込むことを確認"""
+        mock_table.update_item.return_value = {
+            'Attributes': {'articleId': 1, 'status': 'draft', 'category': '節約術'}
+        }
+        repo = ArticleRepository()
+
+        result = repo.update(1, {'status': 'published'}, 'admin001')
+
+        mock_table.get_item.assert_not_called()
+        first, second = mock_table.update_item.call_args_list
+        assert ':statusCategory' not in first.kwargs['ExpressionAttributeValues']
+        assert second.kwargs['UpdateExpression'] == 'SET #statusCategory = :statusCategory'
+        assert second.kwargs['ConditionExpression'] == '#status = :status AND #category = :category'
+        assert second.kwargs['ExpressionAttributeValues'] == {
+            ':statusCategory': 'published#節約術', ':status': 'published', ':category': '節約術'
+        }
+        assert result['statusCategory'] == 'published#節約術'
+
+    def test_status_category_superseded(self, mock_table):
+        """後続の更新でstatus・categoryが変わっていた場合はstatusCategoryを書き込まずに成功することを確認"""
+        mock_table.update_item.side_effect = [
+            {'Attributes': {'articleId': 1, 'status': 'draft', 'category': '節約術'}},
+            ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+        ]
+        repo = ArticleRepository()
+
+        result = repo.update(1, {'status': 'published'}, 'admin001')
+
+        assert result['status'] == 'published'
+
+    def test_update_without_status_or_category(self, mock_table):
+        """ステータス・カテゴリを変更しない更新ではstatusCategoryを書き換えないことを確認"""
+        mock_table.update_item.return_value = {
+            'Attributes': {'articleId': 1, 'status': 'draft', 'category': '節約術'}
+        }
+        repo = ArticleRepository()
+
+        repo.update(1, {'title': '新タイトル'}, 'admin001')
+
+        assert mock_table.update_item.call_count == 1
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert ':statusCategory' not in kwargs['ExpressionAttributeValues']
+
+    def test_bulk_update_status_sets_status_category(self, mock_dynamodb):
+        """一括ステータス更新でstatusCategoryも更新されることを確認"""
+        mock_dynamodb.batch_get_item.return_value = {'Responses': {'articles': [
+            {'articleId': 1, 'category': '節約術'}
+        ]}}
+        repo = ArticleRepository()
+
+        updated, failed = repo.bulk_update_status([1, 2], 'published', 'admin001')
+
+        assert list(updated) == [1]
+        assert failed == {2: 'not_found'}
+        kwargs = mock_dynamodb.meta.client.update_item.call_args.kwargs
+        assert kwargs['ExpressionAttributeValues'][':statusCategory'] == 'published#節約術'
+
+
+@pytest.mark.unit
+class TestFullTextSearch:
+    """全文検索インデックス経由の検索のテスト"""
+
+    def test_plan_uses_search_index(self, mock_table):
+        """2文字以上の検索語は全文検索インデックスを使うことを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'search': '値上げ', 'status': 'published'})
+
+        assert plan.operation == 'search'
+        assert plan.index_name == 'ArticleSearchIndex'
+
+    def test_plan_single_character_falls_back(self, mock_table):
+        """bigramを作れない1文字の検索語は従来のアクセスパスになることを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'search': '肉', 'status': 'published'})
+
+        # GSIは本文を射影していないため、テーブルから読み込んで部分一致を評価する
+        assert plan.operation == 'scan'
+        assert plan.filter_expression is not None
+        assert plan.search == '肉'
+        assert 'content' in plan.read_fields()
+
+    def test_list_articles_ranked_by_score(self, mock_dynamodb, mock_table, mock_search_index):
+        """BM25スコア順に並び、残りの条件と部分一致で絞り込まれることを確認"""
+        mock_search_index.search.return_value = [(3, 2.5), (1, 1.2), (2, 0.4)]
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {
+                'articles': [
+                    {'articleId': 1, 'title': '値上げ情報', 'status': 'published'},
+                    {'articleId': 2, 'title': '値上げ情報', 'status': 'draft'},
+                    {'articleId': 3, 'title': '値上げ値上げ', 'status': 'published'}
+                ]
+            }
+        }
+        repo = ArticleRepository()
+
+        items, total, _ = repo.list_articles({'search': '値上げ', 'status': 'published'}, 1, 20)
+
+        assert [item['articleId'] for item in items] == [3, 1]
+        assert total == 2
+        mock_table.scan.assert_not_called()
+        mock_table.query.assert_not_called()
+
+    def test_list_articles_full_width_query(self, mock_dynamodb, mock_table, mock_search_index):
+        """全角の検索語も正規化して部分一致を評価することを確認"""
+        mock_search_index.search.return_value = [(1, 1.5), (2, 0.8)]
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {
+                'articles': [
+                    {'articleId': 1, 'title': 'PayPay還元まとめ', 'status': 'published'},
+                    {'articleId': 2, 'title': 'ｐａｙｐａｙ残高の使い方', 'status': 'published'}
+                ]
+            }
+        }
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'search': 'ＰａｙＰａｙ'})
+        items, total, _ = repo.list_articles({'search': 'ＰａｙＰａｙ'}, 1, 20)
+
+        assert plan.search == 'paypay'
+        assert [item['articleId'] for item in items] == [1, 2]
+        assert total == 2
+
+    def test_list_articles_page_search_cursor(self, mock_dynamodb, mock_table, mock_search_index):
+        """全文検索のカーソルは最後に返したコラムの(スコア, コラムID)になり、その続きから返すことを確認"""
+        mock_search_index.search.return_value = [(3, 2.5), (4, 1.2), (1, 1.2), (2, 0.4)]
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {'articles': [{'articleId': 1, 'title': '値上げ'}]}
+        }
+        repo = ArticleRepository()
+
+        # 前ページの最後が同点のコラム4の場合、同点でIDの小さいコラム1から始まる
+        items, last_key, _ = repo.list_articles_page({'search': '値上げ'}, 1, {'score': 1.2, 'articleId': 4})
+
+        assert [item['articleId'] for item in items] == [1]
+        assert last_key == {'score': 1.2, 'articleId': 1}
+        keys = mock_dynamodb.batch_get_item.call_args.kwargs['RequestItems']['articles']['Keys']
+        assert keys == [{'articleId': 1}]
+
+    def test_create_and_delete_update_index(self, mock_table, mock_search_index):
+        """作成・削除時に全文検索インデックスが更新されることを確認"""
+        mock_table.delete_item.return_value = {'Attributes': {'articleId': 1, 'title': 'タイトル', 'content': '本文'}}
+        repo = ArticleRepository()
+
+        item = repo.create({'title': 'タイトル', 'content': '本文', 'category': '節約術'}, 'admin001')
+        repo.delete(1)
+
+        created, deleted = mock_search_index.apply_article_change.call_args_list
+        assert created.args == (None, item)
+        assert deleted.args == ({'articleId': 1, 'title': 'タイトル', 'content': '本文'}, None)
+
+    def test_update_passes_old_and_new_text(self, mock_table, mock_search_index):
+        """更新時は変更前後のコラムを渡し、差分をインデックスに反映することを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'articleId': 1, 'title': '旧', 'content': '本文'}}
+        repo = ArticleRepository()
+
+        repo.update(1, {'title': '新'}, 'admin001')
+
+        old, new = mock_search_index.apply_article_change.call_args.args
+        assert (old['title'], new['title'], new['content']) == ('旧', '新', '本文')
+
+    @patch('src.admin.repositories.article_repository.settings.SEARCH_INDEX_TRIGGER', 'stream')
+    def test_stream_trigger_leaves_index_to_worker(self, mock_table, mock_search_index):
+        """SEARCH_INDEX_TRIGGER=streamの場合はリクエスト内でインデックスを更新しないことを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'articleId': 1, 'title': '旧'}}
+        repo = ArticleRepository()
+
+        repo.create({'title': 'タイトル', 'content': '本文', 'category': '節約術'}, 'admin001')
+        repo.update(1, {'title': '新'}, 'admin001')
+
+        mock_search_index.apply_article_change.assert_not_called()
+
+    def test_index_failure_does_not_fail_update(self, mock_table, mock_search_index):
+        """インデックス更新に失敗しても記事の更新は成功することを確認"""
+        mock_table.get_item.return_value = {'Item': {'articleId': 1}}
+        mock_table.update_item.return_value = {'Attributes': {'articleId': 1, 'title': '新'}}
+        mock_search_index.apply_article_change.side_effect = Exception('index error')
+        repo = ArticleRepository()
+
+        result = repo.update(1, {'title': '新'}, 'admin001')
+
+        assert result['articleId'] == 1
+        assert result['title'] == '新'
+
+
+@pytest.mark.unit
+class TestTagIndex:
+    """タグ隣接リストのテスト"""
+
+    def test_plan_uses_tag_index(self, mock_table):
+        """タグ指定時はタグ隣接リストのマージを使うことを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'tags': 'AI,ML', 'status': 'published', 'dateFrom': '2025-01-01'})
+
+        assert plan.operation == 'merge'
+        assert plan.index_name == 'ArticleTags'
+        assert plan.key_attributes == ['tag', 'publishedAt']
+
+    def test_status_and_category_take_priority_over_tags(self, mock_table):
+        """status+categoryがある場合はStatusCategoryIndexを優先することを確認"""
+        repo = ArticleRepository()
+
+        plan = repo.plan_query({'tags': 'AI', 'status': 'published', 'category': '節約術'})
+
+        assert plan.index_name == 'StatusCategoryIndex'
+        assert plan.filter_expression is not None
+
+    def test_list_articles_by_tags(self, mock_dynamodb, mock_table):
+        """タグの候補IDを取得し、残りの条件で絞り込むことを確認"""
+        repo = ArticleRepository()
+        repo.tag_index = MagicMock()
+        repo.tag_index.find_articles.return_value = (
+            [('2025-03-01#0000000003', 3), ('2025-02-01#0000000001', 1), ('2025-01-01#0000000002', 2)], 4
+        )
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {'articles': [
+                {'articleId': 1, 'status': 'published', 'tags': ['AI']},
+                {'articleId': 2, 'status': 'draft', 'tags': ['ML']},
+                {'articleId': 3, 'status': 'published', 'tags': ['ML']}
+            ]}
+        }
+
+        items, total, plan = repo.list_articles({'tags': 'AI, ML', 'status': 'published'}, 1, 20)
+
+        assert [item['articleId'] for item in items] == [3, 1]
+        assert total == 2
+        repo.tag_index.find_articles.assert_called_once_with(['AI', 'ML'], None, None)
+        mock_table.scan.assert_not_called()
+        assert plan.items_examined == 7
+
+    def test_tag_cursor_continues_from_sort_key(self, mock_dynamodb, mock_table):
+        """タグのカーソルは最後のタグ行のソートキーになり、除外された分だけ続きを読むことを確認"""
+        repo = ArticleRepository()
+        repo.tag_index = MagicMock()
+        repo.tag_index.find_articles.side_effect = [
+            ([('2025-03-01#0000000003', 3), ('2025-02-01#0000000002', 2)], 2),
+            ([('2025-01-01#0000000001', 1)], 1)
+        ]
+        mock_dynamodb.batch_get_item.side_effect = lambda RequestItems: {'Responses': {'articles': [
+            {'articleId': key['articleId'], 'status': 'draft' if key['articleId'] == 2 else 'published', 'tags': ['AI']}
+            for key in RequestItems['articles']['Keys']
+        ]}}
+
+        items, last_key, _ = repo.list_articles_page(
+            {'tags': 'AI', 'status': 'published'}, 2, {'sortKey': '2025-04-01#0000000004'}
+        )
+
+        assert [item['articleId'] for item in items] == [3, 1]
+        assert last_key == {'sortKey': '2025-01-01#0000000001'}
+        calls = repo.tag_index.find_articles.call_args_list
+        assert calls[0].kwargs == {'before': '2025-04-01#0000000004', 'limit': 2}
+        assert calls[1].kwargs == {'before': '2025-02-01#0000000002', 'limit': 1}
+
+    def test_tag_cursor_last_page(self, mock_dynamodb, mock_table):
+        """タグ行がページ件数に満たない場合は最終ページになることを確認"""
+        repo = ArticleRepository()
+        repo.tag_index = MagicMock()
+        repo.tag_index.find_articles.return_value = ([('2025-01-01#0000000001', 1)], 1)
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {'articles': [{'articleId': 1, 'tags': ['AI']}]}
+        }
+
+        items, last_key, _ = repo.list_articles_page({'tags': 'AI'}, 2)
+
+        assert [item['articleId'] for item in items] == [1]
+        assert last_key is None
+
+    def test_create_writes_tags_in_transaction(self, mock_dynamodb, mock_table):
+        """タグ付きのコラムは本体とタグ行を1つのトランザクションで書き込むことを確認"""
+        mock_table.scan.return_value = {'Items': []}
+        repo = ArticleRepository()
+
+        repo.create({
+            'title': 'タイトル',
+            'content': '本文',
+            'category': '節約術',
+            'status': 'published',
+            'publishedAt': '2025-01-01T00:00:00Z',
+            'tags': ['AI', 'ML']
+        }, 'admin001')
+
+        mock_table.put_item.assert_not_called()
+        items = mock_dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        assert items[0]['Put']['Item']['articleId'] == 1
+        assert [item['Put']['Item']['tag'] for item in items[1:]] == ['AI', 'ML']
+
+    def test_update_tags_without_read(self, mock_dynamodb, mock_table):
+        """タグ変更時は更新前のタグ（ALL_OLD）との差分のみを、タグが変わっていない条件付きのトランザクションで反映することを確認"""
+        mock_table.update_item.return_value = {
+            'Attributes': {'articleId': 1, 'tags': ['AI', 'ML'], 'publishedAt': '2025-01-01'}
+        }
+        repo = ArticleRepository()
+
+        result = repo.update(1, {'tags': ['ML', 'LLM']}, 'admin001')
+
+        mock_table.get_item.assert_not_called()
+        assert mock_table.update_item.call_args.kwargs['ReturnValues'] == 'ALL_OLD'
+        items = mock_dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        check = items[0]['ConditionCheck']
+        assert check['ConditionExpression'] == '#tags = :tags AND #publishedAt = :publishedAt'
+        assert check['ExpressionAttributeValues'] == {':tags': ['ML', 'LLM'], ':publishedAt': '2025-01-01'}
+        assert items[1]['Delete']['Key']['tag'] == 'AI'
+        assert items[2]['Put']['Item']['tag'] == 'LLM'
+        assert result['tags'] == ['ML', 'LLM']
+        assert result['updatedBy'] == 'admin001'
+
+    def test_update_too_many_tags_writes_nothing(self, mock_dynamodb, mock_table):
+        """タグ数が上限を超える場合はコラムを更新せずにValueErrorになることを確認"""
+        repo = ArticleRepository()
+
+        with pytest.raises(ValueError):
+            repo.update(1, {'tags': [f"tag{i}" for i in range(41)]}, 'admin001')
+
+        mock_table.update_item.assert_not_called()
+
+    def test_delete_removes_tag_rows(self, mock_table):
+        """削除時は削除前のタグでタグ行を削除することを確認"""
+        mock_table.delete_item.return_value = {
+            'Attributes': {'articleId': 1, 'tags': ['AI'], 'publishedAt': '2025-01-01'}
+        }
+        repo = ArticleRepository()
+        repo.tag_index = MagicMock()
+
+        assert repo.delete(1) is True
+
+        assert mock_table.delete_item.call_args.kwargs['ReturnValues'] == 'ALL_OLD'
+        repo.tag_index.remove_article.assert_called_once_with(1, ['AI'], '2025-01-01')
+
+
+@pytest.mark.unit
+class TestParallelScanListing:
+    """条件なし一覧の並列スキャンのテスト"""
+
+    @patch('src.admin.repositories.article_repository.settings.USE_ARTICLE_LIST_INDEX', False)
+    def test_list_articles_scan_uses_segments(self, mock_table):
+        """スキャン時はセグメントに分割して読み込み、公開日時順に並べることを確認"""
+        mock_table.name = 'articles'
+        mock_table.meta.client.scan.side_effect = lambda **kwargs: {
+            'Items': [{'articleId': kwargs['Segment'] + 1, 'publishedAt': f"2025-01-0{kwargs['Segment'] + 1}"}],
+            'ScannedCount': 1
+        }
+        repo = ArticleRepository()
+
+        items, total, plan = repo.list_articles({}, 1, 20)
+
+        assert [item['articleId'] for item in items] == [4, 3, 2, 1]
+        assert total == 4
+        assert mock_table.meta.client.scan.call_args.kwargs['TotalSegments'] == 4
+        mock_table.scan.assert_not_called()
+        assert plan.items_examined == 4
+
+
+@pytest.mark.unit
+class TestSummaryProjection:
+    """一覧のサマリー射影のテスト"""
+
+    def test_list_query_excludes_content(self, mock_table):
+        """一覧のqueryは本文を読み込まないことを確認"""
+        mock_table.query.return_value = {'Items': [], 'ScannedCount': 0}
+        repo = ArticleRepository()
+
+        repo.list_articles({'status': 'published'}, 1, 20)
+
+        kwargs = mock_table.query.call_args.kwargs
+        names = kwargs['ExpressionAttributeNames']
+        assert 'content' not in names.values()
+        assert kwargs['ProjectionExpression'] == ', '.join(names)
+
+    def test_list_fields_subset(self, mock_table):
+        """fields指定時は指定した項目のみを返すことを確認"""
+        mock_table.query.return_value = {
+            'Items': [{'articleId': 1, 'title': 'タイトル'}],
+            'ScannedCount': 1
+        }
+        repo = ArticleRepository()
+
+        items, _, _ = repo.list_articles({'status': 'published'}, 1, 20, fields=['articleId', 'title'])
+
+        assert items == [{'articleId': 1, 'title': 'タイトル'}]
+        assert sorted(mock_table.query.call_args.kwargs['ExpressionAttributeNames'].values()) == ['articleId', 'title']
+
+    def test_residual_search_fields_are_trimmed(self, mock_table):
+        """1文字検索の評価用に読み込んだ本文は返却しないことを確認"""
+        mock_table.name = 'articles'
+        mock_table.meta.client.scan.side_effect = lambda **kwargs: {
+            'Items': [{'articleId': 1, 'title': '肉', 'content': '本文'}] if kwargs['Segment'] == 0 else [],
+            'ScannedCount': 1
+        }
+        repo = ArticleRepository()
+
+        items, _, _ = repo.list_articles({'search': '肉'}, 1, 20)
+
+        assert items == [{'articleId': 1, 'title': '肉'}]
+
+    def test_candidate_fetch_uses_projection(self, mock_dynamodb, mock_table, mock_search_index):
+        """全文検索の候補取得でもProjectionExpressionを使い、本文を返さないことを確認"""
+        mock_search_index.search.return_value = [(1, 2.0)]
+        mock_dynamodb.batch_get_item.return_value = {
+            'Responses': {'articles': [{'articleId': 1, 'title': '値上げ', 'content': '本文'}]}
+        }
+        repo = ArticleRepository()
+
+        items, _, _ = repo.list_articles({'search': '値上げ'}, 1, 20)
+
+        request = mock_dynamodb.batch_get_item.call_args.kwargs['RequestItems']['articles']
+        assert 'content' in request['ExpressionAttributeNames'].values()
+        assert items == [{'articleId': 1, 'title': '値上げ'}]
+
+
+@pytest.mark.unit
+class TestArticleCounts:
+    """件数カウンターのテスト"""
+
+    def test_list_uses_counter_for_total(self, mock_table, mock_counters):
+        """status/categoryのみの場合は総件数をカウンターから取得し、表示ページまでしか読まないことを確認"""
+        mock_counters.get_count.return_value = 120
+        mock_table.query.return_value = {
+            'Items': [{'articleId': i} for i in range(40)],
+            'ScannedCount': 40,
+            'LastEvaluatedKey': {'articleId': 39}
+        }
+        repo = ArticleRepository()
+
+        items, total, _ = repo.list_articles({'status': 'published', 'category': '節約術'}, 2, 20)
+
+        assert total == 120
+        assert [item['articleId'] for item in items] == list(range(20, 40))
+        mock_counters.get_count.assert_called_once_with('statusCategory#published#節約術')
+        assert mock_table.query.call_count == 1
+        assert mock_table.query.call_args.kwargs['Limit'] == 40
+
+    def test_list_with_tags_does_not_use_counter(self, mock_table, mock_counters):
+        """カウンターで表せない条件がある場合は使わないことを確認"""
+        mock_table.query.return_value = {'Items': [], 'ScannedCount': 0}
+        repo = ArticleRepository()
+
+        repo.list_articles({'status': 'published', 'dateFrom': '2025-01-01'}, 1, 20)
+
+        mock_counters.get_count.assert_not_called()
+
+    def test_create_and_delete_update_counters(self, mock_dynamodb, mock_table, mock_counters):
+        """作成時はコラム本体と同じトランザクションで、削除時は削除後にカウンターが増減することを確認"""
+        mock_table.scan.return_value = {'Items': []}
+        mock_table.delete_item.return_value = {
+            'Attributes': {'articleId': 1, 'status': 'draft', 'category': '節約術'}
+        }
+        repo = ArticleRepository()
+
+        repo.create({'title': 'タイトル', 'content': '本文', 'category': '節約術'}, 'admin001')
+        repo.delete(1)
+
+        mock_counters.transact_items.assert_called_once_with({
+            'all': 1, 'status#draft': 1, 'category#節約術': 1, 'statusCategory#draft#節約術': 1
+        })
+        mock_dynamodb.meta.client.transact_write_items.assert_called_once()
+        assert mock_counters.apply.call_args.args[0] == {
+            'all': -1, 'status#draft': -1, 'category#節約術': -1, 'statusCategory#draft#節約術': -1
+        }
+
+    def test_bulk_update_status_aggregates_deltas(self, mock_dynamodb, mock_counters):
+        """一括ステータス更新の増減はまとめて1回で反映されることを確認"""
+        mock_dynamodb.batch_get_item.return_value = {'Responses': {'articles': [
+            {'articleId': 1, 'status': 'draft', 'category': '節約術'},
+            {'articleId': 2, 'status': 'draft', 'category': 'レシピ'},
+            {'articleId': 3, 'status': 'published', 'category': 'レシピ'}
+        ]}}
+        repo = ArticleRepository()
+
+        repo.bulk_update_status([1, 2, 3], 'published', 'admin001')
+
+        mock_counters.apply.assert_called_once_with({
+            'status#published': 2,
+            'status#draft': -2,
+            'statusCategory#published#節約術': 1,
+            'statusCategory#draft#節約術': -1,
+            'statusCategory#published#レシピ': 1,
+            'statusCategory#draft#レシピ': -1
+        })
+
+
+@pytest.mark.unit
+class TestIdAllocation:
+    """ID採番のテスト"""
+
+    def test_create_uses_sequence_without_scan(self, mock_dynamodb, mock_table):
+        """作成時はテーブルをスキャンせずシーケンスからIDを払い出すことを確認"""
+        mock_dynamodb.id_sequence.allocate.side_effect = lambda name, count=1: range(42, 42 + count)
+        repo = ArticleRepository()
+
+        item = repo.create({'title': 'タイトル', 'content': '本文', 'category': '節約術'}, 'admin001')
+
+        assert item['articleId'] == 42
+        mock_table.scan.assert_not_called()
+        mock_dynamodb.id_sequence.allocate.assert_called_once_with('articles', 1)
+        items = mock_dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        assert items[0]['Put']['ConditionExpression'] == 'attribute_not_exists(articleId)'
+
+    def test_reserve_ids_block(self, mock_dynamodb, mock_table):
+        """一括登録用にIDをまとめて確保できることを確認"""
+        repo = ArticleRepository()
+
+        assert list(repo.reserve_ids(3)) == [1, 2, 3]
+        mock_dynamodb.id_sequence.allocate.assert_called_once_with('articles', 3)
+
+
+@pytest.mark.unit
+class TestConditionalWrites:
+    """読み込みなしの条件付き書き込みのテスト"""
+
+    def test_update_single_request(self, mock_table):
+        """タイトル等の更新は条件付きupdate_item1回で行い、更新前後の値を返すことを確認"""
+        mock_table.update_item.return_value = {
+            'Attributes': {'articleId': 1, 'title': '旧', 'imageUrl': 'https://s3.example.com/old.jpg'}
+        }
+        repo = ArticleRepository()
+
+        updated, old = repo.update_returning_old(1, {'title': '新'}, 'admin001')
+
+        mock_table.get_item.assert_not_called()
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert kwargs['ConditionExpression'] == 'attribute_exists(articleId)'
+        assert kwargs['ReturnValues'] == 'ALL_OLD'
+        assert old['imageUrl'] == 'https://s3.example.com/old.jpg'
+        assert updated['title'] == '新'
+        assert updated['imageUrl'] == 'https://s3.example.com/old.jpg'
+
+    def test_update_not_found(self, mock_table):
+        """存在しない場合は条件付き書き込みの失敗からNoneを返すことを確認"""
+        mock_table.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
+        )
+        repo = ArticleRepository()
+
+        assert repo.update(999, {'title': '新'}, 'admin001') is None
+        mock_table.get_item.assert_not_called()
+
+    def test_update_status_and_category_without_read(self, mock_table):
+        """status・categoryを両方指定した場合は読み込まずにstatusCategoryを算出することを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'articleId': 1}}
+        repo = ArticleRepository()
+
+        repo.update(1, {'status': 'published', 'category': '節約術'}, 'admin001')
+
+        mock_table.get_item.assert_not_called()
+        values = mock_table.update_item.call_args.kwargs['ExpressionAttributeValues']
+        assert values[':statusCategory'] == 'published#節約術'
+
+    def test_delete_not_found(self, mock_table, mock_search_index):
+        """存在しない場合はFalseを返し、インデックスを更新しないことを確認"""
+        mock_table.delete_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'DeleteItem'
+        )
+        repo = ArticleRepository()
+
+        assert repo.delete(999) is False
+        assert mock_table.delete_item.call_args.kwargs['ConditionExpression'] == 'attribute_exists(articleId)'
+        mock_search_index.apply_article_change.assert_not_called()
+
+    def test_delete_returning_old(self, mock_table):
+        """削除前の値が1回の削除で返ることを確認"""
+        mock_table.delete_item.return_value = {
+            'Attributes': {'articleId': 1, 'imageUrl': 'https://s3.example.com/old.jpg'}
+        }
+        repo = ArticleRepository()
+
+        old = repo.delete_returning_old(1)
+
+        assert old['imageUrl'] == 'https://s3.example.com/old.jpg'
+        mock_table.get_item.assert_not_called()
+
+
+@pytest.mark.unit
+class TestBulkDelete:
+    """BatchWriteItemによる一括削除のテスト"""
+
+    @staticmethod
+    def _articles(*article_ids):
+        return {'Responses': {'articles': [
+            {'articleId': i, 'status': 'draft', 'category': '節約術', 'imageUrl': f'https://s3.example.com/{i}.jpg'}
+            for i in article_ids
+        ]}}
+
+    def test_bulk_delete_batches_writes(self, mock_dynamodb, mock_search_index, mock_counters):
+        """削除が25件ずつのBatchWriteItemになり、索引とカウンターがまとめて更新されることを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(*range(1, 31))
+        sent = []
+        mock_dynamodb.meta.client.batch_write_item.side_effect = lambda RequestItems: sent.append(RequestItems) or {}
+        repo = ArticleRepository()
+
+        deleted, failed = repo.bulk_delete(list(range(1, 31)))
+
+        assert sorted(deleted) == list(range(1, 31))
+        assert failed == {}
+        sizes = sorted(len(request['articles']) for request in sent)
+        assert sizes == [5, 25]
+        mock_dynamodb.Table.return_value.delete_item.assert_not_called()
+        assert mock_search_index.apply_article_change.call_count == 30
+        projection = mock_dynamodb.batch_get_item.call_args.kwargs['RequestItems']['articles']
+        assert 'content' in projection['ExpressionAttributeNames'].values()
+        mock_counters.apply.assert_called_once()
+        assert mock_counters.apply.call_args.args[0]['all'] == -30
+
+    def test_bulk_delete_not_found_and_unprocessed(self, mock_dynamodb):
+        """存在しないIDと再送後も残ったUnprocessedItemsがIDごとの失敗になることを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(1, 2)
+        unprocessed = {'UnprocessedItems': {'articles': [{'DeleteRequest': {'Key': {'articleId': 2}}}]}}
+        mock_dynamodb.meta.client.batch_write_item.return_value = unprocessed
+        repo = ArticleRepository()
+
+        with patch('utils.dynamodb_batch.time.sleep'):
+            deleted, failed = repo.bulk_delete([1, 2, 3])
+
+        assert list(deleted) == [1]
+        assert failed == {2: 'error', 3: 'not_found'}
+
+
+@pytest.mark.unit
+class TestBulkUpdateStatus:
+    """並列・トランザクションによる一括ステータス更新のテスト"""
+
+    @staticmethod
+    def _articles(*article_ids):
+        return {'Responses': {'articles': [
+            {'articleId': i, 'status': 'draft', 'category': '節約術'} for i in article_ids
+        ]}}
+
+    def test_updates_without_per_item_reads(self, mock_dynamodb, mock_table):
+        """1件ずつの読み込みをせず、カテゴリを条件にした更新を行うことを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(*range(1, 201))
+        # MagicMockの呼び出し記録はスレッドセーフではないため、呼び出しはリストに記録する
+        requests = []
+        mock_dynamodb.meta.client.update_item.side_effect = lambda **kwargs: requests.append(kwargs) or {}
+        repo = ArticleRepository()
+
+        updated, failed = repo.bulk_update_status(list(range(1, 201)), 'published', 'admin001')
+
+        assert len(updated) == 200
+        assert failed == {}
+        assert mock_dynamodb.batch_get_item.call_count == 2
+        assert len(requests) == 200
+        mock_table.get_item.assert_not_called()
+        kwargs = requests[0]
+        assert kwargs['ConditionExpression'] == 'attribute_exists(articleId) AND #category = :category'
+        assert kwargs['ExpressionAttributeValues'][':category'] == '節約術'
+
+    def test_conflict_is_reported_per_id(self, mock_dynamodb, mock_counters):
+        """読み込み後に変更されたコラムはconflictとなり、カウンターに含めないことを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(1, 2)
+
+        def update_item(**kwargs):
+            if kwargs['Key']['articleId'] == 2:
+                raise ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+            return {}
+
+        mock_dynamodb.meta.client.update_item.side_effect = update_item
+        repo = ArticleRepository()
+
+        updated, failed = repo.bulk_update_status([1, 2], 'published', 'admin001')
+
+        assert list(updated) == [1]
+        assert failed == {2: 'conflict'}
+        assert mock_counters.apply.call_args.args[0]['status#published'] == 1
+
+    def test_atomic_uses_transaction(self, mock_dynamodb):
+        """atomic=Trueの場合は1つのトランザクションで更新することを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(1, 2)
+        repo = ArticleRepository()
+
+        updated, failed = repo.bulk_update_status([1, 2], 'published', 'admin001', atomic=True)
+
+        assert sorted(updated) == [1, 2]
+        items = mock_dynamodb.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+        assert [item['Update']['Key'] for item in items] == [{'articleId': 1}, {'articleId': 2}]
+        mock_dynamodb.meta.client.update_item.assert_not_called()
+
+    def test_atomic_cancellation_fails_all(self, mock_dynamodb, mock_counters):
+        """トランザクションが取り消された場合は全件失敗になることを確認"""
+        mock_dynamodb.batch_get_item.return_value = self._articles(1, 2)
+        mock_dynamodb.meta.client.transact_write_items.side_effect = ClientError({
+            'Error': {'Code': 'TransactionCanceledException'},
+            'CancellationReasons': [{'Code': 'None'}, {'Code': 'ConditionalCheckFailed'}]
+        }, 'TransactWriteItems')
+        repo = ArticleRepository()
+
+        updated, failed = repo.bulk_update_status([1, 2], 'published', 'admin001', atomic=True)
+
+        assert updated == {}
+        assert failed == {1: 'aborted', 2: 'conflict'}
+        mock_counters.apply.assert_called_once_with({})
+
+    def test_atomic_limit(self, mock_dynamodb):
+        """atomic=Trueで上限を超える場合はValueErrorになることを確認"""
+        repo = ArticleRepository()
+
+        with pytest.raises(ValueError):
+            repo.bulk_update_status(list(range(101)), 'published', 'admin001', atomic=True)
+
+
+@pytest.mark.unit
+class TestGetMany:
+    """BatchGetItemによる複数取得のテスト"""
+
+    def test_chunks_and_projection(self, mock_dynamodb):
+        """100件ずつに分割し、指定項目のみ読み込むことを確認"""
+        mock_dynamodb.batch_get_item.side_effect = lambda RequestItems: {'Responses': {'articles': [
+            {'articleId': key['articleId']} for key in RequestItems['articles']['Keys']
+        ]}}
+        repo = ArticleRepository()
+
+        found = repo.get_many(list(range(1, 151)), ['articleId', 'title'])
+
+        assert sorted(found) == list(range(1, 151))
+        calls = mock_dynamodb.batch_get_item.call_args_list
+        assert [len(c.kwargs['RequestItems']['articles']['Keys']) for c in calls] == [100, 50]
+        request = calls[0].kwargs['RequestItems']['articles']
+        assert request['ExpressionAttributeNames'] == {'#f0': 'articleId', '#f1': 'title'}
+
+    def test_retries_unprocessed_keys(self, mock_dynamodb):
+        """UnprocessedKeysを再送することを確認"""
+        mock_dynamodb.batch_get_item.side_effect = [
+            {'Responses': {'articles': [{'articleId': 1}]},
+             'UnprocessedKeys': {'articles': {'Keys': [{'articleId': 2}]}}},
+            {'Responses': {'articles': [{'articleId': 2}]}}
+        ]
+        repo = ArticleRepository()
+
+        with patch('utils.dynamodb_batch.time.sleep'):
+            found = repo.get_many([1, 2])
+
+        assert sorted(found) == [1, 2]
+        assert mock_dynamodb.batch_get_item.call_args.kwargs['RequestItems'] == {
+            'articles': {'Keys': [{'articleId': 2}]}
+        }
@@ -0,0 +1,154 @@
+"""
+ArticleSearchRepository ユニットテスト
+全文検索インデックスのテスト（DynamoDBテーブルはモック）
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from src.admin.repositories.article_search_repository import ArticleSearchRepository
+
+
+@pytest.fixture
+def mock_dynamodb():
+    """DynamoDBデータ層のモック"""
+    with patch('src.admin.repositories.article_search_repository.dynamodb') as mock_resource:
+        table = MagicMock()
+        table.name = 'article-search-index'
+        mock_resource.Table.return_value = table
+        mock_resource.meta.client.batch_write_item.return_value = {}
+        yield mock_resource
+
+
+@pytest.fixture
+def mock_table(mock_dynamodb):
+    """DynamoDBテーブルのモック"""
+    return mock_dynamodb.Table.return_value
+
+
+def written(mock_dynamodb):
+    """BatchWriteItemで書き込んだ({term: Item}, {削除したterm})"""
+    puts, deletes = {}, set()
+    for c in mock_dynamodb.meta.client.batch_write_item.call_args_list:
+        for request in c.kwargs['RequestItems']['article-search-index']:
+            if 'PutRequest' in request:
+                puts[request['PutRequest']['Item']['term']] = request['PutRequest']['Item']
+            else:
+                deletes.add(request['DeleteRequest']['Key']['term'])
+    return puts, deletes
+
+
+@pytest.mark.unit
+class TestApplyChange:
+    """インデックスの差分更新のテスト"""
+
+    def test_index_new_article(self, mock_dynamodb, mock_table):
+        """新規コラムのポスティング・文書長・統計が登録されることを確認"""
+        repo = ArticleSearchRepository()
+
+        repo.apply_change(1, None, '特売特売')
+
+        items, deleted = written(mock_dynamodb)
+        assert items == {
+            '特売': {'term': '特売', 'articleId': 1, 'tf': 2},
+            '売特': {'term': '売特', 'articleId': 1, 'tf': 1},
+            '#doc': {'term': '#doc', 'articleId': 1, 'len': 3}
+        }
+        assert deleted == set()
+        mock_table.get_item.assert_not_called()
+        assert mock_table.update_item.call_args.kwargs['ExpressionAttributeValues'] == {
+            ':docs': 1, ':length': 3
+        }
+
+    def test_update_writes_only_changed_postings(self, mock_dynamodb, mock_table):
+        """更新時は追加・削除・出現回数が変わったトークンのポスティングのみを書き込むことを確認"""
+        repo = ArticleSearchRepository()
+
+        repo.apply_change(1, '値上げ値上', '値上げ値下')
+
+        puts, deleted = written(mock_dynamodb)
+        # 値上（2→1）・値下（追加）のみ。上げ・げ値は変わらないため書き込まない。文書長も同じ
+        assert puts == {
+            '値上': {'term': '値上', 'articleId': 1, 'tf': 1},
+            '値下': {'term': '値下', 'articleId': 1, 'tf': 1}
+        }
+        assert deleted == set()
+        mock_table.update_item.assert_not_called()
+
+    def test_unchanged_text_is_skipped(self, mock_dynamodb, mock_table):
+        """タイトル・本文が変わらない変更（ステータスのみなど）は書き込まないことを確認"""
+        repo = ArticleSearchRepository()
+
+        repo.apply_article_change(
+            {'articleId': 1, 'title': '特売', 'content': '本文', 'status': 'draft'},
+            {'articleId': 1, 'title': '特売', 'content': '本文', 'status': 'published'}
+        )
+
+        mock_dynamodb.meta.client.batch_write_item.assert_not_called()
+        mock_table.update_item.assert_not_called()
+
+    def test_remove_article(self, mock_dynamodb, mock_table):
+        """削除時に変更前のテキストのポスティングと文書長が削除されることを確認"""
+        repo = ArticleSearchRepository()
+
+        repo.apply_article_change({'articleId': 1, 'title': '特売', 'content': ''}, None)
+
+        puts, deleted = written(mock_dynamodb)
+        assert deleted == {'特売', '#doc'}
+        assert puts == {}
+        assert mock_table.update_item.call_args.kwargs['ExpressionAttributeValues'] == {
+            ':docs': -1, ':length': -1
+        }
+
+    def test_write_failure_skips_stats(self, mock_dynamodb, mock_table):
+        """ポスティングを書き込めなかった場合は統計を更新せずに失敗することを確認（ストリームで再試行する）"""
+        mock_dynamodb.meta.client.batch_write_item.side_effect = Exception('throttled')
+        repo = ArticleSearchRepository()
+
+        with pytest.raises(RuntimeError):
+            repo.apply_change(1, None, '特売')
+
+        mock_table.update_item.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSearch:
+    """検索のテスト"""
+
+    def test_search_and_semantics_and_ranking(self, mock_table, mock_dynamodb):
+        """全bigramを含む文書だけがスコア順に返り、その文書長だけを読むことを確認"""
+        mock_table.get_item.return_value = {'Item': {'docCount': 3, 'totalLength': 30}}
+        postings = {
+            '上げ': [
+                {'articleId': 1, 'tf': 1},
+                {'articleId': 2, 'tf': 3},
+                {'articleId': 3, 'tf': 1}
+            ],
+            '値上': [
+                {'articleId': 1, 'tf': 1},
+                {'articleId': 2, 'tf': 3}
+            ]
+        }
+
+        def query(**kwargs):
+            term = kwargs['KeyConditionExpression'].get_expression()['values'][1]
+            return {'Items': postings[term], 'Count': len(postings[term])}
+
+        mock_table.query.side_effect = query
+        mock_dynamodb.meta.client.batch_get_item.return_value = {'Responses': {'article-search-index': [
+            {'articleId': 1, 'len': 10},
+            {'articleId': 2, 'len': 10}
+        ]}}
+        repo = ArticleSearchRepository()
+
+        results = repo.search('値上げ')
+
+        assert [article_id for article_id, _ in results] == [2, 1]
+        keys = mock_dynamodb.meta.client.batch_get_item.call_args.kwargs['RequestItems']['article-search-index']['Keys']
+        assert sorted(key['articleId'] for key in keys) == [1, 2]
+        assert {key['term'] for key in keys} == {'#doc'}
+
+    def test_search_without_bigrams(self, mock_table):
+        """1文字の検索語はNoneを返すことを確認"""
+        repo = ArticleSearchRepository()
+
+        assert repo.search('肉') is None
+        mock_table.query.assert_not_called()
@@ -0,0 +1,129 @@
+"""
+ArticleTagRepository ユニットテスト
+タグ隣接リストのテスト（DynamoDBクライアントはモック）
+"""
+import pytest
+from unittest.mock import MagicMock
+from src.admin.repositories.article_tag_repository import (
+    ArticleTagRepository,
+    build_sort_key,
+    MAX_TAGS_PER_ARTICLE
+)
+
+
+def _row(published_at, article_id):
+    """query結果の1行"""
+    return {'sortKey': build_sort_key(published_at, article_id), 'articleId': article_id}
+
+
+@pytest.mark.unit
+class TestTransactItems:
+    """トランザクション用の操作リスト生成のテスト"""
+
+    def test_only_changed_tags(self):
+        """追加・削除されたタグのみが操作になることを確認"""
+        repo = ArticleTagRepository(MagicMock())
+
+        items = repo.transact_items(1, ['AI', 'ML'], '2025-01-01', ['ML', 'LLM', ''], '2025-01-01')
+
+        assert items[0]['Delete']['Key'] == {'tag': 'AI', 'sortKey': '2025-01-01#0000000001'}
+        assert items[1]['Put']['Item'] == {'tag': 'LLM', 'sortKey': '2025-01-01#0000000001', 'articleId': 1}
+        assert len(items) == 2
+
+    def test_published_at_change_rewrites_all_tags(self):
+        """公開日時が変わった場合は全タグ行を書き直すことを確認"""
+        repo = ArticleTagRepository(MagicMock())
+
+        items = repo.transact_items(1, ['AI'], None, ['AI'], '2025-01-01')
+
+        assert items[0]['Delete']['Key']['sortKey'] == '#0000000001'
+        assert items[1]['Put']['Item']['sortKey'] == '2025-01-01#0000000001'
+
+    def test_too_many_tags(self):
+        """タグ数の上限を超える場合はValueErrorになることを確認"""
+        repo = ArticleTagRepository(MagicMock())
+
+        with pytest.raises(ValueError):
+            repo.transact_items(1, [], None, [f"tag{i}" for i in range(MAX_TAGS_PER_ARTICLE + 1)], None)
+
+
+@pytest.mark.unit
+class TestFindArticles:
+    """タグのOR検索のテスト"""
+
+    def test_merges_tags_by_published_at(self):
+        """タグごとの結果が公開日時順にマージされ、重複が除かれることを確認"""
+        client = MagicMock()
+        rows = {
+            'AI': [_row('2025-03-01', 3), _row('2025-01-01', 1)],
+            'ML': [_row('2025-03-01', 3), _row('2025-02-01', 2)]
+        }
+        client.query.side_effect = lambda **kwargs: {
+            'Items': rows[kwargs['ExpressionAttributeValues'][':tag']]
+        }
+        repo = ArticleTagRepository(client)
+
+        rows, rows_read = repo.find_articles(['AI', 'ML'])
+
+        assert [article_id for _, article_id in rows] == [3, 2, 1]
+        assert rows_read == 4
+
+    def test_date_range_in_key_condition(self):
+        """日付範囲がソートキーの条件になり、終了日当日を含むことを確認"""
+        client = MagicMock()
+        client.query.return_value = {'Items': []}
+        repo = ArticleTagRepository(client)
+
+        repo.find_articles(['AI'], '2025-01-01', '2025-01-31')
+
+        kwargs = client.query.call_args.kwargs
+        assert kwargs['KeyConditionExpression'] == '#tag = :tag AND #sortKey BETWEEN :from AND :to'
+        assert kwargs['ExpressionAttributeValues'][':to'] == '2025-01-31#~'
+        assert kwargs['ScanIndexForward'] is False
+
+    def test_paginates_query(self):
+        """LastEvaluatedKeyがある場合は続きを読み込むことを確認"""
+        client = MagicMock()
+        client.query.side_effect = [
+            {'Items': [_row('2025-02-01', 2)], 'LastEvaluatedKey': {'k': 1}},
+            {'Items': [_row('2025-01-01', 1)]}
+        ]
+        repo = ArticleTagRepository(client)
+
+        rows, _ = repo.find_articles(['AI'])
+
+        assert [article_id for _, article_id in rows] == [2, 1]
+        assert client.query.call_args_list[1].kwargs['ExclusiveStartKey'] == {'k': 1}
+
+    def test_limit_and_cursor(self):
+        """カーソル位置より古い行から、各タグlimit行までしか読まないことを確認"""
+        client = MagicMock()
+        rows = {
+            'AI': [_row('2025-03-01', 3), _row('2025-02-01', 2)],
+            'ML': [_row('2025-03-01', 3), _row('2025-01-01', 1)]
+        }
+        client.query.side_effect = lambda **kwargs: {
+            'Items': [row for row in rows[kwargs['ExpressionAttributeValues'][':tag']]
+                      if row['sortKey'] <= kwargs['ExpressionAttributeValues'][':to']][:kwargs['Limit']]
+        }
+        repo = ArticleTagRepository(client)
+
+        result, _ = repo.find_articles(['AI', 'ML'], before=build_sort_key('2025-03-01', 3), limit=1)
+
+        assert result == [(build_sort_key('2025-02-01', 2), 2)]
+        kwargs = client.query.call_args.kwargs
+        assert kwargs['KeyConditionExpression'] == '#tag = :tag AND #sortKey <= :to'
+        # カーソル位置の行は除くため1行多く読む
+        assert kwargs['Limit'] == 2
+
+    def test_cursor_within_date_range(self):
+        """日付範囲がある場合はカーソル位置を上限にすることを確認"""
+        client = MagicMock()
+        client.query.return_value = {'Items': []}
+        repo = ArticleTagRepository(client)
+
+        repo.find_articles(['AI'], '2025-01-01', '2025-01-31', before=build_sort_key('2025-01-15', 7), limit=20)
+
+        values = client.query.call_args.kwargs['ExpressionAttributeValues']
+        assert values[':from'] == '2025-01-01'
+        assert values[':to'] == '2025-01-15#0000000007'
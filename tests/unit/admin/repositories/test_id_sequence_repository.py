@@ -0,0 +1,60 @@
+"""
+IdSequenceRepository ユニットテスト
+ID採番のテスト（DynamoDBテーブルはモック）
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
+from src.admin.repositories.id_sequence_repository import IdSequenceRepository
+
+
+@pytest.fixture
+def mock_table():
+    """DynamoDBテーブルのモック"""
+    with patch('src.admin.repositories.id_sequence_repository.dynamodb') as mock_resource:
+        mock_resource.Table.return_value = MagicMock()
+        yield mock_resource.Table.return_value
+
+
+@pytest.mark.unit
+class TestIdSequenceRepository:
+    """ID採番のテスト"""
+
+    def test_allocate_single(self, mock_table):
+        """ADDの結果から1件払い出すことを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'lastId': 11}}
+        repo = IdSequenceRepository()
+
+        assert list(repo.allocate('articles')) == [11]
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert kwargs['UpdateExpression'] == 'ADD lastId :count'
+        assert kwargs['ExpressionAttributeValues'] == {':count': 1}
+        assert kwargs['ReturnValues'] == 'UPDATED_NEW'
+
+    def test_allocate_block(self, mock_table):
+        """まとめて確保した範囲を返すことを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'lastId': 150}}
+        repo = IdSequenceRepository()
+
+        ids = repo.allocate('articles', 50)
+
+        assert ids == range(101, 151)
+        assert mock_table.update_item.call_count == 1
+
+    def test_allocate_invalid_count(self, mock_table):
+        """countが1未満の場合はValueErrorになることを確認"""
+        repo = IdSequenceRepository()
+
+        with pytest.raises(ValueError):
+            repo.allocate('articles', 0)
+
+    def test_ensure_at_least(self, mock_table):
+        """既にシーケンスが進んでいる場合は何もしないことを確認"""
+        mock_table.update_item.side_effect = [
+            None,
+            ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+        ]
+        repo = IdSequenceRepository()
+
+        assert repo.ensure_at_least('articles', 30) is True
+        assert repo.ensure_at_least('articles', 10) is False
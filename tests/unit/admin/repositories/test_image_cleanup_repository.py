@@ -0,0 +1,171 @@
+"""
+ImageCleanupRepository ユニットテスト
+画像削除キューのテスト（DynamoDBテーブルはモック）
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+from src.admin.repositories.image_cleanup_repository import (
+    DEAD,
+    DEAD_RETENTION_SECONDS,
+    DUE_INDEX,
+    PENDING,
+    ImageCleanupRepository,
+    InMemoryImageCleanupRepository
+)
+
+BUCKET_URL = 'https://images.s3.ap-northeast-1.amazonaws.com'
+
+
+@pytest.fixture
+def mock_table():
+    """DynamoDBテーブルのモック"""
+    with patch('src.admin.repositories.image_cleanup_repository.dynamodb') as mock_resource:
+        mock_resource.Table.return_value = MagicMock()
+        mock_resource.Table.return_value.name = 'image-cleanup-queue'
+        mock_resource.Table.return_value.meta.client.batch_write_item.return_value = {}
+        yield mock_resource.Table.return_value
+
+
+@pytest.mark.unit
+class TestImageCleanupRepository:
+    """画像削除キューのテスト"""
+
+    def test_enqueue_is_idempotent(self, mock_table):
+        """同じ画像は1アイテムにまとまり、バケット外のURLは登録しないことを確認"""
+        repo = ImageCleanupRepository()
+
+        count = repo.enqueue([
+            f'{BUCKET_URL}/articles/a.jpg',
+            f'{BUCKET_URL}/articles/a.jpg',
+            'https://example.com/other.jpg',
+            None
+        ])
+
+        assert count == 1
+        requests = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['image-cleanup-queue']
+        assert [r['PutRequest']['Item']['imageKey'] for r in requests] == ['articles/a.jpg']
+
+    def test_enqueue_failure_raises(self, mock_table):
+        """登録できなかった場合は例外になることを確認（呼び出し側でその場で削除する）"""
+        mock_table.meta.client.batch_write_item.side_effect = Exception('DynamoDB error')
+        repo = ImageCleanupRepository()
+
+        with pytest.raises(RuntimeError):
+            repo.enqueue([f'{BUCKET_URL}/articles/a.jpg'])
+
+    def test_enqueue_marks_items_pending(self, mock_table):
+        """登録したアイテムはpendingとしてDueIndexに入ることを確認"""
+        repo = ImageCleanupRepository()
+
+        repo.enqueue([f'{BUCKET_URL}/articles/a.jpg'])
+
+        requests = mock_table.meta.client.batch_write_item.call_args.kwargs['RequestItems']['image-cleanup-queue']
+        item = requests[0]['PutRequest']['Item']
+        assert item['queueStatus'] == PENDING
+        assert item['nextAttemptAt']
+
+    def test_receive_queries_due_index(self, mock_table):
+        """スキャンせずDueIndexを期限でqueryし、件数分だけ読むことを確認"""
+        mock_table.query.side_effect = [
+            {'Items': [{'imageKey': 'a'}], 'LastEvaluatedKey': {'imageKey': 'a'}},
+            {'Items': [{'imageKey': 'b'}, {'imageKey': 'c'}]}
+        ]
+        repo = ImageCleanupRepository()
+
+        items = repo.receive(3)
+
+        assert [item['imageKey'] for item in items] == ['a', 'b', 'c']
+        mock_table.scan.assert_not_called()
+        first, second = [c.kwargs for c in mock_table.query.call_args_list]
+        assert first['IndexName'] == DUE_INDEX
+        assert first['KeyConditionExpression'] == '#status = :pending AND #nextAttemptAt <= :now'
+        assert first['ExpressionAttributeValues'][':pending'] == PENDING
+        assert first['Limit'] == 3
+        assert second['Limit'] == 2
+        assert second['ExclusiveStartKey'] == {'imageKey': 'a'}
+
+    def test_receive_stops_at_limit(self, mock_table):
+        """件数に達したら次のページを読まないことを確認"""
+        mock_table.query.return_value = {
+            'Items': [{'imageKey': 'a'}, {'imageKey': 'b'}],
+            'LastEvaluatedKey': {'imageKey': 'b'}
+        }
+        repo = ImageCleanupRepository()
+
+        items = repo.receive(2)
+
+        assert len(items) == 2
+        assert mock_table.query.call_count == 1
+
+    def test_fail_with_retry_sets_next_attempt(self, mock_table):
+        """再試行する場合は次の試行日時を更新することを確認"""
+        repo = ImageCleanupRepository()
+
+        repo.fail('articles/a.jpg', 'SlowDown', datetime(2024, 1, 1, 0, 0, 0))
+
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert 'nextAttemptAt = :next' in kwargs['UpdateExpression']
+        assert kwargs['ExpressionAttributeValues'][':next'] == '2024-01-01T00:00:00Z'
+
+    def test_fail_without_retry_marks_dead(self, mock_table):
+        """再試行しない場合はdeadにしてDueIndexから外し、TTLを設定することを確認"""
+        repo = ImageCleanupRepository()
+
+        with patch('src.admin.repositories.image_cleanup_repository.time.time', return_value=1000):
+            repo.fail('articles/a.jpg', 'AccessDenied', None)
+
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert 'queueStatus = :dead' in kwargs['UpdateExpression']
+        assert 'expiresAt = :expires' in kwargs['UpdateExpression']
+        assert 'REMOVE nextAttemptAt' in kwargs['UpdateExpression']
+        assert kwargs['ExpressionAttributeValues'][':dead'] == DEAD
+        assert kwargs['ExpressionAttributeValues'][':expires'] == 1000 + DEAD_RETENTION_SECONDS
+
+
+@pytest.mark.unit
+class TestInMemoryImageCleanupRepository:
+    """プロセス内キューのテスト"""
+
+    def test_receive_and_complete(self):
+        """登録した画像を取得し、完了で除くことを確認"""
+        queue = InMemoryImageCleanupRepository()
+        queue.enqueue([f'{BUCKET_URL}/articles/a.jpg', f'{BUCKET_URL}/articles/b.jpg'])
+
+        items = queue.receive(10)
+        queue.complete([items[0]['imageKey']])
+
+        assert len(items) == 2
+        assert len(queue.items) == 1
+
+    def test_delayed_enqueue_is_not_received_yet(self):
+        """遅延を指定して登録した画像は期限まで取得されないことを確認"""
+        queue = InMemoryImageCleanupRepository()
+        queue.enqueue([f'{BUCKET_URL}/articles/a.jpg'], delay_seconds=3600)
+
+        assert queue.receive(10) == []
+        assert queue.items['articles/a.jpg']['nextAttemptAt'] > queue.items['articles/a.jpg']['enqueuedAt']
+
+    def test_dead_item_is_not_received(self):
+        """再試行の上限に達したアイテムは取得されず、TTLが設定されることを確認"""
+        queue = InMemoryImageCleanupRepository()
+        queue.enqueue([f'{BUCKET_URL}/articles/a.jpg'])
+
+        queue.fail('articles/a.jpg', 'AccessDenied', None)
+
+        assert queue.receive(10) == []
+        item = queue.items['articles/a.jpg']
+        assert item['queueStatus'] == DEAD
+        assert item['expiresAt'] > 0
+        assert 'nextAttemptAt' not in item
+
+    def test_receive_returns_oldest_first(self):
+        """期限の古い順に取得することを確認"""
+        queue = InMemoryImageCleanupRepository()
+        queue.enqueue([f'{BUCKET_URL}/articles/a.jpg', f'{BUCKET_URL}/articles/b.jpg'])
+        queue.items['articles/a.jpg']['nextAttemptAt'] = '2024-01-02T00:00:00Z'
+        queue.items['articles/b.jpg']['nextAttemptAt'] = '2024-01-01T00:00:00Z'
+
+        items = queue.receive(1)
+
+        assert [item['imageKey'] for item in items] == ['articles/b.jpg']
@@ -0,0 +1,143 @@
+"""
+ImageRefRepository ユニットテスト
+画像参照カウントのテスト（DynamoDBテーブルはモック）
+"""
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
+from src.admin.repositories.image_ref_repository import (
+    ImageRefRepository,
+    InMemoryImageRefRepository,
+    image_ref_key
+)
+
+SHA = 'a' * 64
+
+
+def _conditional_check_failed():
+    return ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+
+
+@pytest.fixture
+def mock_table():
+    """DynamoDBテーブルのモック"""
+    with patch('src.admin.repositories.image_ref_repository.dynamodb') as mock_resource:
+        mock_resource.Table.return_value = MagicMock()
+        mock_resource.Table.return_value.name = 'image-refs'
+        yield mock_resource.Table.return_value
+
+
+@pytest.mark.unit
+class TestImageRefRepository:
+    """画像参照カウントのテスト"""
+
+    def test_image_ref_key(self):
+        """元画像と派生画像が同じ参照キーになることを確認"""
+        assert image_ref_key(f'flyers/{SHA}.jpg') == f'flyers/{SHA}'
+        assert image_ref_key(f'variants/flyers/{SHA}/thumbnail.webp') == f'flyers/{SHA}'
+
+    def test_acquire_returns_count(self, mock_table):
+        """参照を登録し、登録後の参照数を返すことを確認"""
+        mock_table.update_item.return_value = {'Attributes': {'refCount': 2}}
+
+        assert ImageRefRepository().acquire(f'flyers/{SHA}.jpg') == 2
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert kwargs['Key'] == {'refKey': f'flyers/{SHA}'}
+        assert 'ADD refCount :one' in kwargs['UpdateExpression']
+
+    def test_release_without_references(self, mock_table):
+        """参照カウントの無い画像の解放は参照数0を返すことを確認"""
+        mock_table.update_item.side_effect = _conditional_check_failed()
+
+        assert ImageRefRepository().release(f'flyers/{SHA}.jpg') == 0
+        assert mock_table.update_item.call_args.kwargs['ConditionExpression'] == 'refCount > :zero'
+
+    def test_claim_unreferenced(self, mock_table):
+        """参照のない画像（派生画像を含む）のみを削除中にして返すことを確認"""
+        referenced = 'b' * 64
+
+        def update_item(**kwargs):
+            if kwargs['Key']['refKey'] == f'flyers/{referenced}':
+                raise _conditional_check_failed()
+            return {}
+
+        mock_table.meta.client.update_item.side_effect = update_item
+
+        removable = ImageRefRepository().claim_unreferenced([
+            f'flyers/{SHA}.jpg',
+            f'variants/flyers/{SHA}/thumbnail.webp',
+            f'flyers/{referenced}.jpg',
+        ])
+
+        assert removable == {f'flyers/{SHA}.jpg', f'variants/flyers/{SHA}/thumbnail.webp'}
+        assert mock_table.meta.client.update_item.call_count == 2
+        kwargs = mock_table.meta.client.update_item.call_args.kwargs
+        assert 'SET deletingUntil = :until' in kwargs['UpdateExpression']
+        assert 'refCount <= :zero' in kwargs['ConditionExpression']
+
+    def test_finish_removal_keeps_reacquired_ref(self, mock_table):
+        """削除中に参照された画像は参照カウントを残し、削除中の印のみ外すことを確認"""
+        mock_table.meta.client.delete_item.side_effect = _conditional_check_failed()
+
+        ImageRefRepository().finish_removal([f'flyers/{SHA}.jpg'])
+
+        kwargs = mock_table.meta.client.update_item.call_args.kwargs
+        assert kwargs['Key'] == {'refKey': f'flyers/{SHA}'}
+        assert kwargs['UpdateExpression'] == 'REMOVE deletingUntil'
+
+    def test_acquire_waits_for_removal(self, mock_table):
+        """削除中の画像の参照は削除の完了を待ってから最初の参照として返すことを確認"""
+        mock_table.update_item.return_value = {
+            'Attributes': {'refCount': 1, 'deletingUntil': int(time.time()) + 60}
+        }
+        mock_table.get_item.side_effect = [
+            {'Item': {'refKey': f'flyers/{SHA}', 'refCount': 1, 'deletingUntil': int(time.time()) + 60}},
+            {'Item': {'refKey': f'flyers/{SHA}', 'refCount': 1}},
+        ]
+
+        with patch('src.admin.repositories.image_ref_repository.time.sleep') as mock_sleep:
+            assert ImageRefRepository().acquire(f'flyers/{SHA}.jpg') == 1
+
+        assert mock_table.get_item.call_count == 2
+        assert mock_table.get_item.call_args.kwargs['ConsistentRead'] is True
+        mock_sleep.assert_called_once()
+
+
+@pytest.mark.unit
+class TestInMemoryImageRefRepository:
+    """プロセス内の画像参照カウントのテスト"""
+
+    def test_last_release_allows_delete(self):
+        """最後の参照を解放した画像のみ削除できることを確認"""
+        refs = InMemoryImageRefRepository()
+        key = f'flyers/{SHA}.jpg'
+
+        assert refs.acquire(key) == 1
+        assert refs.acquire(key) == 2
+        assert refs.release(key) == 1
+        assert refs.claim_unreferenced([key]) == set()
+        assert refs.release(key) == 0
+        assert refs.release(key) == 0
+        assert refs.claim_unreferenced([key]) == {key}
+        refs.finish_removal([key])
+        assert refs.counts == {}
+
+    def test_acquire_during_removal(self):
+        """削除中に登録した参照は削除の完了を待ち、削除後も参照カウントが残ることを確認"""
+        refs = InMemoryImageRefRepository()
+        key = f'flyers/{SHA}.jpg'
+        assert refs.claim_unreferenced([key]) == {key}
+
+        results = []
+        uploader = threading.Thread(target=lambda: results.append(refs.acquire(key)))
+        uploader.start()
+        uploader.join(timeout=0.1)
+        assert uploader.is_alive()
+
+        refs.finish_removal([key])
+        uploader.join(timeout=1)
+
+        assert results == [1]
+        assert refs.counts == {f'flyers/{SHA}': 1}
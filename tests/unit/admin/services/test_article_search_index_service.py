@@ -0,0 +1,52 @@
+"""
+ArticleSearchIndexService ユニットテスト
+DynamoDB Streamsのレコードから全文検索インデックスを更新するワーカーのテスト
+"""
+import pytest
+from unittest.mock import MagicMock
+from src.admin.services.article_search_index_service import ArticleSearchIndexService
+
+
+def _record(sequence, old=None, new=None):
+    """DynamoDB Streamsのレコード（ワイヤ形式のイメージ）"""
+    change = {'SequenceNumber': sequence}
+    if old is not None:
+        change['OldImage'] = old
+    if new is not None:
+        change['NewImage'] = new
+    return {'eventName': 'MODIFY', 'dynamodb': change}
+
+
+@pytest.mark.unit
+class TestProcessStreamEvent:
+    """Streamsイベントの処理のテスト"""
+
+    def test_applies_old_and_new_images(self):
+        """変更前後のイメージをPythonの値に変換して反映することを確認"""
+        search_index = MagicMock()
+        service = ArticleSearchIndexService(search_index)
+
+        result = service.process_stream_event({'Records': [
+            _record('1', new={'articleId': {'N': '1'}, 'title': {'S': '新'}}),
+            _record('2', old={'articleId': {'N': '2'}, 'title': {'S': '旧'}})
+        ]})
+
+        assert result == {'processed': 2, 'batchItemFailures': []}
+        created, removed = search_index.apply_article_change.call_args_list
+        assert created.args == (None, {'articleId': 1, 'title': '新'})
+        assert removed.args == ({'articleId': 2, 'title': '旧'}, None)
+
+    def test_stops_at_first_failure(self):
+        """失敗したレコード以降は処理せず、そのシーケンス番号を再試行に回すことを確認"""
+        search_index = MagicMock()
+        search_index.apply_article_change.side_effect = [None, Exception('throttled'), None]
+        service = ArticleSearchIndexService(search_index)
+
+        result = service.process_stream_event({'Records': [
+            _record('1', new={'articleId': {'N': '1'}}),
+            _record('2', new={'articleId': {'N': '2'}}),
+            _record('3', new={'articleId': {'N': '3'}})
+        ]})
+
+        assert result == {'processed': 1, 'batchItemFailures': [{'itemIdentifier': '2'}]}
+        assert search_index.apply_article_change.call_count == 2
@@ -4,7 +4,10 @@ ArticleService ユニットテスト
 """
 import pytest
 from unittest.mock import patch, MagicMock, call
+from src.admin.repositories.image_cleanup_repository import InMemoryImageCleanupRepository
+from src.admin.repositories.image_ref_repository import InMemoryImageRefRepository
 from src.admin.services.article_service import ArticleService
+from src.admin.services.image_cleanup_service import ImageCleanupService
 
 
 @pytest.mark.unit
@@ -23,40 +26,44 @@ class TestArticleService:
             limit = 20
 
             # Act
-            articles, total, total_pages = service.list_articles(filters, page, limit)
+            articles, total, total_pages, plan = service.list_articles(filters, page, limit)
 
             # Assert
             assert len(articles) == 1
             assert total == 1
             assert total_pages == 1
+            assert plan is None
             assert articles[0]['title'] == 'テスト記事'
-            mock_article_repository.list_articles.assert_called_once_with(filters, page, limit)
+            mock_article_repository.list_articles.assert_called_once_with(filters, page, limit, fields=None)
 
     def test_list_articles_pagination(self, mock_article_repository):
         """ページネーション計算が正しく動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.list_articles.return_value = ([], 45)
+            query_plan = MagicMock()
+            query_plan.describe.return_value = 'index=table; operation=scan'
+            mock_article_repository.list_articles.return_value = ([], 45, query_plan)
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             # Act
-            articles, total, total_pages = service.list_articles({}, 1, 20)
+            articles, total, total_pages, plan = service.list_articles({}, 1, 20)
 
             # Assert
             assert total == 45
             assert total_pages == 3  # 45 / 20 = 2.25 -> 3
+            assert plan == 'index=table; operation=scan'
 
     def test_list_articles_empty(self, mock_article_repository):
         """記事が0件の場合でも正しく動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.list_articles.return_value = ([], 0)
+            mock_article_repository.list_articles.return_value = ([], 0, None)
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             # Act
-            articles, total, total_pages = service.list_articles({}, 1, 20)
+            articles, total, total_pages, _ = service.list_articles({}, 1, 20)
 
             # Assert
             assert len(articles) == 0
@@ -94,13 +101,13 @@ class TestArticleService:
             assert article is None
             mock_article_repository.get_by_id.assert_called_once_with(999)
 
-    @patch('src.admin.services.article_service.upload_image')
-    def test_create_article_with_image(self, mock_upload_image, mock_article_repository):
+    @patch('src.admin.services.article_service.store_image')
+    def test_create_article_with_image(self, mock_store_image, mock_article_repository):
         """画像付きコラム作成が正常に動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
             MockRepo.return_value = mock_article_repository
-            mock_upload_image.return_value = 'https://s3.example.com/articles/new-image.jpg'
+            mock_store_image.return_value = ('https://s3.example.com/articles/new-image.jpg', True)
 
             service = ArticleService()
             article_data = {
@@ -108,20 +115,83 @@ class TestArticleService:
                 'content': '記事の内容',
                 'category': 'テクノロジー',
                 'status': 'draft',
-                'image': 'base64encodedimagedata'
+                'image': 'aW1hZ2VkYXRh'
             }
 
             # Act
-            result = service.create_article(article_data)
+            result = service.create_article(article_data, 'admin-1')
 
             # Assert
             assert result is not None
-            mock_upload_image.assert_called_once_with('base64encodedimagedata', 'articles', 'jpg')
+            # デコードした画像をアップロードすることを確認
+            mock_store_image.assert_called_once_with(
+                b'imagedata', 'articles', 'jpg', refs=service.image_refs
+            )
             # imageフィールドが削除され、imageUrlが追加されることを確認
             assert 'image' not in article_data
             assert 'imageUrl' in article_data
             mock_article_repository.create.assert_called_once()
 
+    @patch('src.admin.services.article_service.ImageVariantService')
+    @patch('src.admin.services.article_service.store_image')
+    def test_create_article_attaches_image_variants(
+        self,
+        mock_store_image,
+        mock_variant_service,
+        mock_article_repository
+    ):
+        """アップロードした画像の派生画像のURLが保存データに設定されることを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_store_image.return_value = ('https://s3.example.com/articles/new-image.jpg', True)
+            service = ArticleService()
+            article_data = {'title': 't', 'content': 'c', 'category': 'その他', 'image': 'aW1hZ2VkYXRh'}
+
+            service.create_article(article_data, 'admin-1')
+
+            # アップロードした画像のデータを渡し、S3から読み直さないことを確認
+            mock_variant_service.return_value.attach.assert_called_once_with(
+                article_data, 'https://s3.example.com/articles/new-image.jpg', data=b'imagedata', existing=False
+            )
+
+    @patch('src.admin.services.article_service.ImageVariantService')
+    @patch('src.admin.services.article_service.store_image')
+    def test_create_article_existing_image_skips_rendering(
+        self,
+        mock_store_image,
+        mock_variant_service,
+        mock_article_repository
+    ):
+        """同じ内容の画像が保存済みだった場合は派生画像を生成し直さないことを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_store_image.return_value = ('https://s3.example.com/articles/new-image.jpg', False)
+            service = ArticleService()
+            article_data = {'title': 't', 'content': 'c', 'category': 'その他', 'image': 'aW1hZ2VkYXRh'}
+
+            service.create_article(article_data, 'admin-1')
+
+            assert mock_variant_service.return_value.attach.call_args.kwargs['existing'] is True
+
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_delete_article_deletes_image_variants(self, mock_create_queue, mock_article_repository):
+        """記事の削除で派生画像も削除キューに登録されることを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_article_repository.delete_returning_old.return_value = {
+                'articleId': 1,
+                'imageUrl': 'https://s3.example.com/articles/test.jpg',
+                'imageVariants': {'thumbnail': {'webp': 'https://s3.example.com/variants/articles/test/thumbnail.webp'}}
+            }
+            service = ArticleService()
+
+            assert service.delete_article(1) is True
+
+            mock_create_queue.return_value.enqueue.assert_called_once_with([
+                'https://s3.example.com/articles/test.jpg',
+                'https://s3.example.com/variants/articles/test/thumbnail.webp'
+            ])
+
     def test_create_article_without_image(self, mock_article_repository):
         """画像なしコラム作成が正常に動作することを確認"""
         # Arrange
@@ -137,60 +207,175 @@ class TestArticleService:
             }
 
             # Act
-            result = service.create_article(article_data)
+            result = service.create_article(article_data, 'admin-1')
 
             # Assert
             assert result is not None
-            mock_article_repository.create.assert_called_once_with(article_data)
+            mock_article_repository.create.assert_called_once_with(article_data, 'admin-1')
+
+    @patch('src.admin.services.article_service.finalize_upload')
+    @patch('src.admin.services.article_service.store_image')
+    def test_create_article_with_upload_token(
+        self,
+        mock_store_image,
+        mock_finalize_upload,
+        mock_article_repository
+    ):
+        """アップロードトークン指定時は直接アップロード済みの画像を確定することを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_finalize_upload.return_value = 'https://s3.example.com/articles/direct.jpg'
+            service = ArticleService()
 
-    @patch('src.admin.services.article_service.delete_image')
-    @patch('src.admin.services.article_service.upload_image')
+            service.create_article({'title': '記事', 'imageUploadToken': 'token'}, 'admin-1')
+
+            mock_finalize_upload.assert_called_once_with('token', 'articles')
+            mock_store_image.assert_not_called()
+            created = mock_article_repository.create.call_args.args[0]
+            assert created['imageUrl'] == 'https://s3.example.com/articles/direct.jpg'
+            assert 'imageUploadToken' not in created
+
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    @patch('src.admin.services.article_service.store_image')
     def test_update_article_replace_image(
         self,
-        mock_upload_image,
-        mock_delete_image,
+        mock_store_image,
+        mock_create_queue,
         mock_article_repository
     ):
         """画像を置き換える更新が正常に動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
             MockRepo.return_value = mock_article_repository
-            mock_upload_image.return_value = 'https://s3.example.com/articles/updated-image.jpg'
+            mock_store_image.return_value = ('https://s3.example.com/articles/updated-image.jpg', True)
 
             service = ArticleService()
             update_data = {
                 'title': '更新された記事',
-                'image': 'base64newimagedata'
+                'image': 'bmV3aW1hZ2U='
             }
 
             # Act
-            result = service.update_article(1, update_data)
+            result = service.update_article(1, update_data, 'admin-1')
 
             # Assert
             assert result is not None
-            # 古い画像が削除されることを確認
-            mock_delete_image.assert_called_once_with('https://s3.example.com/articles/test.jpg')
+            # 古い画像が削除キューに登録されることを確認
+            mock_create_queue.return_value.enqueue.assert_called_once_with(['https://s3.example.com/articles/test.jpg'])
             # 新しい画像がアップロードされることを確認
-            mock_upload_image.assert_called_once_with('base64newimagedata', 'articles', 'jpg')
-            mock_article_repository.update.assert_called_once()
+            mock_store_image.assert_called_once_with(
+                b'newimage', 'articles', 'jpg', refs=service.image_refs
+            )
+            mock_article_repository.update_returning_old.assert_called_once()
+            # 事前の読み込みを行わないことを確認
+            mock_article_repository.get_by_id.assert_not_called()
+
+    @patch('src.admin.services.article_service.create_image_ref_index')
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    @patch('src.admin.services.article_service.store_image')
+    def test_update_article_same_image_releases_old_ref(
+        self,
+        mock_store_image,
+        mock_create_queue,
+        mock_create_refs,
+        mock_article_repository
+    ):
+        """同じ画像をアップロードし直した場合も古い参照を解放し、参照数が増えないことを確認"""
+        image_url = 'https://images.s3.ap-northeast-1.amazonaws.com/articles/same.jpg'
+        refs = InMemoryImageRefRepository()
+        refs.acquire('articles/same.jpg')
+        mock_create_refs.return_value = refs
+
+        def store_image(image_data, folder, file_extension, refs=None):
+            refs.acquire('articles/same.jpg')
+            return image_url, False
+
+        mock_store_image.side_effect = store_image
+
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            old_article = {'articleId': 1, 'imageUrl': image_url}
+            mock_article_repository.update_returning_old.return_value = ({**old_article, 'title': '更新'}, old_article)
+            service = ArticleService()
+
+            assert service.update_article(1, {'title': '更新', 'image': 'c2FtZWltYWdl'}, 'admin-1') is not None
+
+            assert refs.counts == {'articles/same': 1}
+            mock_create_queue.return_value.enqueue.assert_not_called()
+
+    @patch('src.admin.services.article_service.create_image_ref_index')
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    @patch('src.admin.services.article_service.store_image')
+    def test_create_article_failure_releases_image(
+        self,
+        mock_store_image,
+        mock_create_queue,
+        mock_create_refs,
+        mock_article_repository
+    ):
+        """コラムを作成できなかった場合はアップロード時に登録した画像の参照を解放することを確認"""
+        image_url = 'https://images.s3.ap-northeast-1.amazonaws.com/articles/new.jpg'
+        refs = InMemoryImageRefRepository()
+        mock_create_refs.return_value = refs
+
+        def store_image(image_data, folder, file_extension, refs=None):
+            refs.acquire('articles/new.jpg')
+            return image_url, True
+
+        mock_store_image.side_effect = store_image
+
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_article_repository.create.side_effect = Exception('TransactionCanceled')
+            service = ArticleService()
+
+            with pytest.raises(Exception):
+                service.create_article({'title': '記事', 'image': 'bmV3aW1hZ2U='}, 'admin-1')
+
+            assert refs.counts == {'articles/new': 0}
+            enqueued = mock_create_queue.return_value.enqueue.call_args.args[0]
+            assert enqueued[0] == image_url
 
     def test_update_article_not_found(self, mock_article_repository):
         """存在しない記事の更新時にNoneを返すことを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.get_by_id.return_value = None
+            mock_article_repository.update_returning_old.return_value = None
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             # Act
-            result = service.update_article(999, {'title': '更新'})
+            result = service.update_article(999, {'title': '更新'}, 'admin-1')
 
             # Assert
             assert result is None
-            mock_article_repository.update.assert_not_called()
+            mock_article_repository.get_by_id.assert_not_called()
+
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    @patch('src.admin.services.article_service.store_image')
+    def test_update_article_not_found_removes_uploaded_image(
+        self,
+        mock_store_image,
+        mock_create_queue,
+        mock_article_repository
+    ):
+        """存在しない記事の更新時はアップロードした画像を削除することを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            mock_article_repository.update_returning_old.return_value = None
+            MockRepo.return_value = mock_article_repository
+            mock_store_image.return_value = ('https://s3.example.com/articles/new.jpg', True)
+            service = ArticleService()
+
+            # Act
+            result = service.update_article(999, {'image': 'bmV3aW1hZ2U='}, 'admin-1')
 
-    @patch('src.admin.services.article_service.delete_image')
-    def test_delete_article_with_image(self, mock_delete_image, mock_article_repository):
+            # Assert
+            assert result is None
+            mock_create_queue.return_value.enqueue.assert_called_once_with(['https://s3.example.com/articles/new.jpg'])
+
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_delete_article_with_image(self, mock_create_queue, mock_article_repository):
         """画像付き記事の削除が正常に動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
@@ -202,15 +387,55 @@ class TestArticleService:
 
             # Assert
             assert result is True
-            # 画像が削除されることを確認
-            mock_delete_image.assert_called_once_with('https://s3.example.com/articles/test.jpg')
-            mock_article_repository.delete.assert_called_once_with(1)
+            # 画像が削除キューに登録されることを確認
+            mock_create_queue.return_value.enqueue.assert_called_once_with(['https://s3.example.com/articles/test.jpg'])
+            mock_article_repository.delete_returning_old.assert_called_once_with(1)
+            mock_article_repository.get_by_id.assert_not_called()
+
+    @patch('src.admin.services.article_service.create_image_ref_index')
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_delete_article_keeps_shared_image(self, mock_create_queue, mock_create_refs, mock_article_repository):
+        """他のコラムが参照している画像は削除キューに登録しないことを確認"""
+        image_url = 'https://images.s3.ap-northeast-1.amazonaws.com/articles/shared.jpg'
+        refs = InMemoryImageRefRepository()
+        refs.acquire('articles/shared.jpg')
+        refs.acquire('articles/shared.jpg')
+        mock_create_refs.return_value = refs
+
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_article_repository.delete_returning_old.return_value = {'articleId': 1, 'imageUrl': image_url}
+            service = ArticleService()
+
+            assert service.delete_article(1) is True
+            mock_create_queue.return_value.enqueue.assert_not_called()
+
+            assert service.delete_article(1) is True
+            mock_create_queue.return_value.enqueue.assert_called_once_with([image_url])
+
+    @patch('src.admin.services.article_service.delete_images')
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_delete_article_queue_failure_deletes_now(
+        self,
+        mock_create_queue,
+        mock_delete_images,
+        mock_article_repository
+    ):
+        """削除キューに登録できない場合はその場で画像を削除することを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            mock_create_queue.return_value.enqueue.side_effect = Exception('DynamoDB error')
+            mock_delete_images.return_value = {}
+            service = ArticleService()
+
+            assert service.delete_article(1) is True
+            mock_delete_images.assert_called_once_with(['https://s3.example.com/articles/test.jpg'])
 
     def test_delete_article_not_found(self, mock_article_repository):
         """存在しない記事の削除時にFalseを返すことを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.get_by_id.return_value = None
+            mock_article_repository.delete_returning_old.return_value = None
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
@@ -219,13 +444,37 @@ class TestArticleService:
 
             # Assert
             assert result is False
-            mock_article_repository.delete.assert_not_called()
+
+    def test_get_articles_keeps_order(self, mock_article_repository):
+        """複数取得が指定順で返り、見つからないIDを返すことを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            mock_article_repository.get_many.return_value = {3: {'articleId': 3}, 1: {'articleId': 1}}
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            articles, missing = service.get_articles([1, 2, 3], fields=['title'])
+
+            assert [a['articleId'] for a in articles] == [1, 3]
+            assert missing == [2]
+            mock_article_repository.get_many.assert_called_once_with([1, 2, 3], ['articleId', 'title'])
+            mock_article_repository.get_by_id.assert_not_called()
+
+    def test_get_articles_limit(self, mock_article_repository):
+        """上限を超えるIDはValueErrorになることを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            with pytest.raises(ValueError):
+                service.get_articles(list(range(101)))
 
     def test_bulk_update_status_success(self, mock_article_repository):
         """ステータス一括更新が正常に動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.update.return_value = {'articleId': 1}
+            mock_article_repository.bulk_update_status.return_value = (
+                {1: {'articleId': 1}, 2: {'articleId': 2}, 3: {'articleId': 3}}, {}
+            )
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
@@ -233,23 +482,25 @@ class TestArticleService:
             status = 'published'
 
             # Act
-            success_count, failed_count = service.bulk_update_status(article_ids, status)
+            success_count, failed_count, results = service.bulk_update_status(article_ids, status, 'admin001')
 
             # Assert
             assert success_count == 3
             assert failed_count == 0
-            assert mock_article_repository.update.call_count == 3
+            assert all(result['success'] for result in results)
+            mock_article_repository.bulk_update_status.assert_called_once_with(
+                article_ids, status, 'admin001', atomic=False
+            )
+            mock_article_repository.update.assert_not_called()
 
     def test_bulk_update_status_partial_failure(self, mock_article_repository):
         """一部失敗するステータス一括更新を確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
             # 1件目成功、2件目失敗、3件目成功
-            mock_article_repository.update.side_effect = [
-                {'articleId': 1},
-                None,
-                {'articleId': 3}
-            ]
+            mock_article_repository.bulk_update_status.return_value = (
+                {1: {'articleId': 1}, 3: {'articleId': 3}}, {2: 'not_found'}
+            )
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
@@ -257,80 +508,228 @@ class TestArticleService:
             status = 'published'
 
             # Act
-            success_count, failed_count = service.bulk_update_status(article_ids, status)
+            success_count, failed_count, results = service.bulk_update_status(article_ids, status)
 
             # Assert
             assert success_count == 2
             assert failed_count == 1
+            assert {'articleId': 2, 'success': False, 'error': 'not_found'} in results
 
-    @patch('src.admin.services.article_service.delete_image')
-    def test_bulk_delete_articles_success(self, mock_delete_image, mock_article_repository):
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_bulk_delete_articles_success(self, mock_create_queue, mock_article_repository):
         """記事一括削除が正常に動作することを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            # 各記事の画像URLを返す
-            mock_article_repository.get_by_id.side_effect = [
-                {'articleId': 1, 'imageUrl': 'https://s3.example.com/1.jpg'},
-                {'articleId': 2, 'imageUrl': 'https://s3.example.com/2.jpg'},
-                {'articleId': 3, 'imageUrl': 'https://s3.example.com/3.jpg'}
-            ]
-            mock_article_repository.delete.return_value = True
+            # 削除したコラムの削除前の値（画像URL）を返す
+            mock_article_repository.bulk_delete.return_value = ({
+                1: {'articleId': 1, 'imageUrl': 'https://s3.example.com/1.jpg'},
+                2: {'articleId': 2, 'imageUrl': 'https://s3.example.com/2.jpg'},
+                3: {'articleId': 3, 'imageUrl': 'https://s3.example.com/3.jpg'}
+            }, {})
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             article_ids = [1, 2, 3]
 
             # Act
-            success_count, failed_count = service.bulk_delete_articles(article_ids)
+            success_count, failed_count, results = service.bulk_delete_articles(article_ids)
 
             # Assert
             assert success_count == 3
             assert failed_count == 0
-            assert mock_delete_image.call_count == 3
-            assert mock_article_repository.delete.call_count == 3
-
-    @patch('src.admin.services.article_service.delete_image')
-    def test_bulk_delete_articles_partial_failure(self, mock_delete_image, mock_article_repository):
+            # 画像はまとめて1回で削除キューに登録する
+            mock_create_queue.return_value.enqueue.assert_called_once_with([
+                'https://s3.example.com/1.jpg',
+                'https://s3.example.com/2.jpg',
+                'https://s3.example.com/3.jpg'
+            ])
+            mock_article_repository.bulk_delete.assert_called_once_with(article_ids)
+            mock_article_repository.delete_returning_old.assert_not_called()
+            mock_article_repository.get_by_id.assert_not_called()
+
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_bulk_delete_articles_partial_failure(self, mock_create_queue, mock_article_repository):
         """一部失敗する記事一括削除を確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.get_by_id.side_effect = [
-                {'articleId': 1, 'imageUrl': 'https://s3.example.com/1.jpg'},
-                {'articleId': 2, 'imageUrl': 'https://s3.example.com/2.jpg'},
-                {'articleId': 3, 'imageUrl': 'https://s3.example.com/3.jpg'}
-            ]
-            # 1件目成功、2件目失敗、3件目成功
-            mock_article_repository.delete.side_effect = [True, False, True]
+            # 1件目成功、2件目失敗（存在しない）、3件目成功
+            mock_article_repository.bulk_delete.return_value = ({
+                1: {'articleId': 1, 'imageUrl': 'https://s3.example.com/1.jpg'},
+                3: {'articleId': 3, 'imageUrl': 'https://s3.example.com/3.jpg'}
+            }, {2: 'not_found'})
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             article_ids = [1, 2, 3]
 
             # Act
-            success_count, failed_count = service.bulk_delete_articles(article_ids)
+            success_count, failed_count, results = service.bulk_delete_articles(article_ids)
 
             # Assert
             assert success_count == 2
             assert failed_count == 1
+            assert {'articleId': 2, 'success': False, 'error': 'not_found'} in results
 
-    def test_bulk_delete_articles_with_exception(self, mock_article_repository):
-        """例外が発生した場合の一括削除を確認"""
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_bulk_delete_articles_with_exception(self, mock_create_queue, mock_article_repository):
+        """例外が発生した場合は全件失敗として返すことを確認"""
         # Arrange
         with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
-            mock_article_repository.get_by_id.side_effect = [
-                {'articleId': 1},
-                Exception('Database error'),
-                {'articleId': 3}
-            ]
-            mock_article_repository.delete.return_value = True
+            mock_article_repository.bulk_delete.side_effect = Exception('Database error')
             MockRepo.return_value = mock_article_repository
             service = ArticleService()
 
             article_ids = [1, 2, 3]
 
             # Act
-            success_count, failed_count = service.bulk_delete_articles(article_ids)
+            success_count, failed_count, results = service.bulk_delete_articles(article_ids)
 
             # Assert
-            assert success_count == 2
-            assert failed_count == 1
+            assert success_count == 0
+            assert failed_count == 3
+            assert [result['error'] for result in results] == ['error', 'error', 'error']
+
+    def test_list_articles_by_cursor_first_page(self, mock_article_repository):
+        """カーソルなしで1ページ目を取得し、次ページのカーソルが返ることを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            mock_article_repository.list_articles_page.return_value = (
+                [{'articleId': 1}],
+                {'articleId': 1, 'status': 'published', 'publishedAt': '2025-01-01T00:00:00Z'},
+                None
+            )
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            filters = {'status': 'published'}
+
+            # Act
+            articles, next_cursor, _ = service.list_articles_by_cursor(filters, 20)
+
+            # Assert
+            assert len(articles) == 1
+            assert next_cursor is not None
+            mock_article_repository.list_articles_page.assert_called_once_with(filters, 20, None, fields=None)
+
+    def test_list_articles_by_cursor_next_page(self, mock_article_repository):
+        """返されたカーソルでExclusiveStartKeyが復元されることを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            last_key = {'articleId': 5, 'status': 'published', 'publishedAt': '2025-01-05T00:00:00Z'}
+            mock_article_repository.list_articles_page.side_effect = [
+                ([{'articleId': 5}], last_key, None),
+                ([{'articleId': 4}], None, None)
+            ]
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            filters = {'status': 'published'}
+
+            # Act
+            _, cursor, _ = service.list_articles_by_cursor(filters, 1)
+            articles, next_cursor, _ = service.list_articles_by_cursor(filters, 1, cursor)
+
+            # Assert
+            assert articles == [{'articleId': 4}]
+            assert next_cursor is None
+            assert mock_article_repository.list_articles_page.call_args_list[1] == call(filters, 1, last_key, fields=None)
+
+    def test_list_articles_by_cursor_filter_mismatch(self, mock_article_repository):
+        """別の検索条件で発行されたカーソルはValueErrorになることを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            mock_article_repository.list_articles_page.return_value = ([], {'articleId': 1}, None)
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            _, cursor, _ = service.list_articles_by_cursor({'status': 'published'}, 20)
+
+            # Act & Assert
+            with pytest.raises(ValueError):
+                service.list_articles_by_cursor({'status': 'draft'}, 20, cursor)
+
+    def test_list_articles_fields(self, mock_article_repository):
+        """fields指定時はarticleIdを含めてリポジトリに渡すことを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            mock_article_repository.list_articles.return_value = ([], 0, None)
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            # Act
+            service.list_articles({}, 1, 20, fields=['title', 'status'])
+
+            # Assert
+            mock_article_repository.list_articles.assert_called_once_with(
+                {}, 1, 20, fields=['articleId', 'title', 'status']
+            )
+
+    def test_list_articles_fields_rejects_content(self, mock_article_repository):
+        """一覧で本文contentを指定するとValueErrorになることを確認"""
+        # Arrange
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            # Act & Assert
+            with pytest.raises(ValueError):
+                service.list_articles({}, 1, 20, fields=['title', 'content'])
+            mock_article_repository.list_articles.assert_not_called()
+
+    def test_create_and_update_pass_admin_id_to_repository(self):
+        """作成・更新がリポジトリのシグネチャどおりに管理者IDを渡すことを確認"""
+        with patch('src.admin.services.article_service.ArticleRepository', autospec=True) as MockRepo:
+            repo = MockRepo.return_value
+            repo.create.return_value = {'articleId': 1}
+            repo.update_returning_old.return_value = ({'articleId': 1}, {'articleId': 1})
+            service = ArticleService()
+
+            service.create_article({'title': '記事'}, 'admin-1')
+            service.update_article(1, {'title': '更新'}, 'admin-1')
+
+            repo.create.assert_called_once_with({'title': '記事'}, 'admin-1')
+            repo.update_returning_old.assert_called_once_with(1, {'title': '更新'}, 'admin-1')
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    @patch('src.admin.services.article_service.finalize_upload')
+    @patch('src.admin.services.article_service.create_upload_session')
+    @patch('src.admin.services.article_service.create_image_ref_index')
+    @patch('src.admin.services.article_service.create_image_cleanup_queue')
+    def test_abandoned_upload_is_queued_for_deletion(
+        self,
+        mock_create_queue,
+        mock_create_refs,
+        mock_create_session,
+        mock_finalize,
+        mock_delete_images,
+        mock_article_repository
+    ):
+        """発行したアップロード先はトークンの期限後に削除され、確定した画像は残ることを確認"""
+        bucket_url = 'https://images.s3.ap-northeast-1.amazonaws.com'
+        queue = InMemoryImageCleanupRepository()
+        refs = InMemoryImageRefRepository()
+        mock_create_queue.return_value = queue
+        mock_create_refs.return_value = refs
+        mock_create_session.side_effect = [{'key': 'articles/abandoned.jpg'}, {'key': 'articles/used.jpg'}]
+        mock_finalize.return_value = f'{bucket_url}/articles/used.jpg'
+        mock_delete_images.return_value = {}
+
+        with patch('src.admin.services.article_service.ArticleRepository') as MockRepo:
+            MockRepo.return_value = mock_article_repository
+            service = ArticleService()
+
+            service.create_image_upload_session('image/jpeg')
+            service.create_image_upload_session('image/jpeg')
+            service.create_article({'title': '記事', 'imageUploadToken': 'token'}, 'admin-1')
+
+        # トークンの期限までは削除しない
+        assert set(queue.items) == {'articles/abandoned.jpg', 'articles/used.jpg'}
+        assert queue.receive(10) == []
+
+        # 期限後は削除ワーカーが確定されなかった画像のみを削除する
+        for item in queue.items.values():
+            item['nextAttemptAt'] = item['enqueuedAt']
+        summary = ImageCleanupService(queue, refs).drain()
+
+        assert summary == {'deleted': 1, 'retried': 0, 'dead': 0, 'kept': 1}
+        assert list(mock_delete_images.call_args.args[0]) == [f'{bucket_url}/articles/abandoned.jpg']
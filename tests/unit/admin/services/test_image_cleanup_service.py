@@ -0,0 +1,104 @@
+"""
+ImageCleanupService ユニットテスト
+"""
+import threading
+import pytest
+from unittest.mock import patch
+from src.admin.repositories.image_cleanup_repository import InMemoryImageCleanupRepository
+from src.admin.repositories.image_ref_repository import InMemoryImageRefRepository
+from src.admin.services.image_cleanup_service import ImageCleanupService, MAX_ATTEMPTS
+
+BUCKET_URL = 'https://images.s3.ap-northeast-1.amazonaws.com'
+
+
+@pytest.fixture
+def queue():
+    """プロセス内の画像削除キュー"""
+    queue = InMemoryImageCleanupRepository()
+    queue.enqueue([f'{BUCKET_URL}/articles/{i}.jpg' for i in range(3)])
+    return queue
+
+
+@pytest.fixture
+def refs():
+    """プロセス内の画像参照カウント（参照なし）"""
+    return InMemoryImageRefRepository()
+
+
+@pytest.mark.unit
+class TestImageCleanupService:
+    """画像削除ワーカーのテスト"""
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    def test_drain_deletes_in_one_batch(self, mock_delete_images, queue, refs):
+        """キューの画像を1回のDeleteObjectsで削除し、キューから除くことを確認"""
+        mock_delete_images.return_value = {}
+
+        summary = ImageCleanupService(queue, refs).drain()
+
+        assert summary == {'deleted': 3, 'retried': 0, 'dead': 0, 'kept': 0}
+        mock_delete_images.assert_called_once()
+        assert queue.items == {}
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    def test_failure_is_retried_later(self, mock_delete_images, queue, refs):
+        """失敗した画像は後で再試行し、すぐには再取得しないことを確認"""
+        failed_url = f'{BUCKET_URL}/articles/1.jpg'
+        mock_delete_images.return_value = {failed_url: 'SlowDown'}
+        service = ImageCleanupService(queue, refs)
+
+        summary = service.drain()
+
+        assert summary == {'deleted': 2, 'retried': 1, 'dead': 0, 'kept': 0}
+        assert queue.items['articles/1.jpg']['attempts'] == 1
+        assert queue.receive(10) == []
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    def test_gives_up_after_max_attempts(self, mock_delete_images, queue, refs):
+        """試行回数の上限に達した画像は再試行しないことを確認"""
+        failed_url = f'{BUCKET_URL}/articles/1.jpg'
+        queue.items['articles/1.jpg']['attempts'] = MAX_ATTEMPTS - 1
+        mock_delete_images.return_value = {failed_url: 'AccessDenied'}
+
+        summary = ImageCleanupService(queue, refs).drain()
+
+        assert summary['dead'] == 1
+        assert 'nextAttemptAt' not in queue.items['articles/1.jpg']
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    def test_referenced_again_is_kept(self, mock_delete_images, queue, refs):
+        """キュー登録後に再び参照された画像は削除せずにキューから除くことを確認"""
+        mock_delete_images.return_value = {}
+        refs.acquire('articles/1.jpg')
+
+        summary = ImageCleanupService(queue, refs).drain()
+
+        assert summary == {'deleted': 2, 'retried': 0, 'dead': 0, 'kept': 1}
+        deleted_urls = list(mock_delete_images.call_args.args[0])
+        assert f'{BUCKET_URL}/articles/1.jpg' not in deleted_urls
+        assert queue.items == {}
+        assert refs.counts == {'articles/1': 1}
+
+    @patch('src.admin.services.image_cleanup_service.delete_images')
+    def test_upload_during_delete_waits(self, mock_delete_images, queue, refs):
+        """削除中に同じ画像を参照したアップロードは削除の完了を待ち、最初の参照としてアップロードし直すことを確認"""
+        results = []
+        uploader = threading.Thread(target=lambda: results.append(refs.acquire('articles/1.jpg')))
+
+        def delete_images(urls):
+            list(urls)
+            uploader.start()
+            uploader.join(timeout=0.1)
+            # DeleteObjectsが終わるまで参照の登録は完了しない
+            assert uploader.is_alive()
+            return {}
+
+        mock_delete_images.side_effect = delete_images
+
+        summary = ImageCleanupService(queue, refs).drain()
+        uploader.join(timeout=1)
+
+        assert summary == {'deleted': 3, 'retried': 0, 'dead': 0, 'kept': 0}
+        # 参照数1が返るため、アップロード側は画像をアップロードし直す
+        assert results == [1]
+        assert refs.counts == {'articles/1': 1}
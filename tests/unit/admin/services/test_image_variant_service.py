@@ -0,0 +1,99 @@
+"""
+ImageVariantService ユニットテスト
+"""
+import pytest
+from unittest.mock import patch
+from src.admin.services.image_variant_service import ImageVariantService, item_image_urls
+
+BUCKET_URL = 'https://images.s3.ap-northeast-1.amazonaws.com'
+VARIANTS = {
+    'thumbnail': {'webp': f'{BUCKET_URL}/variants/articles/a/thumbnail.webp'},
+    'medium': {'webp': f'{BUCKET_URL}/variants/articles/a/medium.webp'},
+}
+
+
+def _s3_event(*keys, bucket='images'):
+    return {'Records': [{'s3': {'bucket': {'name': bucket}, 'object': {'key': key}}} for key in keys]}
+
+
+@pytest.fixture
+def trigger():
+    with patch('src.admin.services.image_variant_service.settings') as mock_settings:
+        mock_settings.S3_BUCKET_NAME = 'images'
+        mock_settings.IMAGE_VARIANTS_TRIGGER = 'upload'
+        yield mock_settings
+
+
+@pytest.mark.unit
+class TestImageVariantService:
+    """派生画像サービスのテスト"""
+
+    @patch('src.admin.services.image_variant_service.generate_image_variants')
+    def test_attach_generates_on_upload(self, mock_generate, trigger):
+        """uploadモードではアップロードした画像のデータからその場で生成し、一覧用のサムネイルも設定することを確認"""
+        mock_generate.return_value = VARIANTS
+        item = {}
+
+        ImageVariantService().attach(item, f'{BUCKET_URL}/articles/a.jpg', data=b'image')
+
+        mock_generate.assert_called_once_with('articles/a.jpg', data=b'image', executor=None)
+        assert item == {'imageVariants': VARIANTS, 'thumbnail': VARIANTS['thumbnail']}
+
+    @patch('src.admin.services.image_variant_service.generate_image_variants')
+    def test_s3_trigger_stores_expected_urls(self, mock_generate, trigger):
+        """s3モードではS3を読まずに、ワーカーが生成する派生画像のURLを返すことを確認"""
+        trigger.IMAGE_VARIANTS_TRIGGER = 's3'
+
+        with patch('utils.image_variants.s3_client') as mock_s3, \
+                patch('utils.image_variants.supported_formats', return_value=frozenset({'jpeg', 'webp', 'avif'})):
+            variants = ImageVariantService().variants_for_upload(f'{BUCKET_URL}/articles/a.jpg', data=b'image')
+
+        assert variants['thumbnail']['webp'].endswith('/variants/articles/a/thumbnail.webp')
+        assert variants['medium']['avif'].endswith('/variants/articles/a/medium.avif')
+        mock_generate.assert_not_called()
+        assert mock_s3.method_calls == []
+
+    @patch('src.admin.services.image_variant_service.generate_image_variants')
+    def test_existing_image_is_not_rendered(self, mock_generate, trigger):
+        """uploadモードでも保存済みの画像は生成し直さず、生成済みの派生画像のURLを返すことを確認"""
+        with patch('utils.image_variants.s3_client'), \
+                patch('utils.image_variants.supported_formats', return_value=frozenset({'jpeg', 'webp'})):
+            variants = ImageVariantService().variants_for_upload(
+                f'{BUCKET_URL}/articles/a.jpg', data=b'image', existing=True
+            )
+
+        assert variants['thumbnail']['webp'].endswith('/variants/articles/a/thumbnail.webp')
+        mock_generate.assert_not_called()
+
+    @patch('src.admin.services.image_variant_service.generate_image_variants')
+    def test_failure_returns_empty(self, mock_generate, trigger):
+        """生成に失敗しても例外にせず、空の派生画像を設定することを確認"""
+        mock_generate.side_effect = Exception('cannot identify image file')
+        item = {}
+
+        ImageVariantService().attach(item, f'{BUCKET_URL}/articles/a.jpg')
+
+        assert item == {'imageVariants': {}, 'thumbnail': {}}
+
+    @patch('src.admin.services.image_variant_service.generate_image_variants')
+    def test_process_s3_event(self, mock_generate, trigger):
+        """S3イベントの画像の派生画像を生成し、派生画像自身や他のバケットは対象外にすることを確認"""
+        mock_generate.side_effect = [VARIANTS, Exception('broken')]
+        event = _s3_event('articles/a+b%281%29.jpg', 'variants/articles/a/thumbnail.webp', 'flyers/c.jpg')
+        event['Records'] += _s3_event('articles/other.jpg', bucket='other')['Records']
+
+        summary = ImageVariantService().process_s3_event(event)
+
+        assert summary == {'processed': 1, 'skipped': 2, 'failed': 1}
+        assert [c.args[0] for c in mock_generate.call_args_list] == ['articles/a b(1).jpg', 'flyers/c.jpg']
+
+    def test_item_image_urls(self):
+        """元画像と派生画像のURLを返すことを確認"""
+        item = {'imageUrl': f'{BUCKET_URL}/articles/a.jpg', 'imageVariants': VARIANTS}
+
+        assert sorted(item_image_urls(item)) == sorted([
+            f'{BUCKET_URL}/articles/a.jpg',
+            VARIANTS['thumbnail']['webp'],
+            VARIANTS['medium']['webp'],
+        ])
+        assert item_image_urls(None) == []
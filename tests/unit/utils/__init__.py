@@ -0,0 +1 @@
+# Utils layer unit tests
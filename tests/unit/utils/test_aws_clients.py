@@ -0,0 +1,61 @@
+"""
+aws_clients ユニットテスト
+"""
+import pytest
+from unittest.mock import patch
+
+from utils import aws_clients
+
+
+@pytest.fixture
+def session():
+    aws_clients.reset_clients()
+    with patch('utils.aws_clients.boto3.session.Session') as mock_session, \
+            patch('utils.aws_clients.settings') as mock_settings:
+        mock_settings.DYNAMODB_ENDPOINT_URL = None
+        yield mock_session, mock_settings
+    aws_clients.reset_clients()
+
+
+@pytest.mark.unit
+class TestAwsClients:
+    """共有AWSクライアントのテスト"""
+
+    def test_lazy_and_shared(self, session):
+        """初回使用時に1つのセッションから生成し、以降は同じクライアントを返すことを確認"""
+        mock_session, _ = session
+
+        mock_session.assert_not_called()
+        table = aws_clients.dynamodb.Table('articles')
+
+        assert table is mock_session.return_value.resource.return_value.Table.return_value
+        assert aws_clients.get_dynamodb_resource() is aws_clients.get_dynamodb_resource()
+        assert aws_clients.get_dynamodb_client() is mock_session.return_value.resource.return_value.meta.client
+        aws_clients.get_s3_client()
+        mock_session.assert_called_once()
+        mock_session.return_value.resource.assert_called_once()
+
+    def test_tuned_config(self, session):
+        """接続プール・keepalive・adaptiveリトライ・タイムアウトを設定することを確認"""
+        mock_session, _ = session
+
+        aws_clients.get_dynamodb_resource()
+        aws_clients.get_s3_client()
+
+        dynamodb_config = mock_session.return_value.resource.call_args.kwargs['config']
+        s3_config = mock_session.return_value.client.call_args.kwargs['config']
+        assert dynamodb_config.max_pool_connections == aws_clients.MAX_POOL_CONNECTIONS
+        assert dynamodb_config.tcp_keepalive is True
+        assert dynamodb_config.retries == {'mode': 'adaptive', 'max_attempts': aws_clients.MAX_ATTEMPTS}
+        assert dynamodb_config.connect_timeout == aws_clients.CONNECT_TIMEOUT
+        assert s3_config.read_timeout > dynamodb_config.read_timeout
+        assert 'endpoint_url' not in mock_session.return_value.resource.call_args.kwargs
+
+    def test_endpoint_override(self, session):
+        """DYNAMODB_ENDPOINT_URLが設定されている場合はローカルのDynamoDBに接続することを確認"""
+        mock_session, mock_settings = session
+        mock_settings.DYNAMODB_ENDPOINT_URL = 'http://localhost:8000'
+
+        aws_clients.get_dynamodb_resource()
+
+        assert mock_session.return_value.resource.call_args.kwargs['endpoint_url'] == 'http://localhost:8000'
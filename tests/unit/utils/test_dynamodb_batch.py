@@ -0,0 +1,68 @@
+"""
+dynamodb_batch ユニットテスト
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from utils.dynamodb_batch import batch_write, backoff_delay
+
+
+def _requests(count):
+    return [{'DeleteRequest': {'Key': {'articleId': i}}} for i in range(count)]
+
+
+@pytest.mark.unit
+class TestBatchWrite:
+    """batch_writeのテスト"""
+
+    def test_chunks_of_25(self):
+        """25件ずつに分割して送信することを確認"""
+        client = MagicMock()
+        # チャンクは並列に送信されるため、呼び出しはリストに記録する（MagicMockの記録はスレッドセーフではない）
+        sent = []
+        client.batch_write_item.side_effect = lambda RequestItems: sent.append(RequestItems) or {}
+
+        failed = batch_write(client, 'articles', _requests(60))
+
+        assert failed == []
+        sizes = sorted(len(request['articles']) for request in sent)
+        assert sizes == [10, 25, 25]
+
+    def test_retries_unprocessed_items(self):
+        """UnprocessedItemsをバックオフ後に再送することを確認"""
+        client = MagicMock()
+        requests = _requests(3)
+        client.batch_write_item.side_effect = [
+            {'UnprocessedItems': {'articles': requests[2:]}},
+            {}
+        ]
+
+        with patch('utils.dynamodb_batch.time.sleep') as mock_sleep:
+            failed = batch_write(client, 'articles', requests)
+
+        assert failed == []
+        assert client.batch_write_item.call_args.kwargs['RequestItems'] == {'articles': requests[2:]}
+        mock_sleep.assert_called_once()
+
+    def test_returns_requests_after_max_retries(self):
+        """再送回数の上限を超えたリクエストを返すことを確認"""
+        client = MagicMock()
+        requests = _requests(2)
+        client.batch_write_item.return_value = {'UnprocessedItems': {'articles': requests[:1]}}
+
+        with patch('utils.dynamodb_batch.time.sleep'):
+            failed = batch_write(client, 'articles', requests, max_retries=2)
+
+        assert failed == requests[:1]
+        assert client.batch_write_item.call_count == 3
+
+    def test_error_fails_chunk(self):
+        """送信エラーのチャンクを失敗として返すことを確認"""
+        client = MagicMock()
+        client.batch_write_item.side_effect = Exception('Throttled')
+
+        assert batch_write(client, 'articles', _requests(2)) == _requests(2)
+
+    def test_backoff_is_bounded(self):
+        """待ち時間が上限を超えないことを確認"""
+        assert all(0 <= backoff_delay(attempt) <= 2.0 for attempt in range(20))
@@ -0,0 +1,121 @@
+"""
+dynamodb_client ユニットテスト
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from utils.dynamodb_client import ClientDynamoDB
+
+
+@pytest.fixture
+def raw_client():
+    return MagicMock()
+
+
+@pytest.fixture
+def dynamodb(raw_client):
+    return ClientDynamoDB(lambda: raw_client)
+
+
+@pytest.mark.unit
+class TestClientDynamoDB:
+    """低レベルクライアントのデータ層のテスト"""
+
+    def test_get_item(self, dynamodb, raw_client):
+        """キーをワイヤ形式に変換し、アイテムをPythonの値で返すことを確認"""
+        raw_client.get_item.return_value = {'Item': {'articleId': {'S': 'a1'}, 'viewCount': {'N': '3'}}}
+
+        response = dynamodb.Table('articles').get_item(Key={'articleId': 'a1'})
+
+        raw_client.get_item.assert_called_once_with(TableName='articles', Key={'articleId': {'S': 'a1'}})
+        assert response['Item'] == {'articleId': 'a1', 'viewCount': 3}
+
+    def test_query_with_conditions(self, dynamodb, raw_client):
+        """Key/Attr条件を式に変換し、既存の名前・値のプレースホルダーと併せて送ることを確認"""
+        raw_client.query.return_value = {
+            'Items': [{'articleId': {'S': 'a1'}}],
+            'LastEvaluatedKey': {'articleId': {'S': 'a1'}, 'createdAt': {'S': '2026-01-01'}},
+        }
+
+        response = dynamodb.Table('articles').query(
+            IndexName='StatusIndex',
+            KeyConditionExpression=Key('status').eq('published'),
+            FilterExpression=Attr('category').eq('saving'),
+            ProjectionExpression='#title',
+            ExpressionAttributeNames={'#title': 'title'},
+            ExclusiveStartKey={'articleId': 'a0'},
+        )
+
+        params = raw_client.query.call_args.kwargs
+        assert params['KeyConditionExpression'] == '#n0 = :v0'
+        assert params['FilterExpression'] == '#n1 = :v1'
+        assert params['ExpressionAttributeNames'] == {'#title': 'title', '#n0': 'status', '#n1': 'category'}
+        assert params['ExpressionAttributeValues'] == {':v0': {'S': 'published'}, ':v1': {'S': 'saving'}}
+        assert params['ExclusiveStartKey'] == {'articleId': {'S': 'a0'}}
+        assert response['Items'] == [{'articleId': 'a1'}]
+        assert response['LastEvaluatedKey'] == {'articleId': 'a1', 'createdAt': '2026-01-01'}
+
+    def test_update_item(self, dynamodb, raw_client):
+        """式の値をワイヤ形式に変換し、更新後の値を返すことを確認"""
+        raw_client.update_item.return_value = {'Attributes': {'refCount': {'N': '2'}}}
+
+        response = dynamodb.Table('image-refs').update_item(
+            Key={'refKey': 'articles/abc'},
+            UpdateExpression='ADD refCount :one',
+            ExpressionAttributeValues={':one': 1},
+            ReturnValues='UPDATED_NEW'
+        )
+
+        params = raw_client.update_item.call_args.kwargs
+        assert params['ExpressionAttributeValues'] == {':one': {'N': '1'}}
+        assert response['Attributes'] == {'refCount': 2}
+
+    def test_batch_and_transact(self, dynamodb, raw_client):
+        """バッチ・トランザクションのアイテムを変換し、未処理分はPythonの値で返すことを確認"""
+        raw_client.batch_get_item.return_value = {
+            'Responses': {'articles': [{'articleId': {'S': 'a1'}}]},
+            'UnprocessedKeys': {'articles': {'Keys': [{'articleId': {'S': 'a2'}}]}},
+        }
+        raw_client.batch_write_item.return_value = {
+            'UnprocessedItems': {'articles': [{'DeleteRequest': {'Key': {'articleId': {'S': 'a3'}}}}]},
+        }
+        client = dynamodb.meta.client
+
+        got = client.batch_get_item(RequestItems={'articles': {'Keys': [{'articleId': 'a1'}, {'articleId': 'a2'}]}})
+        written = client.batch_write_item(RequestItems={'articles': [
+            {'PutRequest': {'Item': {'articleId': 'a4', 'viewCount': 0}}},
+            {'DeleteRequest': {'Key': {'articleId': 'a3'}}},
+        ]})
+        client.transact_write_items(TransactItems=[
+            {'Put': {'TableName': 'articles', 'Item': {'articleId': 'a5'}}},
+            {'Update': {
+                'TableName': 'article-counters',
+                'Key': {'counterKey': 'all'},
+                'UpdateExpression': 'ADD articleCount :one',
+                'ExpressionAttributeValues': {':one': 1},
+            }},
+        ])
+
+        assert raw_client.batch_get_item.call_args.kwargs['RequestItems'] == {
+            'articles': {'Keys': [{'articleId': {'S': 'a1'}}, {'articleId': {'S': 'a2'}}]}
+        }
+        assert got['Responses'] == {'articles': [{'articleId': 'a1'}]}
+        assert got['UnprocessedKeys'] == {'articles': {'Keys': [{'articleId': 'a2'}]}}
+        assert raw_client.batch_write_item.call_args.kwargs['RequestItems']['articles'][0] == {
+            'PutRequest': {'Item': {'articleId': {'S': 'a4'}, 'viewCount': {'N': '0'}}}
+        }
+        assert written['UnprocessedItems'] == {'articles': [{'DeleteRequest': {'Key': {'articleId': 'a3'}}}]}
+        transact_items = raw_client.transact_write_items.call_args.kwargs['TransactItems']
+        assert transact_items[0] == {'Put': {'TableName': 'articles', 'Item': {'articleId': {'S': 'a5'}}}}
+        assert transact_items[1]['Update']['ExpressionAttributeValues'] == {':one': {'N': '1'}}
+
+    def test_lazy_client(self):
+        """低レベルクライアントは初回の呼び出しまで生成しないことを確認"""
+        factory = MagicMock()
+
+        table = ClientDynamoDB(factory).Table('articles')
+
+        factory.assert_not_called()
+        assert table.name == 'articles'
@@ -0,0 +1,89 @@
+"""
+dynamodb_codec ユニットテスト
+"""
+import pytest
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from utils.dynamodb_codec import decode_item, decode_items, decode_value, encode_item, encode_value
+
+
+@pytest.mark.unit
+class TestDynamoDBCodec:
+    """DynamoDBアイテム変換のテスト"""
+
+    def test_decode_numbers_as_int_or_float(self):
+        """数値は整数ならint、小数ならfloatに変換することを確認"""
+        item = decode_item({'viewCount': {'N': '42'}, 'rating': {'N': '4.5'}, 'big': {'N': '1E+2'}})
+
+        assert item == {'viewCount': 42, 'rating': 4.5, 'big': 100.0}
+        assert type(item['viewCount']) is int
+        assert type(item['rating']) is float
+
+    def test_matches_resource_deserializer(self):
+        """数値以外はリソースの変換（TypeDeserializer）と同じ値になることを確認"""
+        wire = {
+            'articleId': {'S': 'article_000001'},
+            'isFeatured': {'BOOL': True},
+            'deletedAt': {'NULL': True},
+            'tags': {'L': [{'S': '節約'}, {'S': '食費'}]},
+            'meta': {'M': {'author': {'S': 'admin'}, 'nested': {'L': [{'BOOL': False}]}}},
+            'keywords': {'SS': ['a', 'b']},
+            'raw': {'B': b'\x00\x01'},
+        }
+        deserializer = TypeDeserializer()
+
+        expected = {name: deserializer.deserialize(value) for name, value in wire.items()}
+        expected['raw'] = bytes(expected['raw'])
+
+        assert decode_item(wire) == expected
+
+    def test_same_shape_different_types(self):
+        """同じ属性名で型が異なるアイテム（キャッシュした形と合わない場合）も変換できることを確認"""
+        items = decode_items([
+            {'articleId': {'S': 'a'}, 'thumbnail': {'S': 'https://example.com/t.webp'}},
+            {'articleId': {'S': 'b'}, 'thumbnail': {'NULL': True}},
+        ])
+
+        assert items == [
+            {'articleId': 'a', 'thumbnail': 'https://example.com/t.webp'},
+            {'articleId': 'b', 'thumbnail': None},
+        ]
+
+    def test_decode_none(self):
+        """アイテムがない場合はNoneを返すことを確認"""
+        assert decode_item(None) is None
+
+    def test_encode_round_trip(self):
+        """Pythonの値をワイヤ形式に変換し、元の値に戻せることを確認"""
+        item = {
+            'articleId': 'article_000001',
+            'viewCount': 7,
+            'rating': 4.5,
+            'price': Decimal('1980'),
+            'isFeatured': False,
+            'thumbnail': None,
+            'tags': ['節約'],
+            'imageVariants': {'thumbnail': {'webp': 'https://example.com/t.webp'}},
+            'ids': {1, 2},
+        }
+
+        encoded = encode_item(item)
+
+        assert encoded['viewCount'] == {'N': '7'}
+        assert encoded['rating'] == {'N': '4.5'}
+        assert encoded['isFeatured'] == {'BOOL': False}
+        assert sorted(encoded['ids']['NS']) == ['1', '2']
+        assert decode_item(encoded) == {**item, 'price': 1980}
+
+    @pytest.mark.parametrize('value', [float('nan'), float('inf'), set(), object()])
+    def test_encode_unsupported(self, value):
+        """DynamoDBに保存できない値はTypeErrorになることを確認"""
+        with pytest.raises(TypeError):
+            encode_value(value)
+
+    def test_decode_empty_attribute(self):
+        """型のない値はValueErrorになることを確認"""
+        with pytest.raises(ValueError):
+            decode_value({})
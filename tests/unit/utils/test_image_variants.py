@@ -0,0 +1,135 @@
+"""
+image_variants ユニットテスト
+"""
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import patch
+
+from utils.image_variants import (
+    IMAGE_VARIANTS, expected_image_variants, generate_image_variants, is_variant_key,
+    render_variant, variant_key, variant_urls
+)
+
+IMAGE_KEY = 'articles/20240115100000_abcd1234.jpg'
+BUCKET_URL = 'https://test-bucket.s3.ap-northeast-1.amazonaws.com'
+
+
+@pytest.fixture
+def s3():
+    with patch('utils.image_variants.settings') as mock_settings, \
+            patch('utils.s3.settings') as mock_s3_settings, \
+            patch('utils.image_variants.s3_client') as mock_client:
+        for target in (mock_settings, mock_s3_settings):
+            target.S3_BUCKET_NAME = 'test-bucket'
+            target.S3_VARIANTS_FOLDER = 'variants'
+            target.AWS_REGION = 'ap-northeast-1'
+        yield mock_client
+
+
+@pytest.mark.unit
+class TestImageVariants:
+    """派生画像のテスト"""
+
+    def test_variant_key(self, s3):
+        """元画像のキーから派生画像のキーを生成することを確認"""
+        key = variant_key(IMAGE_KEY, 'thumbnail', 'webp')
+
+        assert key == 'variants/articles/20240115100000_abcd1234/thumbnail.webp'
+        assert is_variant_key(key)
+        assert not is_variant_key(IMAGE_KEY)
+
+    def test_generate_uploads_each_variant(self, s3):
+        """幅ごとにレンダリングし、各派生画像を保存してURLを返すことを確認"""
+        # MagicMockの呼び出し記録はスレッドセーフではないためリストに記録する
+        uploaded = []
+        lock = threading.Lock()
+
+        def put_object(**kwargs):
+            with lock:
+                uploaded.append((kwargs['Key'], kwargs['ContentType']))
+            return {}
+
+        s3.put_object.side_effect = put_object
+
+        def fake_render(data, width, formats):
+            return [(image_format, f'{width}'.encode()) for image_format in formats if image_format != 'avif']
+
+        with patch('utils.image_variants.render_variant', side_effect=fake_render) as mock_render, \
+                ThreadPoolExecutor(max_workers=1) as executor:
+            variants = generate_image_variants(IMAGE_KEY, data=b'original', executor=executor)
+
+        assert [c.args[1] for c in mock_render.call_args_list] == [width for _, width, _ in IMAGE_VARIANTS]
+        assert variants == {
+            'thumbnail': {
+                'jpeg': f'{BUCKET_URL}/variants/articles/20240115100000_abcd1234/thumbnail.jpg',
+                'webp': f'{BUCKET_URL}/variants/articles/20240115100000_abcd1234/thumbnail.webp',
+            },
+            'medium': {
+                'webp': f'{BUCKET_URL}/variants/articles/20240115100000_abcd1234/medium.webp',
+            },
+        }
+        assert sorted(uploaded) == [
+            ('variants/articles/20240115100000_abcd1234/medium.webp', 'image/webp'),
+            ('variants/articles/20240115100000_abcd1234/thumbnail.jpg', 'image/jpeg'),
+            ('variants/articles/20240115100000_abcd1234/thumbnail.webp', 'image/webp'),
+        ]
+        s3.get_object.assert_not_called()
+
+    def test_generate_reads_original_from_s3(self, s3):
+        """画像データを省略した場合はS3から読み込むことを確認"""
+        s3.get_object.return_value = {'Body': io.BytesIO(b'original')}
+
+        with patch('utils.image_variants.render_variant', return_value=[]) as mock_render, \
+                ThreadPoolExecutor(max_workers=1) as executor:
+            assert generate_image_variants(IMAGE_KEY, executor=executor) == {}
+
+        s3.get_object.assert_called_once_with(Bucket='test-bucket', Key=IMAGE_KEY)
+        assert mock_render.call_args.args[0] == b'original'
+
+    def test_expected_image_variants(self, s3):
+        """元画像のキーから派生画像のURLが決まり、S3を読まないことを確認"""
+        prefix = 'variants/articles/20240115100000_abcd1234/'
+
+        with patch('utils.image_variants.supported_formats', return_value=frozenset({'jpeg', 'webp', 'avif'})):
+            variants = expected_image_variants(IMAGE_KEY)
+
+        assert variants == {
+            'thumbnail': {
+                'jpeg': f'{BUCKET_URL}/{prefix}thumbnail.jpg',
+                'webp': f'{BUCKET_URL}/{prefix}thumbnail.webp',
+                'avif': f'{BUCKET_URL}/{prefix}thumbnail.avif',
+            },
+            'medium': {
+                'webp': f'{BUCKET_URL}/{prefix}medium.webp',
+                'avif': f'{BUCKET_URL}/{prefix}medium.avif',
+            },
+        }
+        assert s3.method_calls == []
+        assert len(variant_urls(variants)) == 5
+
+    def test_expected_variants_without_avif(self, s3):
+        """PillowがAVIFに対応していない場合はAVIFのURLを返さないことを確認"""
+        with patch('utils.image_variants.supported_formats', return_value=frozenset({'jpeg', 'webp'})):
+            variants = expected_image_variants(IMAGE_KEY)
+
+        assert {name: sorted(urls) for name, urls in variants.items()} == {
+            'thumbnail': ['jpeg', 'webp'],
+            'medium': ['webp'],
+        }
+
+    def test_render_variant_resizes(self):
+        """指定幅に縮小し、小さい画像は拡大しないことを確認"""
+        Image = pytest.importorskip('PIL.Image')
+        buffer = io.BytesIO()
+        Image.new('RGBA', (1000, 500)).save(buffer, format='PNG')
+
+        results = dict(render_variant(buffer.getvalue(), 320, ('jpeg', 'webp')))
+        with Image.open(io.BytesIO(results['jpeg'])) as thumbnail:
+            assert thumbnail.size == (320, 160)
+
+        results = dict(render_variant(buffer.getvalue(), 2000, ('jpeg',)))
+        with Image.open(io.BytesIO(results['jpeg'])) as original_size:
+            assert original_size.size == (1000, 500)
@@ -0,0 +1,89 @@
+"""
+metrics ユニットテスト
+"""
+import json
+import pytest
+from unittest.mock import patch
+
+from utils import metrics
+
+
+@pytest.fixture
+def metrics_file(tmp_path):
+    path = tmp_path / 'metrics.jsonl'
+    with patch('utils.metrics.settings') as mock_settings:
+        mock_settings.METRICS_SINK = 'file'
+        mock_settings.METRICS_FILE = str(path)
+        mock_settings.METRICS_NAMESPACE = 'KaidokiNavi'
+        yield lambda: [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def _metric_names(record):
+    return [metric['Name'] for metric in record['_aws']['CloudWatchMetrics'][0]['Metrics']]
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """EMFメトリクスのテスト"""
+
+    def test_route_metrics(self, metrics_file):
+        """ルートごとにレイテンシー・コールドスタート・レスポンスサイズ・エラーを出力することを確認"""
+        @metrics.route_metrics
+        def handler(event, context):
+            metrics.add_dimension('Filters', 'category+status')
+            return {'statusCode': 500, 'body': '{"error": "内部"}'}
+
+        event = {'httpMethod': 'GET', 'resource': '/admin/articles/list/{articleId}', 'path': '/admin/articles/list/1'}
+        with patch('utils.metrics._cold_start', True):
+            handler(event, None)
+            handler(event, None)
+
+        first, second = metrics_file()
+        assert first['Route'] == 'GET /admin/articles/list/{articleId}'
+        assert first['_aws']['CloudWatchMetrics'][0]['Namespace'] == 'KaidokiNavi'
+        assert first['_aws']['CloudWatchMetrics'][0]['Dimensions'] == [['Route'], ['Route', 'Filters']]
+        assert first['Filters'] == 'category+status'
+        assert {'Latency', 'ColdStart', 'ResponseBytes', 'Errors', 'DynamoDBCalls'} <= set(_metric_names(first))
+        assert (first['ColdStart'], second['ColdStart']) == (1, 0)
+        assert first['Errors'] == 1
+        assert first['ResponseBytes'] == len('{"error": "内部"}'.encode('utf-8'))
+        assert first['StatusCode'] == 500
+
+    def test_dynamodb_calls_in_nested_scopes(self, metrics_file):
+        """DynamoDBの呼び出しを実行中のすべてのスコープ（ルート・サービスメソッド）に記録することを確認"""
+        class Service:
+            @metrics.timed
+            def list_articles(self):
+                metrics.record_dynamodb_call('Query', {'Count': 2, 'ScannedCount': 10})
+                metrics.record_dynamodb_call('GetItem', {'Item': {'articleId': {'N': '1'}}})
+
+        with metrics.MetricScope(Route='GET /admin/articles/list'):
+            Service().list_articles()
+            metrics.record_dynamodb_call('UpdateItem', {})
+
+        service, route = metrics_file()
+        assert service['Operation'] == 'Service.list_articles'
+        assert (service['DynamoDBCalls'], service['ItemsExamined'], service['ItemsReturned']) == (2, 11, 3)
+        assert (route['DynamoDBCalls'], route['ItemsExamined'], route['ItemsReturned']) == (3, 11, 3)
+        assert service['Errors'] == 0
+
+    def test_service_error(self, metrics_file):
+        """例外が発生したサービスメソッドはErrors=1で出力し、例外はそのまま送出することを確認"""
+        @metrics.timed
+        def create_article():
+            raise ValueError('invalid')
+
+        with pytest.raises(ValueError):
+            create_article()
+
+        record, = metrics_file()
+        assert record['Errors'] == 1
+        assert metrics.current_scope() is None
+
+    def test_warmup_route(self, metrics_file):
+        """ウォームアップイベントはRoute='warmup'で出力することを確認"""
+        metrics.route_metrics(lambda event, context: {'warmup': True})({'warmup': True}, None)
+
+        record, = metrics_file()
+        assert record['Route'] == 'warmup'
+        assert record['ResponseBytes'] == 0
@@ -0,0 +1,54 @@
+"""
+pagination ユーティリティテスト
+カーソルのエンコード・デコードと改ざん検知のテスト
+"""
+import pytest
+from decimal import Decimal
+from src.utils.pagination import build_cursor_scope, encode_cursor, decode_cursor
+
+
+@pytest.mark.unit
+class TestCursor:
+    """カーソルのテスト"""
+
+    def test_round_trip(self):
+        """エンコードしたカーソルが元のキーに戻ることを確認"""
+        scope = build_cursor_scope({'status': 'published'})
+        last_key = {'articleId': Decimal('12'), 'status': 'published', 'publishedAt': '2025-01-01T00:00:00Z'}
+
+        cursor = encode_cursor(last_key, scope)
+
+        assert decode_cursor(cursor, scope) == {
+            'articleId': 12,
+            'status': 'published',
+            'publishedAt': '2025-01-01T00:00:00Z'
+        }
+
+    def test_no_more_pages(self):
+        """LastEvaluatedKeyがない場合はNone、空カーソルはNoneに戻ることを確認"""
+        assert encode_cursor(None, 'scope') is None
+        assert decode_cursor(None, 'scope') is None
+        assert decode_cursor('', 'scope') is None
+
+    def test_tampered_cursor(self):
+        """改ざんされたカーソルはValueErrorになることを確認"""
+        scope = build_cursor_scope({})
+        cursor = encode_cursor({'articleId': 1}, scope)
+        forged = encode_cursor({'articleId': 999}, scope).split('.')[0] + '.' + cursor.split('.')[1]
+
+        with pytest.raises(ValueError):
+            decode_cursor(forged, scope)
+        with pytest.raises(ValueError):
+            decode_cursor('not-a-cursor', scope)
+
+    def test_scope_mismatch(self):
+        """別のフィルター条件で発行されたカーソルはValueErrorになることを確認"""
+        cursor = encode_cursor({'articleId': 1}, build_cursor_scope({'status': 'draft'}))
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, build_cursor_scope({'status': 'published'}))
+
+    def test_scope_ignores_empty_filters(self):
+        """未指定のフィルターは適用範囲に影響しないことを確認"""
+        assert build_cursor_scope({'status': 'published', 'search': None}) == \
+            build_cursor_scope({'status': 'published'})
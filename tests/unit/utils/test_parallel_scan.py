@@ -0,0 +1,77 @@
+"""
+並列スキャンユーティリティのユニットテスト
+"""
+import pytest
+from unittest.mock import MagicMock
+from src.utils.parallel_scan import ParallelScan, parallel_scan
+
+
+def _segmented_table(pages_by_segment):
+    """セグメントごとのページを返すTableリソースのモック"""
+    table = MagicMock()
+    table.name = 'articles'
+
+    def scan(**kwargs):
+        pages = pages_by_segment[kwargs['Segment']]
+        index = kwargs.get('ExclusiveStartKey', {}).get('page', 0)
+        response = dict(pages[index])
+        if index + 1 < len(pages):
+            response['LastEvaluatedKey'] = {'page': index + 1}
+        return response
+
+    table.meta.client.scan.side_effect = scan
+    return table
+
+
+@pytest.mark.unit
+class TestParallelScan:
+    """並列スキャンのテスト"""
+
+    def test_reads_all_segments_and_pages(self):
+        """全セグメントの全ページを読み込むことを確認"""
+        table = _segmented_table({
+            0: [{'Items': [{'id': 1}], 'ScannedCount': 2}, {'Items': [{'id': 2}], 'ScannedCount': 1}],
+            1: [{'Items': [{'id': 3}], 'ScannedCount': 1}],
+            2: [{'Items': [], 'ScannedCount': 0}]
+        })
+
+        scan = ParallelScan(table, total_segments=3, FilterExpression='x')
+        items = list(scan)
+
+        assert sorted(item['id'] for item in items) == [1, 2, 3]
+        assert scan.scanned_count == 4
+        assert scan.count == 3
+        calls = table.meta.client.scan.call_args_list
+        assert {call.kwargs['Segment'] for call in calls} == {0, 1, 2}
+        assert all(call.kwargs['TotalSegments'] == 3 for call in calls)
+        assert all(call.kwargs['TableName'] == 'articles' for call in calls)
+        assert all(call.kwargs['FilterExpression'] == 'x' for call in calls)
+
+    def test_bounded_workers(self):
+        """同時実行数がセグメント数を超えないことを確認"""
+        table = _segmented_table({0: [{'Items': [{'id': 1}]}]})
+
+        scan = ParallelScan(table, total_segments=1, max_workers=8)
+
+        assert scan.max_workers == 1
+        assert list(scan) == [{'id': 1}]
+
+    def test_segment_error_is_raised(self):
+        """セグメントのスキャンに失敗した場合は例外が伝播することを確認"""
+        table = MagicMock()
+        table.name = 'articles'
+        table.meta.client.scan.side_effect = Exception('throttled')
+
+        with pytest.raises(Exception, match='throttled'):
+            list(parallel_scan(table, total_segments=2))
+
+    def test_consumer_can_stop_early(self):
+        """途中で読むのをやめてもスキャンが停止することを確認"""
+        pages = [{'Items': [{'id': i}]} for i in range(100)]
+        table = _segmented_table({0: pages, 1: pages})
+
+        iterator = parallel_scan(table, total_segments=2)
+        assert next(iterator)['id'] == 0
+        iterator.close()
+
+        assert table.meta.client.scan.call_count < 200
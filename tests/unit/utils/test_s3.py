@@ -0,0 +1,304 @@
+"""
+s3 ユニットテスト
+"""
+import base64
+import hashlib
+import threading
+
+import pytest
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+
+from admin.repositories.image_ref_repository import InMemoryImageRefRepository
+
+from utils.s3 import (
+    PresignedUrlCache, content_image_key, delete_image, delete_images, image_key_from_url,
+    store_image, upload_image
+)
+
+MB = 1024 * 1024
+
+
+def _url(bucket, key):
+    return f"https://{bucket}.s3.ap-northeast-1.amazonaws.com/{key}"
+
+
+@pytest.mark.unit
+class TestDeleteImages:
+    """delete_imagesのテスト"""
+
+    @pytest.fixture
+    def bucket(self):
+        with patch('utils.s3.settings') as mock_settings:
+            mock_settings.S3_BUCKET_NAME = 'test-bucket'
+            yield 'test-bucket'
+
+    def test_image_key_from_url(self, bucket):
+        """URLからキーを抽出することを確認"""
+        assert image_key_from_url(_url(bucket, 'articles/a.jpg')) == 'articles/a.jpg'
+        assert image_key_from_url(_url('other-bucket', 'articles/a.jpg')) is None
+        assert image_key_from_url('') is None
+
+    def test_chunks_of_1000(self, bucket):
+        """1000件ずつDeleteObjectsで削除することを確認"""
+        urls = [_url(bucket, f'articles/{i}.jpg') for i in range(1500)]
+
+        with patch('utils.s3.s3_client') as mock_client:
+            mock_client.delete_objects.return_value = {}
+            errors = delete_images(urls)
+
+        assert errors == {}
+        sizes = [len(c.kwargs['Delete']['Objects']) for c in mock_client.delete_objects.call_args_list]
+        assert sizes == [1000, 500]
+        assert mock_client.delete_objects.call_args.kwargs['Delete']['Quiet'] is True
+        mock_client.delete_object.assert_not_called()
+
+    def test_returns_per_key_errors(self, bucket):
+        """キーごとのエラーと不正なURLを返すことを確認"""
+        ok, denied = _url(bucket, 'articles/ok.jpg'), _url(bucket, 'articles/denied.jpg')
+        invalid = _url('other-bucket', 'articles/x.jpg')
+
+        with patch('utils.s3.s3_client') as mock_client:
+            mock_client.delete_objects.return_value = {
+                'Errors': [{'Key': 'articles/denied.jpg', 'Code': 'AccessDenied'}]
+            }
+            errors = delete_images([ok, denied, invalid, None])
+
+        assert errors == {denied: 'AccessDenied', invalid: 'InvalidURL'}
+
+    def test_request_failure_fails_chunk(self, bucket):
+        """リクエストが失敗した場合はチャンクの全URLを失敗として返すことを確認"""
+        urls = [_url(bucket, 'articles/a.jpg'), _url(bucket, 'articles/b.jpg')]
+
+        with patch('utils.s3.s3_client') as mock_client:
+            mock_client.delete_objects.side_effect = Exception('Network error')
+            errors = delete_images(urls)
+
+        assert set(errors) == set(urls)
+
+
+@pytest.mark.unit
+class TestMultipartUpload:
+    """大きな画像のマルチパートアップロード（_upload_parts）のテスト"""
+
+    @pytest.fixture
+    def s3(self):
+        with patch('utils.s3.settings') as mock_settings, patch('utils.s3.s3_client') as mock_client:
+            mock_settings.S3_BUCKET_NAME = 'test-bucket'
+            mock_client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+            mock_client.head_object.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+            yield mock_client
+
+    def _record_parts(self, s3, fail_part=None):
+        # MagicMockの呼び出し記録はスレッドセーフではないためリストに記録する
+        parts = []
+        lock = threading.Lock()
+
+        def upload_part(**kwargs):
+            if kwargs['PartNumber'] == fail_part:
+                raise Exception('network error')
+            with lock:
+                parts.append((kwargs['PartNumber'], len(kwargs['Body'])))
+            return {'ETag': f"etag-{kwargs['PartNumber']}"}
+
+        s3.upload_part.side_effect = upload_part
+        return parts
+
+    def test_small_image_uses_put_object(self, s3):
+        """1パートに収まる画像はput_objectで送ることを確認"""
+        upload_image(b'x' * 100, 'flyers', 'png')
+
+        s3.put_object.assert_called_once()
+        s3.create_multipart_upload.assert_not_called()
+
+    def test_large_image_uploaded_in_parts(self, s3):
+        """パートサイズを超える画像は内容から決まるキーにパートを並列送信し、番号順に完了することを確認"""
+        parts = self._record_parts(s3)
+        data = b'x' * (20 * MB)
+
+        upload_image(data, 'flyers')
+
+        assert sorted(parts) == [(1, 8 * MB), (2, 8 * MB), (3, 4 * MB)]
+        key = content_image_key(data, 'flyers', 'jpg')
+        assert s3.create_multipart_upload.call_args.kwargs['Key'] == key
+        completed = s3.complete_multipart_upload.call_args.kwargs['MultipartUpload']['Parts']
+        assert completed == [{'PartNumber': n, 'ETag': f'etag-{n}'} for n in (1, 2, 3)]
+        s3.put_object.assert_not_called()
+        s3.abort_multipart_upload.assert_not_called()
+
+    def test_failure_aborts_upload(self, s3):
+        """パートの送信に失敗した場合はアップロードを中止することを確認"""
+        self._record_parts(s3, fail_part=2)
+
+        with pytest.raises(Exception, match='network error'):
+            upload_image(b'x' * (20 * MB), 'flyers')
+
+        s3.abort_multipart_upload.assert_called_once()
+        assert s3.abort_multipart_upload.call_args.kwargs['UploadId'] == 'upload-1'
+        s3.complete_multipart_upload.assert_not_called()
+
+
+@pytest.mark.unit
+class TestContentAddressedUpload:
+    """内容から決まるキーでのアップロードのテスト"""
+
+    IMAGE = base64.b64encode(b'flyer-image').decode()
+
+    @pytest.fixture
+    def s3(self):
+        with patch('utils.s3.settings') as mock_settings, patch('utils.s3.s3_client') as mock_client:
+            mock_settings.S3_BUCKET_NAME = 'test-bucket'
+            mock_settings.AWS_REGION = 'ap-northeast-1'
+            yield mock_client
+
+    def _not_found(self):
+        return ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+    def test_same_image_same_key(self, s3):
+        """同じ画像は同じキーになり、保存済みの場合はアップロードしないことを確認"""
+        s3.head_object.side_effect = [self._not_found(), {'ContentLength': 11, 'ContentType': 'image/jpeg'}]
+
+        first = upload_image(self.IMAGE, 'flyers')
+        second = upload_image(self.IMAGE, 'flyers')
+
+        key = content_image_key(b'flyer-image', 'flyers', 'jpg')
+        assert key == f"flyers/{hashlib.sha256(b'flyer-image').hexdigest()}.jpg"
+        assert first == second == _url('test-bucket', key)
+        s3.put_object.assert_called_once()
+        assert s3.put_object.call_args.kwargs['Key'] == key
+
+    def test_first_reference_always_uploads(self, s3):
+        """最初の参照の場合はHEADせずにアップロードし、2件目以降はHEADで確認することを確認"""
+        refs = InMemoryImageRefRepository()
+        s3.head_object.return_value = {'ContentLength': 11, 'ContentType': 'image/jpeg'}
+
+        upload_image(self.IMAGE, 'flyers', refs=refs)
+        upload_image(self.IMAGE, 'flyers', refs=refs)
+
+        s3.put_object.assert_called_once()
+        s3.head_object.assert_called_once()
+        assert list(refs.counts.values()) == [2]
+
+    def test_store_image_reports_existing(self, s3):
+        """保存済みの画像の場合はアップロードせず、新たに保存していないことを返すことを確認"""
+        refs = InMemoryImageRefRepository()
+        s3.head_object.return_value = {'ContentLength': 11, 'ContentType': 'image/jpeg'}
+
+        first = store_image(b'flyer-image', 'flyers', refs=refs)
+        second = store_image(b'flyer-image', 'flyers', refs=refs)
+
+        assert first[1] is True
+        assert second == (first[0], False)
+        s3.put_object.assert_called_once()
+
+    def test_upload_failure_releases_reference(self, s3):
+        """アップロードに失敗した場合は登録した参照を解放することを確認"""
+        refs = InMemoryImageRefRepository()
+        s3.put_object.side_effect = Exception('SlowDown')
+
+        with pytest.raises(Exception):
+            upload_image(self.IMAGE, 'flyers', refs=refs)
+
+        assert list(refs.counts.values()) == [0]
+
+    def test_delete_keeps_referenced_image(self, s3):
+        """最後の参照がなくなるまで画像を削除しないことを確認"""
+        refs = InMemoryImageRefRepository()
+        key = content_image_key(b'flyer-image', 'flyers', 'jpg')
+        refs.acquire(key)
+        refs.acquire(key)
+
+        assert delete_image(_url('test-bucket', key), refs=refs) is True
+        s3.delete_object.assert_not_called()
+
+        assert delete_image(_url('test-bucket', key), refs=refs) is True
+        s3.delete_object.assert_called_once_with(Bucket='test-bucket', Key=key)
+
+
+@pytest.mark.unit
+class TestPresignedUrlCache:
+    """署名付きURLのキャッシュのテスト"""
+
+    @pytest.fixture
+    def signer(self):
+        with patch('utils.s3.settings') as mock_settings, \
+                patch('utils.s3.s3_client') as mock_client, \
+                patch('utils.s3.time.time') as mock_time:
+            mock_settings.S3_BUCKET_NAME = 'test-bucket'
+            mock_time.return_value = 1000.0
+            signed = []
+
+            def generate_presigned_url(operation, Params, ExpiresIn):
+                signed.append((Params['Key'], ExpiresIn))
+                return f"https://test-bucket/{Params['Key']}?sig={len(signed)}"
+
+            mock_client.generate_presigned_url.side_effect = generate_presigned_url
+            yield signed, mock_time
+
+    def test_same_url_until_margin(self, signer):
+        """安全マージン前までは同じURLを返し、その後は署名し直すことを確認"""
+        signed, mock_time = signer
+        cache = PresignedUrlCache()
+
+        first = cache.sign('articles/a.jpg', 3600)
+        mock_time.return_value = 1000.0 + 3600 - 301
+        assert cache.sign('articles/a.jpg', 3500) == first
+        assert signed == [('articles/a.jpg', 3600)]
+
+        mock_time.return_value = 1000.0 + 3600 - 299
+        assert cache.sign('articles/a.jpg', 3600) != first
+        assert len(signed) == 2
+
+    def test_expiration_bucket(self, signer):
+        """有効期限を単位に切り上げ、単位ごとに別のURLにすることを確認"""
+        signed, _ = signer
+        cache = PresignedUrlCache()
+
+        cache.sign('articles/a.jpg', 3601)
+        cache.sign('articles/a.jpg', 60)
+
+        assert signed == [('articles/a.jpg', 3900), ('articles/a.jpg', 300)]
+
+    def test_sign_many(self, signer):
+        """まとめて取得し、キャッシュ済みのキーは署名しないことを確認"""
+        signed, _ = signer
+        cache = PresignedUrlCache()
+        cache.sign('articles/a.jpg')
+
+        urls = cache.sign_many(['articles/a.jpg', 'articles/b.jpg', 'articles/b.jpg'])
+
+        assert set(urls) == {'articles/a.jpg', 'articles/b.jpg'}
+        assert [key for key, _ in signed] == ['articles/a.jpg', 'articles/b.jpg']
+
+    def test_bounded_lru(self, signer):
+        """上限を超えた場合は最も古く使われたURLから捨てることを確認"""
+        signed, _ = signer
+        cache = PresignedUrlCache(max_size=2)
+
+        cache.sign_many(['a.jpg', 'b.jpg'])
+        cache.sign('a.jpg')
+        cache.sign('c.jpg')
+        cache.sign_many(['a.jpg', 'b.jpg'])
+
+        assert [key for key, _ in signed] == ['a.jpg', 'b.jpg', 'c.jpg', 'b.jpg']
+
+    def test_signs_outside_lock(self):
+        """署名中はキャッシュのロックを保持しないことを確認"""
+        cache = PresignedUrlCache()
+        held = []
+
+        def generate_presigned_url(operation, Params, ExpiresIn):
+            held.append(cache._lock.locked())
+            return f"https://test-bucket/{Params['Key']}"
+
+        with patch('utils.s3.settings') as mock_settings, \
+                patch('utils.s3.s3_client') as mock_client:
+            mock_settings.S3_BUCKET_NAME = 'test-bucket'
+            mock_client.generate_presigned_url.side_effect = generate_presigned_url
+
+            urls = cache.sign_many(['a.jpg', 'b.jpg'])
+            cached = cache.sign('a.jpg')
+
+        assert held == [False, False]
+        assert urls == {'a.jpg': 'https://test-bucket/a.jpg', 'b.jpg': 'https://test-bucket/b.jpg'}
+        assert cached == 'https://test-bucket/a.jpg'
@@ -0,0 +1,43 @@
+"""
+text_search ユーティリティテスト
+bigramトークナイザーとBM25スコアのテスト
+"""
+import pytest
+from src.utils.text_search import normalize_text, tokenize, term_frequencies, bm25_score
+
+
+@pytest.mark.unit
+class TestTokenizer:
+    """トークナイザーのテスト"""
+
+    def test_tokenize_japanese(self):
+        """日本語が文字bigramに分割されることを確認"""
+        assert tokenize('値上げ情報') == ['値上', '上げ', 'げ情', '情報']
+
+    def test_tokenize_splits_on_separators(self):
+        """空白・記号をまたぐbigramは生成されないことを確認"""
+        assert tokenize('鶏肉、特売！') == ['鶏肉', '特売']
+        assert tokenize('a b') == []
+
+    def test_normalize_width_and_case(self):
+        """全角英数・半角カナ・大文字が正規化されることを確認"""
+        assert normalize_text('ＡＢＣ１２３') == 'abc123'
+        assert normalize_text('ｶﾀｶﾅ') == 'カタカナ'
+        assert tokenize('ＡＩ') == tokenize('ai')
+
+    def test_term_frequencies(self):
+        """出現回数が集計されることを確認"""
+        assert term_frequencies('特売特売') == {'特売': 2, '売特': 1}
+
+
+@pytest.mark.unit
+class TestBm25:
+    """BM25スコアのテスト"""
+
+    def test_rarer_terms_score_higher(self):
+        """出現文書数が少ないトークンほどスコアが高いことを確認"""
+        assert bm25_score(1, 1, 100, 100, 1000) > bm25_score(1, 500, 100, 100, 1000)
+
+    def test_shorter_documents_score_higher(self):
+        """同じ出現回数なら短い文書ほどスコアが高いことを確認"""
+        assert bm25_score(2, 10, 50, 100, 1000) > bm25_score(2, 10, 200, 100, 1000)
@@ -0,0 +1,91 @@
+"""
+upload_session ユニットテスト
+"""
+import pytest
+from unittest.mock import patch
+
+from utils.upload_session import create_upload_session, finalize_upload
+
+
+@pytest.fixture
+def mock_s3_client():
+    """S3クライアントのモック"""
+    with patch('utils.s3.s3_client') as mock_client:
+        mock_client.generate_presigned_post.return_value = {
+            'url': 'https://images.s3.amazonaws.com/',
+            'fields': {'key': 'articles/x.jpg', 'policy': 'p', 'x-amz-signature': 's'}
+        }
+        mock_client.generate_presigned_url.return_value = 'https://images.s3.amazonaws.com/articles/x.png?sig'
+        yield mock_client
+
+
+@pytest.mark.unit
+class TestCreateUploadSession:
+    """create_upload_sessionのテスト"""
+
+    def test_post_has_size_and_type_conditions(self, mock_s3_client):
+        """POSTの署名にサイズとContent-Typeの条件が含まれることを確認"""
+        session = create_upload_session('articles', 'image/jpeg', size=2048)
+
+        assert session['method'] == 'POST'
+        assert session['key'].startswith('articles/') and session['key'].endswith('.jpg')
+        assert session['maxSize'] == 2048
+        conditions = mock_s3_client.generate_presigned_post.call_args.kwargs['Conditions']
+        assert ['content-length-range', 1, 2048] in conditions
+        assert {'Content-Type': 'image/jpeg'} in conditions
+
+    def test_put_signs_content_type(self, mock_s3_client):
+        """PUTの署名にContent-Typeが含まれることを確認"""
+        session = create_upload_session('articles', 'image/png', method='PUT')
+
+        assert session['method'] == 'PUT'
+        assert session['headers']['Content-Type'] == 'image/png'
+        params = mock_s3_client.generate_presigned_url.call_args.kwargs['Params']
+        assert params['ContentType'] == 'image/png'
+
+    @pytest.mark.parametrize('content_type, size', [
+        ('application/pdf', None),
+        ('image/jpeg', 0),
+        ('image/jpeg', 100 * 1024 * 1024)
+    ])
+    def test_rejects_invalid_request(self, mock_s3_client, content_type, size):
+        """非対応の形式・上限を超えるサイズはValueErrorになることを確認"""
+        with pytest.raises(ValueError):
+            create_upload_session('articles', content_type, size=size)
+
+
+@pytest.mark.unit
+class TestFinalizeUpload:
+    """finalize_uploadのテスト"""
+
+    def test_returns_image_url(self, mock_s3_client):
+        """アップロード済みの画像のURLを返すことを確認"""
+        session = create_upload_session('articles', 'image/jpeg', size=2048)
+        mock_s3_client.head_object.return_value = {'ContentLength': 1000, 'ContentType': 'image/jpeg'}
+
+        image_url = finalize_upload(session['uploadToken'], 'articles')
+
+        assert image_url.endswith(session['key'])
+        assert mock_s3_client.head_object.call_args.kwargs['Key'] == session['key']
+
+    def test_rejects_tampered_token(self, mock_s3_client):
+        """改ざんされたトークンはValueErrorになることを確認"""
+        session = create_upload_session('articles', 'image/jpeg')
+
+        with pytest.raises(ValueError):
+            finalize_upload(session['uploadToken'][:-2] + 'xx', 'articles')
+
+    def test_rejects_other_folder(self, mock_s3_client):
+        """別のフォルダのトークンはValueErrorになることを確認"""
+        session = create_upload_session('flyers', 'image/jpeg')
+
+        with pytest.raises(ValueError):
+            finalize_upload(session['uploadToken'], 'articles')
+
+    def test_rejects_mismatched_upload(self, mock_s3_client):
+        """サイズ・形式が条件と異なる画像はValueErrorになることを確認"""
+        session = create_upload_session('articles', 'image/jpeg', size=2048)
+        mock_s3_client.head_object.return_value = {'ContentLength': 4096, 'ContentType': 'image/jpeg'}
+
+        with pytest.raises(ValueError):
+            finalize_upload(session['uploadToken'], 'articles')
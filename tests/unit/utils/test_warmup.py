@@ -0,0 +1,79 @@
+"""
+warmup ユニットテスト
+"""
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+from utils.warmup import Primer, is_warmup_event
+
+
+@pytest.fixture
+def lambda_env(monkeypatch):
+    monkeypatch.setenv('AWS_LAMBDA_FUNCTION_NAME', 'ArticlesApiFunction')
+    monkeypatch.delenv('AWS_LAMBDA_INITIALIZATION_TYPE', raising=False)
+    with patch('utils.warmup.settings') as mock_settings:
+        mock_settings.PRIMING_ENABLED = True
+        yield monkeypatch
+
+
+@pytest.mark.unit
+class TestWarmup:
+    """ウォームアップ・プライミングのテスト"""
+
+    @pytest.mark.parametrize('event, expected', [
+        ({'warmup': True}, True),
+        ({'source': 'aws.events', 'detail-type': 'Scheduled Event'}, True),
+        ({'httpMethod': 'GET', 'path': '/admin/articles/list'}, False),
+        (None, False),
+    ])
+    def test_is_warmup_event(self, event, expected):
+        """スケジュールのウォームアップイベントのみを判定することを確認"""
+        assert is_warmup_event(event) is expected
+
+    def test_run_once_with_report(self):
+        """各ステップを1度だけ実行し、失敗したステップも含めてレポートすることを確認"""
+        clients = MagicMock()
+        failing = MagicMock(side_effect=RuntimeError('no network'))
+        primer = Primer('route_articles', [('clients', clients), ('connections', failing)])
+
+        report = primer.run()
+        primer.run()
+
+        clients.assert_called_once()
+        assert [(entry['step'], entry['ok']) for entry in report] == [('clients', True), ('connections', False)]
+        assert all(entry['savedMs'] >= 0 for entry in report)
+        assert primer.warmup_response() == {'warmup': True, 'handler': 'route_articles', 'primed': report}
+
+    def test_install_outside_lambda(self, monkeypatch):
+        """Lambda以外（テスト・ローカル）では初期化時に実行しないことを確認"""
+        monkeypatch.delenv('AWS_LAMBDA_FUNCTION_NAME', raising=False)
+        step = MagicMock()
+
+        Primer('route_articles', [('clients', step)]).install()
+
+        step.assert_not_called()
+
+    def test_install_on_demand(self, lambda_env):
+        """通常の初期化ではその場で実行することを確認"""
+        step = MagicMock()
+
+        Primer('route_articles', [('clients', step)]).install()
+
+        step.assert_called_once()
+
+    def test_install_snap_start(self, lambda_env):
+        """SnapStartではスナップショット作成前に実行し、復元後は接続のみやり直すことを確認"""
+        lambda_env.setenv('AWS_LAMBDA_INITIALIZATION_TYPE', 'snap-start')
+        hooks = MagicMock()
+        clients, connections = MagicMock(), MagicMock()
+        primer = Primer('route_articles', [('clients', clients), ('connections', connections)])
+
+        with patch.dict(sys.modules, {'snapshot_restore_py': hooks}):
+            primer.install()
+
+        clients.assert_not_called()
+        hooks.register_before_snapshot.call_args.args[0]()
+        hooks.register_after_restore.call_args.args[0]()
+        clients.assert_called_once()
+        assert connections.call_count == 2